@@ -0,0 +1,105 @@
+"""
+Benchmark de carga: DictReader (lista de dicts) vs backend columnar vs
+validación en streaming (una lectura por lotes, sin cargar el archivo).
+
+Cada modo se ejecuta en un proceso aparte para medir su RSS pico. Se
+reporta también el tiempo de validar con el backend ya cargado.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_carga
+    python -m benchmarks.bench_carga --filas 1000000
+    python -m benchmarks.bench_carga --archivo data/Crime_Data_from_2020_to_Present.csv
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+
+
+def _rss_pico_mb() -> float:
+    # En Linux ru_maxrss viene en KiB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _validar_todo(validator: CrimeDataValidator) -> None:
+    validator.validate_headers()
+    validator.validate_dr_no_unique()
+    validator.validate_coordinates()
+    validator.validate_victim_age()
+    validator.validate_sex_values()
+    validator.get_basic_stats()
+
+
+def _ejecutar(backend: str, ruta: str, cola) -> None:
+    rss_inicial = _rss_pico_mb()
+
+    if backend == 'streaming':
+        inicio = time.perf_counter()
+        CrimeDataValidator(ruta).validate_streaming()
+        cola.put({
+            'backend': backend,
+            'carga_s': 0.0,
+            'validacion_s': time.perf_counter() - inicio,
+            'rss_datos_mb': _rss_pico_mb() - rss_inicial,
+            'rss_pico_mb': _rss_pico_mb(),
+        })
+        return
+
+    validator = CrimeDataValidator(ruta, backend=backend)
+
+    inicio = time.perf_counter()
+    validator.load_data()
+    carga = time.perf_counter() - inicio
+    rss_carga = _rss_pico_mb()
+
+    inicio = time.perf_counter()
+    _validar_todo(validator)
+    validacion = time.perf_counter() - inicio
+
+    cola.put({
+        'backend': backend,
+        'carga_s': carga,
+        'validacion_s': validacion,
+        'rss_datos_mb': rss_carga - rss_inicial,
+        'rss_pico_mb': _rss_pico_mb(),
+    })
+
+
+def medir(backend: str, ruta: str) -> dict:
+    """Carga y valida en un proceso nuevo y devuelve sus métricas."""
+    cola = mp.Queue()
+    proceso = mp.Process(target=_ejecutar, args=(backend, ruta, cola))
+    proceso.start()
+    resultado = cola.get()
+    proceso.join()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=500_000)
+    parser.add_argument('--archivo', default=None, help='CSV real; si se omite se genera uno sintético')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = args.archivo or generar_csv(os.path.join(carpeta, 'crimes.csv'), args.filas)
+        mb_archivo = os.path.getsize(ruta) / 1024 ** 2
+        modos = list(CrimeDataValidator.BACKENDS) + ['streaming']
+        resultados = [medir(modo, ruta) for modo in modos]
+
+    print(f"=== BENCHMARK CARGA ({mb_archivo:.0f} MB) ===")
+    print(f"{'modo':<10}{'carga (s)':>11}{'validar (s)':>13}{'total (s)':>11}"
+          f"{'RSS datos (MB)':>16}{'RSS pico (MB)':>15}")
+    for r in resultados:
+        print(f"{r['backend']:<10}{r['carga_s']:>11.2f}{r['validacion_s']:>13.3f}"
+              f"{r['carga_s'] + r['validacion_s']:>11.2f}{r['rss_datos_mb']:>16.1f}{r['rss_pico_mb']:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
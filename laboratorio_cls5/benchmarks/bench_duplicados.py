@@ -0,0 +1,86 @@
+"""
+Benchmark de memoria por millón de DR_NO para cada modo de DuplicateDetector,
+comparado con la implementación original (lista de str + set).
+
+Los IDs se generan antes de empezar a medir y se entregan por lotes, como
+llegan desde el CSV; la memoria pico se mide con tracemalloc (que también
+registra los arreglos de NumPy) en una segunda ejecución y se escala a un
+millón de IDs.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_duplicados
+    python -m benchmarks.bench_duplicados --ids 5000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.columnar import ROWS_PER_BATCH
+from src.duplicates import MODES, DuplicateDetector
+
+
+def generar_ids(n_ids: int, repetidos: int = 100, semilla: int = 0) -> List[str]:
+    """DR_NO de 9 dígitos en orden aleatorio con algunos repetidos."""
+    rng = np.random.default_rng(semilla)
+    ids = rng.permutation(np.arange(200_000_000, 200_000_000 + n_ids)).astype(str).astype(object)
+    ids[rng.choice(n_ids, repetidos, replace=False)] = ids[rng.choice(n_ids, repetidos, replace=False)]
+    return ids.tolist()
+
+
+def _original(ids: List[str]) -> Dict:
+    dr_numbers = [value for value in ids if value]
+    return {'unique': len(dr_numbers) == len(set(dr_numbers))}
+
+
+def _detector(mode: str, n_ids: int) -> Callable[[List[str]], Dict]:
+    def run(ids: List[str]) -> Dict:
+        detector = DuplicateDetector(mode, expected_ids=n_ids)
+        for start in range(0, len(ids), ROWS_PER_BATCH):
+            detector.add(ids[start:start + ROWS_PER_BATCH])
+        return detector.report()
+    return run
+
+
+def medir(nombre: str, funcion: Callable[[List[str]], Dict], ids: List[str]) -> Dict:
+    """Ejecuta una búsqueda y devuelve memoria pico por millón de IDs y tiempo."""
+    # El tiempo se mide sin tracemalloc, que hace mucho más lenta cada asignación
+    inicio = time.perf_counter()
+    reporte = funcion(ids)
+    segundos = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    funcion(ids)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'modo': nombre,
+        'mb_por_millon': pico / 1024 ** 2 / (len(ids) / 1e6),
+        'segundos': segundos,
+        'unico': reporte['unique'],
+        'repetidos': reporte.get('duplicate_count'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ids', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    ids = generar_ids(args.ids)
+    resultados = [medir('set de str', _original, ids)]
+    resultados += [medir(mode, _detector(mode, args.ids), ids) for mode in MODES]
+
+    print(f"=== BENCHMARK DR_NO ({args.ids:,} IDs, memoria pico por millón) ===")
+    print(f"{'modo':<12}{'MB/millón':>11}{'tiempo (s)':>12}{'único':>8}{'repetidos':>11}")
+    for r in resultados:
+        repetidos = '-' if r['repetidos'] is None else f"{r['repetidos']:,}"
+        print(f"{r['modo']:<12}{r['mb_por_millon']:>11.2f}{r['segundos']:>12.2f}"
+              f"{str(r['unico']):>8}{repetidos:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark del validador de emails sobre listas realistas con muchas
+direcciones repetidas.
+
+Genera un padrón de direcciones distintas (algunas inválidas o con espacios)
+y una columna que las repite con frecuencias tipo Zipf, como en un registro
+de usuarios o de eventos. Mide:
+
+- la implementación anterior (strip, split('@') y búsqueda del punto);
+- is_valid_email en los modos 'fast' y 'strict', dirección por dirección;
+- EmailValidator.validate_many con la caché fría y caliente;
+- is_valid_email_batch sobre un arreglo de Arrow (si está instalado).
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_email
+    python -m benchmarks.bench_email --direcciones 5000000 --distintas 100000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from src.text_utils import EmailValidator, is_valid_email, is_valid_email_batch
+
+USUARIOS = ['ana', 'juan.perez', 'maria_g', 'soporte', 'ventas+promo', 'j.o.nce', 'x']
+DOMINIOS = ['gmail.com', 'tecazuay.edu.ec', 'empresa.com.ec', 'correo.org', 'sub-dominio.net']
+# Variantes inválidas: sin @, doble @, sin punto, espacios, puntos seguidos
+DEFECTOS = [
+    lambda u, d: u + d,
+    lambda u, d: f"{u}@@{d}",
+    lambda u, d: f"{u}@{d.split('.')[0]}",
+    lambda u, d: f"{u} @{d}",
+    lambda u, d: f"  {u}@{d}  ",
+    lambda u, d: f"{u}..{u}@{d}",
+]
+
+
+def anterior(email: str) -> bool:
+    """is_valid_email antes del validador compilado (acepta espacios en medio)."""
+    if not isinstance(email, str):
+        raise TypeError("El parámetro debe ser una cadena de texto")
+    email = email.strip()
+    if '@' not in email:
+        return False
+    parts = email.split('@')
+    if len(parts) != 2:
+        return False
+    local, domain = parts
+    if not local or not domain:
+        return False
+    return '.' in domain
+
+
+def generar_direcciones(n: int, distintas: int, fraccion_invalida: float = 0.1,
+                        semilla: int = 0) -> List[str]:
+    """n direcciones tomadas de un padrón de `distintas` con frecuencias 1/rango."""
+    rng = np.random.default_rng(semilla)
+    padron = []
+    for i in range(distintas):
+        usuario = f"{USUARIOS[i % len(USUARIOS)]}{i}"
+        dominio = DOMINIOS[rng.integers(len(DOMINIOS))]
+        if rng.random() < fraccion_invalida:
+            padron.append(DEFECTOS[rng.integers(len(DEFECTOS))](usuario, dominio))
+        else:
+            padron.append(f"{usuario}@{dominio}")
+    pesos = 1 / np.arange(1, distintas + 1)
+    elegidas = rng.choice(distintas, size=n, p=pesos / pesos.sum())
+    return [padron[i] for i in elegidas]
+
+
+def _cronometrar(funcion: Callable[[], object]):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--direcciones', type=int, default=1_000_000)
+    parser.add_argument('--distintas', type=int, default=20_000)
+    parser.add_argument('--cache', type=int, default=65536, help='Tamaño de la caché LRU')
+    args = parser.parse_args()
+
+    direcciones = generar_direcciones(args.direcciones, args.distintas)
+    filas = []
+
+    base, base_s = _cronometrar(lambda: [anterior(e) for e in direcciones])
+    filas.append(('anterior', base_s, sum(base)))
+    for modo in ('fast', 'strict'):
+        valores, segundos = _cronometrar(lambda: [is_valid_email(e, modo) for e in direcciones])
+        filas.append((f'escalar {modo}', segundos, sum(valores)))
+
+        validador = EmailValidator(modo, cache_size=args.cache)
+        frio, frio_s = _cronometrar(lambda: validador.validate_many(direcciones))
+        _, caliente_s = _cronometrar(lambda: validador.validate_many(direcciones))
+        assert frio.values.tolist() == valores
+        filas.append((f'lote {modo} (caché fría)', frio_s, int(frio.values.sum())))
+        filas.append((f'lote {modo} (caché caliente)', caliente_s, int(frio.values.sum())))
+    try:
+        import pyarrow as pa
+        arreglo = pa.array(direcciones)
+        lote, lote_s = _cronometrar(lambda: is_valid_email_batch(arreglo))
+        filas.append(('lote fast (Arrow)', lote_s, int(lote.values.sum())))
+    except ImportError:
+        pass
+
+    print(f"=== BENCHMARK EMAIL ({args.direcciones:,} direcciones, {args.distintas:,} distintas) ===")
+    print(f"{'variante':<28}{'tiempo (s)':>12}{'M/s':>8}{'válidas':>11}")
+    for nombre, segundos, validas in filas:
+        print(f"{nombre:<28}{segundos:>12.3f}{args.direcciones / segundos / 1e6:>8.2f}{validas:>11,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""
+Benchmark del motor de esquemas frente a los acumuladores escritos a mano.
+
+Compara, regla por regla y con todas juntas, los acumuladores específicos que
+tenía src/streaming.py antes del motor de esquemas (CoordinatesAccumulator,
+VictimAgeAccumulator, ...; se conservan aquí como referencia) con las reglas
+compiladas desde el esquema la_crimes:
+
+- solo reglas: los lotes se leen y parsean una vez antes de medir, así se
+  compara únicamente la evaluación de las reglas;
+- archivo completo: lectura, parseo y reglas en una pasada (run_accumulators).
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_esquema
+    python -m benchmarks.bench_esquema --filas 2000000 --repeticiones 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from benchmarks.sintetico import generar_csv
+from src.columnar import (
+    CsvBatchReader, coordinates_result, count_coordinates, count_in_range, parse_values
+)
+from src.csv_validator import CrimeDataValidator
+from src.duplicates import DuplicateDetector
+from src.schema import validate_file
+from src.streaming import Accumulator, run_accumulators
+
+V = CrimeDataValidator
+
+
+# Acumuladores escritos a mano que usaba validate_streaming antes del esquema
+
+def all_values_allowed(values: Iterable[str], allowed: Set[str]) -> bool:
+    """True si cada valor, sin espacios, está vacío o pertenece a allowed."""
+    for value in values:
+        value = value.strip()
+        if value and value not in allowed:
+            return False
+    return True
+
+
+class DrNoUniqueAccumulator(Accumulator):
+    """Unicidad de DR_NO (validate_dr_no_unique)."""
+
+    text_columns = ('DR_NO',)
+
+    def __init__(self, track_rows: bool = False):
+        """
+        Args:
+            track_rows (bool): Guardar las filas de cada DR_NO repetido
+                (quedan en detector.report()['duplicates'])
+        """
+        self.detector = DuplicateDetector('sorted', track_rows=track_rows)
+
+    def update(self, n_rows, text, numeric):
+        if 'DR_NO' in text:
+            self.detector.add(text['DR_NO'])
+
+    def merge(self, other):
+        # Un DR_NO repetido entre tramos queda contiguo al ordenar la unión
+        self.detector.merge(other.detector)
+
+    def result(self) -> bool:
+        return self.detector.report()['unique']
+
+
+class CoordinatesAccumulator(Accumulator):
+    """Conteo de coordenadas (validate_coordinates)."""
+
+    numeric_columns = ('LAT', 'LON')
+
+    def __init__(self, lat_range: Tuple[float, float], lon_range: Tuple[float, float]):
+        self.lat_range = lat_range
+        self.lon_range = lon_range
+        self.total = 0
+        self.valid = 0
+        self.invalid = 0
+        self.missing = 0
+
+    def update(self, n_rows, text, numeric):
+        valid, invalid, missing = count_coordinates(
+            n_rows, numeric.get('LAT'), numeric.get('LON'), self.lat_range, self.lon_range
+        )
+        self.total += n_rows
+        self.valid += valid
+        self.invalid += invalid
+        self.missing += missing
+
+    def merge(self, other):
+        self.total += other.total
+        self.valid += other.valid
+        self.invalid += other.invalid
+        self.missing += other.missing
+
+    def result(self) -> Dict[str, Any]:
+        return coordinates_result(self.total, self.valid, self.invalid, self.missing)
+
+
+class VictimAgeAccumulator(Accumulator):
+    """Conteo de edades (validate_victim_age)."""
+
+    numeric_columns = ('Vict Age',)
+
+    def __init__(self, age_range: Tuple[float, float]):
+        self.age_range = age_range
+        self.valid = 0
+        self.invalid = 0
+        self.missing = 0
+
+    def update(self, n_rows, text, numeric):
+        valid, invalid, missing = count_in_range(n_rows, numeric.get('Vict Age'), self.age_range)
+        self.valid += valid
+        self.invalid += invalid
+        self.missing += missing
+
+    def merge(self, other):
+        self.valid += other.valid
+        self.invalid += other.invalid
+        self.missing += other.missing
+
+    def result(self) -> Dict[str, int]:
+        return {
+            'valid_ages': self.valid,
+            'invalid_ages': self.invalid,
+            'missing_ages': self.missing
+        }
+
+
+class SexValuesAccumulator(Accumulator):
+    """Valores de sexo permitidos (validate_sex_values)."""
+
+    text_columns = ('Vict Sex',)
+
+    def __init__(self, valid_values: Set[str]):
+        self.valid_values = valid_values
+        self.valid = True
+
+    def update(self, n_rows, text, numeric):
+        if self.valid and 'Vict Sex' in text:
+            self.valid = all_values_allowed(set(text['Vict Sex']), self.valid_values)
+
+    def merge(self, other):
+        self.valid = self.valid and other.valid
+
+    def result(self) -> bool:
+        return self.valid
+
+
+A_MANO: Dict[str, Callable[[], Accumulator]] = {
+    'dr_no_unique': DrNoUniqueAccumulator,
+    'coordinates': lambda: CoordinatesAccumulator(V.LAT_RANGE, V.LON_RANGE),
+    'victim_age': lambda: VictimAgeAccumulator(V.AGE_RANGE),
+    'sex_values': lambda: SexValuesAccumulator(V.VALID_SEX_VALUES),
+}
+
+
+def _esquema(nombre: str) -> Accumulator:
+    return V.SCHEMA.compile(only=[V.STREAMING_RULES[nombre]])[V.STREAMING_RULES[nombre]].accumulator()
+
+
+def leer_lotes(ruta: str) -> List[Tuple[int, Dict, Dict]]:
+    """Lotes de validate_streaming ya extraídos y parseados."""
+    columnas = ['DR_NO', 'Vict Sex'] + list(V.NUMERIC_COLUMNS)
+    lotes = []
+    for n_filas, lote in CsvBatchReader(ruta, columnas):
+        texto = {nombre: lote[nombre] for nombre in ('DR_NO', 'Vict Sex')}
+        numerico = {nombre: parse_values(lote[nombre], tipo) for nombre, tipo in V.NUMERIC_COLUMNS.items()}
+        lotes.append((n_filas, texto, numerico))
+    return lotes
+
+
+def _mejor(funcion: Callable[[], None], repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def solo_reglas(lotes, fabricas: List[Callable[[], Accumulator]], repeticiones: int) -> float:
+    def correr():
+        acumuladores = [fabrica() for fabrica in fabricas]
+        for n_filas, texto, numerico in lotes:
+            for acumulador in acumuladores:
+                acumulador.update(n_filas, texto, numerico)
+        for acumulador in acumuladores:
+            acumulador.result()
+    return _mejor(correr, repeticiones)
+
+
+def archivo_completo(ruta: str, fabricas: Dict[str, Callable[[], Accumulator]], repeticiones: int) -> float:
+    def correr():
+        acumuladores = {nombre: fabrica() for nombre, fabrica in fabricas.items()}
+        run_accumulators(ruta, acumuladores, V.NUMERIC_COLUMNS)
+    return _mejor(correr, repeticiones)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = generar_csv(os.path.join(carpeta, 'crimes.csv'), args.filas, duplicados=100)
+        lotes = leer_lotes(ruta)
+
+        # Los resultados deben coincidir antes de comparar tiempos
+        a_mano = {nombre: fabrica() for nombre, fabrica in A_MANO.items()}
+        esquema = V._accumulators()
+        for acumuladores in (a_mano, esquema):
+            for n_filas, texto, numerico in lotes:
+                for acumulador in acumuladores.values():
+                    acumulador.update(n_filas, texto, numerico)
+        esperado = {nombre: acumulador.result() for nombre, acumulador in a_mano.items()}
+        iguales = all(V._results(esquema)[nombre] == esperado[nombre] for nombre in A_MANO)
+
+        filas = []
+        for nombre, fabrica in A_MANO.items():
+            filas.append((nombre, solo_reglas(lotes, [fabrica], args.repeticiones),
+                          solo_reglas(lotes, [lambda n=nombre: _esquema(n)], args.repeticiones)))
+        filas.append(('todas', solo_reglas(lotes, list(A_MANO.values()), args.repeticiones),
+                      solo_reglas(lotes, [lambda n=n: _esquema(n) for n in A_MANO], args.repeticiones)))
+
+        completo_mano = archivo_completo(ruta, A_MANO, args.repeticiones)
+        completo_esquema = archivo_completo(
+            ruta, {nombre: (lambda n=nombre: _esquema(n)) for nombre in A_MANO}, args.repeticiones
+        )
+        inicio = time.perf_counter()
+        todo = validate_file(ruta, V.SCHEMA)
+        esquema_entero = time.perf_counter() - inicio
+
+    print(f"=== BENCHMARK ESQUEMA ({args.filas:,} filas, resultados iguales: {iguales}) ===")
+    print(f"{'solo reglas':<16}{'a mano (s)':>12}{'esquema (s)':>13}{'relación':>10}")
+    for nombre, mano, compilado in filas:
+        print(f"{nombre:<16}{mano:>12.3f}{compilado:>13.3f}{compilado / mano:>9.2f}x")
+    print(f"{'archivo completo':<16}{completo_mano:>12.3f}{completo_esquema:>13.3f}"
+          f"{completo_esquema / completo_mano:>9.2f}x")
+    print(f"validate_file con las {len(todo['rules'])} reglas de la_crimes: {esquema_entero:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
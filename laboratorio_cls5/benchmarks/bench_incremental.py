@@ -0,0 +1,76 @@
+"""
+Benchmark de validate_incremental: corrida completa, archivo sin cambios y
+archivo con filas agregadas al final, comparados con validate_streaming.
+
+Genera un CSV sintético, lo valida una vez para poblar la caché, vuelve a
+validarlo sin cambios y después le agrega un porcentaje de filas nuevas.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_incremental
+    python -m benchmarks.bench_incremental --filas 2000000 --agregadas 0.01
+    python -m benchmarks.bench_incremental --verify full
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+
+
+def _cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def _agregar(ruta: str, origen: str) -> None:
+    with open(origen, 'rb') as extra:
+        extra.readline()
+        cuerpo = extra.read()
+    with open(ruta, 'ab') as destino:
+        destino.write(cuerpo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    parser.add_argument('--agregadas', type=float, default=0.01, help='Fracción de filas agregadas')
+    parser.add_argument('--verify', choices=['sample', 'full'], default='sample')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = generar_csv(os.path.join(directorio, 'crimes.csv'), args.filas)
+        n_extra = max(1, int(args.filas * args.agregadas))
+        extra = generar_csv(os.path.join(directorio, 'extra.csv'), n_extra, semilla=1,
+                            dr_no_inicial=200_100_000 + args.filas)
+        cache = os.path.join(directorio, 'cache')
+
+        def incremental():
+            return CrimeDataValidator(ruta).validate_incremental(cache, verify=args.verify)
+
+        _, streaming_s = _cronometrar(lambda: CrimeDataValidator(ruta).validate_streaming())
+        completa, completa_s = _cronometrar(incremental)
+        sin_cambios, sin_cambios_s = _cronometrar(incremental)
+        _agregar(ruta, extra)
+        agregado, agregado_s = _cronometrar(incremental)
+        _, referencia_s = _cronometrar(lambda: CrimeDataValidator(ruta).validate_streaming())
+
+        megabytes = os.path.getsize(ruta) / 1024 ** 2
+        print(f"=== BENCHMARK INCREMENTAL ({args.filas:,} filas, {megabytes:.0f} MB, verify={args.verify}) ===")
+        print(f"{'corrida':<28}{'estado':>8}{'bytes':>14}{'tiempo (s)':>12}")
+        print(f"{'validate_streaming':<28}{'-':>8}{'-':>14}{streaming_s:>12.3f}")
+        for nombre, resultado, segundos in [
+            ('primera (caché vacía)', completa, completa_s),
+            ('sin cambios', sin_cambios, sin_cambios_s),
+            (f'+{n_extra:,} filas', agregado, agregado_s),
+        ]:
+            estado = resultado['cache']
+            print(f"{nombre:<28}{estado['status']:>8}{estado['bytes_validated']:>14,}{segundos:>12.3f}")
+        print(f"{'validate_streaming (final)':<28}{'-':>8}{'-':>14}{referencia_s:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
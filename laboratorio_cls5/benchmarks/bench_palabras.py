@@ -0,0 +1,98 @@
+"""
+Benchmark del conteo de palabras por trozos frente a count_words sobre el
+archivo completo en memoria.
+
+Genera un log sintético de --mb megabytes y mide tiempo y memoria de:
+
+- count_words(archivo.read()) y Counter(texto.split()): el texto y la lista
+  de palabras completos en memoria;
+- count_words_stream(ruta) y word_frequencies(ruta, top_k): trozos de
+  CHUNK_CHARS caracteres, memoria constante.
+
+La memoria es el pico de tracemalloc en una segunda corrida (la primera,
+sin trazar, da el tiempo).
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_palabras
+    python -m benchmarks.bench_palabras --mb 1000 --solo-trozos
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+from src.text_utils import count_words, count_words_stream, word_frequencies
+
+METODOS = ['GET', 'POST', 'PUT', 'DELETE']
+RUTAS = ['/api/v1/usuarios', '/api/v1/crimenes', '/login', '/static/app.js', '/reportes/año']
+NIVELES = ['INFO', 'WARN', 'ERROR', 'DEBUG']
+MENSAJES = ['tiempo de espera agotado', 'usuario autenticado', 'consulta lenta', 'conexión cerrada']
+
+
+def generar_log(ruta: str, megabytes: int, semilla: int = 0) -> str:
+    """Escribe un log de acceso de unos `megabytes` MB en UTF-8."""
+    rng = random.Random(semilla)
+    lineas = [
+        f"2024-01-{d:02d}T{h:02d}:00:00Z {rng.choice(NIVELES)}\t{rng.choice(METODOS)} {rng.choice(RUTAS)} "
+        f"{rng.choice([200, 201, 404, 500])} {rng.randint(1, 5000)}ms  {rng.choice(MENSAJES)}\n"
+        for d in range(1, 29) for h in range(24) for _ in range(15)
+    ]
+    bloque = ''.join(lineas).encode('utf-8')
+    with open(ruta, 'wb') as archivo:
+        for _ in range(max(1, megabytes * 2 ** 20 // len(bloque))):
+            archivo.write(bloque)
+    return ruta
+
+
+def _medir(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    funcion()
+    pico = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def _leer(ruta: str) -> str:
+    with open(ruta, encoding='utf-8') as archivo:
+        return archivo.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mb', type=int, default=100, help='Tamaño del log en MB')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--solo-trozos', action='store_true', help='No cargar el archivo completo')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = generar_log(os.path.join(carpeta, 'acceso.log'), args.mb)
+        tamano = os.path.getsize(ruta) / 2 ** 20
+
+        filas = [
+            ('count_words_stream', *_medir(lambda: count_words_stream(ruta))),
+            (f'word_frequencies top {args.top}', *_medir(lambda: word_frequencies(ruta, args.top))),
+        ]
+        if not args.solo_trozos:
+            filas.append(('count_words(read())', *_medir(lambda: count_words(_leer(ruta)))))
+            filas.append(('Counter(read().split())', *_medir(
+                lambda: Counter(_leer(ruta).split()).most_common(args.top))))
+
+    palabras = filas[0][1]
+    iguales = all(fila[1] == palabras for fila in filas if isinstance(fila[1], int))
+    print(f"=== BENCHMARK PALABRAS ({tamano:,.0f} MB, {palabras:,} palabras, conteos iguales: {iguales}) ===")
+    print(f"{'variante':<28}{'tiempo (s)':>12}{'MB/s':>9}{'memoria (MB)':>15}")
+    for nombre, _, segundos, memoria in filas:
+        print(f"{nombre:<28}{segundos:>12.2f}{tamano / segundos:>9.1f}{memoria:>15.1f}")
+    if not args.solo_trozos:
+        print(f"top {args.top} iguales: {filas[1][1] == filas[3][1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark de escalamiento de validate_batch con 1, 2, 4 y 8 procesos.
+
+Genera varios CSV sintéticos (como las entregas mensuales, con DR_NO
+distintos en cada archivo) y los valida con distinto número de procesos.
+La aceleración está limitada por los núcleos disponibles, que se reportan
+junto con los tiempos.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_paralelo
+    python -m benchmarks.bench_paralelo --archivos 12 --filas 250000 --workers 1 2 4 8
+    python -m benchmarks.bench_paralelo --patron "data/*.csv"
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.sintetico import generar_csv
+from src.batch import CHUNK_BYTES
+from src.csv_validator import CrimeDataValidator
+
+
+def medir(archivos, workers: int, chunk_bytes: int) -> dict:
+    """Valida los archivos con el número de procesos dado."""
+    inicio = time.perf_counter()
+    resultado = CrimeDataValidator.validate_batch(archivos, workers=workers, chunk_bytes=chunk_bytes)
+    return {
+        'workers': workers,
+        'segundos': time.perf_counter() - inicio,
+        'filas': resultado['total_rows'],
+        'tramos': sum(f['chunks'] for f in resultado['files']),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archivos', type=int, default=4)
+    parser.add_argument('--filas', type=int, default=250_000, help='Filas por archivo')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_BYTES / 1024 ** 2)
+    parser.add_argument('--patron', default=None, help='Archivos reales; si se omite se generan sintéticos')
+    args = parser.parse_args()
+    chunk_bytes = int(args.chunk_mb * 1024 ** 2)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        if args.patron:
+            archivos = args.patron
+        else:
+            archivos = [
+                generar_csv(os.path.join(carpeta, f'crimes_{i:02d}.csv'), args.filas, semilla=i,
+                            dr_no_inicial=200_000_000 + i * args.filas)
+                for i in range(args.archivos)
+            ]
+        resultados = [medir(archivos, workers, chunk_bytes) for workers in args.workers]
+
+    base = resultados[0]['segundos']
+    print(f"=== BENCHMARK PARALELO ({resultados[0]['filas']:,} filas, "
+          f"{resultados[0]['tramos']} tramos, {os.cpu_count()} CPU) ===")
+    print(f"{'workers':>8}{'tiempo (s)':>12}{'filas/s':>14}{'aceleración':>13}")
+    for r in resultados:
+        print(f"{r['workers']:>8}{r['segundos']:>12.2f}{r['filas'] / r['segundos']:>14,.0f}"
+              f"{base / r['segundos']:>12.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark de build_report: costo frente a validate_streaming, memoria de
+las filas marcadas, búsqueda de filas por posición y tamaño del reporte
+guardado.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_reporte
+    python -m benchmarks.bench_reporte --filas 2000000 --sucias 0.2 --busquedas 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+
+
+def _cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    parser.add_argument('--sucias', type=float, default=0.05, help='Fracción de valores sucios')
+    parser.add_argument('--busquedas', type=int, default=1000, help='Filas al azar a leer')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = generar_csv(os.path.join(carpeta, 'crimes.csv'), args.filas, fraccion_sucia=args.sucias,
+                           duplicados=args.filas // 1000)
+
+        _, streaming_s = _cronometrar(lambda: CrimeDataValidator(ruta).validate_streaming())
+        reporte, reporte_s = _cronometrar(lambda: CrimeDataValidator(ruta).build_report())
+
+        marcadas = np.unique(np.concatenate([reporte.rows(regla) for regla in reporte.failures]))
+        rng = np.random.default_rng(0)
+        elegidas = rng.choice(marcadas, min(args.busquedas, len(marcadas)), replace=False)
+        _, busqueda_s = _cronometrar(lambda: list(reporte.read_rows(elegidas.tolist())))
+
+        tamanos = {}
+        reporte.to_json(os.path.join(carpeta, 'reporte.json'))
+        tamanos['json'] = os.path.getsize(os.path.join(carpeta, 'reporte.json'))
+        try:
+            reporte.to_parquet(os.path.join(carpeta, 'reporte.parquet'))
+            tamanos['parquet'] = os.path.getsize(os.path.join(carpeta, 'reporte.parquet'))
+        except ImportError:
+            pass
+
+    total = sum(reporte.summary().values())
+    memoria = sum(len(filas) * filas.itemsize for filas in reporte.failures.values())
+    memoria += len(reporte.index_rows) * 4 + len(reporte.index_offsets) * 8
+    print(f"=== BENCHMARK REPORTE ({args.filas:,} filas, {total:,} fallas) ===")
+    for regla, cantidad in reporte.summary().items():
+        print(f"  {regla:<14}{cantidad:>12,}")
+    print(f"validate_streaming:     {streaming_s:8.2f} s")
+    print(f"build_report:           {reporte_s:8.2f} s")
+    print(f"memoria de índices:     {memoria / 1024 ** 2:8.2f} MB ({memoria / max(total, 1):.1f} B/falla)")
+    print(f"{len(elegidas):,} filas al azar:  {busqueda_s:8.2f} s")
+    for formato, tamano in tamanos.items():
+        print(f"reporte {formato + ':':<15} {tamano / 1024 ** 2:8.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark de las variantes por lotes de text_utils frente a llamar la
+función escalar elemento por elemento.
+
+Para cada función (clean_text, count_words, is_valid_email) mide el bucle
+escalar sobre una lista y la variante por lotes sobre lista, arreglo NumPy
+de objetos, Series de pandas y arreglo de Arrow (estos dos últimos si están
+instalados), y comprueba que todos los resultados coincidan.
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_texto
+    python -m benchmarks.bench_texto --textos 5000000 --repeticiones 5
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.text_utils import (
+    clean_text, clean_text_batch, count_words, count_words_batch, is_valid_email, is_valid_email_batch
+)
+
+FUNCIONES = {
+    'clean_text': (clean_text, clean_text_batch),
+    'count_words': (count_words, count_words_batch),
+    'is_valid_email': (is_valid_email, is_valid_email_batch),
+}
+
+PALABRAS = ['Hola', 'MUNDO', 'datos', 'Ñandú', 'crimen', 'usuario@dominio.com', 'a@b', 'x.y']
+ESPACIOS = [' ', '  ', '\t', '\xa0']
+
+
+def generar_textos(n: int, semilla: int = 0) -> List[str]:
+    """Textos de 0 a 6 palabras con espacios variados en los extremos."""
+    rng = random.Random(semilla)
+    textos = []
+    for _ in range(n):
+        palabras = rng.choices(PALABRAS, k=rng.randint(0, 6))
+        textos.append(rng.choice(ESPACIOS) + rng.choice(ESPACIOS).join(palabras) + rng.choice(ESPACIOS))
+    return textos
+
+
+def entradas(textos: List[str]) -> Dict[str, object]:
+    """La misma columna en cada tipo de entrada disponible."""
+    tipos = {'lista': textos, 'numpy': np.array(textos, dtype=object)}
+    try:
+        import pandas as pd
+        tipos['pandas'] = pd.Series(textos, dtype='string')
+    except ImportError:
+        pass
+    try:
+        import pyarrow as pa
+        tipos['arrow'] = pa.array(textos)
+    except ImportError:
+        pass
+    return tipos
+
+
+def _mejor(funcion: Callable[[], object], repeticiones: int):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return resultado, min(tiempos)
+
+
+def _como_lista(valores) -> list:
+    return valores.to_pylist() if hasattr(valores, 'to_pylist') else list(valores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--textos', type=int, default=1_000_000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    textos = generar_textos(args.textos)
+    tipos = entradas(textos)
+
+    print(f"=== BENCHMARK TEXTO ({args.textos:,} textos) ===")
+    print(f"{'función':<16}{'entrada':<10}{'tiempo (s)':>12}{'aceleración':>13}{'iguales':>9}")
+    for nombre, (escalar, lote) in FUNCIONES.items():
+        esperado, base = _mejor(lambda: [escalar(texto) for texto in textos], args.repeticiones)
+        print(f"{nombre:<16}{'escalar':<10}{base:>12.3f}{1:>12.2f}x{'':>9}")
+        for tipo, valores in tipos.items():
+            resultado, segundos = _mejor(lambda: lote(valores), args.repeticiones)
+            iguales = _como_lista(resultado.values) == esperado and not resultado.errors.any()
+            print(f"{'':<16}{tipo:<10}{segundos:>12.3f}{base / segundos:>12.2f}x{str(iguales):>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark de las reglas de coordenadas, edad y sexo: bucles por fila
+originales vs kernels NumPy (src/kernels.py).
+
+Se mide solo la validación, con los datos ya cargados: los bucles recorren
+la lista de dicts del backend 'rows' y los kernels trabajan sobre las
+columnas parseadas de ColumnarTable. Para el backend 'rows' se reporta
+aparte la primera llamada, que incluye pasar las columnas a ese formato.
+
+Termina con código 1 si los resultados difieren o si la aceleración de los
+kernels queda por debajo de --min-aceleracion (20x por defecto).
+
+Uso (desde laboratorio_cls5/):
+    python -m benchmarks.bench_validadores
+    python -m benchmarks.bench_validadores --filas 1000000
+    python -m benchmarks.bench_validadores --archivo data/Crime_Data_from_2020_to_Present.csv
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Dict, List, Set
+
+from benchmarks.sintetico import generar_filas
+from src.columnar import table_from_rows
+from src.csv_validator import CrimeDataValidator
+
+
+# Implementación original por fila, conservada como referencia ---------------
+
+def coordenadas_por_fila(data: List[Dict[str, str]]) -> Dict[str, Any]:
+    valid_coords = 0
+    invalid_coords = 0
+    missing_coords = 0
+
+    for row in data:
+        lat = row.get('LAT', '').strip()
+        lon = row.get('LON', '').strip()
+
+        if not lat or not lon:
+            missing_coords += 1
+            continue
+
+        try:
+            lat_float = float(lat)
+            lon_float = float(lon)
+
+            # Validar rangos aproximados para LA
+            if -119 <= lon_float <= -117 and 33 <= lat_float <= 35:
+                valid_coords += 1
+            else:
+                invalid_coords += 1
+        except ValueError:
+            invalid_coords += 1
+
+    total = len(data)
+    return {
+        'total_rows': total,
+        'valid_coordinates': valid_coords,
+        'invalid_coordinates': invalid_coords,
+        'missing_coordinates': missing_coords,
+        'valid_percentage': (valid_coords / total * 100) if total > 0 else 0
+    }
+
+
+def edades_por_fila(data: List[Dict[str, str]]) -> Dict[str, int]:
+    valid_ages = 0
+    invalid_ages = 0
+    missing_ages = 0
+
+    for row in data:
+        age = row.get('Vict Age', '').strip()
+
+        if not age:
+            missing_ages += 1
+            continue
+
+        try:
+            age_int = int(age)
+            if 0 <= age_int <= 120:  # Rango razonable de edad
+                valid_ages += 1
+            else:
+                invalid_ages += 1
+        except ValueError:
+            invalid_ages += 1
+
+    return {
+        'valid_ages': valid_ages,
+        'invalid_ages': invalid_ages,
+        'missing_ages': missing_ages
+    }
+
+
+def sexo_por_fila(data: List[Dict[str, str]], valid_values: Set[str]) -> bool:
+    for row in data:
+        sex = row.get('Vict Sex', '').strip()
+        if sex and sex not in valid_values:
+            return False
+    return True
+
+
+def validar_por_fila(data: List[Dict[str, str]]) -> tuple:
+    """Las tres reglas con los bucles originales."""
+    return (
+        coordenadas_por_fila(data),
+        edades_por_fila(data),
+        sexo_por_fila(data, CrimeDataValidator.VALID_SEX_VALUES),
+    )
+
+
+def validar_con_kernels(validator: CrimeDataValidator) -> tuple:
+    """Las tres reglas con los kernels del validador."""
+    return (
+        validator.validate_coordinates(),
+        validator.validate_victim_age(),
+        validator.validate_sex_values(),
+    )
+
+
+def _mejor_tiempo(funcion, repeticiones: int):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def medir(headers: List[str], data: List[Dict[str, str]], repeticiones: int = 3) -> Dict[str, Any]:
+    """
+    Mide las tres reglas sobre las mismas filas con bucles y con kernels.
+
+    Args:
+        headers (List[str]): Columnas del archivo
+        data (List[Dict[str, str]]): Filas como las entrega csv.DictReader
+        repeticiones (int): Se reporta el mejor tiempo de estas repeticiones
+
+    Returns:
+        Dict: Tiempos en segundos, aceleración y si los resultados coinciden
+    """
+    filas = CrimeDataValidator('')
+    filas.headers, filas.data = headers, data
+
+    inicio = time.perf_counter()
+    con_conversion = validar_con_kernels(filas)
+    primera_llamada = time.perf_counter() - inicio
+
+    columnar = CrimeDataValidator('', backend='columnar')
+    columnar.headers = headers
+    columnar.table = table_from_rows(
+        headers, data, CrimeDataValidator.REQUIRED_COLUMNS, CrimeDataValidator.NUMERIC_COLUMNS
+    )
+
+    bucles, esperado = _mejor_tiempo(lambda: validar_por_fila(data), repeticiones)
+    kernels, obtenido = _mejor_tiempo(lambda: validar_con_kernels(columnar), repeticiones)
+
+    return {
+        'filas': len(data),
+        'bucles_s': bucles,
+        'kernels_s': kernels,
+        'rows_primera_llamada_s': primera_llamada,
+        'aceleracion': bucles / kernels,
+        'iguales': esperado == obtenido == con_conversion,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    parser.add_argument('--archivo', default=None, help='CSV real; si se omite se generan filas sintéticas')
+    parser.add_argument('--min-aceleracion', type=float, default=20,
+                        help='Aceleración mínima esperada de los kernels')
+    args = parser.parse_args()
+
+    if args.archivo:
+        validator = CrimeDataValidator(args.archivo)
+        validator.load_data()
+        headers, data = validator.headers, validator.data
+    else:
+        headers, data = ['LAT', 'LON', 'Vict Age', 'Vict Sex'], generar_filas(args.filas)
+
+    r = medir(headers, data)
+    print(f"=== BENCHMARK VALIDADORES ({r['filas']:,} filas) ===")
+    print(f"bucles por fila:                  {r['bucles_s']:.3f} s")
+    print(f"kernels (columnas parseadas):     {r['kernels_s']:.4f} s  ({r['aceleracion']:.0f}x)")
+    print(f"backend rows, 1a llamada:         {r['rows_primera_llamada_s']:.3f} s (incluye conversión)")
+    print(f"resultados idénticos:             {r['iguales']}")
+
+    if not r['iguales'] or r['aceleracion'] < args.min_aceleracion:
+        print(f"FALLO: se esperaban resultados idénticos y al menos {args.min_aceleracion:.0f}x")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Generador de un CSV sintético con el formato del dataset de crímenes de LA.
+
+Tiene las 28 columnas del archivo real y una fracción de valores sucios
+(coordenadas vacías, fuera de rango o no numéricas, edades inválidas, sexo
+desconocido y DR_NO repetidos) para ejercitar todas las ramas del validador.
+Los valores son deterministas para una misma semilla. generar_filas produce
+las mismas columnas validadas directamente en memoria.
+"""
+
+import csv
+from typing import Dict, List, Optional
+
+import numpy as np
+
+HEADERS = [
+    'DR_NO', 'Date Rptd', 'DATE OCC', 'TIME OCC', 'AREA', 'AREA NAME', 'Rpt Dist No',
+    'Part 1-2', 'Crm Cd', 'Crm Cd Desc', 'Mocodes', 'Vict Age', 'Vict Sex', 'Vict Descent',
+    'Premis Cd', 'Premis Desc', 'Weapon Used Cd', 'Weapon Desc', 'Status', 'Status Desc',
+    'Crm Cd 1', 'Crm Cd 2', 'Crm Cd 3', 'Crm Cd 4', 'LOCATION', 'Cross Street', 'LAT', 'LON',
+]
+
+AREAS = ['Central', 'Rampart', 'Southwest', 'Hollenbeck', 'Harbor', 'Hollywood', 'Wilshire',
+         'West LA', 'Van Nuys', 'West Valley', 'Northeast', '77th Street', 'Newton',
+         'Pacific', 'N Hollywood', 'Foothill', 'Devonshire', 'Southeast', 'Mission',
+         'Olympic', 'Topanga']
+CRIMES = [('354', 'THEFT OF IDENTITY'), ('230', 'ASSAULT WITH DEADLY WEAPON, AGGRAVATED ASSAULT'),
+          ('624', 'BATTERY - SIMPLE ASSAULT'), ('510', 'VEHICLE - STOLEN'),
+          ('330', 'BURGLARY FROM VEHICLE'), ('740', 'VANDALISM - FELONY ($400 & OVER, ALL CHURCH VANDALISMS)')]
+STATUS = [('IC', 'Invest Cont'), ('AO', 'Adult Other'), ('AA', 'Adult Arrest'),
+          ('JA', 'Juv Arrest'), ('CC', 'UNK'), ('JO', 'Juv Other')]
+
+
+def _columnas_validadas(rng: np.random.Generator, n_filas: int, fraccion_sucia: float) -> List[np.ndarray]:
+    """LAT, LON, Vict Age y Vict Sex como arreglos de str, con su fracción de valores sucios."""
+    lat = np.round(rng.uniform(33.7, 34.4, n_filas), 4).astype(str).astype(object)
+    lon = np.round(rng.uniform(-118.7, -118.1, n_filas), 4).astype(str).astype(object)
+    edad = rng.integers(0, 100, n_filas).astype(str).astype(object)
+    sexo = rng.choice(np.array(['M', 'F', 'X', ''], dtype=object), n_filas, p=[0.45, 0.4, 0.1, 0.05])
+
+    sucias = rng.random(n_filas) < fraccion_sucia
+    tipo = rng.integers(0, 4, n_filas)
+    lat[sucias & (tipo == 0)] = ''
+    lon[sucias & (tipo == 1)] = '0'
+    lat[sucias & (tipo == 2)] = 'N/A'
+    edad[sucias & (tipo == 0)] = ''
+    edad[sucias & (tipo == 1)] = '-3'
+    edad[sucias & (tipo == 2)] = '150'
+    edad[sucias & (tipo == 3)] = 'abc'
+    sexo[sucias & (tipo == 3)] = 'H'
+    return [lat, lon, edad, sexo]
+
+
+def generar_filas(n_filas: int, semilla: int = 0, fraccion_sucia: float = 0.05) -> List[Dict[str, str]]:
+    """
+    Genera en memoria filas como las de csv.DictReader, solo con las columnas
+    que revisan las reglas de coordenadas, edad y sexo.
+
+    Args:
+        n_filas (int): Filas a generar
+        semilla (int): Semilla del generador
+        fraccion_sucia (float): Fracción aproximada de valores inválidos por columna
+
+    Returns:
+        List[Dict[str, str]]: Filas con LAT, LON, Vict Age y Vict Sex
+    """
+    columnas = _columnas_validadas(np.random.default_rng(semilla), n_filas, fraccion_sucia)
+    nombres = ('LAT', 'LON', 'Vict Age', 'Vict Sex')
+    return [dict(zip(nombres, valores)) for valores in zip(*columnas)]
+
+
+def generar_csv(
+    ruta: str,
+    n_filas: int,
+    semilla: int = 0,
+    fraccion_sucia: float = 0.05,
+    dr_no_inicial: int = 200_100_000,
+    duplicados: Optional[int] = None,
+) -> str:
+    """
+    Escribe un CSV sintético del dataset de crímenes.
+
+    Args:
+        ruta (str): Archivo de salida
+        n_filas (int): Filas de datos
+        semilla (int): Semilla del generador
+        fraccion_sucia (float): Fracción aproximada de valores inválidos por columna
+        dr_no_inicial (int): Primer DR_NO (los demás son consecutivos)
+        duplicados (int): DR_NO repetidos a inyectar; por defecto ninguno
+
+    Returns:
+        str: La ruta escrita
+    """
+    rng = np.random.default_rng(semilla)
+
+    dr_no = np.arange(dr_no_inicial, dr_no_inicial + n_filas).astype(str).astype(object)
+    if duplicados:
+        destino = rng.choice(n_filas, size=duplicados, replace=False)
+        origen = rng.choice(n_filas, size=duplicados, replace=False)
+        dr_no[destino] = dr_no[origen]
+
+    lat, lon, edad, sexo = _columnas_validadas(rng, n_filas, fraccion_sucia)
+
+    area = rng.integers(1, len(AREAS) + 1, n_filas)
+    crimen = rng.integers(0, len(CRIMES), n_filas)
+    estado = rng.integers(0, len(STATUS), n_filas)
+    dia = rng.integers(1, 29, n_filas)
+    mes = rng.integers(1, 13, n_filas)
+    anio = rng.integers(2020, 2025, n_filas)
+    hora = rng.integers(0, 2400, n_filas)
+
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        for i in range(n_filas):
+            fecha = f'{mes[i]:02d}/{dia[i]:02d}/{anio[i]} 12:00:00 AM'
+            codigo, descripcion = CRIMES[crimen[i]]
+            estado_cd, estado_desc = STATUS[estado[i]]
+            writer.writerow([
+                dr_no[i], fecha, fecha, f'{hora[i]:04d}', f'{area[i]:02d}', AREAS[area[i] - 1],
+                f'{area[i]:02d}{i % 100:02d}', '1', codigo, descripcion, '0344 1822', edad[i],
+                sexo[i], 'H', '101', 'STREET', '', '', estado_cd, estado_desc, codigo, '', '', '',
+                '1000 S MAIN ST', '', lat[i], lon[i],
+            ])
+    return ruta
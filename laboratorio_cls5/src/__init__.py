@@ -5,7 +5,11 @@ Contiene módulos para procesamiento de texto y validación de datasets.
 """
 
 # Importar las funciones principales para facilitar su uso
-from .text_utils import clean_text, count_words, is_valid_email
+from .text_utils import (
+    clean_text, count_words, is_valid_email,
+    clean_text_batch, count_words_batch, is_valid_email_batch, EmailValidator,
+    count_words_stream, word_frequencies
+)
 from .csv_validator import CrimeDataValidator
 
 # Información del paquete
@@ -18,6 +22,12 @@ __all__ = [
     "clean_text",
     "count_words", 
     "is_valid_email",
+    "clean_text_batch",
+    "count_words_batch",
+    "is_valid_email_batch",
+    "EmailValidator",
+    "count_words_stream",
+    "word_frequencies",
     "CrimeDataValidator"
 ]
 
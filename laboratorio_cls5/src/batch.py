@@ -0,0 +1,155 @@
+"""
+Validación en paralelo de varios archivos CSV.
+
+Cada archivo se divide en tramos de bytes que terminan en un salto de línea
+y los tramos se reparten entre procesos con ProcessPoolExecutor. Cada
+proceso recorre su tramo en streaming con los acumuladores de
+src/streaming.py y devuelve su estado parcial (conteos, mínimos y máximos,
+conjuntos de DR_NO); el proceso principal los combina con merge() en el
+orden de los tramos. La unicidad de DR_NO se verifica sobre la unión de los
+conjuntos parciales, así que un DR_NO repetido en dos tramos o en dos
+archivos se detecta igual que dentro de un mismo tramo.
+
+Los tramos se cortan en '\\n', por lo que se asume que ningún campo entre
+comillas contiene saltos de línea (así es el dataset de crímenes de LA).
+Cada tramo se lee en streaming (ver CsvBatchReader), así que la memoria de
+cada proceso no depende del tamaño del tramo. run_batch siempre corta en
+tramos de a lo sumo unos chunk_bytes (CHUNK_BYTES si es None), para que un
+archivo de varios GB también se reparta entre procesos.
+"""
+
+import csv
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .columnar import ROWS_PER_BATCH
+from .streaming import Accumulator, run_accumulators
+
+CHUNK_BYTES = 32 * 1024 ** 2
+
+
+def expand_files(files: Union[str, Sequence[str]]) -> List[str]:
+    """
+    Expande una ruta, un patrón glob o una lista de ellos.
+
+    Args:
+        files (Union[str, Sequence[str]]): Rutas o patrones
+
+    Returns:
+        List[str]: Rutas en orden (cada patrón se ordena alfabéticamente)
+
+    Raises:
+        FileNotFoundError: Si alguna ruta o patrón no corresponde a ningún archivo
+    """
+    patterns = [files] if isinstance(files, str) else list(files)
+    paths: List[str] = []
+    for pattern in patterns:
+        matches = [pattern] if os.path.isfile(pattern) else sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"Archivo no encontrado: {pattern}")
+        paths.extend(matches)
+    return paths
+
+
+def split_file(
+    csv_file_path: str, chunk_bytes: Optional[int] = CHUNK_BYTES, encoding: str = 'utf-8'
+) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Lee el encabezado y divide el resto del archivo en tramos de filas completas.
+
+    Args:
+        csv_file_path (str): Ruta al archivo CSV
+        chunk_bytes (int): Tamaño aproximado de cada tramo; None para uno solo
+        encoding (str): Codificación del archivo
+
+    Returns:
+        Tuple[List[str], List[Tuple[int, int]]]: (encabezado, tramos [inicio, fin))
+    """
+    size = os.path.getsize(csv_file_path)
+    with open(csv_file_path, 'rb') as raw:
+        headers = next(csv.reader([raw.readline().decode(encoding)]), [])
+        start = raw.tell()
+        step = chunk_bytes or size
+
+        ranges: List[Tuple[int, int]] = []
+        while start < size:
+            end = start + step
+            if end >= size:
+                end = size
+            else:
+                # Se extiende el tramo hasta el final de la fila en curso
+                raw.seek(end - 1)
+                raw.readline()
+                end = raw.tell()
+            ranges.append((start, end))
+            start = end
+
+    return headers, ranges
+
+
+def _validate_range(task: tuple) -> Tuple[Dict[str, Accumulator], int, Dict[str, str]]:
+    """Ejecuta los acumuladores sobre un tramo (corre en un proceso del pool)."""
+    path, byte_range, headers, accumulators, numeric_kinds, rows_per_batch = task
+    reader = run_accumulators(
+        path, accumulators, numeric_kinds, rows_per_batch, byte_range=byte_range, headers=headers
+    )
+    return accumulators, reader.n_rows, reader.first_row
+
+
+def run_batch(
+    files: Union[str, Sequence[str]],
+    make_accumulators: Callable[[], Dict[str, Accumulator]],
+    numeric_kinds: Dict[str, str],
+    workers: Optional[int] = None,
+    chunk_bytes: Optional[int] = CHUNK_BYTES,
+    rows_per_batch: int = ROWS_PER_BATCH,
+) -> Tuple[Dict[str, Accumulator], List[Dict[str, Any]]]:
+    """
+    Recorre todos los tramos de todos los archivos y combina los acumuladores.
+
+    Args:
+        files (Union[str, Sequence[str]]): Rutas o patrones glob
+        make_accumulators (Callable): Crea un juego nuevo de acumuladores
+        numeric_kinds (Dict[str, str]): Columna numérica -> 'float' o 'int'
+        workers (int): Procesos; por defecto os.cpu_count(). Con 1 no se crea pool
+        chunk_bytes (int): Tamaño aproximado de cada tramo; None usa CHUNK_BYTES
+        rows_per_batch (int): Filas por lote dentro de cada tramo
+
+    Returns:
+        Tuple: (acumuladores combinados, y por archivo: path, headers,
+        total_rows, first_row y chunks)
+    """
+    workers = workers or os.cpu_count() or 1
+
+    files_info: List[Dict[str, Any]] = []
+    owners: List[int] = []
+    tasks: List[tuple] = []
+    for path in expand_files(files):
+        headers, ranges = split_file(path, chunk_bytes or CHUNK_BYTES)
+        files_info.append({
+            'path': path, 'headers': headers, 'total_rows': 0, 'first_row': {}, 'chunks': len(ranges)
+        })
+        for byte_range in ranges:
+            owners.append(len(files_info) - 1)
+            tasks.append((path, byte_range, headers, make_accumulators(), numeric_kinds, rows_per_batch))
+
+    merged = make_accumulators()
+
+    def combine(results) -> None:
+        for owner, (partial, n_rows, first_row) in zip(owners, results):
+            for name, accumulator in merged.items():
+                accumulator.merge(partial[name])
+            info = files_info[owner]
+            info['total_rows'] += n_rows
+            if not info['first_row']:
+                info['first_row'] = first_row
+
+    if workers == 1 or len(tasks) <= 1:
+        combine(map(_validate_range, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            combine(executor.map(_validate_range, tasks))
+
+    return merged, files_info
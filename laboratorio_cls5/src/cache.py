@@ -0,0 +1,154 @@
+"""
+Caché de validación incremental por archivo.
+
+Guarda, para cada CSV ya validado, el estado de los acumuladores de
+streaming y hasta qué byte llegaron, junto con huellas del contenido:
+
+- La clave de la entrada es una huella del comienzo del archivo
+  (encabezado y primera fila), así que una copia o un archivo renombrado
+  también la encuentran.
+- Si el archivo no cambió (mismo tamaño y misma huella) se devuelven los
+  resultados guardados sin leer los datos.
+- Si solo se agregaron filas al final (la huella del prefijo ya validado
+  coincide) se validan únicamente los bytes nuevos y se combinan con el
+  estado guardado.
+- En cualquier otro caso se valida el archivo completo.
+
+Por defecto las huellas son muestreadas: se hashean el tamaño, el primer y
+el último bloque y bloques espaciados a lo largo del rango, de modo que
+comprobar un archivo de varios GB lee menos de 2 MB. Una edición en el
+medio que no toque ningún bloque muestreado ni cambie el tamaño pasaría
+inadvertida; con verify='full' se hashea el rango completo.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+BLOCK_BYTES = 64 * 1024
+SAMPLED_BLOCKS = 16
+VERIFY_MODES = ('sample', 'full')
+
+# Cambia cuando cambian los acumuladores guardados
+_VERSION = 2
+
+
+def fingerprint(csv_file_path: str, end: int, verify: str = 'sample') -> str:
+    """
+    Huella de los bytes [0, end) del archivo.
+
+    Args:
+        csv_file_path (str): Ruta al archivo
+        end (int): Fin del rango
+        verify (str): 'sample' (bloques muestreados) o 'full' (todo el rango)
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"Modo de verificación no soportado: {verify}")
+
+    digest = hashlib.blake2b(str(end).encode(), digest_size=16)
+    with open(csv_file_path, 'rb') as file:
+        if verify == 'full' or end <= BLOCK_BYTES * (SAMPLED_BLOCKS + 2):
+            remaining = end
+            while remaining > 0:
+                block = file.read(min(remaining, 1024 * 1024))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+            return digest.hexdigest()
+
+        step = (end - BLOCK_BYTES) // (SAMPLED_BLOCKS + 1)
+        starts = [0] + [step * i for i in range(1, SAMPLED_BLOCKS + 1)] + [end - BLOCK_BYTES]
+        for start in starts:
+            file.seek(start)
+            digest.update(file.read(BLOCK_BYTES))
+    return digest.hexdigest()
+
+
+def content_key(csv_file_path: str) -> str:
+    """
+    Clave de caché: hash del encabezado y la primera fila de datos completa.
+
+    No cambia al agregar filas al final. Dos archivos distintos que empiecen
+    igual comparten la entrada; la huella del prefijo los distingue y cada
+    uno provoca una validación completa.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(csv_file_path, 'rb') as file:
+        for _ in range(2):
+            line = file.readline(BLOCK_BYTES)
+            if not line.endswith(b'\n'):
+                break
+            digest.update(line)
+    return digest.hexdigest()
+
+
+def last_row_end(csv_file_path: str, size: int) -> int:
+    """Byte siguiente al último '\\n' del archivo (0 si no hay ninguno)."""
+    with open(csv_file_path, 'rb') as file:
+        position = size
+        while position > 0:
+            start = max(0, position - BLOCK_BYTES)
+            file.seek(start)
+            block = file.read(position - start)
+            index = block.rfind(b'\n')
+            if index >= 0:
+                return start + index + 1
+            position = start
+    return 0
+
+
+class ValidationCache:
+    """
+    Entradas de caché en un directorio: por cada clave, un archivo con los
+    metadatos y resultados (<clave>.meta) y otro con los acumuladores
+    (<clave>.state), que solo se lee cuando hay filas nuevas que validar.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): Directorio de la caché (se crea si no existe)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{key}.{kind}")
+
+    def _read(self, key: str, kind: str) -> Optional[Any]:
+        try:
+            with open(self._path(key, kind), 'rb') as file:
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _write(self, key: str, kind: str, value: Any) -> None:
+        # Se escribe a un temporal y se renombra para no dejar entradas a medias
+        temporary = self._path(key, kind) + '.tmp'
+        with open(temporary, 'wb') as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self._path(key, kind))
+
+    def load_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metadatos de la entrada, o None si no existe o es de otra versión."""
+        meta = self._read(key, 'meta')
+        if not isinstance(meta, dict) or meta.get('version') != _VERSION:
+            return None
+        return meta
+
+    def load_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """Acumuladores guardados de la entrada."""
+        return self._read(key, 'state')
+
+    def save_state(self, key: str, state: Dict[str, Any]) -> None:
+        """Guarda los acumuladores de la entrada."""
+        self._write(key, 'state', state)
+
+    def save_meta(self, key: str, meta: Dict[str, Any]) -> None:
+        """Guarda los metadatos y resultados de la entrada."""
+        self._write(key, 'meta', dict(meta, version=_VERSION))
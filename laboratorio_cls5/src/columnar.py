@@ -0,0 +1,474 @@
+"""
+Backend columnar para el validador de CSV.
+
+En lugar de guardar cada fila como un dict de str, carga solo las columnas
+pedidas y las codifica como categorías: un arreglo NumPy de códigos por fila
+más la lista de valores distintos. Las columnas numéricas (LAT, LON,
+Vict Age) se parsean una sola vez por valor distinto y se guardan como
+arreglos float64 junto con un estado por fila (válido, vacío o inválido).
+"""
+
+import csv
+import io
+from array import array
+from itertools import islice
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .kernels import (  # noqa: F401 (VALID e INVALID se reexportan)
+    INVALID, MISSING, VALID, allowed_lookup, box_mask, coerce_numeric, range_mask
+)
+
+ROWS_PER_BATCH = 20_000
+
+
+class CategoricalColumn:
+    """Columna de texto codificada: un código int32 por fila y los valores distintos."""
+
+    __slots__ = ('codes', 'categories')
+
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class NumericColumn:
+    """Columna numérica parseada: valores float64 (NaN si no aplica) y estado por fila."""
+
+    __slots__ = ('values', 'status')
+
+    def __init__(self, values: np.ndarray, status: np.ndarray):
+        self.values = values
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def parse_categories(categories: Sequence[str], kind: str) -> NumericColumn:
+    """
+    Parsea cada valor distinto una sola vez.
+
+    Args:
+        categories (Sequence[str]): Valores distintos de la columna
+        kind (str): 'float' o 'int'
+
+    Returns:
+        NumericColumn: Valor y estado de cada categoría
+    """
+    values, status = coerce_numeric(categories, kind)
+    return NumericColumn(values, status)
+
+
+class ColumnarTable:
+    """Columnas requeridas de un CSV en arreglos tipados."""
+
+    def __init__(
+        self,
+        headers: List[str],
+        n_rows: int,
+        columns: Dict[str, CategoricalColumn],
+        numeric: Dict[str, NumericColumn],
+        first_row: Dict[str, str],
+    ):
+        """
+        Args:
+            headers (List[str]): Todas las columnas del archivo
+            n_rows (int): Filas de datos
+            columns (Dict[str, CategoricalColumn]): Columnas de texto cargadas
+            numeric (Dict[str, NumericColumn]): Columnas numéricas ya parseadas
+            first_row (Dict[str, str]): Primera fila completa (como la daría DictReader)
+        """
+        self.headers = headers
+        self.n_rows = n_rows
+        self.columns = columns
+        self.numeric = numeric
+        self.first_row = first_row
+
+    def nbytes(self) -> int:
+        """Bytes aproximados que ocupan los arreglos y las categorías."""
+        total = 0
+        for column in self.columns.values():
+            total += column.codes.nbytes + sum(len(c) + 49 for c in column.categories)
+        for column in self.numeric.values():
+            total += column.values.nbytes + column.status.nbytes
+        return total
+
+
+def _transpose(batch: List[List[str]], indices: List[int]) -> List[list]:
+    """Devuelve los campos pedidos del lote por columna; las filas cortas se completan con ''."""
+    if min(map(len, batch)) > max(indices):
+        return [list(map(itemgetter(i), batch)) for i in indices]
+    return [[row[i] if i < len(row) else '' for row in batch] for i in indices]
+
+
+def as_row_dict(headers: List[str], row: List[str]) -> Dict[str, str]:
+    """Convierte una fila en dict igual que csv.DictReader (restkey/restval = None)."""
+    result = dict(zip(headers, row))
+    if len(row) > len(headers):
+        result[None] = row[len(headers):]
+    for key in headers[len(row):]:
+        result[key] = None
+    return result
+
+
+def text_lines(binary_file: BinaryIO, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Líneas de un archivo abierto en binario, decodificadas como las entrega
+    open() en modo texto (fines de línea traducidos a '\\n').
+
+    Como se decodifica línea por línea, file.tell() sigue dando el byte
+    donde empieza la próxima línea que lea csv.reader.
+    """
+    for line in binary_file:
+        text = line.decode(encoding)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        yield text
+
+
+class _RangeReader(io.RawIOBase):
+    """Lectura binaria de un archivo limitada al tramo [start, end) en bytes."""
+
+    def __init__(self, path: str, start: int, end: int):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        n = self._file.readinto(view)
+        self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class CsvBatchReader:
+    """
+    Lee un CSV por lotes de filas y entrega los campos pedidos por columna.
+
+    Sigue las reglas de csv.DictReader: salta líneas vacías y la primera fila
+    se conserva completa como dict. Las columnas pedidas que no existen en el
+    archivo se omiten (ver present).
+
+    Con byte_range se lee solo ese tramo del archivo, que debe empezar y
+    terminar en un límite de fila; en ese caso el tramo no trae encabezado y
+    hay que pasarlo en headers.
+
+    Con index_every se anota, cada tantas filas, el byte donde empieza la
+    fila siguiente (index_rows e index_offsets), de modo que después se
+    puede volver a cualquier fila sin releer el archivo desde el comienzo.
+    """
+
+    def __init__(
+        self,
+        csv_file_path: str,
+        columns: Sequence[str],
+        rows_per_batch: int = ROWS_PER_BATCH,
+        encoding: str = 'utf-8',
+        byte_range: Optional[Tuple[int, int]] = None,
+        headers: Optional[List[str]] = None,
+        index_every: Optional[int] = None,
+    ):
+        """
+        Args:
+            csv_file_path (str): Ruta al archivo CSV
+            columns (Sequence[str]): Columnas a extraer
+            rows_per_batch (int): Filas por lote
+            encoding (str): Codificación del archivo
+            byte_range (Tuple[int, int]): Tramo [inicio, fin) en bytes a leer
+            headers (List[str]): Encabezado del archivo (obligatorio con byte_range)
+            index_every (int): Filas entre cada posición anotada; None para no anotar
+        """
+        if byte_range is not None and headers is None:
+            raise ValueError("byte_range requiere headers")
+        if byte_range is not None and index_every is not None:
+            raise ValueError("index_every no se puede usar con byte_range")
+
+        self.csv_file_path = csv_file_path
+        self.columns = list(columns)
+        self.rows_per_batch = rows_per_batch
+        self.encoding = encoding
+        self.byte_range = byte_range
+        self.headers: List[str] = list(headers) if headers is not None else []
+        self.present: List[str] = []
+        self.first_row: Dict[str, str] = {}
+        self.n_rows = 0
+        self.index_every = index_every
+        # Fila (desde 0) y byte donde empieza, cada index_every filas
+        self.index_rows = array('I')
+        self.index_offsets = array('Q')
+
+    def _open(self):
+        if self.index_every is not None:
+            return open(self.csv_file_path, 'rb')
+        if self.byte_range is None:
+            # Mismos parámetros de apertura que load_data, para leer los mismos valores
+            return open(self.csv_file_path, 'r', encoding=self.encoding)
+        # El tramo se lee en streaming, sin cargarlo entero en memoria;
+        # TextIOWrapper aplica la misma traducción de fin de línea que open()
+        start, end = self.byte_range
+        return io.TextIOWrapper(
+            io.BufferedReader(_RangeReader(self.csv_file_path, start, end)), encoding=self.encoding
+        )
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, List[str]]]]:
+        """
+        Yields:
+            Tuple[int, Dict[str, List[str]]]: (filas del lote, columna -> valores)
+        """
+        self.n_rows = 0
+        self.index_rows = array('I')
+        self.index_offsets = array('Q')
+        with self._open() as file:
+            if self.index_every is None:
+                reader = csv.reader(file)
+            else:
+                reader = csv.reader(text_lines(file, self.encoding))
+            if self.byte_range is None:
+                self.headers = next(reader, [])
+            self.present = [c for c in self.columns if c in self.headers]
+            indices = [self.headers.index(name) for name in self.present]
+            first = True
+
+            while True:
+                if self.index_every is None:
+                    batch = list(islice(reader, self.rows_per_batch))
+                else:
+                    batch = self._indexed_batch(reader, file)
+                if not batch:
+                    break
+                if not all(batch):
+                    # DictReader salta las líneas vacías
+                    batch = [row for row in batch if row]
+                    if not batch:
+                        continue
+                if first:
+                    self.first_row = as_row_dict(self.headers, batch[0])
+                    first = False
+
+                self.n_rows += len(batch)
+                values = _transpose(batch, indices) if indices else []
+                yield len(batch), dict(zip(self.present, values))
+
+    def _indexed_batch(self, reader: Iterator[List[str]], file: BinaryIO) -> List[List[str]]:
+        """Lee un lote anotando la posición del archivo antes de cada tramo de index_every filas."""
+        batch: List[List[str]] = []
+        while len(batch) < self.rows_per_batch:
+            # csv.reader no lee por adelantado: tell() es el comienzo de la próxima fila
+            position = file.tell()
+            rows = list(islice(reader, self.index_every))
+            if not rows:
+                break
+            self.index_rows.append(self.n_rows + len(batch))
+            self.index_offsets.append(position)
+            batch.extend(row for row in rows if row)
+        return batch
+
+
+def encode(values: Sequence[str], lookup: Dict[str, int]) -> np.ndarray:
+    """
+    Codifica valores contra un diccionario valor -> código, agregando los nuevos.
+
+    Args:
+        values (Sequence[str]): Valores de un lote
+        lookup (Dict[str, int]): Diccionario de categorías (se actualiza)
+
+    Returns:
+        np.ndarray: Código int32 de cada valor
+    """
+    for value in set(values).difference(lookup):
+        lookup[value] = len(lookup)
+    return np.fromiter(map(lookup.__getitem__, values), np.int32, len(values))
+
+
+def parse_values(values: Sequence[str], kind: str) -> NumericColumn:
+    """
+    Parsea una columna de texto, convirtiendo cada valor distinto una sola vez.
+
+    Args:
+        values (Sequence[str]): Valores por fila
+        kind (str): 'float' o 'int'
+
+    Returns:
+        NumericColumn: Valor y estado por fila
+    """
+    lookup: Dict[str, int] = {}
+    codes = encode(values, lookup)
+    parsed = parse_categories(list(lookup), kind)
+    return NumericColumn(parsed.values[codes], parsed.status[codes])
+
+
+def load_columnar(
+    csv_file_path: str,
+    columns: Sequence[str],
+    numeric: Optional[Dict[str, str]] = None,
+    rows_per_batch: int = ROWS_PER_BATCH,
+    encoding: str = 'utf-8',
+) -> ColumnarTable:
+    """
+    Carga las columnas pedidas de un CSV en formato columnar.
+
+    Se leen lotes de filas con csv.reader; cada columna se codifica contra un
+    diccionario de valores distintos, así cada texto repetido se guarda una
+    sola vez. Las columnas pedidas que no existen en el archivo se omiten.
+
+    Args:
+        csv_file_path (str): Ruta al archivo CSV
+        columns (Sequence[str]): Columnas a cargar
+        numeric (Dict[str, str]): Columna -> 'float' o 'int' para parsear
+        rows_per_batch (int): Filas que se procesan por lote
+        encoding (str): Codificación del archivo
+
+    Returns:
+        ColumnarTable: Columnas cargadas
+    """
+    numeric = numeric or {}
+    reader = CsvBatchReader(csv_file_path, columns, rows_per_batch, encoding)
+
+    lookups: Dict[str, Dict[str, int]] = {name: {} for name in columns}
+    codes: Dict[str, List[np.ndarray]] = {name: [] for name in columns}
+    n_rows = 0
+
+    for batch_rows, batch in reader:
+        n_rows += batch_rows
+        for name, values in batch.items():
+            codes[name].append(encode(values, lookups[name]))
+
+    text_columns: Dict[str, CategoricalColumn] = {}
+    numeric_columns: Dict[str, NumericColumn] = {}
+    for name in reader.present:
+        column_codes = np.concatenate(codes[name]) if codes[name] else np.empty(0, np.int32)
+        categories = list(lookups[name])
+        if name in numeric:
+            parsed = parse_categories(categories, numeric[name])
+            numeric_columns[name] = NumericColumn(parsed.values[column_codes], parsed.status[column_codes])
+        else:
+            text_columns[name] = CategoricalColumn(column_codes, categories)
+
+    return ColumnarTable(reader.headers, n_rows, text_columns, numeric_columns, reader.first_row)
+
+
+def table_from_rows(
+    headers: List[str],
+    rows: List[Dict[str, str]],
+    columns: Sequence[str],
+    numeric: Optional[Dict[str, str]] = None,
+) -> ColumnarTable:
+    """
+    Pasa a formato columnar filas ya cargadas como dicts (backend 'rows').
+
+    Se recorre cada columna pedida una sola vez; a partir de ahí las reglas
+    usan los mismos kernels que el backend columnar. Los None que deja
+    DictReader en filas cortas se tratan como vacíos.
+
+    Args:
+        headers (List[str]): Columnas del archivo
+        rows (List[Dict[str, str]]): Filas como las entrega csv.DictReader
+        columns (Sequence[str]): Columnas a convertir
+        numeric (Dict[str, str]): Columna -> 'float' o 'int' para parsear
+
+    Returns:
+        ColumnarTable: Columnas convertidas
+    """
+    numeric = numeric or {}
+    text_columns: Dict[str, CategoricalColumn] = {}
+    numeric_columns: Dict[str, NumericColumn] = {}
+
+    for name in columns:
+        if name not in headers:
+            continue
+        try:
+            values = list(map(itemgetter(name), rows))
+        except KeyError:
+            values = [row.get(name, '') for row in rows]
+
+        lookup: Dict[Optional[str], int] = {}
+        codes = encode(values, lookup)
+        categories = ['' if value is None else value for value in lookup]
+        if name in numeric:
+            parsed = parse_categories(categories, numeric[name])
+            numeric_columns[name] = NumericColumn(parsed.values[codes], parsed.status[codes])
+        else:
+            text_columns[name] = CategoricalColumn(codes, categories)
+
+    first_row = rows[0] if rows else {}
+    return ColumnarTable(list(headers), len(rows), text_columns, numeric_columns, first_row)
+
+
+# Conteos sobre columnas parseadas ------------------------------------------
+# Los usan tanto el backend columnar como el modo streaming; reproducen los
+# criterios de los bucles por fila de CrimeDataValidator.
+
+def count_coordinates(
+    n_rows: int,
+    lat: Optional[NumericColumn],
+    lon: Optional[NumericColumn],
+    lat_range: Tuple[float, float],
+    lon_range: Tuple[float, float],
+) -> Tuple[int, int, int]:
+    """
+    Cuenta coordenadas válidas, inválidas y faltantes.
+
+    Una fila es faltante si LAT o LON están vacíos, inválida si alguno no es
+    numérico o está fuera de rango, y válida en otro caso.
+
+    Returns:
+        Tuple[int, int, int]: (válidas, inválidas, faltantes)
+    """
+    if lat is None or lon is None:
+        # Sin alguna de las columnas todas las filas quedan sin coordenadas
+        return 0, 0, n_rows
+
+    missing = (lat.status == MISSING) | (lon.status == MISSING)
+    missing_count = int(np.count_nonzero(missing))
+    # Los vacíos y los no numéricos son NaN, así que nunca caen en la caja
+    valid_count = int(np.count_nonzero(box_mask(lat.values, lon.values, lat_range, lon_range)))
+    return valid_count, n_rows - missing_count - valid_count, missing_count
+
+
+def coordinates_result(total: int, valid: int, invalid: int, missing: int) -> Dict[str, Any]:
+    """Arma el dict de validate_coordinates a partir de los conteos."""
+    return {
+        'total_rows': total,
+        'valid_coordinates': valid,
+        'invalid_coordinates': invalid,
+        'missing_coordinates': missing,
+        'valid_percentage': (valid / total * 100) if total > 0 else 0
+    }
+
+
+def count_in_range(
+    n_rows: int, column: Optional[NumericColumn], value_range: Tuple[float, float]
+) -> Tuple[int, int, int]:
+    """
+    Cuenta valores válidos (numéricos y dentro del rango), inválidos y faltantes.
+
+    Returns:
+        Tuple[int, int, int]: (válidos, inválidos, faltantes)
+    """
+    if column is None:
+        return 0, 0, n_rows
+
+    missing_count = int(np.count_nonzero(column.status == MISSING))
+    valid_count = int(np.count_nonzero(range_mask(column.values, value_range)))
+    return valid_count, n_rows - missing_count - valid_count, missing_count
+
+
+def codes_allowed(column: CategoricalColumn, allowed: Set[str]) -> bool:
+    """True si en todas las filas el valor, sin espacios, está vacío o pertenece a allowed."""
+    lookup = allowed_lookup(column.categories, allowed)
+    return bool(lookup.all() or lookup[column.codes].all())
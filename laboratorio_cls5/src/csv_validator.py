@@ -5,33 +5,71 @@ Específicamente diseñado para validar el dataset de crímenes de LA.
 
 import csv
 import os
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+from .columnar import (
+    ROWS_PER_BATCH, ColumnarTable, CsvBatchReader, codes_allowed, coordinates_result, count_coordinates,
+    count_in_range, load_columnar, table_from_rows
+)
+from .streaming import Accumulator, NumericRangeAccumulator, RowCountAccumulator, run_accumulators
+from .batch import CHUNK_BYTES, run_batch, split_file
+from .cache import ValidationCache, content_key, fingerprint, last_row_end
+from .duplicates import DuplicateDetector, id_set
+from .report import INDEX_EVERY, ValidationReport
+from .schema import load_schema
+
 class CrimeDataValidator:
     """Validador para el dataset de crímenes de Los Angeles"""
     
+    # Esquema del dataset (src/schema.py); las constantes siguientes salen de él
+    SCHEMA = load_schema('la_crimes')
+    
     # Columnas obligatorias esperadas
-    REQUIRED_COLUMNS = [
-        'DR_NO', 'Date Rptd', 'DATE OCC', 'TIME OCC', 'AREA', 
-        'AREA NAME', 'Crm Cd', 'Crm Cd Desc', 'Vict Age', 
-        'Vict Sex', 'Status', 'LAT', 'LON'
-    ]
+    REQUIRED_COLUMNS = SCHEMA.required_columns
     
     # Valores válidos para columnas categóricas
-    VALID_SEX_VALUES = {'M', 'F', 'X', ''}  # M, F, X (desconocido), o vacío
-    VALID_STATUS_VALUES = {'IC', 'CC', 'AO', 'JO'}  # Códigos de estado conocidos
+    VALID_SEX_VALUES = set(SCHEMA.columns['Vict Sex'].enum)  # M, F, X (desconocido), o vacío
+    VALID_STATUS_VALUES = set(SCHEMA.columns['Status'].enum)  # Códigos de estado conocidos
+    
+    # Rangos válidos (área de Los Angeles y edades razonables)
+    LAT_RANGE = tuple(SCHEMA.check('coordinates')['box']['LAT'])
+    LON_RANGE = tuple(SCHEMA.check('coordinates')['box']['LON'])
+    AGE_RANGE = SCHEMA.columns['Vict Age'].range
+    
+    # Columnas que el backend columnar parsea como números
+    NUMERIC_COLUMNS = SCHEMA.numeric_kinds
+    
+    # Regla del esquema detrás de cada resultado de validate_streaming
+    STREAMING_RULES = {
+        'dr_no_unique': 'DR_NO.unique',
+        'coordinates': 'coordinates',
+        'victim_age': 'Vict Age',
+        'sex_values': 'Vict Sex',
+    }
     
-    def __init__(self, csv_file_path: str):
+    # Backends de carga: 'rows' (lista de dicts) o 'columnar' (arreglos tipados)
+    BACKENDS = ('rows', 'columnar')
+    
+    def __init__(self, csv_file_path: str, backend: str = 'rows'):
         """
         Inicializa el validador con la ruta del archivo CSV.
         
         Args:
             csv_file_path (str): Ruta al archivo CSV
+            backend (str): 'rows' carga cada fila como dict; 'columnar' carga
+                solo REQUIRED_COLUMNS en arreglos NumPy (mucho menos memoria)
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend no soportado: {backend}")
+        
         self.csv_file_path = csv_file_path
+        self.backend = backend
         self.data = []
         self.headers = []
+        self.table: Optional[ColumnarTable] = None
+        # Columnas de self.data ya convertidas para los kernels (backend 'rows')
+        self._rows_table: Optional[ColumnarTable] = None
     
     def load_data(self) -> bool:
         """
@@ -47,7 +85,15 @@ class CrimeDataValidator:
         if not os.path.exists(self.csv_file_path):
             raise FileNotFoundError(f"Archivo no encontrado: {self.csv_file_path}")
         
+        self._rows_table = None
         try:
+            if self.backend == 'columnar':
+                self.table = load_columnar(
+                    self.csv_file_path, self.REQUIRED_COLUMNS, numeric=self.NUMERIC_COLUMNS
+                )
+                self.headers = self.table.headers
+                return True
+            
             with open(self.csv_file_path, 'r', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
                 self.headers = reader.fieldnames or []
@@ -73,8 +119,74 @@ class CrimeDataValidator:
         Returns:
             bool: True si todos los DR_NO son únicos
         """
-        dr_numbers = [row.get('DR_NO', '') for row in self.data if row.get('DR_NO', '')]
-        return len(dr_numbers) == len(set(dr_numbers))
+        if self.table is not None:
+            return self._validate_dr_no_unique_columnar()
+        
+        # Los DR_NO se guardan como int64 y se ordenan, sin armar una lista y un set de str
+        detector = DuplicateDetector('sorted', track_rows=False)
+        for start in range(0, len(self.data), ROWS_PER_BATCH):
+            detector.add([row.get('DR_NO', '') for row in self.data[start:start + ROWS_PER_BATCH]])
+        return detector.report()['unique']
+    
+    def find_dr_no_duplicates(
+        self,
+        mode: str = 'sorted',
+        expected_ids: Optional[int] = None,
+        error_rate: float = 0.01,
+        confirm: bool = False,
+        rows_per_batch: int = ROWS_PER_BATCH,
+    ) -> Dict[str, Any]:
+        """
+        Busca DR_NO repetidos y dónde aparecen, leyendo solo esa columna del archivo.
+        
+        No necesita load_data: el archivo se recorre por lotes y solo se
+        guardan los IDs en la estructura del modo elegido.
+        
+        Args:
+            mode (str): 'sorted' o 'hash' (exactos), 'bloom' o 'hll' (probabilísticos)
+            expected_ids (int): IDs esperados para dimensionar el filtro de Bloom;
+                por defecto se estima a partir del tamaño del archivo
+            error_rate (float): Tasa de falsos positivos del filtro de Bloom
+            confirm (bool): Con 'bloom', releer el archivo para confirmar los
+                candidatos de forma exacta (la memoria depende solo de ellos)
+            rows_per_batch (int): Filas por lote
+        
+        Returns:
+            Dict: Reporte de DuplicateDetector: unique, total_ids, distinct_ids,
+            duplicate_count y duplicates (DR_NO -> filas, numeradas desde 0
+            como en self.data)
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            csv.Error: Si hay error al leer el CSV
+        """
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {self.csv_file_path}")
+        if expected_ids is None:
+            # Cota holgada: las filas del dataset real ocupan más de 100 bytes
+            expected_ids = max(1, os.path.getsize(self.csv_file_path) // 100)
+        
+        def scan(detector: DuplicateDetector) -> Dict[str, Any]:
+            try:
+                for _, batch in CsvBatchReader(self.csv_file_path, ['DR_NO'], rows_per_batch):
+                    if 'DR_NO' in batch:
+                        detector.add(batch['DR_NO'])
+            except Exception as e:
+                raise csv.Error(f"Error al leer el archivo CSV: {str(e)}")
+            return detector.report()
+        
+        report = scan(DuplicateDetector(mode, expected_ids=expected_ids, error_rate=error_rate))
+        if mode != 'bloom' or not confirm or report['unique']:
+            return report
+        
+        confirmed = scan(DuplicateDetector('sorted', restrict_to=id_set(report['duplicates'])))
+        confirmed.update({
+            'mode': 'bloom',
+            'total_ids': report['total_ids'],
+            'distinct_ids': report['total_ids'] - confirmed['duplicate_count'],
+            'candidates': len(report['duplicates']),
+        })
+        return confirmed
     
     def validate_coordinates(self) -> Dict[str, Any]:
         """
@@ -83,38 +195,12 @@ class CrimeDataValidator:
         Returns:
             Dict: Estadísticas de validación de coordenadas
         """
-        valid_coords = 0
-        invalid_coords = 0
-        missing_coords = 0
-        
-        for row in self.data:
-            lat = row.get('LAT', '').strip()
-            lon = row.get('LON', '').strip()
-            
-            if not lat or not lon:
-                missing_coords += 1
-                continue
-            
-            try:
-                lat_float = float(lat)
-                lon_float = float(lon)
-                
-                # Validar rangos aproximados para LA
-                if -119 <= lon_float <= -117 and 33 <= lat_float <= 35:
-                    valid_coords += 1
-                else:
-                    invalid_coords += 1
-            except ValueError:
-                invalid_coords += 1
-        
-        total = len(self.data)
-        return {
-            'total_rows': total,
-            'valid_coordinates': valid_coords,
-            'invalid_coordinates': invalid_coords,
-            'missing_coordinates': missing_coords,
-            'valid_percentage': (valid_coords / total * 100) if total > 0 else 0
-        }
+        table = self._kernel_table(('LAT', 'LON'))
+        total = table.n_rows
+        valid_coords, invalid_coords, missing_coords = count_coordinates(
+            total, table.numeric.get('LAT'), table.numeric.get('LON'), self.LAT_RANGE, self.LON_RANGE
+        )
+        return coordinates_result(total, valid_coords, invalid_coords, missing_coords)
     
     def validate_victim_age(self) -> Dict[str, int]:
         """
@@ -123,26 +209,10 @@ class CrimeDataValidator:
         Returns:
             Dict: Estadísticas de edades válidas/inválidas
         """
-        valid_ages = 0
-        invalid_ages = 0
-        missing_ages = 0
-        
-        for row in self.data:
-            age = row.get('Vict Age', '').strip()
-            
-            if not age:
-                missing_ages += 1
-                continue
-            
-            try:
-                age_int = int(age)
-                if 0 <= age_int <= 120:  # Rango razonable de edad
-                    valid_ages += 1
-                else:
-                    invalid_ages += 1
-            except ValueError:
-                invalid_ages += 1
-        
+        table = self._kernel_table(('Vict Age',))
+        valid_ages, invalid_ages, missing_ages = count_in_range(
+            table.n_rows, table.numeric.get('Vict Age'), self.AGE_RANGE
+        )
         return {
             'valid_ages': valid_ages,
             'invalid_ages': invalid_ages,
@@ -156,11 +226,10 @@ class CrimeDataValidator:
         Returns:
             bool: True si todos los valores son válidos
         """
-        for row in self.data:
-            sex = row.get('Vict Sex', '').strip()
-            if sex and sex not in self.VALID_SEX_VALUES:
-                return False
-        return True
+        column = self._kernel_table(('Vict Sex',)).columns.get('Vict Sex')
+        if column is None:
+            return True
+        return codes_allowed(column, self.VALID_SEX_VALUES)
     
     def get_basic_stats(self) -> Dict[str, Any]:
         """
@@ -169,9 +238,342 @@ class CrimeDataValidator:
         Returns:
             Dict: Estadísticas básicas
         """
+        if self.table is not None:
+            return {
+                'total_rows': self.table.n_rows,
+                'total_columns': len(self.headers),
+                'columns': self.headers,
+                'sample_row': self.table.first_row
+            }
+        
         return {
             'total_rows': len(self.data),
             'total_columns': len(self.headers),
             'columns': self.headers,
             'sample_row': self.data[0] if self.data else {}
-        }
\ No newline at end of file
+        }
+    
+    def validate_streaming(self, rows_per_batch: int = ROWS_PER_BATCH) -> Dict[str, Any]:
+        """
+        Ejecuta todas las validaciones en una sola lectura del archivo, por lotes.
+        
+        No usa load_data: la memoria pico queda acotada por un lote (más el
+        conjunto de DR_NO vistos) sin importar el tamaño del archivo.
+        
+        Args:
+            rows_per_batch (int): Filas por lote
+        
+        Returns:
+            Dict: Resultado de cada validación, con las mismas claves y formato
+            que los métodos individuales: headers, dr_no_unique, coordinates,
+            victim_age, sex_values y basic_stats
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            csv.Error: Si hay error al leer el CSV
+        """
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {self.csv_file_path}")
+        
+        accumulators = self._accumulators()
+        try:
+            reader = run_accumulators(
+                self.csv_file_path, accumulators, self.NUMERIC_COLUMNS, rows_per_batch
+            )
+        except Exception as e:
+            raise csv.Error(f"Error al leer el archivo CSV: {str(e)}")
+        
+        self.headers = reader.headers
+        return self._streaming_results(accumulators, reader.first_row)
+    
+    def validate_incremental(
+        self,
+        cache_dir: str,
+        verify: str = 'sample',
+        rows_per_batch: int = ROWS_PER_BATCH,
+    ) -> Dict[str, Any]:
+        """
+        Igual que validate_streaming, pero reutiliza lo validado en corridas anteriores.
+        
+        El estado de los acumuladores se guarda en cache_dir junto con el
+        byte hasta donde se validó. Si el archivo no cambió se devuelven los
+        resultados guardados; si solo se le agregaron filas al final se
+        validan únicamente los bytes nuevos; si cambió el contenido ya
+        validado se valida todo de nuevo (ver src/cache.py).
+        
+        Args:
+            cache_dir (str): Directorio de la caché
+            verify (str): 'sample' compara huellas de bloques muestreados (casi
+                instantáneo); 'full' hashea todo el prefijo ya validado
+            rows_per_batch (int): Filas por lote
+        
+        Returns:
+            Dict: Las mismas claves que validate_streaming, más cache con
+            status ('hit', 'append' o 'full') y bytes_validated
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            csv.Error: Si hay error al leer el CSV
+        """
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {self.csv_file_path}")
+        
+        path = self.csv_file_path
+        cache = ValidationCache(cache_dir)
+        size = os.path.getsize(path)
+        key = content_key(path)
+        meta = cache.load_meta(key)
+        if meta is not None and meta['verify'] != verify:
+            meta = None
+        
+        if (meta is not None and meta['file_size'] == size
+                and meta['file_fingerprint'] == fingerprint(path, size, verify)):
+            self.headers = meta['headers']
+            return dict(meta['results'], cache={'status': 'hit', 'bytes_validated': 0})
+        
+        accumulators = None
+        if (meta is not None and size >= meta['offset']
+                and meta['prefix_fingerprint'] == fingerprint(path, meta['offset'], verify)):
+            accumulators = cache.load_state(key)
+        
+        if accumulators is not None:
+            status, start = 'append', meta['offset']
+            headers, first_row = meta['headers'], meta['first_row']
+        else:
+            status, accumulators, first_row = 'full', self._accumulators(), {}
+            headers, ranges = split_file(path, chunk_bytes=None)
+            start = ranges[0][0] if ranges else size
+        # Una última fila sin '\n' puede estar a medio escribir: se valida, pero
+        # no entra en el estado guardado
+        end = max(start, last_row_end(path, size))
+        
+        try:
+            if end > start:
+                reader = run_accumulators(
+                    path, accumulators, self.NUMERIC_COLUMNS, rows_per_batch,
+                    byte_range=(start, end), headers=headers
+                )
+                first_row = first_row or reader.first_row
+            cache.save_state(key, accumulators)
+            saved_first_row = first_row
+            
+            if end < size:
+                tail = self._accumulators()
+                reader = run_accumulators(
+                    path, tail, self.NUMERIC_COLUMNS, rows_per_batch,
+                    byte_range=(end, size), headers=headers
+                )
+                first_row = first_row or reader.first_row
+                for name, accumulator in accumulators.items():
+                    accumulator.merge(tail[name])
+        except Exception as e:
+            raise csv.Error(f"Error al leer el archivo CSV: {str(e)}")
+        
+        self.headers = headers
+        results = self._streaming_results(accumulators, first_row)
+        prefix_fingerprint = fingerprint(path, end, verify)
+        cache.save_meta(key, {
+            'path': os.path.abspath(path),
+            'verify': verify,
+            'offset': end,
+            'prefix_fingerprint': prefix_fingerprint,
+            'file_size': size,
+            'file_fingerprint': prefix_fingerprint if end == size else fingerprint(path, size, verify),
+            'headers': headers,
+            'first_row': saved_first_row,
+            'results': results,
+        })
+        return dict(results, cache={'status': status, 'bytes_validated': size - start})
+    
+    def build_report(
+        self, rows_per_batch: int = ROWS_PER_BATCH, index_every: int = INDEX_EVERY
+    ) -> ValidationReport:
+        """
+        Valida el archivo en streaming guardando qué filas fallan cada regla.
+        
+        Las reglas del reporte son dr_no_unique (todas las filas de cada DR_NO
+        repetido), coordinates (coordenadas inválidas), victim_age (edades
+        inválidas) y sex_values (valores no permitidos); los vacíos no cuentan
+        como falla, igual que en los conteos.
+        
+        Args:
+            rows_per_batch (int): Filas por lote
+            index_every (int): Filas entre posiciones anotadas para read_rows
+        
+        Returns:
+            ValidationReport: Resultados de validate_streaming más las filas
+            que fallan cada regla y el índice de posiciones del archivo
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            csv.Error: Si hay error al leer el CSV
+        """
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"Archivo no encontrado: {self.csv_file_path}")
+        
+        accumulators = self._accumulators(track_rows=True)
+        try:
+            reader = run_accumulators(
+                self.csv_file_path, accumulators, self.NUMERIC_COLUMNS, rows_per_batch,
+                index_every=index_every
+            )
+        except Exception as e:
+            raise csv.Error(f"Error al leer el archivo CSV: {str(e)}")
+        
+        self.headers = reader.headers
+        failures = {name: accumulators[name].failing_rows() for name in self.STREAMING_RULES}
+        
+        return ValidationReport(
+            self.csv_file_path,
+            reader.headers,
+            reader.n_rows,
+            self._streaming_results(accumulators, reader.first_row),
+            failures,
+            reader.index_rows,
+            reader.index_offsets,
+            reader.encoding,
+        )
+    
+    def _streaming_results(self, accumulators: Dict[str, Accumulator], first_row: Dict[str, str]) -> Dict[str, Any]:
+        """Arma el dict de validate_streaming a partir de los acumuladores."""
+        results = self._results(accumulators)
+        total_rows = results.pop('total_rows')
+        
+        results['headers'] = self.validate_headers()
+        results['basic_stats'] = {
+            'total_rows': total_rows,
+            'total_columns': len(self.headers),
+            'columns': self.headers,
+            'sample_row': first_row
+        }
+        return results
+    
+    @classmethod
+    def validate_batch(
+        cls,
+        files: Union[str, Sequence[str]],
+        workers: Optional[int] = None,
+        chunk_bytes: Optional[int] = CHUNK_BYTES,
+        rows_per_batch: int = ROWS_PER_BATCH,
+    ) -> Dict[str, Any]:
+        """
+        Valida varios archivos en paralelo, repartiendo tramos de bytes entre procesos.
+        
+        Cada tramo se valida en streaming y los resultados parciales se
+        combinan en un solo reporte. La unicidad de DR_NO se evalúa sobre
+        todos los archivos juntos.
+        
+        Args:
+            files (Union[str, Sequence[str]]): Rutas, patrón glob o lista de patrones
+            workers (int): Procesos a usar; por defecto uno por CPU
+            chunk_bytes (int): Tamaño aproximado de cada tramo; None usa CHUNK_BYTES
+            rows_per_batch (int): Filas por lote dentro de cada tramo
+        
+        Returns:
+            Dict: dr_no_unique, coordinates, victim_age y sex_values combinados
+            (mismo formato que validate_streaming), total_rows, numeric_ranges
+            con el mínimo y máximo válidos de LAT, LON y Vict Age, y files con
+            path, headers, basic_stats y chunks de cada archivo
+            
+        Raises:
+            FileNotFoundError: Si algún archivo o patrón no existe
+            csv.Error: Si hay error al leer algún CSV
+        """
+        def make_accumulators() -> Dict[str, Accumulator]:
+            accumulators = cls._accumulators()
+            accumulators['numeric_ranges'] = NumericRangeAccumulator(tuple(cls.NUMERIC_COLUMNS))
+            return accumulators
+        
+        try:
+            merged, files_info = run_batch(
+                files, make_accumulators, cls.NUMERIC_COLUMNS, workers, chunk_bytes, rows_per_batch
+            )
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise csv.Error(f"Error al leer el archivo CSV: {str(e)}")
+        
+        results = cls._results(merged)
+        results['files'] = []
+        for info in files_info:
+            validator = cls(info['path'])
+            validator.headers = info['headers']
+            results['files'].append({
+                'path': info['path'],
+                'headers': validator.validate_headers(),
+                'basic_stats': {
+                    'total_rows': info['total_rows'],
+                    'total_columns': len(info['headers']),
+                    'columns': info['headers'],
+                    'sample_row': info['first_row']
+                },
+                'chunks': info['chunks']
+            })
+        return results
+    
+    @classmethod
+    def _accumulators(cls, track_rows: bool = False) -> Dict[str, Accumulator]:
+        """Acumuladores de las reglas de STREAMING_RULES, compiladas desde SCHEMA, más el total de filas."""
+        rules = cls.SCHEMA.compile(only=list(cls.STREAMING_RULES.values()))
+        accumulators = {
+            name: rules[rule].accumulator(track_rows) for name, rule in cls.STREAMING_RULES.items()
+        }
+        accumulators['total_rows'] = RowCountAccumulator()
+        return accumulators
+    
+    @classmethod
+    def _results(cls, accumulators: Dict[str, Accumulator]) -> Dict[str, Any]:
+        """Resultado de cada acumulador, con las reglas del esquema en el formato de los métodos validate_*."""
+        results = {name: acc.result() for name, acc in accumulators.items()}
+        
+        coordinates = results['coordinates']
+        results['coordinates'] = coordinates_result(
+            sum(coordinates.values()), coordinates['valid'], coordinates['invalid'], coordinates['missing']
+        )
+        ages = results['victim_age']
+        results['victim_age'] = {
+            'valid_ages': ages['valid'],
+            'invalid_ages': ages['invalid'],
+            'missing_ages': ages['missing']
+        }
+        results['dr_no_unique'] = results['dr_no_unique']['invalid'] == 0
+        results['sex_values'] = results['sex_values']['invalid'] == 0
+        return results
+    
+    # Formato columnar ----------------------------------------------------
+    # Las reglas se calculan con los kernels de src/kernels.py sobre los
+    # códigos y valores ya parseados de ColumnarTable, con cualquiera de los
+    # dos backends, y devuelven lo mismo que los bucles por fila originales.
+    
+    def _validate_dr_no_unique_columnar(self) -> bool:
+        column = self.table.columns.get('DR_NO')
+        if column is None:
+            return True
+        
+        # Cada DR_NO no vacío distinto es una categoría
+        empty_code = column.categories.index('') if '' in column.categories else -1
+        non_empty_rows = int((column.codes != empty_code).sum())
+        non_empty_values = len(column.categories) - (1 if empty_code >= 0 else 0)
+        return non_empty_rows == non_empty_values
+    
+    def _kernel_table(self, columns: Tuple[str, ...]) -> ColumnarTable:
+        """
+        Devuelve las columnas en el formato que usan los kernels.
+        
+        Con el backend 'rows' las columnas pedidas se extraen de self.data la
+        primera vez y quedan guardadas hasta el próximo load_data.
+        """
+        if self.table is not None:
+            return self.table
+        
+        if self._rows_table is None:
+            self._rows_table = table_from_rows(self.headers, self.data, ())
+        pending = [
+            name for name in columns
+            if name not in self._rows_table.columns and name not in self._rows_table.numeric
+        ]
+        if pending:
+            converted = table_from_rows(self.headers, self.data, pending, self.NUMERIC_COLUMNS)
+            self._rows_table.columns.update(converted.columns)
+            self._rows_table.numeric.update(converted.numeric)
+        return self._rows_table
@@ -0,0 +1,505 @@
+"""
+Detección de DR_NO repetidos con poca memoria.
+
+Los DR_NO son números de 9 dígitos, así que se guardan como enteros de 64
+bits en arreglos NumPy en lugar de como str dentro de un set. Hay cuatro
+modos:
+
+- 'sorted' (exacto): acumula los IDs y al final los ordena; los repetidos
+  quedan contiguos. Es el de menor memoria entre los exactos.
+- 'hash' (exacto): tabla hash de direccionamiento abierto sobre arreglos
+  int64, insertando lote a lote; detecta los repetidos a medida que llegan.
+- 'bloom' (probabilístico): filtro de Bloom. Nunca pierde un repetido, pero
+  puede marcar como repetido un ID nuevo con probabilidad error_rate. Los
+  candidatos se pueden confirmar con una segunda pasada exacta restringida
+  a ellos (restrict_to e id_set).
+- 'hll' (probabilístico): HyperLogLog. Estima cuántos IDs distintos hay (y
+  por lo tanto cuántos repetidos) en unos pocos KB, sin poder decir cuáles.
+
+Se comparan los textos tal como vienen del CSV, igual que
+validate_dr_no_unique: los vacíos se ignoran y '01' y '1' son IDs
+distintos. Solo los textos en forma decimal canónica pasan a int64; el
+resto se guarda aparte como str (son pocos o ninguno en el dataset real).
+
+Las filas se numeran desde 0 en el orden de los datos, es decir, el mismo
+índice que tienen en CrimeDataValidator.data.
+"""
+
+import hashlib
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .kernels import ascii_mask
+
+MODES = ('sorted', 'hash', 'bloom', 'hll')
+EXACT_MODES = ('sorted', 'hash')
+
+# Hasta 18 dígitos entran en int64 sin desbordar
+_MAX_DIGITS = 18
+# Marca de celda vacía en la tabla hash (los IDs canónicos son >= 0)
+_EMPTY = -1
+_MAX_LOAD = 0.5
+
+
+def split_ids(values: Sequence[Optional[str]]) -> Tuple[np.ndarray, np.ndarray, List[Tuple[int, str]]]:
+    """
+    Separa los IDs de un lote en enteros y textos no canónicos.
+
+    Args:
+        values (Sequence[Optional[str]]): DR_NO del lote (None cuenta como vacío)
+
+    Returns:
+        Tuple: (IDs int64, posición en el lote de cada uno, y pares
+        (posición, texto) de los IDs que no están en forma decimal canónica)
+    """
+    texts = np.asarray(['' if value is None else value for value in values], dtype=np.str_)
+    if len(texts) == 0:
+        return np.empty(0, np.int64), np.empty(0, np.int64), []
+
+    lengths = np.strings.str_len(texts)
+    canonical = (
+        np.strings.isdecimal(texts) & (lengths <= _MAX_DIGITS) & ascii_mask(texts)
+        & ~((lengths > 1) & np.strings.startswith(texts, '0'))
+    )
+    positions = np.flatnonzero(canonical)
+    others = [(int(i), str(texts[i])) for i in np.flatnonzero(~canonical & (lengths > 0))]
+    return _parse_digits(texts[canonical]), positions, others
+
+
+def _parse_digits(texts: np.ndarray) -> np.ndarray:
+    """Convierte textos de solo dígitos ASCII a int64 recorriendo sus columnas de caracteres."""
+    values = np.zeros(len(texts), dtype=np.int64)
+    if len(texts) == 0 or texts.dtype.itemsize == 0:
+        return values
+    # Los textos más cortos que el ancho del arreglo se completan con el carácter 0
+    codepoints = texts.view(np.uint32).reshape(len(texts), -1).astype(np.int64)
+    for column in codepoints.T:
+        present = column != 0
+        values[present] = values[present] * 10 + (column[present] - 48)
+    return values
+
+
+def id_set(values: Iterable[str]) -> Tuple[np.ndarray, Set[str]]:
+    """
+    Convierte una colección de DR_NO al formato de restrict_to.
+
+    Args:
+        values (Iterable[str]): DR_NO, p. ej. las claves de duplicates de un reporte 'bloom'
+
+    Returns:
+        Tuple[np.ndarray, Set[str]]: (IDs int64, IDs no canónicos)
+    """
+    keys, _, others = split_ids(list(values))
+    return keys, {text for _, text in others}
+
+
+def _mix(keys: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Hash de 64 bits (finalizador de splitmix64) sobre un arreglo de enteros."""
+    z = keys.astype(np.uint64) + np.uint64((0x9E3779B97F4A7C15 * (seed + 1)) & 0xFFFFFFFFFFFFFFFF)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _hash_text(text: str) -> int:
+    """Hash estable (igual en todos los procesos) de un ID no canónico."""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little') >> 1
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Posición del bit más alto encendido + 1, para cada uint64."""
+    smeared = values.copy()
+    for shift in (1, 2, 4, 8, 16, 32):
+        smeared |= smeared >> np.uint64(shift)
+    return np.bitwise_count(smeared).astype(np.int64)
+
+
+def _hll_sigma(x: float) -> float:
+    if x == 1:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y *= 2
+        if z == previous:
+            return z
+
+
+def _hll_tau(x: float) -> float:
+    if x in (0, 1):
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class DuplicateDetector:
+    """Busca IDs repetidos alimentándolo lote a lote con add()."""
+
+    def __init__(
+        self,
+        mode: str = 'sorted',
+        expected_ids: int = 1_000_000,
+        error_rate: float = 0.01,
+        track_rows: bool = True,
+        precision: int = 14,
+        restrict_to: Optional[Tuple[np.ndarray, Set[str]]] = None,
+    ):
+        """
+        Args:
+            mode (str): 'sorted', 'hash', 'bloom' o 'hll'
+            expected_ids (int): IDs esperados; dimensiona el filtro de Bloom
+                y la tabla hash inicial
+            error_rate (float): Tasa de falsos positivos del filtro de Bloom
+            track_rows (bool): Guardar el número de fila de cada ID para
+                reportar dónde están los repetidos (modos exactos)
+            precision (int): Bits de índice de HyperLogLog (2**precision registros)
+            restrict_to (Tuple[np.ndarray, Set[str]]): Solo considerar estos IDs
+                (enteros y no canónicos), p. ej. los candidatos de un filtro de Bloom
+        """
+        if mode not in MODES:
+            raise ValueError(f"Modo no soportado: {mode}")
+
+        self.mode = mode
+        self.track_rows = track_rows and mode in EXACT_MODES
+        self.error_rate = error_rate
+        self.n_rows = 0
+        self.total_ids = 0
+        self.restrict_to = None
+        if restrict_to is not None:
+            self.restrict_to = (np.unique(np.asarray(restrict_to[0], dtype=np.int64)), set(restrict_to[1]))
+
+        # IDs no canónicos -> filas (modos exactos)
+        self._others: Dict[str, List[int]] = {}
+
+        if mode == 'sorted':
+            self._keys: List[np.ndarray] = []
+            self._rows: List[np.ndarray] = []
+        elif mode == 'hash':
+            capacity = 1 << max(4, math.ceil(math.log2(max(expected_ids, 1) / _MAX_LOAD)))
+            self._table = np.full(capacity, _EMPTY, dtype=np.int64)
+            self._table_rows = np.full(capacity, -1, dtype=np.int64) if self.track_rows else None
+            self._size = 0
+            self._repeat_keys: List[np.ndarray] = []
+            self._repeat_rows: List[np.ndarray] = []
+        elif mode == 'bloom':
+            n = max(expected_ids, 1)
+            self._n_bits = max(64, math.ceil(-n * math.log(error_rate) / math.log(2) ** 2))
+            self._n_hashes = max(1, round(self._n_bits / n * math.log(2)))
+            self._bits = np.zeros((self._n_bits + 7) // 8, dtype=np.uint8)
+            self._candidates: Dict[str, List[int]] = {}
+        else:
+            self.precision = precision
+            self._registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    # Alimentación -------------------------------------------------------
+
+    def add(self, values: Sequence[Optional[str]]) -> None:
+        """
+        Incorpora un lote de DR_NO; sus filas siguen a las del lote anterior.
+
+        Args:
+            values (Sequence[Optional[str]]): DR_NO por fila (los vacíos se ignoran)
+        """
+        keys, positions, others = split_ids(values)
+        rows = positions + self.n_rows
+        other_rows = [(position + self.n_rows, text) for position, text in others]
+        self.n_rows += len(values)
+
+        if self.restrict_to is not None:
+            keep = np.isin(keys, self.restrict_to[0], assume_unique=False)
+            keys, rows = keys[keep], rows[keep]
+            other_rows = [(row, text) for row, text in other_rows if text in self.restrict_to[1]]
+
+        self.total_ids += len(keys) + len(other_rows)
+
+        if self.mode in ('bloom', 'hll'):
+            if other_rows:
+                hashed = np.array([_hash_text(text) for _, text in other_rows], dtype=np.int64)
+                keys = np.concatenate([keys, hashed])
+                rows = np.concatenate([rows, np.array([row for row, _ in other_rows], dtype=np.int64)])
+            labels = None
+            if self.mode == 'bloom':
+                labels = np.asarray(values, dtype=object)
+            getattr(self, f'_add_{self.mode}')(keys, rows, labels)
+            return
+
+        for row, text in other_rows:
+            self._others.setdefault(text, []).append(row)
+        getattr(self, f'_add_{self.mode}')(keys, rows)
+
+    def _add_sorted(self, keys: np.ndarray, rows: np.ndarray) -> None:
+        self._keys.append(keys)
+        if self.track_rows:
+            self._rows.append(rows)
+
+    def _probe(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Busca cada clave en la tabla hash.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (celda, encontrada) por clave; si no
+            está, la celda es la primera vacía de su secuencia de sondeo
+        """
+        mask = np.int64(len(self._table) - 1)
+        slots = (_mix(keys).view(np.int64) & mask)
+        found = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while len(pending):
+            current = self._table[slots[pending]]
+            hit = current == keys[pending]
+            found[pending[hit]] = True
+            done = hit | (current == _EMPTY)
+            pending = pending[~done]
+            slots[pending] = (slots[pending] + 1) & mask
+        return slots, found
+
+    def _insert(self, keys: np.ndarray, rows: Optional[np.ndarray]) -> None:
+        """Inserta claves distintas entre sí que no están en la tabla."""
+        while len(keys):
+            slots, _ = self._probe(keys)
+            # Si dos claves nuevas apuntan a la misma celda vacía gana la primera
+            _, first = np.unique(slots, return_index=True)
+            self._table[slots[first]] = keys[first]
+            if rows is not None:
+                self._table_rows[slots[first]] = rows[first]
+            self._size += len(first)
+            rest = np.ones(len(keys), dtype=bool)
+            rest[first] = False
+            keys = keys[rest]
+            rows = rows[rest] if rows is not None else None
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._table)
+        while needed > capacity * _MAX_LOAD:
+            capacity *= 2
+        if capacity == len(self._table):
+            return
+        occupied = self._table != _EMPTY
+        keys = self._table[occupied]
+        rows = self._table_rows[occupied] if self.track_rows else None
+        self._table = np.full(capacity, _EMPTY, dtype=np.int64)
+        self._table_rows = np.full(capacity, -1, dtype=np.int64) if self.track_rows else None
+        self._size = 0
+        self._insert(keys, rows)
+
+    def _add_hash(self, keys: np.ndarray, rows: np.ndarray) -> None:
+        # Repetidos dentro del lote: quedan las primeras apariciones
+        unique, first = np.unique(keys, return_index=True)
+        repeated = np.ones(len(keys), dtype=bool)
+        repeated[first] = False
+        if repeated.any():
+            self._repeat_keys.append(keys[repeated])
+            self._repeat_rows.append(rows[repeated])
+
+        unique_rows = rows[first]
+        _, found = self._probe(unique)
+        if found.any():
+            self._repeat_keys.append(unique[found])
+            self._repeat_rows.append(unique_rows[found])
+
+        self._grow(self._size + int((~found).sum()))
+        self._insert(unique[~found], unique_rows[~found] if self.track_rows else None)
+
+    def _bloom_positions(self, keys: np.ndarray) -> np.ndarray:
+        """Bits del filtro de cada clave (doble hashing), forma (k, n)."""
+        h1 = _mix(keys, seed=0)
+        h2 = _mix(keys, seed=1) | np.uint64(1)
+        steps = np.arange(self._n_hashes, dtype=np.uint64)[:, None]
+        return (h1[None, :] + steps * h2[None, :]) % np.uint64(self._n_bits)
+
+    def _add_bloom(self, keys: np.ndarray, rows: np.ndarray, labels: np.ndarray) -> None:
+        unique, first = np.unique(keys, return_index=True)
+        repeated = np.ones(len(keys), dtype=bool)
+        repeated[first] = False
+
+        positions = self._bloom_positions(unique)
+        byte, bit = positions >> np.uint64(3), (positions & np.uint64(7)).astype(np.uint8)
+        present = ((self._bits[byte] >> bit) & 1).all(axis=0)
+        np.bitwise_or.at(self._bits, byte.ravel(), (np.uint8(1) << bit).ravel())
+
+        # Candidatos: repetidos seguros dentro del lote y posibles con lotes anteriores
+        batch_start = self.n_rows - len(labels)
+        for index in np.concatenate([np.flatnonzero(repeated), first[present]]):
+            row = int(rows[index])
+            self._candidates.setdefault(labels[row - batch_start], []).append(row)
+
+    def _add_hll(self, keys: np.ndarray, rows: np.ndarray, labels: None) -> None:
+        hashed = _mix(keys)
+        p = self.precision
+        index = (hashed >> np.uint64(64 - p)).astype(np.int64)
+        rest = hashed << np.uint64(p)
+        rank = np.minimum(64 - _bit_length(rest) + 1, 64 - p + 1).astype(np.uint8)
+        np.maximum.at(self._registers, index, rank)
+
+    # Combinación --------------------------------------------------------
+
+    def merge(self, other: 'DuplicateDetector') -> None:
+        """
+        Incorpora otro detector del mismo modo alimentado con las filas
+        siguientes (sus números de fila se desplazan en self.n_rows).
+        """
+        if other.mode != self.mode:
+            raise ValueError("Solo se pueden combinar detectores del mismo modo")
+
+        offset = self.n_rows
+        self.n_rows += other.n_rows
+        self.total_ids += other.total_ids
+
+        for text, rows in other._others.items():
+            self._others.setdefault(text, []).extend(row + offset for row in rows)
+
+        if self.mode == 'sorted':
+            self._keys.extend(other._keys)
+            if self.track_rows:
+                self._rows.extend(rows + offset for rows in other._rows)
+        elif self.mode == 'hash':
+            occupied = other._table != _EMPTY
+            keys = other._table[occupied]
+            rows = other._table_rows[occupied] + offset if other.track_rows else np.full(len(keys), -1)
+            _, found = self._probe(keys)
+            self._repeat_keys.append(keys[found])
+            self._repeat_rows.append(rows[found])
+            self._repeat_keys.extend(other._repeat_keys)
+            self._repeat_rows.extend(rows + offset for rows in other._repeat_rows)
+            self._grow(self._size + int((~found).sum()))
+            self._insert(keys[~found], rows[~found] if self.track_rows else None)
+        elif self.mode == 'bloom':
+            if other._n_bits != self._n_bits:
+                raise ValueError("Los filtros de Bloom deben tener el mismo tamaño")
+            # Sin los IDs originales no se puede saber qué IDs del otro filtro ya
+            # estaban en este; solo se conservan los candidatos de cada uno
+            self._bits |= other._bits
+            for text, rows in other._candidates.items():
+                self._candidates.setdefault(text, []).extend(row + offset for row in rows)
+        else:
+            np.maximum(self._registers, other._registers, out=self._registers)
+
+    # Resultado ----------------------------------------------------------
+
+    def nbytes(self) -> int:
+        """Bytes de los arreglos NumPy que guarda el detector."""
+        if self.mode == 'sorted':
+            return sum(a.nbytes for a in self._keys) + sum(a.nbytes for a in self._rows)
+        if self.mode == 'hash':
+            rows = self._table_rows.nbytes if self.track_rows else 0
+            return self._table.nbytes + rows + sum(a.nbytes for a in self._repeat_keys + self._repeat_rows)
+        if self.mode == 'bloom':
+            return self._bits.nbytes
+        return self._registers.nbytes
+
+    def _exact_duplicates(self) -> Tuple[int, Dict[str, List[int]]]:
+        """(IDs distintos, ID -> filas de cada aparición) para los modos exactos."""
+        duplicates: Dict[str, List[int]] = {}
+
+        if self.mode == 'sorted':
+            # Se consolidan los lotes para no tener dos copias en el próximo reporte
+            self._keys = [np.concatenate(self._keys)] if self._keys else [np.empty(0, np.int64)]
+            if self.track_rows:
+                self._rows = [np.concatenate(self._rows)] if self._rows else [np.empty(0, np.int64)]
+            keys = self._keys[0]
+
+            # Basta ordenar los IDs; las filas solo se buscan para los repetidos
+            ordered = np.sort(keys)
+            same = ordered[1:] == ordered[:-1]
+            distinct = len(ordered) - int(same.sum())
+            repeated_keys = np.unique(ordered[1:][same])
+            del ordered, same
+            if len(repeated_keys):
+                where = np.isin(keys, repeated_keys)
+                rows = self._rows[0][where] if self.track_rows else np.full(int(where.sum()), -1)
+                for key, row in zip(keys[where].tolist(), rows.tolist()):
+                    duplicates.setdefault(str(key), []).append(row)
+        else:
+            distinct = self._size
+            if self._repeat_keys:
+                keys = np.concatenate(self._repeat_keys)
+                rows = np.concatenate(self._repeat_rows)
+                unique = np.unique(keys)
+                slots, _ = self._probe(unique)
+                first_rows = self._table_rows[slots] if self.track_rows else np.full(len(unique), -1)
+                for key, row in zip(unique.tolist(), first_rows.tolist()):
+                    duplicates[str(key)] = [row]
+                for key, row in zip(keys.tolist(), rows.tolist()):
+                    duplicates[str(key)].append(row)
+
+        for text, rows in self._others.items():
+            distinct += 1
+            if len(rows) > 1:
+                duplicates[text] = list(rows)
+
+        if not self.track_rows:
+            duplicates = {key: [] for key in duplicates}
+        else:
+            duplicates = {key: sorted(rows) for key, rows in duplicates.items()}
+        return distinct, duplicates
+
+    def _hll_estimate(self) -> float:
+        """
+        Estimador mejorado de Ertl (2017): sin el sesgo del estimador original
+        en rangos intermedios y sin tablas empíricas de corrección.
+        """
+        m = len(self._registers)
+        q = 64 - self.precision
+        counts = np.bincount(self._registers, minlength=q + 2).astype(float)
+
+        z = m * _hll_tau(1 - counts[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + counts[k])
+        z += m * _hll_sigma(counts[0] / m)
+        return m * m / (2 * math.log(2) * z)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Resultado de la búsqueda.
+
+        Returns:
+            Dict: mode, exact, unique, total_ids (no vacíos), distinct_ids,
+            duplicate_count (apariciones de más) y duplicates (ID -> filas).
+            En 'bloom' duplicates son candidatos con las filas donde el ID
+            pareció repetirse (unique=True es seguro; False es probable) y
+            distinct_ids no se calcula. En 'hll' distinct_ids y
+            duplicate_count son estimaciones, unique es None y duplicates None
+        """
+        result: Dict[str, Any] = {
+            'mode': self.mode,
+            'exact': self.mode in EXACT_MODES,
+            'total_ids': self.total_ids,
+        }
+
+        if self.mode in EXACT_MODES:
+            distinct, duplicates = self._exact_duplicates()
+            result.update({
+                'unique': not duplicates,
+                'distinct_ids': distinct,
+                'duplicate_count': self.total_ids - distinct,
+                'duplicates': duplicates,
+            })
+        elif self.mode == 'bloom':
+            candidates = {str(key): sorted(rows) for key, rows in self._candidates.items()}
+            result.update({
+                'unique': not candidates,
+                'distinct_ids': None,
+                'duplicate_count': sum(len(rows) for rows in candidates.values()),
+                'duplicates': candidates,
+                'error_rate': self.error_rate,
+            })
+        else:
+            distinct = min(self._hll_estimate(), float(self.total_ids))
+            result.update({
+                'unique': None,
+                'distinct_ids': round(distinct),
+                'duplicate_count': max(0, self.total_ids - round(distinct)),
+                'duplicates': None,
+                'relative_error': 1.04 / math.sqrt(len(self._registers)),
+            })
+        return result
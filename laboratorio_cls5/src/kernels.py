@@ -0,0 +1,140 @@
+"""
+Kernels NumPy para las reglas del validador de crímenes.
+
+Operan sobre columnas completas en lugar de fila por fila:
+
+- coerce_numeric convierte una columna de texto a float64 de una sola vez
+  (NaN para vacíos y valores no numéricos) y devuelve el estado de cada fila.
+- range_mask y box_mask evalúan los rangos como máscaras booleanas; como NaN
+  nunca cae dentro de un rango, los valores vacíos o inválidos quedan fuera
+  sin ramas adicionales.
+- allowed_lookup arma una tabla booleana por categoría, de modo que la
+  pertenencia a un conjunto se resuelve indexando con los códigos de la
+  columna categórica.
+
+Los criterios son los mismos que los de los bucles originales con strip(),
+float()/int() y try/except.
+"""
+
+from typing import Callable, Dict, Iterable, Sequence, Set, Tuple
+
+import numpy as np
+
+# Estado de cada valor numérico, con la misma semántica que los bucles por fila
+VALID = 0    # se pudo convertir
+MISSING = 1  # vacío después de strip()
+INVALID = 2  # float()/int() lanzó ValueError
+
+# Las edades fuera de este rango son inválidas igual; se acotan para no
+# desbordar float64 con enteros arbitrariamente grandes
+_INT_LIMIT = 10 ** 9
+
+# Enteros con más dígitos podrían perder precisión al pasar por float64; se
+# convierten con int() como el resto de los casos no triviales
+_MAX_INT_DIGITS = 15
+
+
+def _parse_float(text: str) -> float:
+    return float(text)
+
+
+def _parse_int(text: str) -> float:
+    value = int(text)
+    return float(max(-_INT_LIMIT, min(_INT_LIMIT, value)))
+
+
+PARSERS: Dict[str, Callable[[str], float]] = {
+    'float': _parse_float,
+    'int': _parse_int,
+}
+
+
+def ascii_mask(texts: np.ndarray) -> np.ndarray:
+    """True para los textos que solo tienen caracteres ASCII."""
+    if texts.dtype.itemsize == 0:
+        return np.ones(len(texts), dtype=bool)
+    codepoints = texts.view(np.uint32).reshape(len(texts), -1)
+    return (codepoints < 128).all(axis=1)
+
+
+def _plain_numbers(texts: np.ndarray, kind: str) -> np.ndarray:
+    """
+    Marca los textos con la forma simple [+-]dígitos[.dígitos] (o [+-]dígitos
+    si kind es 'int'), que NumPy convierte igual que float()/int(). El resto
+    (exponentes, guiones bajos, 'nan', dígitos no ASCII, etc.) se deja para
+    los parsers de Python.
+    """
+    body = np.strings.lstrip(texts, '+-')
+    lengths = np.strings.str_len(texts)
+    body_lengths = np.strings.str_len(body)
+    one_sign = lengths - body_lengths <= 1
+
+    if kind == 'int':
+        digits = np.strings.isdecimal(body) & (body_lengths <= _MAX_INT_DIGITS)
+    else:
+        digits = np.strings.isdecimal(np.strings.replace(body, '.', '', 1))
+
+    return one_sign & digits & ascii_mask(texts)
+
+
+def coerce_numeric(texts: Sequence[str], kind: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte una columna de texto a números de forma vectorizada.
+
+    Args:
+        texts (Sequence[str]): Valores de la columna
+        kind (str): 'float' o 'int'
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Valores float64 (NaN si el texto está
+        vacío o no es numérico) y estado int8 (VALID, MISSING o INVALID)
+    """
+    parser = PARSERS[kind]
+    texts = np.asarray(texts, dtype=np.str_)
+    values = np.full(len(texts), np.nan)
+    status = np.full(len(texts), VALID, dtype=np.int8)
+    if len(texts) == 0:
+        return values, status
+
+    stripped = np.strings.strip(texts)
+    empty = np.strings.str_len(stripped) == 0
+    status[empty] = MISSING
+
+    plain = _plain_numbers(stripped, kind)
+    values[plain] = stripped[plain].astype(np.float64)
+    if kind == 'int':
+        np.clip(values, -_INT_LIMIT, _INT_LIMIT, out=values)
+
+    for i in np.flatnonzero(~plain & ~empty):
+        try:
+            values[i] = parser(str(stripped[i]))
+        except ValueError:
+            status[i] = INVALID
+
+    return values, status
+
+
+def range_mask(values: np.ndarray, value_range: Tuple[float, float]) -> np.ndarray:
+    """True donde el valor está dentro del rango cerrado (NaN queda fuera)."""
+    return (values >= value_range[0]) & (values <= value_range[1])
+
+
+def box_mask(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    lat_range: Tuple[float, float],
+    lon_range: Tuple[float, float],
+) -> np.ndarray:
+    """True donde el par (lat, lon) cae dentro de la caja."""
+    return range_mask(lat, lat_range) & range_mask(lon, lon_range)
+
+
+def allowed_lookup(categories: Iterable[str], allowed: Set[str]) -> np.ndarray:
+    """
+    Tabla booleana por categoría: True si el valor, sin espacios, está vacío
+    o pertenece a allowed. Indexada con los códigos de una columna da la
+    máscara por fila.
+    """
+    return np.array(
+        [not value.strip() or value.strip() in allowed for value in categories], dtype=bool
+    )
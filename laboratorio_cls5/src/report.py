@@ -0,0 +1,245 @@
+"""
+Reporte de validación con el índice de las filas que fallan cada regla.
+
+Además de los conteos de validate_streaming, ValidationReport guarda por
+regla los números de fila (desde 0, como en CrimeDataValidator.data) que no
+la cumplen, en array('I'): 4 bytes por fila marcada, sin dicts ni listas.
+
+Para volver a las filas originales sin recargar el dataset se guarda un
+índice disperso de posiciones: el byte donde empieza una de cada
+index_every filas. Leer una fila es ir a la posición anotada anterior y
+avanzar como mucho index_every filas.
+
+El reporte se guarda como JSON (índices en base64) o como Parquet (una fila
+por falla, con el resto en los metadatos del esquema). pyarrow es una
+dependencia opcional: solo la necesitan to_parquet y from_parquet.
+"""
+
+import base64
+import csv
+import json
+import os
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .cache import fingerprint
+from .columnar import as_row_dict, text_lines
+
+def _pyarrow():
+    """Importa pyarrow y pyarrow.parquet, con un error claro si no está instalado."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Guardar o cargar el reporte como Parquet requiere pyarrow "
+            "(dependencia opcional): pip install pyarrow"
+        ) from error
+    return pa, pq
+
+
+# Filas entre posiciones anotadas: 12 bytes cada 256 filas
+INDEX_EVERY = 256
+
+_VERSION = 1
+
+
+def _encode(values: array, dtype: str) -> str:
+    return base64.b64encode(np.asarray(values, dtype=dtype).tobytes()).decode('ascii')
+
+
+def _to_array(values: np.ndarray, typecode: str) -> array:
+    result = array(typecode)
+    result.frombytes(np.asarray(values, dtype=result.typecode).tobytes())
+    return result
+
+
+def _decode(text: str, dtype: str, typecode: str) -> array:
+    return _to_array(np.frombuffer(base64.b64decode(text), dtype=dtype), typecode)
+
+
+class ValidationReport:
+    """
+    Resultado de CrimeDataValidator.build_report.
+
+    Attributes:
+        path (str): Archivo validado
+        headers (List[str]): Encabezado del archivo
+        n_rows (int): Filas de datos
+        results (Dict): Mismo formato que validate_streaming
+        failures (Dict[str, array]): Regla -> filas que no la cumplen, en orden
+    """
+
+    def __init__(
+        self,
+        path: str,
+        headers: List[str],
+        n_rows: int,
+        results: Dict[str, Any],
+        failures: Dict[str, array],
+        index_rows: array,
+        index_offsets: array,
+        encoding: str = 'utf-8',
+    ):
+        self.path = path
+        self.headers = headers
+        self.n_rows = n_rows
+        self.results = results
+        self.failures = failures
+        self.index_rows = index_rows
+        self.index_offsets = index_offsets
+        self.encoding = encoding
+        # Para detectar que el archivo cambió antes de buscar filas
+        self.file_size = os.path.getsize(path)
+        self.file_fingerprint = fingerprint(path, self.file_size)
+
+    def summary(self) -> Dict[str, int]:
+        """Cantidad de filas que fallan cada regla."""
+        return {rule: len(rows) for rule, rows in self.failures.items()}
+
+    def rows(self, rule: str) -> np.ndarray:
+        """Filas que fallan la regla, como vista uint32 (sin copiar)."""
+        return np.frombuffer(self.failures[rule], dtype=np.uint32)
+
+    def bitmap(self, rule: str) -> np.ndarray:
+        """Máscara de la regla empaquetada en bits (n_rows / 8 bytes)."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.rows(rule)] = True
+        return np.packbits(mask)
+
+    def read_rows(self, indices: Iterable[int]) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """
+        Lee del archivo las filas pedidas usando el índice de posiciones.
+
+        Args:
+            indices (Iterable[int]): Números de fila (desde 0)
+
+        Yields:
+            Tuple[int, Dict[str, str]]: (fila, valores como en CrimeDataValidator.data),
+            en orden creciente de fila
+
+        Raises:
+            ValueError: Si el archivo cambió desde que se armó el reporte
+            IndexError: Si alguna fila no existe
+        """
+        size = os.path.getsize(self.path)
+        if size != self.file_size or fingerprint(self.path, size) != self.file_fingerprint:
+            raise ValueError(f"El archivo cambió desde que se armó el reporte: {self.path}")
+
+        checkpoints = np.frombuffer(self.index_rows, dtype=np.uint32)
+        with open(self.path, 'rb') as file:
+            reader = None
+            current = -1  # próxima fila que entregaría reader
+            for index in sorted(set(int(i) for i in indices)):
+                if not 0 <= index < self.n_rows:
+                    raise IndexError(f"Fila fuera de rango: {index}")
+                checkpoint = int(np.searchsorted(checkpoints, index, side='right')) - 1
+                start_row = int(checkpoints[checkpoint])
+                # Solo se vuelve a posicionar si la fila no está más adelante en el mismo tramo
+                if reader is None or not start_row <= current <= index:
+                    file.seek(self.index_offsets[checkpoint])
+                    reader = filter(None, csv.reader(text_lines(file, self.encoding)))
+                    current = start_row
+                row = next(islice(reader, index - current, None))
+                current = index + 1
+                yield index, as_row_dict(self.headers, row)
+
+    def failing_rows(self, rule: str, limit: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Filas que fallan la regla (las primeras limit si se indica), leídas del archivo."""
+        return self.read_rows(self.rows(rule)[:limit].tolist())
+
+    # Serialización -------------------------------------------------------
+
+    def _meta(self) -> Dict[str, Any]:
+        return {
+            'version': _VERSION,
+            'path': self.path,
+            'headers': self.headers,
+            'n_rows': self.n_rows,
+            'encoding': self.encoding,
+            'file_size': self.file_size,
+            'file_fingerprint': self.file_fingerprint,
+            'results': self.results,
+            'index_rows': _encode(self.index_rows, '<u4'),
+            'index_offsets': _encode(self.index_offsets, '<u8'),
+        }
+
+    @classmethod
+    def _from_meta(cls, meta: Dict[str, Any], failures: Dict[str, array]) -> 'ValidationReport':
+        if meta.get('version') != _VERSION:
+            raise ValueError(f"Versión de reporte no soportada: {meta.get('version')}")
+        report = cls.__new__(cls)
+        report.path = meta['path']
+        report.headers = meta['headers']
+        report.n_rows = meta['n_rows']
+        report.encoding = meta['encoding']
+        report.file_size = meta['file_size']
+        report.file_fingerprint = meta['file_fingerprint']
+        report.results = meta['results']
+        if 'headers' in report.results:
+            # JSON no distingue tuplas de listas: (bool, columnas faltantes)
+            report.results['headers'] = tuple(report.results['headers'])
+        report.failures = failures
+        report.index_rows = _decode(meta['index_rows'], '<u4', 'I')
+        report.index_offsets = _decode(meta['index_offsets'], '<u8', 'Q')
+        return report
+
+    def to_json(self, path: str) -> None:
+        """Guarda el reporte como JSON; las filas de cada regla van en base64 (uint32)."""
+        meta = self._meta()
+        meta['failures'] = {rule: _encode(rows, '<u4') for rule, rows in self.failures.items()}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(meta, file, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, path: str) -> 'ValidationReport':
+        """Carga un reporte guardado con to_json."""
+        with open(path, encoding='utf-8') as file:
+            meta = json.load(file)
+        failures = {rule: _decode(text, '<u4', 'I') for rule, text in meta.pop('failures').items()}
+        return cls._from_meta(meta, failures)
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Guarda el reporte como Parquet: columnas rule y row (una fila por falla)
+        y el resto del reporte en los metadatos del esquema.
+
+        Raises:
+            ImportError: Si pyarrow no está instalado
+        """
+        pa, pq = _pyarrow()
+
+        rules = list(self.failures)
+        counts = [len(self.failures[rule]) for rule in rules]
+        codes = np.repeat(np.arange(len(rules), dtype=np.int32), counts)
+        rows = np.concatenate([self.rows(rule) for rule in rules]) if rules else np.zeros(0, np.uint32)
+
+        table = pa.table({
+            'rule': pa.DictionaryArray.from_arrays(codes, pa.array(rules, pa.string())),
+            'row': pa.array(rows, pa.uint32()),
+        })
+        meta = dict(self._meta(), rules=rules)
+        table = table.replace_schema_metadata({'validation_report': json.dumps(meta, ensure_ascii=False)})
+        pq.write_table(table, path)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> 'ValidationReport':
+        """Carga un reporte guardado con to_parquet."""
+        _, pq = _pyarrow()
+
+        table = pq.read_table(path)
+        meta = json.loads(table.schema.metadata[b'validation_report'])
+        rules = meta.pop('rules')
+        # Cada tramo del archivo puede traer su propio diccionario de reglas
+        codes = np.concatenate([np.zeros(0, np.int64)] + [
+            np.array([rules.index(name) for name in chunk.dictionary.to_pylist()], dtype=np.int64)[
+                chunk.indices.to_numpy(zero_copy_only=False)
+            ]
+            for chunk in table.column('rule').chunks
+        ])
+        rows = table.column('row').to_numpy()
+        failures = {rule: _to_array(rows[codes == code], 'I') for code, rule in enumerate(rules)}
+        return cls._from_meta(meta, failures)
@@ -0,0 +1,635 @@
+"""
+Motor de reglas declarativo para validar datasets CSV.
+
+Un esquema (dict, JSON o YAML) declara las columnas del archivo y sus
+restricciones:
+
+    name: chicago_crimes
+    columns:
+      ID:        {unique: true, nullable: false}
+      Beat:      {type: int, range: [100, 2600]}
+      Arrest:    {enum: ['true', 'false']}
+      Latitude:  {type: float}
+      Longitude: {type: float}
+    checks:
+      - {name: coordinates, box: {Latitude: [41.6, 42.1], Longitude: [-87.95, -87.5]}}
+
+Claves de cada columna (todas opcionales):
+
+- type: 'str' (por defecto), 'int' o 'float'.
+- required: la columna debe estar en el encabezado (por defecto True).
+- nullable: False para que los vacíos cuenten como inválidos (por defecto
+  True: cuentan como faltantes).
+- unique: los valores no vacíos no se repiten.
+- range: [mínimo, máximo] cerrado para columnas numéricas (None = sin límite).
+- enum: valores permitidos para columnas de texto (se comparan sin espacios).
+
+Los checks combinan columnas; por ahora box, que exige que todas estén
+dentro de su rango (una fila es faltante si alguna está vacía).
+
+Schema.compile() convierte el esquema en reglas que se evalúan con los
+kernels vectorizados de src/kernels.py, y run_schema las evalúa a todas en
+una sola lectura del archivo: cada columna se extrae y cada columna numérica
+se parsea una sola vez por lote aunque la usen varias reglas. Cada regla
+cuenta filas válidas, inválidas y faltantes, y opcionalmente guarda los
+números de las filas inválidas para un ValidationReport.
+
+Las reglas y sus acumuladores se pueden serializar con pickle, así que
+también sirven para validate_batch y para la caché incremental.
+"""
+
+import json
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .columnar import (
+    INVALID, MISSING, ROWS_PER_BATCH, CsvBatchReader, NumericColumn, encode, range_mask
+)
+from .duplicates import DuplicateDetector
+from .report import INDEX_EVERY, ValidationReport
+from .streaming import Accumulator, extend_rows, offset_rows, run_accumulators
+
+COLUMN_TYPES = ('str', 'int', 'float')
+
+_COLUMN_KEYS = {'type', 'required', 'nullable', 'unique', 'range', 'enum'}
+_SCHEMA_KEYS = {'name', 'columns', 'checks'}
+
+
+class ColumnSpec:
+    """Restricciones declaradas para una columna."""
+
+    __slots__ = ('name', 'type', 'required', 'nullable', 'unique', 'range', 'enum')
+
+    def __init__(
+        self,
+        name: str,
+        type: str = 'str',
+        required: bool = True,
+        nullable: bool = True,
+        unique: bool = False,
+        range: Optional[Sequence[Optional[float]]] = None,
+        enum: Optional[Sequence[str]] = None,
+    ):
+        if type not in COLUMN_TYPES:
+            raise ValueError(f"Tipo no soportado para {name}: {type}")
+        if range is not None and type == 'str':
+            raise ValueError(f"range requiere una columna numérica: {name}")
+        if enum is not None and type != 'str':
+            raise ValueError(f"enum requiere una columna de texto: {name}")
+
+        self.name = name
+        self.type = type
+        self.required = bool(required)
+        self.nullable = bool(nullable)
+        self.unique = bool(unique)
+        self.range = _parse_range(name, range) if range is not None else None
+        self.enum = frozenset(enum) if enum is not None else None
+
+
+def _parse_range(name: str, bounds: Sequence[Optional[float]]) -> Tuple[float, float]:
+    """Convierte [mínimo, máximo] en una tupla cerrada; None es un extremo abierto."""
+    if len(bounds) != 2:
+        raise ValueError(f"El rango de {name} debe tener dos valores: {bounds}")
+    low = -math.inf if bounds[0] is None else bounds[0]
+    high = math.inf if bounds[1] is None else bounds[1]
+    if low > high:
+        raise ValueError(f"Rango vacío para {name}: {bounds}")
+    return low, high
+
+
+# Reglas compiladas ----------------------------------------------------------
+# Cada regla recibe un lote como en Accumulator.update (columnas de texto
+# como listas, columnas numéricas ya parseadas) y marca las filas inválidas
+# y las faltantes. Una columna que no está en el archivo deja todas las
+# filas como faltantes, igual que los conteos de src/columnar.py.
+
+class Rule:
+    """Regla compilada a partir de un esquema."""
+
+    def __init__(
+        self,
+        name: str,
+        text_columns: Sequence[str] = (),
+        numeric_kinds: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.text_columns = tuple(text_columns)
+        self.numeric_kinds = dict(numeric_kinds or {})
+
+    @property
+    def numeric_columns(self) -> Tuple[str, ...]:
+        return tuple(self.numeric_kinds)
+
+    def evaluate(
+        self, n_rows: int, text: Dict[str, List[str]], numeric: Dict[str, NumericColumn]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evalúa la regla sobre un lote.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Máscaras de filas inválidas y faltantes
+        """
+        raise NotImplementedError
+
+    def counts(self, n_rows: int, text: Dict[str, List[str]], numeric: Dict[str, NumericColumn]) -> Tuple[int, int]:
+        """Cantidad de filas inválidas y faltantes del lote."""
+        invalid, missing = self.evaluate(n_rows, text, numeric)
+        return int(np.count_nonzero(invalid)), int(np.count_nonzero(missing))
+
+    def invalid_mask(self, n_rows: int, text: Dict[str, List[str]], numeric: Dict[str, NumericColumn]) -> np.ndarray:
+        """Máscara de filas inválidas del lote (para FailingRowsAccumulator)."""
+        return self.evaluate(n_rows, text, numeric)[0]
+
+    def accumulator(self, track_rows: bool = False) -> Accumulator:
+        """Acumulador que cuenta (y con track_rows guarda) las filas que fallan la regla."""
+        return RuleAccumulator(self, track_rows)
+
+
+def _all_missing(n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.zeros(n_rows, dtype=bool), np.ones(n_rows, dtype=bool)
+
+
+class NumericRule(Rule):
+    """Columna numérica: inválida si no se puede convertir o queda fuera del rango."""
+
+    def __init__(self, spec: ColumnSpec):
+        super().__init__(spec.name, numeric_kinds={spec.name: spec.type})
+        self.column = spec.name
+        self.value_range = spec.range
+        self.nullable = spec.nullable
+
+    def evaluate(self, n_rows, text, numeric):
+        column = numeric.get(self.column)
+        if column is None:
+            return _all_missing(n_rows)
+
+        missing = column.status == MISSING
+        if self.value_range is None:
+            invalid = column.status == INVALID
+        else:
+            # Los vacíos y los no numéricos son NaN y nunca caen en el rango
+            invalid = ~missing & ~range_mask(column.values, self.value_range)
+        if not self.nullable:
+            return invalid | missing, np.zeros(n_rows, dtype=bool)
+        return invalid, missing
+
+
+class TextRule(Rule):
+    """Columna de texto: inválida si el valor, sin espacios, no está en enum (o está vacío y no es nullable)."""
+
+    def __init__(self, spec: ColumnSpec):
+        super().__init__(spec.name, text_columns=(spec.name,))
+        self.column = spec.name
+        self.allowed = spec.enum
+        self.nullable = spec.nullable
+
+    def _classify(self, values: Sequence[str]) -> Tuple[List[bool], List[bool]]:
+        """Clasifica cada valor distinto como (inválido, faltante)."""
+        invalid, missing = [], []
+        for value in values:
+            value = value.strip()
+            empty = not value
+            invalid.append((empty and not self.nullable)
+                           or (not empty and self.allowed is not None and value not in self.allowed))
+            missing.append(empty and self.nullable)
+        return invalid, missing
+
+    def evaluate(self, n_rows, text, numeric):
+        values = text.get(self.column)
+        if values is None:
+            return _all_missing(n_rows)
+        lookup: Dict[str, int] = {}
+        codes = encode(values, lookup)
+        invalid, missing = self._classify(list(lookup))
+        return np.array(invalid, dtype=bool)[codes], np.array(missing, dtype=bool)[codes]
+
+    def counts(self, n_rows, text, numeric):
+        values = text.get(self.column)
+        if values is None:
+            return 0, n_rows
+        # Solo se clasifican los valores distintos; Counter cuenta en C
+        counter = Counter(values)
+        invalid, missing = self._classify(list(counter))
+        frequencies = list(counter.values())
+        return (
+            sum(f for f, bad in zip(frequencies, invalid) if bad),
+            sum(f for f, empty in zip(frequencies, missing) if empty),
+        )
+
+
+class BoxRule(Rule):
+    """Varias columnas numéricas que deben caer juntas dentro de sus rangos (p. ej. LAT/LON)."""
+
+    def __init__(self, name: str, ranges: Dict[str, Tuple[float, float]], kinds: Dict[str, str]):
+        super().__init__(name, numeric_kinds={column: kinds.get(column, 'float') for column in ranges})
+        self.ranges = dict(ranges)
+
+    def evaluate(self, n_rows, text, numeric):
+        columns = [numeric.get(name) for name in self.ranges]
+        if any(column is None for column in columns):
+            return _all_missing(n_rows)
+
+        missing = np.zeros(n_rows, dtype=bool)
+        inside = np.ones(n_rows, dtype=bool)
+        for column, value_range in zip(columns, self.ranges.values()):
+            missing |= column.status == MISSING
+            inside &= range_mask(column.values, value_range)
+        return ~missing & ~inside, missing
+
+
+class UniqueRule(Rule):
+    """Valores no vacíos sin repetir, con el detector exacto de src/duplicates.py."""
+
+    def __init__(self, spec: ColumnSpec):
+        super().__init__(f"{spec.name}.unique", text_columns=(spec.name,))
+        self.column = spec.name
+
+    def evaluate(self, n_rows, text, numeric):
+        # Unicidad dentro del lote: cada repetición de un valor ya visto en el
+        # lote es inválida. Para todo el archivo (entre lotes) usar accumulator()
+        values = text.get(self.column)
+        if values is None:
+            return _all_missing(n_rows)
+        detector = DuplicateDetector('sorted', track_rows=True)
+        detector.add(values)
+        invalid = np.zeros(n_rows, dtype=bool)
+        for rows in detector.report()['duplicates'].values():
+            invalid[rows[1:]] = True
+        return invalid, np.array([not value for value in values], dtype=bool)
+
+    def accumulator(self, track_rows: bool = False) -> Accumulator:
+        return UniqueAccumulator(self, track_rows)
+
+
+# Acumuladores ---------------------------------------------------------------
+
+class RuleAccumulator(Accumulator):
+    """Conteo de filas válidas, inválidas y faltantes de una regla."""
+
+    def __init__(self, rule: Rule, track_rows: bool = False):
+        """
+        Args:
+            rule (Rule): Regla a evaluar
+            track_rows (bool): Guardar además los índices de las filas inválidas
+        """
+        self.rule = rule
+        self.text_columns = rule.text_columns
+        self.numeric_columns = rule.numeric_columns
+        self.n_rows = 0
+        self.invalid = 0
+        self.missing = 0
+        self.rows = array('I') if track_rows else None
+
+    def update(self, n_rows, text, numeric):
+        if self.rows is None:
+            invalid, missing = self.rule.counts(n_rows, text, numeric)
+        else:
+            invalid_mask, missing_mask = self.rule.evaluate(n_rows, text, numeric)
+            invalid_rows = np.flatnonzero(invalid_mask)
+            extend_rows(self.rows, invalid_rows + self.n_rows)
+            invalid, missing = len(invalid_rows), int(np.count_nonzero(missing_mask))
+        self.n_rows += n_rows
+        self.invalid += invalid
+        self.missing += missing
+
+    def merge(self, other):
+        if self.rows is not None:
+            extend_rows(self.rows, offset_rows(other.rows, self.n_rows))
+        self.n_rows += other.n_rows
+        self.invalid += other.invalid
+        self.missing += other.missing
+
+    def result(self) -> Dict[str, int]:
+        return {
+            'valid': self.n_rows - self.invalid - self.missing,
+            'invalid': self.invalid,
+            'missing': self.missing,
+        }
+
+    def failing_rows(self) -> array:
+        """Filas inválidas en orden (requiere track_rows)."""
+        if self.rows is None:
+            raise ValueError("El acumulador no guarda filas (track_rows=False)")
+        return self.rows
+
+
+class UniqueAccumulator(Accumulator):
+    """
+    Conteo de una regla de unicidad: la primera aparición de cada valor es
+    válida y cada repetición inválida; los vacíos son faltantes.
+    """
+
+    def __init__(self, rule: UniqueRule, track_rows: bool = False):
+        """
+        Args:
+            rule (UniqueRule): Regla a evaluar
+            track_rows (bool): Guardar las filas de cada valor repetido
+        """
+        self.rule = rule
+        self.text_columns = rule.text_columns
+        self.n_rows = 0
+        self.detector = DuplicateDetector('sorted', track_rows=track_rows)
+        self._report: Optional[Dict[str, Any]] = None
+
+    def update(self, n_rows, text, numeric):
+        values = text.get(self.rule.column)
+        if values is not None:
+            self.detector.add(values)
+        self.n_rows += n_rows
+        self._report = None
+
+    def merge(self, other):
+        # Un valor repetido entre tramos queda contiguo al ordenar la unión
+        self.detector.merge(other.detector)
+        self.n_rows += other.n_rows
+        self._report = None
+
+    def report(self) -> Dict[str, Any]:
+        """Reporte del detector (se calcula una vez por estado)."""
+        if self._report is None:
+            self._report = self.detector.report()
+        return self._report
+
+    def result(self) -> Dict[str, int]:
+        report = self.report()
+        return {
+            'valid': report['total_ids'] - report['duplicate_count'],
+            'invalid': report['duplicate_count'],
+            'missing': self.n_rows - report['total_ids'],
+        }
+
+    def failing_rows(self) -> array:
+        """Todas las filas de cada valor repetido, incluida la primera, en orden."""
+        duplicates = self.report()['duplicates']
+        if duplicates is None:
+            raise ValueError("El acumulador no guarda filas (track_rows=False)")
+        rows = np.sort(np.fromiter(
+            (row for rows in duplicates.values() for row in rows), dtype=np.int64
+        ))
+        failing = array('I')
+        extend_rows(failing, rows)
+        return failing
+
+
+# Esquemas -------------------------------------------------------------------
+
+class Schema:
+    """Esquema de un dataset: columnas con sus restricciones y checks entre columnas."""
+
+    def __init__(self, name: str, columns: Sequence[ColumnSpec], checks: Sequence[Dict[str, Any]] = ()):
+        self.name = name
+        self.columns: Dict[str, ColumnSpec] = {spec.name: spec for spec in columns}
+        self.checks = [dict(check) for check in checks]
+        # Se compila una vez para detectar errores del esquema al crearlo
+        self.compile()
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> 'Schema':
+        """
+        Crea un esquema a partir de su forma declarativa.
+
+        Args:
+            spec (Dict): name, columns (columna -> restricciones) y checks
+
+        Returns:
+            Schema: Esquema validado
+
+        Raises:
+            ValueError: Si el esquema tiene claves, tipos o rangos no válidos
+        """
+        unknown = set(spec) - _SCHEMA_KEYS
+        if unknown:
+            raise ValueError(f"Claves de esquema desconocidas: {sorted(unknown)}")
+
+        columns = []
+        for name, options in (spec.get('columns') or {}).items():
+            options = options or {}
+            unknown = set(options) - _COLUMN_KEYS
+            if unknown:
+                raise ValueError(f"Claves desconocidas en la columna {name}: {sorted(unknown)}")
+            columns.append(ColumnSpec(name, **options))
+        return cls(spec.get('name', ''), columns, spec.get('checks') or ())
+
+    @property
+    def required_columns(self) -> List[str]:
+        """Columnas que deben estar en el encabezado, en el orden declarado."""
+        return [name for name, spec in self.columns.items() if spec.required]
+
+    @property
+    def numeric_kinds(self) -> Dict[str, str]:
+        """Columna numérica -> 'int' o 'float', incluidas las de los checks."""
+        kinds = {name: spec.type for name, spec in self.columns.items() if spec.type != 'str'}
+        for rule in self.compile().values():
+            for name, kind in rule.numeric_kinds.items():
+                kinds.setdefault(name, kind)
+        return kinds
+
+    def check(self, name: str) -> Dict[str, Any]:
+        """Devuelve el check con ese nombre."""
+        for check in self.checks:
+            if check.get('name') == name:
+                return check
+        raise KeyError(name)
+
+    def compile(self, only: Optional[Sequence[str]] = None) -> Dict[str, Rule]:
+        """
+        Convierte el esquema en reglas.
+
+        Cada columna numérica da una regla de tipo y rango con su nombre,
+        cada columna de texto con enum o nullable=False una regla con su
+        nombre, cada columna unique una regla '<columna>.unique', y cada
+        check una regla con el nombre del check.
+
+        Args:
+            only (Sequence[str]): Nombres de las reglas a compilar (todas si es None)
+
+        Returns:
+            Dict[str, Rule]: Reglas por nombre, en el orden declarado
+
+        Raises:
+            ValueError: Si hay checks inválidos o nombres repetidos
+        """
+        kinds = {name: spec.type for name, spec in self.columns.items() if spec.type != 'str'}
+        rules: List[Rule] = []
+        for spec in self.columns.values():
+            if spec.type != 'str':
+                rules.append(NumericRule(spec))
+            elif spec.enum is not None or not spec.nullable:
+                rules.append(TextRule(spec))
+            if spec.unique:
+                rules.append(UniqueRule(spec))
+
+        for check in self.checks:
+            if set(check) != {'name', 'box'} or not check['box']:
+                raise ValueError(f"Check no soportado (se espera name y box): {check}")
+            ranges = {column: _parse_range(column, bounds) for column, bounds in check['box'].items()}
+            if any(column in self.columns and column not in kinds for column in ranges):
+                raise ValueError(f"El check {check['name']} usa columnas de texto")
+            rules.append(BoxRule(check['name'], ranges, kinds))
+
+        compiled: Dict[str, Rule] = {}
+        for rule in rules:
+            if rule.name in compiled:
+                raise ValueError(f"Regla repetida: {rule.name}")
+            compiled[rule.name] = rule
+
+        if only is None:
+            return compiled
+        missing = [name for name in only if name not in compiled]
+        if missing:
+            raise ValueError(f"Reglas inexistentes: {missing}")
+        return {name: compiled[name] for name in only}
+
+    def validate_headers(self, headers: Sequence[str]) -> Tuple[bool, List[str]]:
+        """Igual que CrimeDataValidator.validate_headers, con las columnas requeridas del esquema."""
+        missing = [column for column in self.required_columns if column not in headers]
+        return len(missing) == 0, missing
+
+
+def load_schema(source: Union[str, Dict[str, Any], Schema]) -> Schema:
+    """
+    Obtiene un esquema desde un dict, un archivo .json/.yaml/.yml o el nombre
+    de un esquema incorporado (ver BUILTIN_SCHEMAS).
+
+    Leer YAML requiere PyYAML.
+
+    Raises:
+        ValueError: Si el esquema no es válido o el nombre no existe
+        FileNotFoundError: Si el archivo no existe
+    """
+    if isinstance(source, Schema):
+        return source
+    if isinstance(source, dict):
+        return Schema.from_dict(source)
+    if source in BUILTIN_SCHEMAS:
+        return Schema.from_dict(BUILTIN_SCHEMAS[source])
+    if source.endswith(('.yaml', '.yml')):
+        import yaml
+        with open(source, encoding='utf-8') as file:
+            return Schema.from_dict(yaml.safe_load(file))
+    if source.endswith('.json'):
+        with open(source, encoding='utf-8') as file:
+            return Schema.from_dict(json.load(file))
+    raise ValueError(f"Esquema desconocido: {source}")
+
+
+def run_schema(
+    csv_file_path: str,
+    rules: Dict[str, Rule],
+    numeric_kinds: Dict[str, str],
+    rows_per_batch: int = ROWS_PER_BATCH,
+    track_rows: bool = False,
+    index_every: Optional[int] = None,
+) -> Tuple[Dict[str, Accumulator], CsvBatchReader]:
+    """
+    Evalúa todas las reglas en una sola lectura del archivo.
+
+    Args:
+        csv_file_path (str): Ruta al archivo CSV
+        rules (Dict[str, Rule]): Reglas compiladas por nombre
+        numeric_kinds (Dict[str, str]): Columna numérica -> 'int' o 'float'
+        rows_per_batch (int): Filas por lote
+        track_rows (bool): Guardar las filas inválidas de cada regla
+        index_every (int): Anotar posiciones del archivo (ver CsvBatchReader)
+
+    Returns:
+        Tuple: Acumulador de cada regla y el lector usado
+    """
+    accumulators = {name: rule.accumulator(track_rows) for name, rule in rules.items()}
+    reader = run_accumulators(
+        csv_file_path, accumulators, numeric_kinds, rows_per_batch, index_every=index_every
+    )
+    return accumulators, reader
+
+
+def validate_file(
+    csv_file_path: str,
+    schema: Union[str, Dict[str, Any], Schema],
+    rows_per_batch: int = ROWS_PER_BATCH,
+) -> Dict[str, Any]:
+    """
+    Valida un CSV contra un esquema en una sola lectura.
+
+    Args:
+        csv_file_path (str): Ruta al archivo CSV
+        schema: Esquema, dict, archivo o nombre de esquema incorporado
+        rows_per_batch (int): Filas por lote
+
+    Returns:
+        Dict: schema (nombre), headers (como validate_headers), total_rows y
+        rules (regla -> valid, invalid y missing)
+    """
+    schema = load_schema(schema)
+    accumulators, reader = run_schema(
+        csv_file_path, schema.compile(), schema.numeric_kinds, rows_per_batch
+    )
+    return {
+        'schema': schema.name,
+        'headers': schema.validate_headers(reader.headers),
+        'total_rows': reader.n_rows,
+        'rules': {name: accumulator.result() for name, accumulator in accumulators.items()},
+    }
+
+
+def build_schema_report(
+    csv_file_path: str,
+    schema: Union[str, Dict[str, Any], Schema],
+    rows_per_batch: int = ROWS_PER_BATCH,
+    index_every: int = INDEX_EVERY,
+) -> ValidationReport:
+    """
+    Como validate_file, pero devuelve un ValidationReport con las filas
+    inválidas de cada regla (para unique, todas las filas de cada valor
+    repetido).
+    """
+    schema = load_schema(schema)
+    accumulators, reader = run_schema(
+        csv_file_path, schema.compile(), schema.numeric_kinds, rows_per_batch,
+        track_rows=True, index_every=index_every
+    )
+    results = {
+        'schema': schema.name,
+        'headers': schema.validate_headers(reader.headers),
+        'total_rows': reader.n_rows,
+        'rules': {name: accumulator.result() for name, accumulator in accumulators.items()},
+    }
+    failures = {name: accumulator.failing_rows() for name, accumulator in accumulators.items()}
+    return ValidationReport(
+        csv_file_path, reader.headers, reader.n_rows, results, failures,
+        reader.index_rows, reader.index_offsets, reader.encoding
+    )
+
+
+# Esquemas incorporados ------------------------------------------------------
+
+LA_CRIMES: Dict[str, Any] = {
+    'name': 'la_crimes',
+    'columns': {
+        'DR_NO': {'unique': True},
+        'Date Rptd': {},
+        'DATE OCC': {},
+        'TIME OCC': {},
+        'AREA': {},
+        'AREA NAME': {},
+        'Crm Cd': {},
+        'Crm Cd Desc': {},
+        'Vict Age': {'type': 'int', 'range': [0, 120]},
+        # M, F, X (desconocido), o vacío
+        'Vict Sex': {'enum': ['M', 'F', 'X', '']},
+        'Status': {'enum': ['IC', 'CC', 'AO', 'JO']},
+        'LAT': {'type': 'float'},
+        'LON': {'type': 'float'},
+    },
+    'checks': [
+        # Área de Los Angeles
+        {'name': 'coordinates', 'box': {'LAT': [33, 35], 'LON': [-119, -117]}},
+    ],
+}
+
+BUILTIN_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'la_crimes': LA_CRIMES,
+}
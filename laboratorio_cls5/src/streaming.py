@@ -0,0 +1,205 @@
+"""
+Validación en streaming para el dataset de crímenes.
+
+Lee el CSV una sola vez, por lotes de tamaño fijo, y alimenta con cada lote
+a todos los validadores mediante acumuladores incrementales. La memoria pico
+queda acotada por un lote, salvo los DR_NO vistos, que son inevitables para
+verificar unicidad de forma exacta (se guardan como int64, ver
+src/duplicates.py).
+
+Los acumuladores de las reglas salen del esquema del dataset (ver
+src/schema.py) y dan los mismos resultados que los métodos validate_* de
+CrimeDataValidator. Los acumuladores de distintos tramos del archivo (o de
+distintos archivos) se combinan con merge(), lo que permite repartir el
+trabajo entre procesos (ver src/batch.py).
+
+FailingRowsAccumulator no cuenta sino que guarda qué filas no cumplen una
+regla, para armar un ValidationReport (ver src/report.py).
+"""
+
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .columnar import VALID, NumericColumn, ROWS_PER_BATCH, CsvBatchReader, parse_values
+
+
+class Accumulator:
+    """Acumula el resultado de una regla lote a lote."""
+
+    # Columnas de texto y numéricas que necesita la regla
+    text_columns: Tuple[str, ...] = ()
+    numeric_columns: Tuple[str, ...] = ()
+
+    def update(self, n_rows: int, text: Dict[str, List[str]], numeric: Dict[str, NumericColumn]) -> None:
+        """
+        Incorpora un lote.
+
+        Args:
+            n_rows (int): Filas del lote
+            text (Dict[str, List[str]]): Columnas de texto presentes en el archivo
+            numeric (Dict[str, NumericColumn]): Columnas numéricas ya parseadas
+        """
+        raise NotImplementedError
+
+    def merge(self, other: 'Accumulator') -> None:
+        """
+        Incorpora el estado de otro acumulador del mismo tipo, alimentado con
+        filas distintas (otro tramo u otro archivo).
+
+        Args:
+            other (Accumulator): Acumulador a combinar
+        """
+        raise NotImplementedError
+
+    def result(self) -> Any:
+        """Devuelve el resultado con el mismo formato que el método validate_* equivalente."""
+        raise NotImplementedError
+
+
+class RowCountAccumulator(Accumulator):
+    """Total de filas (para get_basic_stats)."""
+
+    def __init__(self):
+        self.total = 0
+
+    def update(self, n_rows, text, numeric):
+        self.total += n_rows
+
+    def merge(self, other):
+        self.total += other.total
+
+    def result(self) -> int:
+        return self.total
+
+
+class NumericRangeAccumulator(Accumulator):
+    """Mínimo y máximo de los valores numéricos válidos de cada columna."""
+
+    def __init__(self, columns: Sequence[str]):
+        self.numeric_columns = tuple(columns)
+        self.minimum: Dict[str, float] = {}
+        self.maximum: Dict[str, float] = {}
+
+    def _include(self, name: str, low: float, high: float) -> None:
+        self.minimum[name] = min(low, self.minimum.get(name, low))
+        self.maximum[name] = max(high, self.maximum.get(name, high))
+
+    def update(self, n_rows, text, numeric):
+        for name in self.numeric_columns:
+            column = numeric.get(name)
+            if column is None:
+                continue
+            values = column.values[column.status == VALID]
+            values = values[~np.isnan(values)]
+            if len(values):
+                self._include(name, float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        for name in other.minimum:
+            self._include(name, other.minimum[name], other.maximum[name])
+
+    def result(self) -> Dict[str, Optional[Dict[str, float]]]:
+        return {
+            name: {'min': self.minimum[name], 'max': self.maximum[name]} if name in self.minimum else None
+            for name in self.numeric_columns
+        }
+
+
+def extend_rows(rows: array, indices: np.ndarray) -> None:
+    """Agrega índices de fila ordenados a un array('I')."""
+    if len(indices) and indices[-1] > np.iinfo(np.uint32).max:
+        raise OverflowError("Demasiadas filas para índices de 32 bits")
+    rows.frombytes(indices.astype(np.uint32).tobytes())
+
+
+def offset_rows(rows: array, offset: int) -> np.ndarray:
+    """Índices de rows desplazados en offset (para combinar tramos con merge)."""
+    return np.frombuffer(rows, dtype=np.uint32).astype(np.int64) + offset
+
+
+class FailingRowsAccumulator(Accumulator):
+    """
+    Índices (desde 0) de las filas en las que mask devuelve True, guardados
+    como array('I'): 4 bytes por fila marcada, hasta 2**32 - 1 filas.
+    """
+
+    def __init__(
+        self,
+        mask: Callable[[int, Dict[str, List[str]], Dict[str, NumericColumn]], np.ndarray],
+        text_columns: Sequence[str] = (),
+        numeric_columns: Sequence[str] = (),
+    ):
+        """
+        Args:
+            mask (Callable): Recibe (n_rows, text, numeric) de un lote y
+                devuelve una máscara booleana por fila
+            text_columns (Sequence[str]): Columnas de texto que usa mask
+            numeric_columns (Sequence[str]): Columnas numéricas que usa mask
+        """
+        self.mask = mask
+        self.text_columns = tuple(text_columns)
+        self.numeric_columns = tuple(numeric_columns)
+        self.n_rows = 0
+        self.rows = array('I')
+
+    def update(self, n_rows, text, numeric):
+        extend_rows(self.rows, np.flatnonzero(self.mask(n_rows, text, numeric)) + self.n_rows)
+        self.n_rows += n_rows
+
+    def merge(self, other):
+        # Las filas del otro acumulador vienen después de las propias
+        extend_rows(self.rows, offset_rows(other.rows, self.n_rows))
+        self.n_rows += other.n_rows
+
+    def result(self) -> array:
+        return self.rows
+
+
+def run_accumulators(
+    csv_file_path: str,
+    accumulators: Dict[str, Accumulator],
+    numeric_kinds: Dict[str, str],
+    rows_per_batch: int = ROWS_PER_BATCH,
+    byte_range: Optional[Tuple[int, int]] = None,
+    headers: Optional[List[str]] = None,
+    index_every: Optional[int] = None,
+) -> CsvBatchReader:
+    """
+    Recorre el archivo una vez alimentando a todos los acumuladores.
+
+    Cada columna numérica se parsea una sola vez por lote aunque la usen
+    varios acumuladores.
+
+    Args:
+        csv_file_path (str): Ruta al archivo CSV
+        accumulators (Dict[str, Accumulator]): Acumuladores por nombre
+        numeric_kinds (Dict[str, str]): Columna numérica -> 'float' o 'int'
+        rows_per_batch (int): Filas por lote
+        byte_range (Tuple[int, int]): Tramo del archivo a leer (ver CsvBatchReader)
+        headers (List[str]): Encabezado del archivo, obligatorio con byte_range
+        index_every (int): Anotar la posición de cada tantas filas (ver CsvBatchReader)
+
+    Returns:
+        CsvBatchReader: El lector usado, con headers y first_row ya leídos
+    """
+    text_columns = {c for acc in accumulators.values() for c in acc.text_columns}
+    numeric_columns = {c for acc in accumulators.values() for c in acc.numeric_columns}
+    columns = sorted(text_columns | numeric_columns)
+
+    reader = CsvBatchReader(
+        csv_file_path, columns, rows_per_batch, byte_range=byte_range, headers=headers,
+        index_every=index_every
+    )
+
+    for n_rows, batch in reader:
+        text = {name: batch[name] for name in text_columns if name in batch}
+        numeric = {
+            name: parse_values(batch[name], numeric_kinds[name])
+            for name in numeric_columns if name in batch
+        }
+        for accumulator in accumulators.values():
+            accumulator.update(n_rows, text, numeric)
+
+    return reader
@@ -1,8 +1,61 @@
 """
 Módulo de utilidades para procesamiento de texto.
 Contiene funciones para validación, limpieza y análisis básico de cadenas.
+
+Cada función tiene una variante por lotes (clean_text_batch,
+count_words_batch, is_valid_email_batch) que recibe una columna entera:
+lista, arreglo NumPy, Series de pandas o arreglo de Arrow. En lugar de
+lanzar TypeError marca en errors los elementos que no son cadenas y da el
+mismo resultado que la función escalar para el resto.
+
+Los arreglos de Arrow y las Series respaldadas por Arrow (el tipo 'str' de
+pandas con pyarrow instalado) se procesan con los kernels de
+pyarrow.compute, usando el mismo conjunto de espacios que str.strip() y
+str.split(); solo lower() de textos fuera del alfabeto latino se resuelve
+con Python. Las demás entradas se recorren con map sobre los métodos de
+str, sin una llamada ni un isinstance por elemento.
+
+is_valid_email usa un EmailValidator precompilado con dos modos: 'fast'
+(las reglas básicas, sin espacios en medio) y 'strict' (un subconjunto de
+RFC 5322). validate_many valida columnas con una caché LRU para las
+direcciones repetidas.
+
+count_words_stream y word_frequencies cuentan palabras de un archivo o de un
+iterador de trozos con memoria constante, igual que count_words sobre el
+texto completo aunque una palabra quede partida entre dos trozos.
 """
 
+import codecs
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+# Caracteres que str.strip() y str.split() consideran espacios (ninguno
+# está por encima de U+3000)
+_WHITESPACE = ''.join(chr(code) for code in range(0x3001) if chr(code).isspace())
+
+# Expresión RE2 del modo 'fast' de EmailValidator para pyarrow.compute; el
+# email se evalúa ya sin espacios en los extremos (RE2 no tiene un \s
+# equivalente al de Python, por eso la clase explícita)
+_RE2_SPACES = ''.join(f'\\x{{{ord(c):x}}}' for c in _WHITESPACE)
+_EMAIL_PATTERN = rf'^[^@{_RE2_SPACES}]+@[^@.{_RE2_SPACES}]*\.[^@{_RE2_SPACES}]*$'
+
+# utf8_lower de Arrow coincide con str.lower() en Latin-1 y Latin extendido
+# A/B salvo 'İ'; los textos con otros caracteres se bajan con Python
+_LOWER_FALLBACK = r'[^\x{0}-\x{12f}\x{131}-\x{24f}]'
+
+class BatchResult(NamedTuple):
+    """Resultado de una función por lotes."""
+
+    # Resultado por elemento (None, 0 o False donde hay error)
+    values: Any
+    # True donde el elemento no es una cadena (la función escalar lanzaría TypeError)
+    errors: np.ndarray
+
 def clean_text(text: str) -> str:
     """
     Limpia un texto eliminando espacios extra y convirtiendo a minúsculas.
@@ -42,40 +95,382 @@ def count_words(text: str) -> int:
     
     return len(text.split())
 
-def is_valid_email(email: str) -> bool:
+def is_valid_email(email: str, mode: str = 'fast') -> bool:
     """
     Valida si una cadena tiene formato básico de email.
     
     Args:
         email (str): Email a validar
+        mode (str): 'fast' (una '@', parte local y dominio con un punto, sin
+            espacios) o 'strict' (subconjunto de RFC 5322, ver EmailValidator)
         
     Returns:
         bool: True si es válido, False en caso contrario
         
     Raises:
         TypeError: Si el input no es una cadena
+        ValueError: Si el modo no existe
     """
+    if mode != 'fast':
+        return _validator(mode)(email)
     if not isinstance(email, str):
         raise TypeError("El parámetro debe ser una cadena de texto")
+    return _fast_email(email)
+
+
+# Variantes por lotes ---------------------------------------------------------
+
+def _module(values: Any) -> str:
+    return type(values).__module__.split('.')[0]
+
+def _arrow_strings(values: Any) -> Optional[Any]:
+    """
+    Devuelve values como pyarrow.Array de cadenas si es un arreglo de Arrow
+    o una Series respaldada por Arrow; None para cualquier otra entrada.
+    """
+    module = _module(values)
+    if module == 'pandas' and getattr(values.dtype, 'storage', None) == 'pyarrow':
+        import pyarrow as pa
+        values = pa.array(values.array)
+    elif module != 'pyarrow':
+        return None
+
+    import pyarrow as pa
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        return None
+    return values
+
+def _python_strings(values: Any) -> Tuple[List[str], np.ndarray]:
+    """
+    Convierte values en una lista de cadenas y la máscara de elementos que
+    no lo son (reemplazados por '' para poder aplicarles los métodos de str).
+    """
+    if isinstance(values, np.ndarray) or _module(values) == 'pandas':
+        values = values.tolist()
+    elif _module(values) == 'pyarrow':
+        values = values.to_pylist()
+    else:
+        values = list(values)
+
+    if set(map(type, values)) <= {str}:
+        return values, np.zeros(len(values), dtype=bool)
+    errors = np.fromiter((not isinstance(v, str) for v in values), bool, len(values))
+    return [v if isinstance(v, str) else '' for v in values], errors
+
+def _arrow_errors(array: Any) -> np.ndarray:
+    return array.is_null().to_numpy(zero_copy_only=False)
+
+def _like_input(values: Any, result: Any) -> Any:
+    """Envuelve un resultado de Arrow en una Series si la entrada era una Series."""
+    if _module(values) != 'pandas':
+        return result
+    series = result.to_pandas()
+    series.index = values.index
+    series.name = values.name
+    return series
+
+def clean_text_batch(values: Any) -> BatchResult:
+    """
+    clean_text para una columna entera.
+    
+    Args:
+        values: Lista, arreglo NumPy, Series de pandas o arreglo de Arrow
+        
+    Returns:
+        BatchResult: values con los textos limpios (arreglo de Arrow o Series
+        para esas entradas, arreglo NumPy de objetos para el resto; nulo o
+        None donde hay error) y la máscara errors
+    """
+    array = _arrow_strings(values)
+    if array is not None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        trimmed = pc.utf8_trim(array, characters=_WHITESPACE)
+        cleaned = pc.utf8_lower(trimmed)
+        fallback = pc.match_substring_regex(trimmed, _LOWER_FALLBACK).fill_null(False)
+        rows = np.flatnonzero(fallback.to_numpy(zero_copy_only=False))
+        if len(rows):
+            lowered = [text.lower() for text in trimmed.take(rows).to_pylist()]
+            cleaned = pc.replace_with_mask(cleaned, fallback, pa.array(lowered, type=cleaned.type))
+        return BatchResult(_like_input(values, cleaned), _arrow_errors(array))
+    
+    texts, errors = _python_strings(values)
+    cleaned = np.empty(len(texts), dtype=object)
+    cleaned[:] = list(map(str.lower, map(str.strip, texts)))
+    cleaned[errors] = None
+    return BatchResult(cleaned, errors)
+
+def count_words_batch(values: Any) -> BatchResult:
+    """
+    count_words para una columna entera.
     
+    Args:
+        values: Lista, arreglo NumPy, Series de pandas o arreglo de Arrow
+        
+    Returns:
+        BatchResult: values con la cantidad de palabras (int64, 0 donde hay
+        error) y la máscara errors
+    """
+    array = _arrow_strings(values)
+    if array is not None:
+        import pyarrow.compute as pc
+        
+        # utf8_split_whitespace usa los mismos espacios que str.split(), pero
+        # deja un '' por cada extremo con espacios: se cuenta sobre el texto recortado
+        trimmed = pc.utf8_trim(array, characters=_WHITESPACE)
+        words = pc.list_value_length(pc.utf8_split_whitespace(trimmed))
+        counts = pc.if_else(pc.equal(pc.binary_length(trimmed), 0), 0, words).fill_null(0)
+        return BatchResult(counts.to_numpy(zero_copy_only=False).astype(np.int64), _arrow_errors(array))
+    
+    texts, errors = _python_strings(values)
+    counts = np.fromiter(map(len, map(str.split, texts)), np.int64, len(texts))
+    counts[errors] = 0
+    return BatchResult(counts, errors)
+
+# Validador de emails ---------------------------------------------------------
+
+_ATEXT = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]"
+_LABEL = r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+
+# Expresiones para fullmatch; los espacios de los extremos se aceptan, como
+# hace strip()
+EMAIL_PATTERNS = {
+    # Una '@', parte local y dominio no vacíos, un punto en el dominio y
+    # ningún espacio en medio
+    'fast': r'\s*[^@\s]+@[^@\s.]*\.[^@\s]*\s*',
+    # Subconjunto de RFC 5322: parte local dot-atom de hasta 64 caracteres,
+    # dominio de etiquetas de hasta 63 (letras, dígitos y '-' interiores) con
+    # TLD alfabético y hasta 254 caracteres en total. Sin partes locales entre
+    # comillas, comentarios ni literales IP
+    'strict': (rf'\s*(?=\S{{3,254}}\s*\Z)(?=[^@]{{1,64}}@)'
+               rf'{_ATEXT}+(?:\.{_ATEXT}+)*@(?:{_LABEL}\.)+[A-Za-z]{{2,63}}\s*'),
+}
+
+_SPACE = re.compile(r'\s').search
+
+def _fast_email(email: str) -> bool:
+    """
+    Modo 'fast' sin expresión regular: equivale a EMAIL_PATTERNS['fast'] y
+    con el re de CPython es más rápido así. Todo espacio distinto de ' '
+    es no imprimible, por eso la búsqueda de \\s queda solo para textos con
+    caracteres no imprimibles.
+    """
     email = email.strip()
+    local, _, domain = email.partition('@')
+    return (local != '' and '.' in domain and '@' not in domain
+            and (email.isprintable() and ' ' not in email or _SPACE(email) is None))
+
+class EmailValidator:
+    """
+    Validador de emails con la regla de su modo ya preparada: la expresión
+    compilada del modo 'strict' o la comprobación sin listas del modo 'fast'.
+    
+    validate_many valida una columna entera y guarda el resultado de cada
+    dirección en una caché LRU que se conserva entre llamadas, así en
+    columnas con muchas direcciones repetidas cada una se evalúa una vez.
+    """
+    
+    def __init__(self, mode: str = 'fast', cache_size: Optional[int] = 65536):
+        """
+        Args:
+            mode (str): Clave de EMAIL_PATTERNS ('fast' o 'strict')
+            cache_size (int): Direcciones en la caché de validate_many
+                (None: sin límite, 0: sin caché)
+            
+        Raises:
+            ValueError: Si el modo no existe
+        """
+        if mode not in EMAIL_PATTERNS:
+            raise ValueError(f"Modo de email desconocido: {mode!r} (use {', '.join(EMAIL_PATTERNS)})")
+        self.mode = mode
+        self.cache_size = cache_size
+        if mode == 'fast':
+            self._check = _fast_email
+        else:
+            fullmatch = re.compile(EMAIL_PATTERNS[mode]).fullmatch
+            self._check = lambda email: fullmatch(email) is not None
+        self._cached = lru_cache(maxsize=cache_size)(self._check) if cache_size != 0 else self._check
     
-    # Validación básica: debe contener @ y al menos un punto después del @
-    if '@' not in email:
-        return False
+    def __reduce__(self):
+        # La caché no viaja al serializar (procesos de validate_batch)
+        return (EmailValidator, (self.mode, self.cache_size))
     
-    parts = email.split('@')
-    if len(parts) != 2:
-        return False
+    def __call__(self, email: str) -> bool:
+        """
+        Valida un email.
+        
+        Raises:
+            TypeError: Si el input no es una cadena
+        """
+        if not isinstance(email, str):
+            raise TypeError("El parámetro debe ser una cadena de texto")
+        return self._check(email)
+    
+    def validate_many(self, values: Any) -> BatchResult:
+        """
+        Valida una columna de direcciones pasando por la caché LRU.
+        
+        Args:
+            values: Lista, arreglo NumPy, Series de pandas o arreglo de Arrow
+            
+        Returns:
+            BatchResult: values con la máscara de emails válidos (False donde
+            hay error) y la máscara errors de elementos que no son cadenas
+        """
+        texts, errors = _python_strings(values)
+        valid = np.fromiter(map(self._cached, texts), bool, len(texts))
+        valid[errors] = False
+        return BatchResult(valid, errors)
+    
+    def cache_info(self):
+        """Aciertos, fallos y tamaño de la caché (functools.lru_cache)."""
+        return self._cached.cache_info() if self.cache_size != 0 else None
+    
+    def cache_clear(self) -> None:
+        if self.cache_size != 0:
+            self._cached.cache_clear()
+
+# Un validador por modo, compartido por is_valid_email e is_valid_email_batch
+_VALIDATORS = {}
+
+def _validator(mode: str) -> EmailValidator:
+    validator = _VALIDATORS.get(mode)
+    if validator is None:
+        validator = _VALIDATORS[mode] = EmailValidator(mode)
+    return validator
+
+def is_valid_email_batch(values: Any, mode: str = 'fast') -> BatchResult:
+    """
+    is_valid_email para una columna entera.
+    
+    Args:
+        values: Lista, arreglo NumPy, Series de pandas o arreglo de Arrow
+        mode (str): 'fast' o 'strict', como en is_valid_email
+        
+    Returns:
+        BatchResult: values con la máscara de emails válidos (False donde hay
+        error) y la máscara errors
+    """
+    validator = _validator(mode)
+    array = _arrow_strings(values) if mode == 'fast' else None
+    if array is not None:
+        import pyarrow.compute as pc
+        
+        trimmed = pc.utf8_trim(array, characters=_WHITESPACE)
+        valid = pc.match_substring_regex(trimmed, _EMAIL_PATTERN).fill_null(False)
+        return BatchResult(valid.to_numpy(zero_copy_only=False), _arrow_errors(array))
+    
+    # RE2 no admite las anticipaciones del modo estricto: ese modo y las
+    # demás entradas pasan por la caché del validador
+    return validator.validate_many(values)
+
+
+# Conteo de palabras por trozos ------------------------------------------------
+
+# Tamaño de los trozos leídos de un archivo, en caracteres
+CHUNK_CHARS = 1 << 16
+
+# True en los códigos de espacio; todo código mayor cae en la última entrada (False)
+_SPACE_TABLE = np.zeros(0x3002, dtype=bool)
+_SPACE_TABLE[[ord(c) for c in _WHITESPACE]] = True
+
+def _text_chunks(source: Any, chunk_size: int, encoding: str) -> Iterator[str]:
+    """
+    Trozos de texto de source: ruta (str u os.PathLike), archivo abierto en
+    modo texto o binario, o iterable de trozos str o bytes. Los bytes se
+    decodifican de forma incremental, así un carácter multibyte puede quedar
+    partido entre dos trozos.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from _text_chunks(file, chunk_size, encoding)
+        return
     
-    local, domain = parts
+    if hasattr(source, 'read'):
+        chunks: Iterable = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
     
-    # El local y dominio no pueden estar vacíos
-    if not local or not domain:
-        return False
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        elif not isinstance(chunk, str):
+            raise TypeError("Los trozos deben ser str o bytes")
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+def _count_chunk(chunk: str, after_space: bool) -> Tuple[int, bool]:
+    """
+    Palabras que empiezan en chunk (un no espacio precedido de un espacio,
+    o del inicio si after_space) y si chunk termina dentro de una palabra.
+    """
+    codes = np.frombuffer(chunk.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    space = np.empty(len(codes) + 1, dtype=bool)
+    space[0] = after_space
+    space[1:] = _SPACE_TABLE[np.minimum(codes, len(_SPACE_TABLE) - 1)]
+    return int(np.count_nonzero(space[:-1] > space[1:])), not space[-1]
+
+def count_words_stream(source: Any, chunk_size: int = CHUNK_CHARS, encoding: str = 'utf-8') -> int:
+    """
+    count_words para un texto que llega por trozos, sin armar listas de
+    palabras: cuenta los inicios de palabra de cada trozo con NumPy.
     
-    # El dominio debe tener al menos un punto
-    if '.' not in domain:
-        return False
+    Args:
+        source: Ruta del archivo, archivo abierto (texto o binario) o
+            iterable de trozos str o bytes
+        chunk_size (int): Caracteres (o bytes) leídos por vez de un archivo
+        encoding (str): Codificación de los archivos binarios y trozos bytes
+        
+    Returns:
+        int: Número de palabras, igual a count_words del texto completo
+        
+    Raises:
+        TypeError: Si algún trozo no es str ni bytes
+    """
+    total = 0
+    after_space = True
+    for chunk in _text_chunks(source, chunk_size, encoding):
+        words, in_word = _count_chunk(chunk, after_space)
+        total += words
+        after_space = not in_word
+    return total
+
+def word_frequencies(source: Any, top_k: Optional[int] = None, chunk_size: int = CHUNK_CHARS,
+                     encoding: str = 'utf-8') -> Union[Counter, List[Tuple[str, int]]]:
+    """
+    Frecuencia de cada palabra (separadas como en str.split()) de un texto
+    que llega por trozos. La palabra partida al final de un trozo se
+    completa con el siguiente; la memoria crece con el vocabulario, no con
+    el tamaño del texto.
     
-    return True
\ No newline at end of file
+    Args:
+        source: Ruta del archivo, archivo abierto (texto o binario) o
+            iterable de trozos str o bytes
+        top_k (int): Si se indica, solo las top_k palabras más frecuentes
+        chunk_size (int): Caracteres (o bytes) leídos por vez de un archivo
+        encoding (str): Codificación de los archivos binarios y trozos bytes
+        
+    Returns:
+        Counter con todas las palabras, o la lista de (palabra, frecuencia)
+        de las top_k más frecuentes (Counter.most_common, con un heap)
+    """
+    frequencies = Counter()
+    carry = ''
+    for chunk in _text_chunks(source, chunk_size, encoding):
+        text = carry + chunk if carry else chunk
+        words = text.split()
+        carry = words.pop() if words and not text[-1].isspace() else ''
+        frequencies.update(words)
+    if carry:
+        frequencies[carry] += 1
+    return frequencies if top_k is None else frequencies.most_common(top_k)
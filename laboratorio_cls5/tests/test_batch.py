@@ -0,0 +1,123 @@
+"""
+Pruebas para la validación en paralelo de varios archivos.
+"""
+
+import csv
+import os
+
+import pytest
+from benchmarks.sintetico import generar_csv
+from src import batch as batch_module
+from src.batch import expand_files, split_file
+from src.csv_validator import CrimeDataValidator
+
+STREAMING_KEYS = ('dr_no_unique', 'coordinates', 'victim_age', 'sex_values')
+
+
+class TestSplitFile:
+    """Pruebas para la división en tramos de bytes"""
+
+    def test_ranges_cover_the_file_on_row_boundaries(self, tmp_path):
+        """Los tramos son contiguos, cubren los datos y terminan en fin de fila"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 500)
+        headers, ranges = split_file(path, chunk_bytes=4096)
+        content = open(path, 'rb').read()
+
+        assert headers[0] == 'DR_NO'
+        assert len(ranges) > 5
+        assert ranges[0][0] == content.index(b'\n') + 1
+        assert ranges[-1][1] == len(content)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and content[end - 1:end] == b'\n'
+
+    def test_single_range_without_chunk_size(self, tmp_path):
+        """Con chunk_bytes=None hay un solo tramo"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 50)
+        assert len(split_file(path, chunk_bytes=None)[1]) == 1
+
+    def test_expand_glob_and_missing_file(self, tmp_path):
+        """Prueba patrones glob ordenados y rutas inexistentes"""
+        for name in ("2024-02.csv", "2024-01.csv"):
+            (tmp_path / name).write_text("DR_NO\n1\n", encoding='utf-8')
+
+        assert expand_files(str(tmp_path / "*.csv")) == [
+            str(tmp_path / "2024-01.csv"), str(tmp_path / "2024-02.csv")
+        ]
+        with pytest.raises(FileNotFoundError):
+            expand_files(str(tmp_path / "*.parquet"))
+
+
+class TestValidateBatch:
+    """validate_batch debe coincidir con validar cada archivo por separado"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_same_results_as_streaming(self, tmp_path, workers):
+        """Un archivo en muchos tramos da lo mismo que validate_streaming"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 3000, duplicados=2)
+
+        batch = CrimeDataValidator.validate_batch(path, workers=workers, chunk_bytes=16_384)
+        streaming = CrimeDataValidator(path).validate_streaming()
+
+        assert {key: batch[key] for key in STREAMING_KEYS} == {key: streaming[key] for key in STREAMING_KEYS}
+        assert batch['files'][0]['basic_stats'] == streaming['basic_stats']
+        assert batch['files'][0]['headers'] == streaming['headers']
+        assert batch['files'][0]['chunks'] > 1
+        assert batch['total_rows'] == 3000
+
+    def test_no_chunk_size_uses_default(self, tmp_path, monkeypatch):
+        """Con chunk_bytes=None el archivo se corta igual en tramos de CHUNK_BYTES"""
+        monkeypatch.setattr(batch_module, 'CHUNK_BYTES', 16_384)
+        path = generar_csv(str(tmp_path / "crimes.csv"), 3000)
+
+        batch = CrimeDataValidator.validate_batch(path, workers=1, chunk_bytes=None)
+
+        assert batch['files'][0]['chunks'] > 1
+        assert batch['total_rows'] == 3000
+
+    def test_duplicate_across_chunks(self, tmp_path):
+        """Un DR_NO repetido en el primer y el último tramo se detecta"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 2000)
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        rows[-1][0] = rows[1][0]
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+        _, ranges = split_file(path, chunk_bytes=16_384)
+        assert len(ranges) > 2
+        assert CrimeDataValidator.validate_batch(path, workers=2, chunk_bytes=16_384)['dr_no_unique'] == False
+
+    @pytest.mark.parametrize("same_ids", [False, True])
+    def test_multiple_files(self, tmp_path, same_ids):
+        """Los conteos se suman y la unicidad de DR_NO abarca todos los archivos"""
+        january = generar_csv(str(tmp_path / "2024-01.csv"), 1000, semilla=1)
+        february = generar_csv(str(tmp_path / "2024-02.csv"), 500, semilla=2,
+                               dr_no_inicial=200_100_000 if same_ids else 300_000_000)
+
+        batch = CrimeDataValidator.validate_batch(str(tmp_path / "*.csv"), workers=2, chunk_bytes=32_768)
+        parts = [CrimeDataValidator(p).validate_streaming() for p in (january, february)]
+
+        assert batch['dr_no_unique'] == (not same_ids)
+        assert batch['total_rows'] == 1500
+        assert [f['path'] for f in batch['files']] == [january, february]
+        assert batch['coordinates']['valid_coordinates'] == sum(
+            p['coordinates']['valid_coordinates'] for p in parts
+        )
+        assert batch['victim_age']['invalid_ages'] == sum(p['victim_age']['invalid_ages'] for p in parts)
+
+    def test_numeric_ranges(self, tmp_path):
+        """El mínimo y máximo ignoran vacíos e inválidos"""
+        path = tmp_path / "data.csv"
+        path.write_text("LAT,LON,Vict Age\n34.5,-118,31\n,abc,\n33.1,-117.5,-3\n", encoding='utf-8')
+
+        ranges = CrimeDataValidator.validate_batch(str(path), workers=1, chunk_bytes=10)['numeric_ranges']
+        assert ranges == {
+            'LAT': {'min': 33.1, 'max': 34.5},
+            'LON': {'min': -118.0, 'max': -117.5},
+            'Vict Age': {'min': -3.0, 'max': 31.0},
+        }
+
+    def test_file_not_found(self, tmp_path):
+        """Prueba con archivo inexistente"""
+        with pytest.raises(FileNotFoundError):
+            CrimeDataValidator.validate_batch(os.path.join(str(tmp_path), "no_existe.csv"))
@@ -0,0 +1,119 @@
+"""
+Pruebas para la validación incremental con caché.
+"""
+
+import shutil
+
+import pytest
+from benchmarks.sintetico import generar_csv
+from src.cache import fingerprint, last_row_end
+from src.csv_validator import CrimeDataValidator
+
+
+def _append_rows(path, tmp_path, n_rows, dr_no_inicial, semilla=1):
+    """Agrega al final de path las filas de otro CSV sintético (sin su encabezado)."""
+    extra = generar_csv(str(tmp_path / "extra.csv"), n_rows, semilla=semilla, dr_no_inicial=dr_no_inicial)
+    with open(extra, 'rb') as f:
+        f.readline()
+        body = f.read()
+    with open(path, 'ab') as f:
+        f.write(body)
+    return len(body)
+
+
+def _without_cache(results):
+    return {key: value for key, value in results.items() if key != 'cache'}
+
+
+class TestValidateIncremental:
+    """Los resultados deben ser los de validate_streaming sobre el archivo actual"""
+
+    @pytest.fixture
+    def crimes(self, tmp_path):
+        return generar_csv(str(tmp_path / "crimes.csv"), 2000)
+
+    def test_unchanged_file_is_a_cache_hit(self, crimes, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        first = CrimeDataValidator(crimes).validate_incremental(cache_dir)
+        second = CrimeDataValidator(crimes).validate_incremental(cache_dir)
+
+        assert first['cache']['status'] == 'full'
+        assert second['cache'] == {'status': 'hit', 'bytes_validated': 0}
+        assert _without_cache(second) == _without_cache(first) == CrimeDataValidator(crimes).validate_streaming()
+
+    def test_copy_with_same_content_is_a_hit(self, crimes, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        CrimeDataValidator(crimes).validate_incremental(cache_dir)
+        copy = shutil.copy(crimes, str(tmp_path / "copia.csv"))
+        assert CrimeDataValidator(copy).validate_incremental(cache_dir)['cache']['status'] == 'hit'
+
+    @pytest.mark.parametrize("dr_no_inicial, unique", [(300_000_000, True), (200_100_500, False)])
+    def test_appended_rows_only(self, crimes, tmp_path, dr_no_inicial, unique):
+        """Solo se validan los bytes nuevos; los DR_NO se comparan con los anteriores"""
+        cache_dir = str(tmp_path / "cache")
+        CrimeDataValidator(crimes).validate_incremental(cache_dir)
+        appended = _append_rows(crimes, tmp_path, 300, dr_no_inicial)
+
+        results = CrimeDataValidator(crimes).validate_incremental(cache_dir)
+        assert results['cache'] == {'status': 'append', 'bytes_validated': appended}
+        assert _without_cache(results) == CrimeDataValidator(crimes).validate_streaming()
+        assert results['dr_no_unique'] == unique
+        assert results['basic_stats']['total_rows'] == 2300
+
+    @pytest.mark.parametrize("verify", ['sample', 'full'])
+    def test_modified_prefix_forces_full_run(self, crimes, tmp_path, verify):
+        cache_dir = str(tmp_path / "cache")
+        CrimeDataValidator(crimes).validate_incremental(cache_dir, verify=verify)
+
+        content = bytearray(open(crimes, 'rb').read())
+        # Se cambia un carácter dentro del último bloque muestreado
+        position = content.rindex(b',34.', 0, len(content) - 100)
+        content[position + 1:position + 3] = b'40'
+        open(crimes, 'wb').write(bytes(content))
+
+        results = CrimeDataValidator(crimes).validate_incremental(cache_dir, verify=verify)
+        assert results['cache']['status'] == 'full'
+        assert _without_cache(results) == CrimeDataValidator(crimes).validate_streaming()
+
+    def test_partial_last_row_is_not_cached(self, tmp_path):
+        """Una última fila sin salto de línea se valida pero se vuelve a leer al completarse"""
+        path = tmp_path / "data.csv"
+        path.write_text("DR_NO,Vict Age\n1,31\n2,4", encoding='utf-8')
+        cache_dir = str(tmp_path / "cache")
+
+        first = CrimeDataValidator(str(path)).validate_incremental(cache_dir)
+        assert first['victim_age']['valid_ages'] == 2
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("50\n1,\n")
+        second = CrimeDataValidator(str(path)).validate_incremental(cache_dir)
+
+        assert second['cache']['status'] == 'append'
+        assert second['victim_age'] == {'valid_ages': 1, 'invalid_ages': 1, 'missing_ages': 1}
+        assert second['dr_no_unique'] == False
+        assert _without_cache(second) == CrimeDataValidator(str(path)).validate_streaming()
+
+    def test_file_not_found(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            CrimeDataValidator("archivo_inexistente.csv").validate_incremental(str(tmp_path))
+
+
+class TestFingerprint:
+    """Pruebas de las huellas y del fin de la última fila"""
+
+    def test_sampled_fingerprint_reads_little(self, tmp_path):
+        path = tmp_path / "big.bin"
+        path.write_bytes(b'x' * 5_000_000)
+        base = fingerprint(str(path), 5_000_000)
+
+        assert fingerprint(str(path), 4_000_000) != base
+        with open(path, 'r+b') as f:
+            f.seek(4_999_990)
+            f.write(b'y')
+        assert fingerprint(str(path), 5_000_000) != base
+
+    def test_last_row_end(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"a\n1\n2")
+        assert last_row_end(str(path), 5) == 4
+        assert last_row_end(str(path), 1) == 0
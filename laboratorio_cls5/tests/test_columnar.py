@@ -0,0 +1,86 @@
+"""
+Pruebas unitarias para el backend columnar del validador.
+"""
+
+import numpy as np
+import pytest
+from src.columnar import INVALID, MISSING, VALID, CsvBatchReader, load_columnar, parse_categories
+
+
+class TestParseCategories:
+    """Pruebas para el parseo de valores distintos"""
+    
+    def test_parse_float(self):
+        """Prueba valores válidos, vacíos e inválidos"""
+        parsed = parse_categories([' 34.5 ', '', '  ', 'N/A', '-118'], 'float')
+        
+        assert list(parsed.status) == [VALID, MISSING, MISSING, INVALID, VALID]
+        assert parsed.values[0] == 34.5
+        assert parsed.values[4] == -118.0
+        assert np.isnan(parsed.values[3])
+    
+    def test_parse_int_follows_int_semantics(self):
+        """'31.0' no es un entero válido para int()"""
+        parsed = parse_categories(['31', '31.0', '9' * 40], 'int')
+        
+        assert list(parsed.status) == [VALID, INVALID, VALID]
+        assert parsed.values[0] == 31
+        assert parsed.values[2] > 120
+
+
+class TestLoadColumnar:
+    """Pruebas para la carga columnar"""
+    
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("A,B,LAT,C\n1,x,34.1,z\n\n2,y,,z\n3,x\n", encoding='utf-8')
+        return str(path)
+    
+    def test_loads_only_requested_columns(self, csv_path):
+        """Prueba la proyección y la codificación por categorías"""
+        table = load_columnar(csv_path, ['B', 'LAT', 'NO_EXISTE'], numeric={'LAT': 'float'})
+        
+        assert table.headers == ['A', 'B', 'LAT', 'C']
+        assert table.n_rows == 3
+        assert set(table.columns) == {'B'}
+        assert [table.columns['B'].categories[c] for c in table.columns['B'].codes] == ['x', 'y', 'x']
+        assert list(table.numeric['LAT'].status) == [VALID, MISSING, MISSING]
+    
+    def test_first_row_matches_dictreader(self, csv_path):
+        """La primera fila completa se conserva para get_basic_stats"""
+        table = load_columnar(csv_path, ['A'])
+        assert table.first_row == {'A': '1', 'B': 'x', 'LAT': '34.1', 'C': 'z'}
+    
+    def test_small_batches(self, csv_path):
+        """El resultado no depende del tamaño de lote"""
+        table = load_columnar(csv_path, ['A', 'B'], rows_per_batch=1)
+        
+        assert table.n_rows == 3
+        assert [table.columns['A'].categories[c] for c in table.columns['A'].codes] == ['1', '2', '3']
+    
+    def test_empty_file(self, tmp_path):
+        """Archivo sin filas de datos"""
+        path = tmp_path / "empty.csv"
+        path.write_text("A,B\n", encoding='utf-8')
+        table = load_columnar(str(path), ['A'])
+        
+        assert table.n_rows == 0
+        assert len(table.columns['A']) == 0
+
+
+class TestCsvBatchReaderByteRange:
+    """Lectura de un tramo de bytes en streaming"""
+
+    def test_reads_only_the_range(self, tmp_path):
+        """Solo se leen las filas del tramo, con fines de línea traducidos"""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"A,B\r\n1,x\r\n2,y\r\n3,z\r\n4,w\r\n")
+        start = len(b"A,B\r\n1,x\r\n")
+        end = start + len(b"2,y\r\n3,z\r\n")
+
+        reader = CsvBatchReader(str(path), ['A', 'B'], rows_per_batch=1, byte_range=(start, end), headers=['A', 'B'])
+        batches = [batch for _, batch in reader]
+
+        assert batches == [{'A': ['2'], 'B': ['y']}, {'A': ['3'], 'B': ['z']}]
+        assert reader.first_row == {'A': '2', 'B': 'y'}
@@ -6,8 +6,11 @@ Incluye pruebas para todas las reglas de validación del dataset de crímenes.
 import pytest
 import csv
 import tempfile
+import tracemalloc
 import os
 from src.csv_validator import CrimeDataValidator
+from benchmarks.bench_validadores import medir, validar_por_fila
+from benchmarks.sintetico import generar_csv, generar_filas
 
 class TestCrimeDataValidator:
     """Pruebas para el validador de datos de crímenes"""
@@ -191,4 +194,169 @@ class TestCrimeDataValidatorIntegration:
         print(f"Coordenadas válidas: {coord_stats['valid_percentage']:.2f}%")
         
         # El test pasa si podemos ejecutar todas las validaciones sin errores
-        assert stats['total_rows'] > 0
\ No newline at end of file
+        assert stats['total_rows'] > 0
+
+class TestColumnarBackend:
+    """El backend columnar debe devolver lo mismo que el backend por filas"""
+    
+    EDGE_CASES_CSV = """DR_NO,Date Rptd,DATE OCC,TIME OCC,AREA,AREA NAME,Crm Cd,Crm Cd Desc,Vict Age,Vict Sex,Status,LAT,LON,Extra
+1,a,b,0845,15,N Hollywood,354,THEFT, 31 ,M,IC, 34.2 ,-118.4,x
+2,a,b,0845,15,N Hollywood,354,THEFT,31.0,F,IC,nan,-118.4,x
+
+3,a,b,0845,15,N Hollywood,354,THEFT,,X,IC,,-118.4,x
+3,a,b,0845,15,N Hollywood,354,THEFT,121,,IC,34.1,abc,x
+,a,b,0845,15,N Hollywood,354,THEFT,-1, H ,IC,40,-118.4,x
+,a,b,0845,15,N Hollywood,354,THEFT,abc,M,IC,34.0,-117.0,x
+"""
+    
+    @staticmethod
+    def _results(validator):
+        validator.load_data()
+        return {
+            'headers': validator.validate_headers(),
+            'dr_no_unique': validator.validate_dr_no_unique(),
+            'coordinates': validator.validate_coordinates(),
+            'victim_age': validator.validate_victim_age(),
+            'sex_values': validator.validate_sex_values(),
+            'basic_stats': validator.get_basic_stats(),
+        }
+    
+    @pytest.fixture
+    def edge_cases_file(self, tmp_path):
+        path = tmp_path / "edge_cases.csv"
+        path.write_text(self.EDGE_CASES_CSV, encoding='utf-8')
+        return str(path)
+    
+    def test_same_results_on_edge_cases(self, edge_cases_file):
+        """Prueba espacios, vacíos, NaN, duplicados y líneas en blanco"""
+        rows = self._results(CrimeDataValidator(edge_cases_file))
+        columnar = self._results(CrimeDataValidator(edge_cases_file, backend='columnar'))
+        
+        assert columnar == rows
+        assert rows['coordinates']['missing_coordinates'] == 1
+        assert rows['victim_age'] == {'valid_ages': 1, 'invalid_ages': 4, 'missing_ages': 1}
+        assert rows['dr_no_unique'] == False
+        assert rows['sex_values'] == False
+    
+    def test_same_results_on_synthetic_file(self, tmp_path):
+        """Prueba sobre un archivo sintético con todas las columnas reales"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 5000, duplicados=3)
+        
+        rows = self._results(CrimeDataValidator(path))
+        columnar = self._results(CrimeDataValidator(path, backend='columnar'))
+        assert columnar == rows
+    
+    def test_columnar_does_not_keep_rows(self, edge_cases_file):
+        """El backend columnar no materializa la lista de dicts"""
+        validator = CrimeDataValidator(edge_cases_file, backend='columnar')
+        validator.load_data()
+        
+        assert validator.data == []
+        assert validator.table.n_rows == 6
+        assert set(validator.table.numeric) == {'LAT', 'LON', 'Vict Age'}
+    
+    def test_invalid_backend(self, edge_cases_file):
+        """Prueba con un backend desconocido"""
+        with pytest.raises(ValueError):
+            CrimeDataValidator(edge_cases_file, backend='pandas')
+
+
+class TestStreamingValidation:
+    """La validación en streaming debe coincidir con los métodos individuales"""
+    
+    @staticmethod
+    def _individual_results(path):
+        validator = CrimeDataValidator(path)
+        validator.load_data()
+        return {
+            'headers': validator.validate_headers(),
+            'dr_no_unique': validator.validate_dr_no_unique(),
+            'coordinates': validator.validate_coordinates(),
+            'victim_age': validator.validate_victim_age(),
+            'sex_values': validator.validate_sex_values(),
+            'basic_stats': validator.get_basic_stats(),
+        }
+    
+    @pytest.mark.parametrize("rows_per_batch", [1, 2, 1000])
+    def test_same_results_on_edge_cases(self, tmp_path, rows_per_batch):
+        """Prueba los casos borde con lotes de distintos tamaños"""
+        path = tmp_path / "edge_cases.csv"
+        path.write_text(TestColumnarBackend.EDGE_CASES_CSV, encoding='utf-8')
+        
+        streaming = CrimeDataValidator(str(path)).validate_streaming(rows_per_batch=rows_per_batch)
+        assert streaming == self._individual_results(str(path))
+    
+    @pytest.mark.parametrize("duplicates", [0, 2])
+    def test_same_results_on_synthetic_file(self, tmp_path, duplicates):
+        """Prueba sobre un archivo sintético, con y sin DR_NO repetidos"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 3000, duplicados=duplicates)
+        
+        streaming = CrimeDataValidator(path).validate_streaming(rows_per_batch=512)
+        assert streaming == self._individual_results(path)
+        assert streaming['dr_no_unique'] == (duplicates == 0)
+    
+    def test_missing_columns(self, tmp_path):
+        """Columnas obligatorias ausentes"""
+        path = tmp_path / "partial.csv"
+        path.write_text("DR_NO,AREA\n1,15\n1,16\n", encoding='utf-8')
+        
+        streaming = CrimeDataValidator(str(path)).validate_streaming()
+        assert streaming['headers'][0] == False
+        assert streaming['dr_no_unique'] == False
+        assert streaming['coordinates']['missing_coordinates'] == 2
+    
+    def test_peak_memory_bounded_by_batch(self, tmp_path):
+        """La memoria pico del streaming no crece con el archivo como load_data"""
+        path = generar_csv(str(tmp_path / "crimes.csv"), 20000)
+        
+        def peak(function):
+            tracemalloc.start()
+            function()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak_bytes
+        
+        streaming_peak = peak(lambda: CrimeDataValidator(path).validate_streaming(rows_per_batch=1000))
+        full_peak = peak(lambda: CrimeDataValidator(path).load_data())
+        assert streaming_peak < full_peak / 4
+    
+    def test_file_not_found(self):
+        """Prueba con archivo inexistente"""
+        with pytest.raises(FileNotFoundError):
+            CrimeDataValidator("archivo_inexistente.csv").validate_streaming()
+
+
+class TestVectorizedKernels:
+    """Las reglas vectorizadas deben devolver lo mismo que los bucles por fila"""
+    
+    def test_same_results_as_row_loops(self, tmp_path):
+        """Prueba los casos borde con el backend por filas"""
+        path = tmp_path / "edge_cases.csv"
+        path.write_text(TestColumnarBackend.EDGE_CASES_CSV, encoding='utf-8')
+        validator = CrimeDataValidator(str(path))
+        validator.load_data()
+        
+        kernels = (
+            validator.validate_coordinates(),
+            validator.validate_victim_age(),
+            validator.validate_sex_values(),
+        )
+        assert kernels == validar_por_fila(validator.data)
+    
+    def test_conversion_is_refreshed_on_reload(self, tmp_path):
+        """Las columnas convertidas se descartan al volver a cargar"""
+        path = tmp_path / "data.csv"
+        path.write_text("Vict Age\n31\n", encoding='utf-8')
+        validator = CrimeDataValidator(str(path))
+        validator.load_data()
+        assert validator.validate_victim_age()['valid_ages'] == 1
+        
+        path.write_text("Vict Age\n31\n150\n", encoding='utf-8')
+        validator.load_data()
+        assert validator.validate_victim_age() == {'valid_ages': 1, 'invalid_ages': 1, 'missing_ages': 0}
+    
+    def test_same_results_on_generated_rows(self):
+        """Kernels y bucles coinciden sobre filas sintéticas (la aceleración se mide en benchmarks/)"""
+        result = medir(['LAT', 'LON', 'Vict Age', 'Vict Sex'], generar_filas(10_000), repeticiones=1)
+        
+        assert result['iguales']
@@ -0,0 +1,134 @@
+"""
+Pruebas para la detección de DR_NO repetidos.
+"""
+
+import csv
+
+import pytest
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+from src.duplicates import DuplicateDetector, id_set, split_ids
+
+
+def _ids(n=5000):
+    values = [str(200_100_000 + i) for i in range(n)]
+    values[100] = values[3]
+    values[4000] = values[3]
+    values[2500] = values[2499]
+    values[7], values[8], values[9] = '', '01', '01'
+    return values
+
+
+EXPECTED = {'200100003': [3, 100, 4000], '200102499': [2499, 2500], '01': [8, 9]}
+
+
+def _feed(detector, values, batch=700):
+    for start in range(0, len(values), batch):
+        detector.add(values[start:start + batch])
+    return detector
+
+
+class TestSplitIds:
+    """Solo los textos en forma decimal canónica pasan a int64"""
+
+    def test_canonical_and_other_ids(self):
+        keys, positions, others = split_ids(['123', '', '0123', ' 1', 'A1', '0', None, '9' * 19])
+
+        assert keys.tolist() == [123, 0]
+        assert positions.tolist() == [0, 5]
+        assert others == [(2, '0123'), (3, ' 1'), (4, 'A1'), (7, '9' * 19)]
+
+
+class TestDuplicateDetector:
+    """Pruebas de los modos exactos y probabilísticos"""
+
+    @pytest.mark.parametrize("mode", ['sorted', 'hash'])
+    def test_exact_modes_report_ids_and_rows(self, mode):
+        """Se reportan los IDs repetidos con todas sus filas"""
+        report = _feed(DuplicateDetector(mode, expected_ids=100), _ids()).report()
+
+        assert report['unique'] == False
+        assert report['duplicates'] == EXPECTED
+        assert report['total_ids'] == 4999
+        assert report['duplicate_count'] == 4
+        assert report['distinct_ids'] == 4995
+
+    @pytest.mark.parametrize("mode", ['sorted', 'hash'])
+    def test_merge_keeps_row_numbers(self, mode):
+        """Combinar dos mitades da lo mismo que un solo detector"""
+        values = _ids()
+        first = _feed(DuplicateDetector(mode), values[:3000])
+        first.merge(_feed(DuplicateDetector(mode), values[3000:]))
+        assert first.report()['duplicates'] == EXPECTED
+
+    def test_unique_ids(self):
+        """Sin repetidos el reporte queda vacío"""
+        values = [str(i) for i in range(1, 1000)]
+        for mode in ('sorted', 'hash', 'bloom'):
+            report = _feed(DuplicateDetector(mode, expected_ids=1000, error_rate=1e-6), values).report()
+            assert report['unique'] == True and report['duplicates'] == {}
+
+    def test_bloom_never_misses_and_confirms_exactly(self):
+        """Los candidatos incluyen todos los repetidos; la segunda pasada los confirma"""
+        values = _ids()
+        bloom = _feed(DuplicateDetector('bloom', expected_ids=len(values)), values).report()
+
+        assert bloom['exact'] == False
+        for key, rows in EXPECTED.items():
+            assert set(rows[1:]) <= set(bloom['duplicates'][key])
+
+        confirmed = _feed(DuplicateDetector('sorted', restrict_to=id_set(bloom['duplicates'])), values)
+        assert confirmed.report()['duplicates'] == EXPECTED
+
+    def test_hll_estimates_duplicates(self):
+        """El estimado de distintos queda dentro del error relativo esperado"""
+        values = [str(i % 40_000) for i in range(50_000)]
+        report = _feed(DuplicateDetector('hll'), values, batch=5000).report()
+
+        assert report['unique'] is None and report['duplicates'] is None
+        assert abs(report['distinct_ids'] - 40_000) < 40_000 * 4 * report['relative_error']
+
+    def test_invalid_mode(self):
+        """Prueba con un modo desconocido"""
+        with pytest.raises(ValueError):
+            DuplicateDetector('cuckoo')
+
+
+class TestFindDrNoDuplicates:
+    """find_dr_no_duplicates sobre archivos CSV"""
+
+    @pytest.fixture
+    def csv_with_duplicates(self, tmp_path):
+        path = generar_csv(str(tmp_path / "crimes.csv"), 3000)
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        rows[2000][0] = rows[11][0]
+        rows[2500][0] = rows[11][0]
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+        # Filas de datos numeradas desde 0, como en validator.data
+        return path, {rows[11][0]: [10, 1999, 2499]}
+
+    @pytest.mark.parametrize("mode", ['sorted', 'hash'])
+    def test_rows_match_loaded_data(self, csv_with_duplicates, mode):
+        path, expected = csv_with_duplicates
+        validator = CrimeDataValidator(path)
+        report = validator.find_dr_no_duplicates(mode=mode, rows_per_batch=512)
+
+        assert report['duplicates'] == expected
+        validator.load_data()
+        assert validator.validate_dr_no_unique() == False
+        for dr_no, rows in expected.items():
+            assert all(validator.data[row]['DR_NO'] == dr_no for row in rows)
+
+    def test_bloom_with_confirmation(self, csv_with_duplicates):
+        path, expected = csv_with_duplicates
+        report = CrimeDataValidator(path).find_dr_no_duplicates(mode='bloom', confirm=True)
+
+        assert report['exact'] == True
+        assert report['duplicates'] == expected
+        assert report['candidates'] >= 1
+
+    def test_file_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            CrimeDataValidator("archivo_inexistente.csv").find_dr_no_duplicates()
@@ -0,0 +1,62 @@
+"""
+Pruebas unitarias para los kernels NumPy del validador.
+"""
+
+import numpy as np
+import pytest
+from src.kernels import (
+    INVALID, MISSING, PARSERS, VALID, allowed_lookup, box_mask, coerce_numeric, range_mask
+)
+
+
+class TestCoerceNumeric:
+    """La conversión vectorizada debe coincidir con strip() + float()/int()"""
+
+    SAMPLES = [
+        '34.05', ' -118.25 ', '+3', '.5', '5.', '1e3', '1_000', 'nan', 'inf', '--1', '+-1',
+        '1.2.3', '.', '-', '', '   ', 'N/A', '١٢', '31.0', '9' * 40, '0', '-0', '120', '121',
+    ]
+
+    @pytest.mark.parametrize("kind", ['float', 'int'])
+    def test_same_as_python_parsers(self, kind):
+        """Prueba formas simples, exponentes, guiones bajos, NaN y dígitos no ASCII"""
+        values, status = coerce_numeric(self.SAMPLES, kind)
+
+        for text, value, state in zip(self.SAMPLES, values, status):
+            text = text.strip()
+            if not text:
+                assert state == MISSING and np.isnan(value)
+                continue
+            try:
+                expected = PARSERS[kind](text)
+            except ValueError:
+                assert state == INVALID and np.isnan(value), text
+                continue
+            assert state == VALID, text
+            assert value == expected or (np.isnan(expected) and np.isnan(value)), text
+
+    def test_empty_input(self):
+        """Prueba con una columna sin filas"""
+        values, status = coerce_numeric([], 'float')
+        assert len(values) == 0 and len(status) == 0
+
+
+class TestMasks:
+    """Pruebas para las máscaras de rango y de pertenencia"""
+
+    def test_nan_is_out_of_range(self):
+        """Los vacíos e inválidos (NaN) nunca cuentan como válidos"""
+        values = np.array([0, 120, -1, 121, np.nan])
+        assert list(range_mask(values, (0, 120))) == [True, True, False, False, False]
+
+    def test_box_requires_both_coordinates(self):
+        """Prueba la caja de LA con puntos dentro, fuera y a medias"""
+        lat = np.array([34.0, 34.0, 40.0, np.nan])
+        lon = np.array([-118.0, 0.0, -118.0, -118.0])
+        assert list(box_mask(lat, lon, (33, 35), (-119, -117))) == [True, False, False, False]
+
+    def test_allowed_lookup_indexed_by_codes(self):
+        """La tabla por categoría da la máscara por fila al indexar con los códigos"""
+        lookup = allowed_lookup(['M', ' F ', '', 'H'], {'M', 'F', 'X', ''})
+        assert list(lookup) == [True, True, True, False]
+        assert list(lookup[np.array([0, 3, 3, 1])]) == [True, False, False, True]
@@ -0,0 +1,118 @@
+"""
+Pruebas para ValidationReport y CrimeDataValidator.build_report.
+"""
+
+import sys
+from array import array
+
+import numpy as np
+import pytest
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+from src.report import ValidationReport
+from src.streaming import FailingRowsAccumulator
+
+
+@pytest.fixture
+def crimes(tmp_path):
+    return generar_csv(str(tmp_path / "crimes.csv"), 3000, duplicados=4)
+
+
+@pytest.fixture
+def report(crimes):
+    return CrimeDataValidator(crimes).build_report(rows_per_batch=700, index_every=50)
+
+
+class TestBuildReport:
+    """Las filas de cada regla coinciden con los conteos y con los datos cargados"""
+
+    def test_results_match_streaming(self, crimes, report):
+        assert report.results == CrimeDataValidator(crimes).validate_streaming()
+        assert report.n_rows == 3000
+
+    def test_failures_match_counts(self, report):
+        summary = report.summary()
+        assert summary['coordinates'] == report.results['coordinates']['invalid_coordinates']
+        assert summary['victim_age'] == report.results['victim_age']['invalid_ages']
+        assert summary['dr_no_unique'] == 8
+        assert isinstance(report.failures['coordinates'], array)
+
+    def test_failing_rows_are_the_loaded_rows(self, crimes, report):
+        validator = CrimeDataValidator(crimes)
+        validator.load_data()
+
+        for rule in report.failures:
+            assert all(row == validator.data[i] for i, row in report.failing_rows(rule))
+
+        allowed = CrimeDataValidator.VALID_SEX_VALUES
+        expected = [i for i, row in enumerate(validator.data) if row['Vict Sex'].strip() not in allowed]
+        assert report.rows('sex_values').tolist() == expected
+        dr_nos = [row['DR_NO'] for row in validator.data]
+        assert all(dr_nos.count(dr_nos[i]) > 1 for i in report.rows('dr_no_unique'))
+
+    def test_bitmap(self, report):
+        bits = np.unpackbits(report.bitmap('victim_age'))[:report.n_rows]
+        assert np.flatnonzero(bits).tolist() == report.rows('victim_age').tolist()
+
+
+class TestReadRows:
+    """Búsqueda de filas por posición en el archivo"""
+
+    def test_quoted_newlines_blank_lines_and_crlf(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(
+            b'DR_NO,Vict Age\r\n1,31\r\n\r\n"2\r\nb",200\r\n3,\r\n4,abc\r\n' + b'5,40\r\n' * 20
+        )
+        validator = CrimeDataValidator(str(path))
+        report = validator.build_report(index_every=2)
+        validator.load_data()
+
+        assert report.rows('victim_age').tolist() == [1, 3]
+        assert dict(report.read_rows([22, 3, 1, 0])) == {i: validator.data[i] for i in (0, 1, 3, 22)}
+
+    def test_out_of_range(self, report):
+        with pytest.raises(IndexError):
+            list(report.read_rows([report.n_rows]))
+
+    def test_changed_file(self, crimes, report):
+        with open(crimes, 'ab') as f:
+            f.write(b'\n')
+        with pytest.raises(ValueError):
+            list(report.failing_rows('coordinates'))
+
+
+class TestSerialization:
+    """El reporte se recupera igual desde JSON y desde Parquet"""
+
+    def _assert_same(self, loaded, report):
+        assert loaded.results == report.results
+        assert loaded.failures == report.failures
+        assert list(loaded.failing_rows('victim_age', 10)) == list(report.failing_rows('victim_age', 10))
+
+    def test_json(self, report, tmp_path):
+        report.to_json(str(tmp_path / "report.json"))
+        self._assert_same(ValidationReport.from_json(str(tmp_path / "report.json")), report)
+
+    def test_parquet(self, report, tmp_path):
+        pytest.importorskip("pyarrow")
+        report.to_parquet(str(tmp_path / "report.parquet"))
+        self._assert_same(ValidationReport.from_parquet(str(tmp_path / "report.parquet")), report)
+
+    def test_parquet_without_pyarrow(self, report, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        with pytest.raises(ImportError, match='pip install pyarrow'):
+            report.to_parquet(str(tmp_path / "report.parquet"))
+
+
+class TestFailingRowsAccumulator:
+    """merge numera las filas del otro acumulador a continuación de las propias"""
+
+    def test_merge(self):
+        def make():
+            return FailingRowsAccumulator(lambda n_rows, text, numeric: np.array(text['x']) == 'bad', ('x',))
+
+        first, second = make(), make()
+        first.update(3, {'x': ['ok', 'bad', 'ok']}, {})
+        second.update(2, {'x': ['bad', 'bad']}, {})
+        first.merge(second)
+        assert first.result().tolist() == [1, 3, 4]
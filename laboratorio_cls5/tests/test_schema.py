@@ -0,0 +1,167 @@
+"""
+Pruebas para el motor de esquemas.
+"""
+
+import json
+import pickle
+
+import pytest
+from benchmarks.sintetico import generar_csv
+from src.csv_validator import CrimeDataValidator
+from src.columnar import CsvBatchReader, parse_values
+from src.schema import LA_CRIMES, Schema, build_schema_report, load_schema, validate_file
+
+CITY_SCHEMA = {
+    'name': 'ciudad',
+    'columns': {
+        'ID': {'unique': True, 'nullable': False},
+        'Beat': {'type': 'int', 'range': [100, 2600], 'nullable': False},
+        'Arrest': {'enum': ['true', 'false']},
+        'Latitude': {'type': 'float'},
+        'Longitude': {'type': 'float'},
+        'Notes': {'required': False},
+    },
+    'checks': [
+        {'name': 'coordinates', 'box': {'Latitude': [41.6, 42.1], 'Longitude': [-87.95, -87.5]}},
+    ],
+}
+
+CITY_CSV = (
+    "ID,Beat,Arrest,Latitude,Longitude\n"
+    "A1,111,true,41.9,-87.6\n"
+    "A2,99,false,41.9,-80\n"
+    "A1,,maybe,,-87.6\n"
+    ",2600, TRUE ,abc,-87.6\n"
+    "A3,x,,41.7,-87.7\n"
+)
+
+
+@pytest.fixture
+def city_csv(tmp_path):
+    path = tmp_path / "ciudad.csv"
+    path.write_text(CITY_CSV, encoding='utf-8')
+    return str(path)
+
+
+class TestSchemaDefinition:
+    """Lectura y validación de esquemas"""
+
+    def test_compiled_rules(self):
+        rules = Schema.from_dict(CITY_SCHEMA).compile()
+        assert list(rules) == ['ID', 'ID.unique', 'Beat', 'Arrest', 'Latitude', 'Longitude', 'coordinates']
+        assert Schema.from_dict(CITY_SCHEMA).required_columns == ['ID', 'Beat', 'Arrest', 'Latitude', 'Longitude']
+
+    @pytest.mark.parametrize("spec", [
+        {'columns': {'A': {'type': 'date'}}},
+        {'columns': {'A': {'range': [0, 1]}}},
+        {'columns': {'A': {'type': 'int', 'enum': ['1']}}},
+        {'columns': {'A': {'type': 'int', 'range': [5, 1]}}},
+        {'columns': {'A': {'maximo': 3}}},
+        {'columns': {}, 'extra': 1},
+        {'columns': {'A': {}}, 'checks': [{'name': 'c', 'box': {'A': [0, 1]}}]},
+        {'columns': {'A': {'type': 'int'}}, 'checks': [{'name': 'A', 'box': {'A': [0, 1]}}]},
+    ])
+    def test_invalid_schemas(self, spec):
+        with pytest.raises(ValueError):
+            Schema.from_dict(spec)
+
+    def test_load_from_files(self, tmp_path):
+        pytest.importorskip("yaml")
+        import yaml
+
+        json_path = tmp_path / "ciudad.json"
+        json_path.write_text(json.dumps(CITY_SCHEMA), encoding='utf-8')
+        yaml_path = tmp_path / "ciudad.yaml"
+        yaml_path.write_text(yaml.safe_dump(CITY_SCHEMA, sort_keys=False), encoding='utf-8')
+
+        for path in (json_path, yaml_path):
+            assert list(load_schema(str(path)).compile()) == list(Schema.from_dict(CITY_SCHEMA).compile())
+        assert load_schema('la_crimes').required_columns == CrimeDataValidator.REQUIRED_COLUMNS
+
+    def test_unknown_schema(self):
+        with pytest.raises(ValueError):
+            load_schema('no_existe')
+
+
+class TestValidateFile:
+    """Conteos por regla sobre otro dataset"""
+
+    def test_city_dataset(self, city_csv):
+        results = validate_file(city_csv, CITY_SCHEMA, rows_per_batch=2)
+
+        assert results['headers'] == (True, [])
+        assert results['total_rows'] == 5
+        assert results['rules'] == {
+            'ID': {'valid': 4, 'invalid': 1, 'missing': 0},
+            'ID.unique': {'valid': 3, 'invalid': 1, 'missing': 1},
+            'Beat': {'valid': 2, 'invalid': 3, 'missing': 0},
+            'Arrest': {'valid': 2, 'invalid': 2, 'missing': 1},
+            'Latitude': {'valid': 3, 'invalid': 1, 'missing': 1},
+            'Longitude': {'valid': 5, 'invalid': 0, 'missing': 0},
+            'coordinates': {'valid': 2, 'invalid': 2, 'missing': 1},
+        }
+
+    def test_city_report(self, city_csv):
+        report = build_schema_report(city_csv, CITY_SCHEMA, index_every=2)
+
+        assert report.rows('Beat').tolist() == [1, 2, 4]
+        assert report.rows('ID.unique').tolist() == [0, 2]
+        assert [row['Arrest'] for _, row in report.failing_rows('Arrest')] == ['maybe', ' TRUE ']
+
+    def test_every_rule_evaluates_a_batch(self, city_csv):
+        """evaluate funciona en todas las reglas; con un solo lote da los conteos del archivo"""
+        rules = Schema.from_dict(CITY_SCHEMA).compile()
+        kinds = {name: kind for rule in rules.values() for name, kind in rule.numeric_kinds.items()}
+        n_rows, batch = next(iter(CsvBatchReader(city_csv, list(CITY_SCHEMA['columns']))))
+        numeric = {name: parse_values(batch[name], kind) for name, kind in kinds.items()}
+        expected = validate_file(city_csv, CITY_SCHEMA)['rules']
+
+        for name, rule in rules.items():
+            invalid, missing = rule.evaluate(n_rows, batch, numeric)
+            assert {'invalid': int(invalid.sum()), 'missing': int(missing.sum())} == {
+                key: expected[name][key] for key in ('invalid', 'missing')
+            }
+        assert rules['ID.unique'].invalid_mask(n_rows, batch, numeric).tolist() == [False, False, True, False, False]
+
+    def test_missing_required_column(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("ID,Beat\n1,200\n", encoding='utf-8')
+        results = validate_file(str(path), CITY_SCHEMA)
+
+        assert results['headers'] == (False, ['Arrest', 'Latitude', 'Longitude'])
+        assert results['rules']['coordinates'] == {'valid': 0, 'invalid': 0, 'missing': 1}
+
+
+class TestCrimeSchema:
+    """CrimeDataValidator es el esquema la_crimes"""
+
+    def test_constants_come_from_schema(self):
+        assert CrimeDataValidator.LAT_RANGE == (33, 35)
+        assert CrimeDataValidator.LON_RANGE == (-119, -117)
+        assert CrimeDataValidator.AGE_RANGE == (0, 120)
+        assert CrimeDataValidator.VALID_SEX_VALUES == {'M', 'F', 'X', ''}
+        assert CrimeDataValidator.NUMERIC_COLUMNS == {'LAT': 'float', 'LON': 'float', 'Vict Age': 'int'}
+
+    def test_schema_matches_loaded_validation(self, tmp_path):
+        path = generar_csv(str(tmp_path / "crimes.csv"), 3000, duplicados=2)
+        validator = CrimeDataValidator(path)
+        validator.load_data()
+        rules = validate_file(path, LA_CRIMES, rows_per_batch=500)['rules']
+
+        coordinates = validator.validate_coordinates()
+        assert rules['coordinates'] == {
+            'valid': coordinates['valid_coordinates'],
+            'invalid': coordinates['invalid_coordinates'],
+            'missing': coordinates['missing_coordinates'],
+        }
+        ages = validator.validate_victim_age()
+        assert rules['Vict Age'] == {
+            'valid': ages['valid_ages'], 'invalid': ages['invalid_ages'], 'missing': ages['missing_ages']
+        }
+        assert rules['DR_NO.unique']['invalid'] == 2
+        assert (rules['Vict Sex']['invalid'] == 0) == validator.validate_sex_values()
+
+    def test_accumulators_are_picklable(self):
+        """validate_batch y la caché incremental serializan los acumuladores"""
+        accumulators = CrimeDataValidator._accumulators(track_rows=True)
+        assert set(pickle.loads(pickle.dumps(accumulators))) == set(accumulators)
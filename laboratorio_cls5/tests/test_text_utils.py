@@ -3,8 +3,18 @@ Pruebas unitarias para el módulo text_utils.
 Incluye casos válidos, casos límite y manejo de errores.
 """
 
+import io
+import pickle
+import random
+import re
+from collections import Counter
+
+import numpy as np
 import pytest
-from src.text_utils import clean_text, count_words, is_valid_email
+from src.text_utils import (
+    EMAIL_PATTERNS, EmailValidator, clean_text, clean_text_batch, count_words, count_words_batch,
+    count_words_stream, is_valid_email, is_valid_email_batch, word_frequencies
+)
 
 class TestCleanText:
     """Pruebas para la función clean_text"""
@@ -110,4 +120,185 @@ class TestIsValidEmail:
             is_valid_email(123)
         
         with pytest.raises(TypeError):
-            is_valid_email(None)
\ No newline at end of file
+            is_valid_email(None)
+    
+    def test_email_with_inner_whitespace(self):
+        """Los espacios de cualquier tipo solo se aceptan en los extremos"""
+        for email in ["test\t@example.com", "test@exa mple.com", "te\u3000st@example.com", "a@b.c\nd"]:
+            assert is_valid_email(email) == False
+        assert is_valid_email("\u3000test@example.com\r\n") == True
+    
+    def test_strict_mode(self):
+        """El modo estricto aplica un subconjunto de RFC 5322"""
+        valid_emails = [" user.name+tag@sub.domain.co ", "a!#$%&'*+/=?^_`{|}~-@x-y.org"]
+        invalid_emails = [
+            "a..b@x.com", ".a@x.com", "a@-x.com", "a@x.c", "a@x.123", "a@localhost",
+            '"a"@x.com', "a@[1.2.3.4]", "a" * 65 + "@x.com", "a@" + "b" * 250 + ".com", "ñ@x.com",
+        ]
+        assert all(is_valid_email(email, mode='strict') for email in valid_emails)
+        assert not any(is_valid_email(email, mode='strict') for email in invalid_emails)
+        assert all(is_valid_email(email) for email in invalid_emails[:5])
+    
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            is_valid_email("test@example.com", mode='rfc')
+
+class TestEmailValidator:
+    """Validación de columnas con caché LRU"""
+    
+    EMAILS = ["test@example.com", "a b@x.com", "a..b@x.com", None, "test@example.com"] * 20
+    
+    @pytest.mark.parametrize("mode", ["fast", "strict"])
+    def test_validate_many_matches_scalar(self, mode):
+        validator = EmailValidator(mode, cache_size=2)
+        result = validator.validate_many(self.EMAILS)
+        assert result.values.tolist() == [_scalar(validator, e, False) for e in self.EMAILS]
+        assert result.errors.tolist() == [e is None for e in self.EMAILS]
+        assert is_valid_email_batch(self.EMAILS, mode=mode).values.tolist() == result.values.tolist()
+    
+    def test_fast_mode_is_its_pattern(self):
+        """El modo 'fast' sin expresión regular acepta lo mismo que EMAIL_PATTERNS['fast']"""
+        pattern = re.compile(EMAIL_PATTERNS['fast'])
+        rng = random.Random(1)
+        pieces = ["a", "@", ".", " ", "\t", "\x00", "\xa0", "ñ", "\u3000", "\u200b", "b"]
+        for _ in range(20000):
+            email = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 7)))
+            assert is_valid_email(email) == (pattern.fullmatch(email) is not None), repr(email)
+    
+    def test_repeated_addresses_hit_the_cache(self):
+        validator = EmailValidator()
+        validator.validate_many(self.EMAILS)
+        validator.validate_many(self.EMAILS)
+        info = validator.cache_info()
+        assert info.misses == 4 and info.hits == 2 * len(self.EMAILS) - 4
+    
+    def test_pickle_drops_cache(self):
+        validator = EmailValidator('strict', cache_size=10)
+        validator.validate_many(self.EMAILS)
+        copy = pickle.loads(pickle.dumps(validator))
+        assert copy.mode == 'strict' and copy.cache_info().currsize == 0
+    
+    def test_strict_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        result = is_valid_email_batch(pa.array(self.EMAILS), mode='strict')
+        assert result.values.tolist() == [_scalar(EmailValidator('strict'), e, False) for e in self.EMAILS]
+
+# Textos con espacios Unicode, mayúsculas no ASCII y casos de email
+BATCH_PIECES = [
+    "Hola", "MUNDO", "test@example.com", "@", ".", "ß", "ΣΑΣ", "İstanbul", "a@b", "x.y",
+    " ", "  ", "\t", "\n", "\r\n", "\x0b", "\x1c", "\x85", "\xa0", "\u2003", "\u3000",
+]
+
+def _random_texts(n, seed=0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(BATCH_PIECES) for _ in range(rng.randint(0, 6))) for _ in range(n)]
+
+BATCH_CASES = [
+    (clean_text_batch, clean_text, None),
+    (count_words_batch, count_words, 0),
+    (is_valid_email_batch, is_valid_email, False),
+]
+
+def _scalar(function, value, default):
+    try:
+        return function(value)
+    except TypeError:
+        return default
+
+class TestBatch:
+    """Las variantes por lotes dan lo mismo que las funciones escalares"""
+    
+    TEXTS = _random_texts(2000) + ["  test@example.com  ", "", "   "]
+    
+    def _check(self, batch, scalar, default, values, inputs=None):
+        result = batch(values if inputs is None else inputs)
+        expected = [_scalar(scalar, v, default) for v in values]
+        produced = result.values.to_pylist() if hasattr(result.values, 'to_pylist') else list(result.values)
+        assert produced == expected
+        assert result.errors.tolist() == [not isinstance(v, str) for v in values]
+        return result
+    
+    @pytest.mark.parametrize("batch,scalar,default", BATCH_CASES)
+    def test_list_and_numpy(self, batch, scalar, default):
+        self._check(batch, scalar, default, self.TEXTS)
+        self._check(batch, scalar, default, self.TEXTS, np.array(self.TEXTS, dtype=object))
+        self._check(batch, scalar, default, self.TEXTS, np.array(self.TEXTS))
+    
+    @pytest.mark.parametrize("batch,scalar,default", BATCH_CASES)
+    def test_errors_per_element(self, batch, scalar, default):
+        values = ["  Hola Mundo ", None, 123, "a@b.c", 4.5]
+        result = self._check(batch, scalar, default, values)
+        assert result.errors.tolist() == [False, True, True, False, True]
+    
+    @pytest.mark.parametrize("batch,scalar,default", BATCH_CASES)
+    def test_arrow(self, batch, scalar, default):
+        pa = pytest.importorskip("pyarrow")
+        values = self.TEXTS + [None]
+        self._check(batch, scalar, default, values, pa.array(values))
+        self._check(batch, scalar, default, values, pa.chunked_array([values[:10], values[10:]]))
+    
+    @pytest.mark.parametrize("batch,scalar,default", BATCH_CASES)
+    def test_series(self, batch, scalar, default):
+        pd = pytest.importorskip("pandas")
+        values = self.TEXTS + [None]
+        for dtype in ('object', 'string'):
+            series = pd.Series(values, dtype=dtype, index=range(10, 10 + len(values)), name='texto')
+            result = batch(series)
+            expected = [_scalar(scalar, v, default) for v in self.TEXTS]
+            assert list(result.values)[:-1] == expected
+            assert result.errors.tolist() == [False] * len(self.TEXTS) + [True]
+    
+    def test_series_keeps_index(self):
+        pd = pytest.importorskip("pandas")
+        series = pd.Series(["  A ", "B"], index=[5, 7], name='texto', dtype='string')
+        cleaned = clean_text_batch(series).values
+        assert list(cleaned.index) == [5, 7] and cleaned.name == 'texto'
+        assert list(cleaned) == ["a", "b"]
+    
+    def test_empty(self):
+        for batch, _, _ in BATCH_CASES:
+            result = batch([])
+            assert len(result.values) == 0 and len(result.errors) == 0
+
+def _cut(sequence, rng, pieces=5):
+    cuts = sorted(rng.randint(0, len(sequence)) for _ in range(rng.randint(0, pieces)))
+    return [sequence[i:j] for i, j in zip([0] + cuts, cuts + [len(sequence)])]
+
+class TestCountWordsStream:
+    """Conteo por trozos igual a count_words sobre el texto completo"""
+    
+    PIECES = ["hola", "ñandú", "😀", " ", "  ", "\t", "\n", "\r\n", "\u3000", "\x1c", "\xa0", "x"]
+    
+    def test_random_chunk_boundaries(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = ''.join(rng.choice(self.PIECES) for _ in range(rng.randint(0, 25)))
+            data = text.encode('utf-8')
+            expected = count_words(text)
+            assert count_words_stream(_cut(text, rng)) == expected, repr(text)
+            # Los bytes pueden partir un carácter multibyte
+            assert count_words_stream(_cut(data, rng)) == expected, repr(text)
+            assert word_frequencies(_cut(text, rng)) == Counter(text.split()), repr(text)
+    
+    def test_files(self, tmp_path):
+        text = "Hola mundo\r\ndesde   Python\u3000ñandú\n" * 50
+        path = tmp_path / "log.txt"
+        path.write_bytes(text.encode('utf-8'))
+        expected = count_words(text)
+        
+        assert count_words_stream(str(path), chunk_size=7) == expected
+        assert count_words_stream(path, chunk_size=7) == expected
+        assert count_words_stream(path, encoding='latin-1') == count_words(text.encode('utf-8').decode('latin-1'))
+        assert count_words_stream(io.StringIO(text), chunk_size=5) == expected
+        assert count_words_stream(io.BytesIO(text.encode('utf-8')), chunk_size=5) == expected
+        assert count_words_stream([]) == 0
+    
+    def test_top_k(self):
+        chunks = ["b a c", "c b", " b", " a"]
+        assert word_frequencies(chunks) == Counter({'b': 3, 'a': 2, 'cc': 1})
+        assert word_frequencies(chunks, top_k=2) == [('b', 3), ('a', 2)]
+    
+    def test_invalid_chunk(self):
+        with pytest.raises(TypeError):
+            count_words_stream(["hola", 3])
+
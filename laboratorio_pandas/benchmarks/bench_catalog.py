@@ -0,0 +1,128 @@
+"""
+Benchmark del catálogo persistente de DuckDB (reservoir_catalog) frente a
+calcular los agregados en una conexión en memoria en cada corrida.
+
+Arma un CSV con el dataset de reservorios repetido --scale veces (ver
+benchmarks.synthetic) y mide:
+
+- sin catálogo: conexión en memoria, vista sobre el Parquet de la capa y las
+  consultas anual, mensual y por categoría;
+- catálogo frío: sin archivo .duckdb, se construye la tabla y los agregados;
+- catálogo caliente: el CSV no cambió, solo se leen los agregados;
+- catálogo incremental: se agregan --append días al final del CSV; solo se
+  leen esos días (sin reingerir la capa de datos).
+
+El resultado incremental se compara con los agregados calculados sobre el CSV
+completo.
+
+Uso (desde laboratorio_pandas/):
+    python -m benchmarks.bench_catalog
+    python -m benchmarks.bench_catalog --scale 100 --rounds 5
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import duckdb
+import pandas as pd
+
+import reservoir_catalog
+import reservoir_dataset
+from benchmarks.synthetic import scale_up
+
+
+def build_source(path, scale, drop_last=0):
+    """CSV con el dataset repetido scale veces; deja fuera los últimos drop_last días"""
+    df = scale_up(scale)
+    df.iloc[:len(df) - drop_last].to_csv(path, index=False)
+    return df.iloc[len(df) - drop_last:]
+
+
+def read_aggregates(conn):
+    return [sorted(conn.execute(f"SELECT * FROM {table}").fetchall()) for table in reservoir_catalog.AGGREGATES]
+
+
+def without_catalog(layer):
+    conn = duckdb.connect()
+    conn.execute(f"CREATE VIEW reservoirs AS SELECT * FROM read_parquet('{layer}')")
+    result = [sorted(conn.execute(query.format(where='TRUE')).fetchall())
+              for _, query in reservoir_catalog.AGGREGATES.values()]
+    conn.close()
+    return result
+
+
+def with_catalog(db, source, layer):
+    conn, mode = reservoir_catalog.connect(db, source, layer)
+    result = read_aggregates(conn)
+    conn.close()
+    return mode, result
+
+
+def best_of(rounds, setup, function):
+    best = float('inf')
+    for _ in range(rounds):
+        setup()
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=20, help='Copias del dataset en el CSV')
+    parser.add_argument('--append', type=int, default=30, help='Días agregados en la corrida incremental')
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench_catalog_')
+    source = os.path.join(workdir, 'reservoirs.csv')
+    layer = os.path.join(workdir, 'reservoirs.parquet')
+    db = os.path.join(workdir, 'reservoirs.duckdb')
+    try:
+        tail = build_source(source, args.scale, drop_last=args.append)
+        reservoir_dataset.ingest(source, layer)
+        rows = len(pd.read_parquet(layer, columns=['Date']))
+        prefix = open(source, 'rb').read()
+
+        def remove_catalog():
+            for path in (db, db + '.wal'):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        def restore_source():
+            # Catálogo al día con el CSV sin los días finales
+            with open(source, 'wb') as file:
+                file.write(prefix)
+            remove_catalog()
+            with_catalog(db, source, layer)
+            with open(source, 'a', newline='') as file:
+                tail.to_csv(file, header=False, index=False)
+
+        timings = []
+        seconds, expected = best_of(args.rounds, lambda: None, lambda: without_catalog(layer))
+        timings.append(('sin catálogo (en memoria)', seconds, 'consultas'))
+        seconds, (mode, result) = best_of(args.rounds, remove_catalog, lambda: with_catalog(db, source, layer))
+        assert mode == 'completa' and result == expected
+        timings.append(('catálogo frío', seconds, mode))
+        seconds, (mode, result) = best_of(args.rounds, lambda: None, lambda: with_catalog(db, source, layer))
+        assert mode == 'al día' and result == expected
+        timings.append(('catálogo caliente', seconds, mode))
+        seconds, (mode, result) = best_of(args.rounds, restore_source, lambda: with_catalog(db, source, layer))
+        reservoir_dataset.ingest(source, layer)
+        assert mode == 'incremental' and result == without_catalog(layer)
+        timings.append((f'catálogo incremental (+{args.append} días)', seconds, mode))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"=== BENCHMARK CATÁLOGO ({rows:,} filas, mejor de {args.rounds}) ===")
+    print(f"{'variante':<36}{'tiempo (s)':>12}{'actualización':>16}")
+    for name, seconds, mode in timings:
+        print(f"{name:<36}{seconds:>12.4f}{mode:>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Benchmark de motores: los análisis anual, mensual y por categoría con pandas
+y con DuckDB sobre datasets sintéticos de 10^4 a 10^8 filas (ver
+benchmarks.synthetic), con el mismo esquema que el CSV del laboratorio.
+
+Para cada tamaño se genera el CSV (o se reutiliza el de --data-dir) y cada
+motor corre en un proceso nuevo, así el pico de memoria (RSS) de uno no se
+mezcla con el del otro ni con el del generador:
+
+- pandas: read_csv, columnas derivadas con reservoir_transforms y los
+  análisis de reservoir_analysis (lo mismo que 01_pandas_analysis.py);
+- DuckDB: tabla con las columnas derivadas en SQL leyendo el CSV
+  (reservoir_catalog.load_csv) y las consultas de reservoir_catalog.AGGREGATES.
+
+Se registran los tiempos de carga y de análisis, el pico de RSS y si los
+resultados de ambos motores coinciden (columnas en común, hasta 0.01 por el
+redondeo a dos decimales). Los resultados van a un JSON (--output) que
+03_comparison.py resume si existe. Un motor que falla o se queda sin memoria
+queda registrado con su estado y el benchmark sigue.
+
+Uso (desde laboratorio_pandas/):
+    python -m benchmarks.bench_engines
+    python -m benchmarks.bench_engines --rows 10000 1000000 100000000 --data-dir /tmp/sinteticos
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks import synthetic
+from run_lab import peak_memory_mb
+
+RESULTS_PATH = 'outputs/bench_engines.json'
+ENGINES = ['pandas', 'duckdb']
+# Análisis y su tabla en reservoir_catalog.AGGREGATES
+ANALYSES = {'yearly': 'yearly_stats', 'monthly': 'monthly_stats', 'category': 'category_stats'}
+# Columnas que identifican cada fila de los análisis
+ANALYSIS_KEYS = {'yearly': ['Year'], 'monthly': ['Month'], 'category': ['Water_Level_Category']}
+# Diferencia admitida: los dos motores redondean a dos decimales sumas que
+# pueden diferir en el último bit
+TOLERANCE = 0.01
+
+
+def run_pandas(source):
+    import reservoir_analysis
+    import reservoir_transforms
+    from reservoir_dataset import RESERVOIRS
+
+    start = time.perf_counter()
+    df = reservoir_transforms.derive_columns(pd.read_csv(source), RESERVOIRS)
+    loaded = time.perf_counter()
+    results = {
+        'yearly': reservoir_analysis.yearly_analysis(df),
+        'monthly': reservoir_analysis.monthly_analysis(df),
+        'category': reservoir_analysis.category_analysis(df),
+    }
+    return loaded - start, time.perf_counter() - loaded, results
+
+
+def run_duckdb(source):
+    import duckdb
+
+    import reservoir_catalog
+
+    start = time.perf_counter()
+    conn = duckdb.connect()
+    reservoir_catalog.load_csv(conn, source)
+    loaded = time.perf_counter()
+    results = {
+        analysis: conn.execute(reservoir_catalog.AGGREGATES[table][1].format(where='TRUE')).df()
+        for analysis, table in ANALYSES.items()
+    }
+    conn.close()
+    return loaded - start, time.perf_counter() - loaded, results
+
+
+def worker(engine, source):
+    """Corre un motor y escribe en stdout una línea JSON con tiempos, RSS y resultados"""
+    rss_start = peak_memory_mb()
+    load_s, analysis_s, results = {'pandas': run_pandas, 'duckdb': run_duckdb}[engine](source)
+    print(json.dumps({
+        'load_s': load_s,
+        'analysis_s': analysis_s,
+        'total_s': load_s + analysis_s,
+        'peak_rss_mb': peak_memory_mb(),
+        'rss_after_import_mb': rss_start,
+        'results': {name: df.to_json(orient='split', index=False) for name, df in results.items()},
+    }))
+
+
+def measure(engine, source, timeout):
+    """Corre worker() en un proceso nuevo y devuelve su registro"""
+    command = [sys.executable, '-m', 'benchmarks.bench_engines', '--worker', engine, '--source', source]
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout', 'wall_s': time.perf_counter() - start}, None
+    record = {'wall_s': time.perf_counter() - start}
+    if process.returncode != 0:
+        # Un código negativo es la señal que terminó el proceso (-9: sin memoria)
+        record.update(status='failed', returncode=process.returncode,
+                      error=process.stderr.strip().splitlines()[-1:] or None)
+        return record, None
+    payload = json.loads(process.stdout.strip().splitlines()[-1])
+    results = {name: pd.read_json(io.StringIO(text), orient='split') for name, text in payload.pop('results').items()}
+    record.update(status='ok', **payload)
+    return record, results
+
+
+def compare(expected, actual, keys):
+    """
+    Compara dos resultados en sus columnas en común, ordenados por keys.
+
+    Returns:
+        dict: equal (bool), max_abs_diff de las columnas numéricas y columns
+    """
+    columns = [column for column in expected.columns if column in actual.columns]
+    left = expected[columns].sort_values(keys).reset_index(drop=True)
+    right = actual[columns].sort_values(keys).reset_index(drop=True)
+    if len(left) != len(right):
+        return {'equal': False, 'max_abs_diff': None, 'columns': columns, 'rows': [len(left), len(right)]}
+    max_diff = 0.0
+    equal = True
+    for column in columns:
+        if pd.api.types.is_numeric_dtype(left[column]) and pd.api.types.is_numeric_dtype(right[column]):
+            diff = (left[column].astype(float) - right[column].astype(float)).abs().max()
+            diff = 0.0 if pd.isna(diff) else float(diff)
+            max_diff = max(max_diff, diff)
+            equal &= diff <= TOLERANCE
+        else:
+            equal &= left[column].astype(str).tolist() == right[column].astype(str).tolist()
+    return {'equal': bool(equal), 'max_abs_diff': max_diff, 'columns': columns}
+
+
+def environment():
+    import duckdb
+    import numpy
+    import pyarrow
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pandas': pd.__version__,
+        'numpy': numpy.__version__,
+        'pyarrow': pyarrow.__version__,
+        'duckdb': duckdb.__version__,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='Tamaños del dataset sintético (filas)')
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', help='Carpeta para guardar y reutilizar los CSV (por defecto, una temporal)')
+    parser.add_argument('--output', default=RESULTS_PATH, help='Archivo JSON de resultados')
+    parser.add_argument('--timeout', type=float, default=3600, help='Segundos máximos por motor y tamaño')
+    parser.add_argument('--worker', choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument('--source', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.source)
+        return
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='bench_engines_')
+    os.makedirs(data_dir, exist_ok=True)
+    report = {'created': datetime.now().isoformat(timespec='seconds'), 'environment': environment(),
+              'tolerance': TOLERANCE, 'runs': []}
+
+    print(f"{'filas':>12}{'motor':>8}{'estado':>9}{'carga (s)':>11}{'análisis (s)':>14}"
+          f"{'total (s)':>11}{'RSS (MB)':>10}")
+    try:
+        for rows in args.rows:
+            source = os.path.join(data_dir, f'reservoirs_{rows}_{args.seed}.csv')
+            start = time.perf_counter()
+            if not os.path.exists(source):
+                synthetic.write_csv(source, rows, seed=args.seed)
+            run = {'rows': rows, 'csv_mb': os.path.getsize(source) / 1024 ** 2,
+                   'generate_s': time.perf_counter() - start, 'engines': {}, 'equivalence': None}
+
+            results = {}
+            for engine in args.engines:
+                record, results[engine] = measure(engine, source, args.timeout)
+                run['engines'][engine] = record
+                print(f"{rows:>12,}{engine:>8}{record['status']:>9}"
+                      f"{record.get('load_s', float('nan')):>11.3f}{record.get('analysis_s', float('nan')):>14.3f}"
+                      f"{record.get('total_s', float('nan')):>11.3f}{record.get('peak_rss_mb') or float('nan'):>10.1f}")
+
+            if all(results.get(engine) is not None for engine in ENGINES):
+                run['equivalence'] = {
+                    analysis: compare(results['pandas'][analysis], results['duckdb'][analysis],
+                                      ANALYSIS_KEYS[analysis])
+                    for analysis in ANALYSES
+                }
+                status = all(item['equal'] for item in run['equivalence'].values())
+                print(f"{'':>12}resultados equivalentes: {status}")
+            report['runs'].append(run)
+    finally:
+        if not args.data_dir:
+            for name in os.listdir(data_dir):
+                os.remove(os.path.join(data_dir, name))
+            os.rmdir(data_dir)
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+        print(f"Resultados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark de las columnas derivadas vectorizadas (reservoir_transforms)
+frente a la versión anterior (apply fila por fila y modas con lambda por
+grupo), sobre el dataset de reservorios repetido --scale veces (ver
+benchmarks.synthetic).
+
+Cada paso compara el resultado con el de la versión anterior antes de
+informar el tiempo.
+
+Uso (desde laboratorio_pandas/):
+    python -m benchmarks.bench_transforms
+    python -m benchmarks.bench_transforms --scale 10 --rounds 5
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+import reservoir_transforms as transforms
+from benchmarks.synthetic import scale_up
+from reservoir_dataset import RESERVOIRS
+
+
+def previous_derive_columns(df):
+    """derive_columns antes de reservoir_transforms"""
+    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
+    df['Total_Water'] = df['POONDI'] + df['CHOLAVARAM'] + df['REDHILLS'] + df['CHEMBARAMBAKKAM']
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+    df['Month_Name'] = df['Date'].dt.month_name()
+    df['Average_Level'] = df[RESERVOIRS].mean(axis=1)
+    df['Water_Level_Category'] = df['Total_Water'].apply(transforms.classify_water_level)
+    df['Dominant_Reservoir'] = df[RESERVOIRS].idxmax(axis=1)
+    return df
+
+
+def previous_monthly_modes(df):
+    return df.groupby(['Month', 'Month_Name']).agg({
+        'Water_Level_Category': lambda x: x.mode()[0] if not x.empty else 'Normal',
+        'Dominant_Reservoir': lambda x: x.mode()[0] if not x.empty else 'REDHILLS'
+    })
+
+
+def monthly_modes(df):
+    return pd.DataFrame({
+        column: transforms.group_mode(df, ['Month', 'Month_Name'], column)
+        for column in ['Water_Level_Category', 'Dominant_Reservoir']
+    })
+
+
+def best_of(rounds, function, *args):
+    best = float('inf')
+    for _ in range(rounds):
+        arguments = [arg.copy() if isinstance(arg, pd.DataFrame) else arg for arg in args]
+        start = time.perf_counter()
+        result = function(*arguments)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def same_values(previous, current):
+    """
+    Mismos valores e índices como texto (las columnas nuevas son
+    categóricas); no compara nombres de columnas
+    """
+    previous, current = previous.reset_index(), current.reset_index()
+    return previous.astype(str).to_numpy().tolist() == current.astype(str).to_numpy().tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=100, help='Copias del dataset')
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    raw = scale_up(args.scale)
+    # Cada versión recibe las columnas derivadas que produce ella misma (las
+    # de texto son categóricas en la nueva)
+    derived = previous_derive_columns(raw.copy())
+    derived_now = transforms.derive_columns(raw.copy(), RESERVOIRS)
+
+    steps = [
+        ('Date', lambda df: pd.to_datetime(df['Date'], format='%d-%m-%Y'),
+         lambda df: transforms.parse_dates(df['Date']), raw, raw),
+        ('Water_Level_Category', lambda df: df['Total_Water'].apply(transforms.classify_water_level),
+         lambda df: transforms.classify_water_levels(df['Total_Water']), derived, derived_now),
+        ('Month_Name', lambda df: df['Date'].dt.month_name(),
+         lambda df: transforms.month_names(df['Month']), derived, derived_now),
+        ('Dominant_Reservoir', lambda df: df[RESERVOIRS].idxmax(axis=1),
+         lambda df: transforms.dominant_reservoirs(df, RESERVOIRS), derived, derived_now),
+        ('derive_columns completo', previous_derive_columns,
+         lambda df: transforms.derive_columns(df, RESERVOIRS), raw, raw),
+        ('modas mensuales', previous_monthly_modes, monthly_modes, derived, derived_now),
+    ]
+
+    rows = []
+    for name, previous, current, previous_data, current_data in steps:
+        previous_s, expected = best_of(args.rounds, previous, previous_data)
+        current_s, result = best_of(args.rounds, current, current_data)
+        same = same_values(expected, result)
+        rows.append((name, previous_s, current_s, same))
+
+    print(f"=== BENCHMARK COLUMNAS DERIVADAS ({len(raw):,} filas, x{args.scale}, mejor de {args.rounds}) ===")
+    print(f"{'paso':<26}{'anterior (s)':>14}{'vectorizado (s)':>17}{'aceleración':>13}{'iguales':>9}")
+    for name, previous_s, current_s, same in rows:
+        print(f"{name:<26}{previous_s:>14.3f}{current_s:>17.3f}{previous_s / current_s:>12.1f}x{str(same):>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Datasets sintéticos para los benchmarks, con el mismo esquema que
+chennai_reservoir_levels.csv (Date como dd-mm-YYYY y los cuatro
+reservorios).
+
+- scale_up: el dataset real repetido varias veces con las fechas corridas.
+- write_csv: un CSV de cualquier tamaño (10^4 a 10^8 filas o más) escrito
+  por bloques, sin tener el dataset entero en memoria.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+
+import reservoir_dataset
+
+# Cada copia se corre 28 años: las fechas no se repiten y los 29 de febrero
+# siguen cayendo en años bisiestos
+YEARS_PER_COPY = 28
+
+# Calendario de write_csv: días desde 2004 hasta 2099; con más filas que
+# días el calendario vuelve a empezar (como varias series del mismo período)
+START_DATE = '2004-01-01'
+END_DATE = '2099-12-31'
+
+CHUNK_ROWS = 1_000_000
+
+SCHEMA = pa.schema([('Date', pa.string())] + [(name, pa.float64()) for name in reservoir_dataset.RESERVOIRS])
+
+
+def scale_up(scale, source=reservoir_dataset.SOURCE_PATH):
+    """
+    Dataset del CSV repetido scale veces.
+
+    Args:
+        scale (int): Copias del dataset
+        source (str): CSV de origen
+
+    Returns:
+        pd.DataFrame: Columnas del CSV, con Date como texto dd-mm-YYYY
+    """
+    base = pd.read_csv(source)
+    dates = pd.to_datetime(base['Date'], format='%d-%m-%Y')
+    copies = []
+    for i in range(scale):
+        copy = base.copy()
+        copy['Date'] = (dates + pd.DateOffset(years=YEARS_PER_COPY * i)).dt.strftime('%d-%m-%Y')
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def _day_profile(source):
+    """
+    Valores reales agrupados por día del año: la matriz de valores ordenada
+    por día y, para cada día (0 a 365), dónde empiezan sus filas y cuántas son
+    """
+    base = pd.read_csv(source)
+    day_of_year = pd.to_datetime(base['Date'], format='%d-%m-%Y').dt.dayofyear.to_numpy() - 1
+    order = np.argsort(day_of_year, kind='stable')
+    values = base[reservoir_dataset.RESERVOIRS].to_numpy()[order]
+    counts = np.bincount(day_of_year, minlength=366)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    # Un día sin registros toma valores de todo el dataset
+    missing = counts == 0
+    offsets[missing], counts[missing] = 0, len(values)
+    return values, offsets, counts
+
+
+def _chunks(rows, seed, source, chunk_rows):
+    """Bloques de write_csv como tablas de Arrow"""
+    calendar = pd.date_range(START_DATE, END_DATE, freq='D')
+    date_text = pa.array(calendar.strftime('%d-%m-%Y'), type=pa.string())
+    calendar_day = calendar.dayofyear.to_numpy() - 1
+    values, offsets, counts = _day_profile(source)
+
+    for number, start in enumerate(range(0, rows, chunk_rows)):
+        rng = np.random.default_rng([seed, number])
+        positions = np.arange(start, min(start + chunk_rows, rows)) % len(calendar)
+        days = calendar_day[positions]
+        # Un registro real del mismo día del año (conserva la estacionalidad
+        # y los reservorios vacíos), con ±10% de ruido
+        picks = offsets[days] + (rng.random(len(days)) * counts[days]).astype(np.int64)
+        chunk = np.round(values[picks] * rng.uniform(0.9, 1.1, (len(days), values.shape[1])), 2)
+        columns = {'Date': date_text.take(pa.array(positions))}
+        columns.update({name: pa.array(chunk[:, i]) for i, name in enumerate(reservoir_dataset.RESERVOIRS)})
+        yield pa.table(columns, schema=SCHEMA)
+
+
+def write_csv(path, rows, seed=0, source=reservoir_dataset.SOURCE_PATH, chunk_rows=CHUNK_ROWS):
+    """
+    Escribe un dataset sintético de rows filas con el esquema del CSV real.
+
+    Las fechas recorren el calendario de START_DATE a END_DATE (y vuelven a
+    empezar si hay más filas). Los valores de cada fila son los de un día
+    real con el mismo día del año, con ±10% de ruido; el resultado depende
+    solo de rows, seed y chunk_rows.
+
+    Args:
+        path (str): CSV de salida
+        rows (int): Cantidad de filas
+        seed (int): Semilla del generador
+        source (str): CSV real del que se toma el perfil de valores
+        chunk_rows (int): Filas por bloque (acota la memoria)
+
+    Returns:
+        int: Bytes escritos
+    """
+    # El encabezado se escribe aparte porque Arrow lo pone entre comillas
+    options = csv.WriteOptions(include_header=False, quoting_style='none')
+    with open(path, 'wb') as file:
+        file.write((','.join(SCHEMA.names) + '\n').encode())
+        with csv.CSVWriter(file, SCHEMA, write_options=options) as writer:
+            for table in _chunks(rows, seed, source, chunk_rows):
+                writer.write_table(table)
+    return os.path.getsize(path)
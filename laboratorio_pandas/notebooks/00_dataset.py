@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pandas as pd
+
+if not __package__:
+    # Ejecutado como script: la carpeta del laboratorio no está en sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import reservoir_dataset
+
+
+def run(inputs=None):
+    """
+    Prepara la capa de datos: ingiere el CSV de reservorios en el Parquet
+    tipado con las columnas derivadas, salvo que el CSV no haya cambiado.
+
+    Returns:
+        dict: reservoirs con el DataFrame de la capa
+    """
+    print("=== CARGA DEL DATASET ===")
+    if reservoir_dataset.ingest():
+        print(f"✓ {reservoir_dataset.SOURCE_PATH} ingerido en {reservoir_dataset.LAYER_PATH}")
+    else:
+        print(f"✓ {reservoir_dataset.LAYER_PATH} al día (el CSV no cambió, no se vuelve a leer)")
+    df = pd.read_parquet(reservoir_dataset.LAYER_PATH)
+    print(f"✓ {df.shape[0]} filas, {df.shape[1]} columnas")
+    return {'reservoirs': df}
+
+
+if __name__ == '__main__':
+    run()
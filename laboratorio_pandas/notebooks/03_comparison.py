@@ -1,37 +1,83 @@
-import pandas as pd
-import time
+import json
 import os
 
-print("=== COMPARACIÓN: pandas vs DuckDB ===")
+import pandas as pd
+
+BENCHMARK_PATH = 'outputs/bench_engines.json'
+
+
+def print_measurements(path=BENCHMARK_PATH):
+    """
+    Resume las mediciones del benchmark de motores (benchmarks.bench_engines)
+    si ya se corrió.
+
+    Args:
+        path (str): JSON de resultados del benchmark
+    """
+    print("\n--- Mediciones en datasets sintéticos ---")
+    if not os.path.exists(path):
+        print("Sin mediciones todavía; para generarlas (desde laboratorio_pandas/):")
+        print("  python -m benchmarks.bench_engines --rows 10000 100000 1000000")
+        return
+
+    with open(path, encoding='utf-8') as file:
+        report = json.load(file)
+    print(f"Corrida del {report['created']} (pandas {report['environment']['pandas']}, "
+          f"DuckDB {report['environment']['duckdb']}, {report['environment']['cpu_count']} CPU)")
+    print(f"{'filas':>12}{'motor':>8}{'estado':>9}{'total (s)':>11}{'RSS (MB)':>10}{'iguales':>9}")
+    for run in report['runs']:
+        equivalence = run['equivalence']
+        same = '-' if equivalence is None else str(all(item['equal'] for item in equivalence.values()))
+        for engine, record in run['engines'].items():
+            total = record.get('total_s', float('nan'))
+            rss = record.get('peak_rss_mb') or float('nan')
+            print(f"{run['rows']:>12,}{engine:>8}{record['status']:>9}{total:>11.3f}{rss:>10.1f}{same:>9}")
 
-# Comparar archivos generados
-print("\n--- Archivos generados ---")
-output_files = os.listdir('outputs')
-print("Archivos en outputs/:")
-for file in sorted(output_files):
-    size = os.path.getsize(f'outputs/{file}')
-    print(f"  {file}: {size:,} bytes")
 
-# Comparar resultados pandas vs duckdb
-print("\n--- Comparación de resultados ---")
+def run(inputs=None):
+    """
+    Comparación de los resultados de pandas y DuckDB.
 
-# Cargar análisis anuales
-pandas_yearly = pd.read_csv('outputs/pandas_yearly_analysis.csv')
-duckdb_yearly = pd.read_csv('outputs/duckdb_yearly_analysis.csv')
+    Args:
+        inputs (dict): Resultados de las secciones pandas y duckdb; sin
+            ellos se leen los CSV exportados en outputs/
+    """
+    print("=== COMPARACIÓN: pandas vs DuckDB ===")
 
-print("Diferencias en análisis anual:")
-print(f"Pandas shape: {pandas_yearly.shape}")
-print(f"DuckDB shape: {duckdb_yearly.shape}")
+    # Comparar archivos generados
+    print("\n--- Archivos generados ---")
+    output_files = os.listdir('outputs')
+    print("Archivos en outputs/:")
+    for file in sorted(output_files):
+        size = os.path.getsize(f'outputs/{file}')
+        print(f"  {file}: {size:,} bytes")
 
-# Verificar que los resultados sean similares
-if 'Total_Water_mean' in pandas_yearly.columns and 'Total_Water_mean' in duckdb_yearly.columns:
-    pandas_mean = pandas_yearly['Total_Water_mean'].mean()
-    duckdb_mean = duckdb_yearly['Total_Water_mean'].mean()
-    difference = abs(pandas_mean - duckdb_mean)
-    print(f"Diferencia promedio en Total_Water_mean: {difference:.4f}")
+    # Comparar resultados pandas vs duckdb
+    print("\n--- Comparación de resultados ---")
 
-print("\n--- Cuándo usar cada herramienta ---")
-print("""
+    # Cargar análisis anuales (en memoria si los pasó el runner)
+    if inputs:
+        pandas_yearly = inputs['pandas']['yearly']
+        duckdb_yearly = inputs['duckdb']['yearly']
+    else:
+        pandas_yearly = pd.read_csv('outputs/pandas_yearly_analysis.csv')
+        duckdb_yearly = pd.read_csv('outputs/duckdb_yearly_analysis.csv')
+
+    print("Diferencias en análisis anual:")
+    print(f"Pandas shape: {pandas_yearly.shape}")
+    print(f"DuckDB shape: {duckdb_yearly.shape}")
+
+    # Verificar que los resultados sean similares
+    if 'Total_Water_mean' in pandas_yearly.columns and 'Total_Water_mean' in duckdb_yearly.columns:
+        pandas_mean = pandas_yearly['Total_Water_mean'].mean()
+        duckdb_mean = duckdb_yearly['Total_Water_mean'].mean()
+        difference = abs(pandas_mean - duckdb_mean)
+        print(f"Diferencia promedio en Total_Water_mean: {difference:.4f}")
+
+    print_measurements()
+
+    print("\n--- Cuándo usar cada herramienta ---")
+    print("""
 PANDAS:
 ✓ Mejor para análisis exploratorio interactivo
 ✓ Ideal para datasets que caben en memoria
@@ -56,4 +102,8 @@ RECOMENDACIONES:
 - Producción y pipelines → DuckDB
 - Equipos con SQL expertise → DuckDB
 - Equipos con Python expertise → pandas
-""")
\ No newline at end of file
+""")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,9 @@
+"""
+Secciones del laboratorio como módulos importables.
+
+Cada módulo tiene una función run(inputs=None) que devuelve un dict con sus
+resultados en memoria (DataFrames). run_lab.py importa los módulos (con su
+bytecode en caché) y pasa a cada sección los resultados de las secciones de
+las que depende; cada archivo sigue pudiendo ejecutarse solo con
+`python notebooks/<archivo>.py`.
+"""
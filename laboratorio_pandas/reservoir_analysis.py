@@ -0,0 +1,70 @@
+"""
+Análisis anual, mensual y por categoría del laboratorio con pandas, sobre el
+dataset con las columnas derivadas (ver reservoir_dataset).
+
+01_pandas_analysis.py y el benchmark de motores (benchmarks.bench_engines)
+usan estas funciones; las consultas equivalentes de DuckDB están en
+reservoir_catalog.AGGREGATES.
+"""
+
+from reservoir_transforms import group_mode
+
+
+def yearly_analysis(df):
+    """
+    Métricas de agua almacenada por año.
+
+    Returns:
+        pd.DataFrame: Year y las métricas con nombres columna_función
+    """
+    yearly = df.groupby('Year').agg({
+        'Total_Water': ['mean', 'max', 'min', 'std'],
+        'Average_Level': 'mean',
+        'POONDI': 'mean',
+        'CHOLAVARAM': 'mean',
+        'REDHILLS': 'mean',
+        'CHEMBARAMBAKKAM': 'mean'
+    }).round(2)
+
+    # Aplanar nombres de columnas
+    yearly.columns = ['_'.join(col).strip() for col in yearly.columns]
+    return yearly.reset_index()
+
+
+def monthly_analysis(df):
+    """
+    Métricas por mes, con la categoría y el reservorio más frecuentes.
+
+    Returns:
+        pd.DataFrame: Month, Month_Name, métricas y modas (las columnas de
+        moda conservan el nombre que tenían con la agregación con lambda)
+    """
+    monthly = df.groupby(['Month', 'Month_Name'], observed=True).agg({
+        'Total_Water': ['mean', 'max', 'min'],
+    }).round(2)
+
+    monthly.columns = ['_'.join(col).strip() if col[1] else col[0] for col in monthly.columns]
+
+    # Categoría y reservorio más frecuentes de cada mes, contando los pares
+    # (mes, valor) en lugar de calcular la moda mes por mes
+    for column in ['Water_Level_Category', 'Dominant_Reservoir']:
+        modes = group_mode(df, ['Month', 'Month_Name'], column)
+        monthly[f'{column}_<lambda>'] = modes.astype(str)
+    return monthly.reset_index()
+
+
+def category_analysis(df):
+    """
+    Registros, agua promedio y rango de años por categoría de nivel.
+
+    Returns:
+        pd.DataFrame: Water_Level_Category y métricas
+    """
+    category = df.groupby('Water_Level_Category', observed=True).agg({
+        'Date': 'count',
+        'Total_Water': 'mean',
+        'Year': ['min', 'max']
+    }).round(2)
+
+    category.columns = ['_'.join(col).strip() for col in category.columns]
+    return category.reset_index()
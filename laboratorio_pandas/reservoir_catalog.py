@@ -0,0 +1,267 @@
+"""
+Catálogo persistente de DuckDB para los análisis de reservorios.
+
+data/reservoirs.duckdb guarda la tabla reservoirs (la capa de datos de
+reservoir_dataset) y los agregados yearly_stats, monthly_stats y
+category_stats ya calculados, de modo que el análisis de DuckDB los lee en
+lugar de recalcularlos en cada corrida.
+
+DuckDB no tiene vistas materializadas: los agregados son tablas que
+refresh() mantiene al día. Si al CSV solo se le agregaron filas al final,
+se leen únicamente esos bytes del CSV (con las columnas derivadas en SQL,
+DERIVED_SQL), se insertan y se recalculan solo los grupos (años, meses y
+categorías) que los contienen, sin volver a ingerir la capa de datos; si el
+CSV cambió de otra forma se reconstruye todo el catálogo desde la capa.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import duckdb
+
+import reservoir_dataset
+from reservoir_dataset import LAYER_PATH, SOURCE_PATH
+
+CATALOG_PATH = 'data/reservoirs.duckdb'
+
+# Cambia cuando cambian las tablas del catálogo
+_VERSION = 1
+
+# Agregados materializados: tabla -> (columna de grupo, consulta). La consulta
+# recibe en {where} el filtro de los grupos a recalcular
+AGGREGATES = {
+    'yearly_stats': ('Year', """
+        SELECT
+            Year,
+            ROUND(AVG(Total_Water), 2) as Total_Water_mean,
+            ROUND(MAX(Total_Water), 2) as Total_Water_max,
+            ROUND(MIN(Total_Water), 2) as Total_Water_min,
+            ROUND(STDDEV(Total_Water), 2) as Total_Water_std,
+            ROUND(AVG(Average_Level), 2) as Average_Level_mean,
+            ROUND(AVG(POONDI), 2) as POONDI_mean,
+            ROUND(AVG(CHOLAVARAM), 2) as CHOLAVARAM_mean,
+            ROUND(AVG(REDHILLS), 2) as REDHILLS_mean,
+            ROUND(AVG(CHEMBARAMBAKKAM), 2) as CHEMBARAMBAKKAM_mean,
+            COUNT(*) as record_count
+        FROM reservoirs
+        WHERE {where}
+        GROUP BY Year
+    """),
+    'monthly_stats': ('Month', """
+        SELECT
+            Month,
+            Month_Name,
+            ROUND(AVG(Total_Water), 2) as Total_Water_mean,
+            ROUND(MAX(Total_Water), 2) as Total_Water_max,
+            ROUND(MIN(Total_Water), 2) as Total_Water_min,
+            COUNT(*) as record_count
+        FROM reservoirs
+        WHERE {where}
+        GROUP BY Month, Month_Name
+    """),
+    'category_stats': ('Water_Level_Category', """
+        SELECT
+            Water_Level_Category,
+            COUNT(*) as Date_count,
+            ROUND(AVG(Total_Water), 2) as Total_Water_mean,
+            MIN(Year) as Year_min,
+            MAX(Year) as Year_max
+        FROM reservoirs
+        WHERE {where}
+        GROUP BY Water_Level_Category
+    """),
+}
+
+
+# Columnas derivadas calculadas en SQL sobre el CSV, con las mismas reglas que
+# reservoir_transforms; es el camino de DuckDB sin la capa de datos de pandas
+# (lo usa el benchmark de motores)
+DERIVED_SQL = """
+    SELECT
+        strptime(Date, '%d-%m-%Y') as Date,
+        POONDI, CHOLAVARAM, REDHILLS, CHEMBARAMBAKKAM,
+        POONDI + CHOLAVARAM + REDHILLS + CHEMBARAMBAKKAM as Total_Water,
+        CAST(year(strptime(Date, '%d-%m-%Y')) AS INTEGER) as Year,
+        CAST(month(strptime(Date, '%d-%m-%Y')) AS INTEGER) as Month,
+        monthname(strptime(Date, '%d-%m-%Y')) as Month_Name,
+        (POONDI + CHOLAVARAM + REDHILLS + CHEMBARAMBAKKAM) / 4.0 as Average_Level,
+        CASE
+            WHEN POONDI + CHOLAVARAM + REDHILLS + CHEMBARAMBAKKAM < 100 THEN 'Crítico'
+            WHEN POONDI + CHOLAVARAM + REDHILLS + CHEMBARAMBAKKAM < 300 THEN 'Bajo'
+            WHEN POONDI + CHOLAVARAM + REDHILLS + CHEMBARAMBAKKAM < 600 THEN 'Normal'
+            ELSE 'Alto'
+        END as Water_Level_Category,
+        CASE
+            WHEN POONDI >= CHOLAVARAM AND POONDI >= REDHILLS AND POONDI >= CHEMBARAMBAKKAM THEN 'POONDI'
+            WHEN CHOLAVARAM >= REDHILLS AND CHOLAVARAM >= CHEMBARAMBAKKAM THEN 'CHOLAVARAM'
+            WHEN REDHILLS >= CHEMBARAMBAKKAM THEN 'REDHILLS'
+            ELSE 'CHEMBARAMBAKKAM'
+        END as Dominant_Reservoir
+    FROM read_csv('{source}', header = true, types = {{
+        'Date': 'VARCHAR', 'POONDI': 'DOUBLE', 'CHOLAVARAM': 'DOUBLE',
+        'REDHILLS': 'DOUBLE', 'CHEMBARAMBAKKAM': 'DOUBLE'
+    }})
+"""
+
+
+def load_csv(conn, source=SOURCE_PATH, name='reservoirs'):
+    """
+    Crea la tabla `name` leyendo el CSV con DuckDB y calculando las columnas
+    derivadas en SQL (DERIVED_SQL), sin pasar por pandas.
+
+    Args:
+        conn: Conexión de duckdb
+        source (str): CSV de reservorios
+        name (str): Nombre de la tabla
+    """
+    conn.execute(f"CREATE OR REPLACE TABLE {name} AS {DERIVED_SQL.format(source=_sql_path(source))}")
+
+
+def _sql_path(path):
+    return path.replace("'", "''")
+
+
+def _prefix_sha256(source, size):
+    """SHA-256 de los primeros size bytes del archivo"""
+    digest = hashlib.sha256()
+    with open(source, 'rb') as file:
+        remaining = size
+        while remaining > 0:
+            block = file.read(min(1 << 20, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _state(conn):
+    """Fila de catalog_state o None si el catálogo está vacío o es de otra versión"""
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = 'catalog_state'"
+    ).fetchone()[0]
+    if not exists:
+        return None
+    row = conn.execute(
+        "SELECT version, size, mtime_ns, sha256, row_count, last_date FROM catalog_state"
+    ).fetchone()
+    if row is None or row[0] != _VERSION:
+        return None
+    return dict(zip(['version', 'size', 'mtime_ns', 'sha256', 'row_count', 'last_date'], row))
+
+
+def _save_state(conn, fingerprint):
+    row_count, last_date = conn.execute("SELECT COUNT(*), MAX(Date) FROM reservoirs").fetchone()
+    conn.execute("""
+        CREATE OR REPLACE TABLE catalog_state (
+            version INTEGER, size BIGINT, mtime_ns BIGINT, sha256 VARCHAR,
+            row_count BIGINT, last_date TIMESTAMP
+        )
+    """)
+    conn.execute(
+        "INSERT INTO catalog_state VALUES (?, ?, ?, ?, ?, ?)",
+        [_VERSION, fingerprint['size'], fingerprint['mtime_ns'], fingerprint['sha256'],
+         row_count, last_date],
+    )
+
+
+def _rebuild(conn, layer):
+    conn.execute(f"CREATE OR REPLACE TABLE reservoirs AS SELECT * FROM read_parquet('{_sql_path(layer)}')")
+    for table, (_, query) in AGGREGATES.items():
+        conn.execute(f"CREATE OR REPLACE TABLE {table} AS {query.format(where='TRUE')}")
+
+
+def _append(conn, source, state):
+    """
+    Agrega las filas escritas en el CSV después de state['size'] bytes y
+    recalcula los grupos que las contienen.
+
+    Solo se lee la cola del CSV: se copia con el encabezado a un CSV temporal
+    y DERIVED_SQL calcula sus columnas derivadas.
+
+    Returns:
+        bool: False si el CSV anterior no terminaba en un salto de línea (la
+        primera fila agregada completaría la última) y hay que reconstruir
+    """
+    with open(source, 'rb') as file:
+        header = file.readline()
+        file.seek(state['size'] - 1)
+        if file.read(1) != b'\n':
+            return False
+        tail = file.read()
+
+    descriptor, path = tempfile.mkstemp(suffix='.csv')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(header)
+            file.write(tail)
+        conn.execute(f"CREATE OR REPLACE TEMP TABLE new_rows AS {DERIVED_SQL.format(source=_sql_path(path))}")
+    finally:
+        os.remove(path)
+
+    conn.execute("INSERT INTO reservoirs BY NAME SELECT * FROM new_rows")
+    for table, (key, query) in AGGREGATES.items():
+        groups = f"{key} IN (SELECT DISTINCT {key} FROM new_rows)"
+        conn.execute(f"DELETE FROM {table} WHERE {groups}")
+        conn.execute(f"INSERT INTO {table} {query.format(where=groups)}")
+    conn.execute("DROP TABLE new_rows")
+    return True
+
+
+def refresh(conn, source=SOURCE_PATH, layer=LAYER_PATH):
+    """
+    Pone el catálogo al día con el CSV.
+
+    Solo la reconstrucción completa ingiere la capa de datos; tras una
+    actualización incremental la capa se pone al día la próxima vez que se
+    lea (reservoir_dataset.load o register).
+
+    Args:
+        conn: Conexión de duckdb al archivo del catálogo
+        source (str): CSV de origen
+        layer (str): Parquet de la capa de datos
+
+    Returns:
+        str: 'al día' si no hubo cambios, 'incremental' si solo se agregaron
+        filas nuevas o 'completa' si se reconstruyó
+    """
+    state = _state(conn)
+    stat = os.stat(source)
+    if state is not None and (state['size'], state['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+        return 'al día'
+
+    fingerprint = reservoir_dataset.source_fingerprint(source)
+    if state is not None and fingerprint['sha256'] == state['sha256']:
+        # Mismo contenido con otra fecha de modificación
+        _save_state(conn, fingerprint)
+        return 'al día'
+
+    # Solo filas agregadas al final: el CSV anterior es un prefijo del actual
+    appended = (state is not None and fingerprint['size'] > state['size']
+                and _prefix_sha256(source, state['size']) == state['sha256'])
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        mode = 'incremental' if appended and _append(conn, source, state) else 'completa'
+        if mode == 'completa':
+            reservoir_dataset.ingest(source, layer)
+            _rebuild(conn, layer)
+        _save_state(conn, fingerprint)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return mode
+
+
+def connect(path=CATALOG_PATH, source=SOURCE_PATH, layer=LAYER_PATH):
+    """
+    Abre el catálogo y lo pone al día.
+
+    Returns:
+        tuple: (conexión de duckdb, resultado de refresh())
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = duckdb.connect(path)
+    return conn, refresh(conn, source, layer)
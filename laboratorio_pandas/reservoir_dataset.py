@@ -0,0 +1,146 @@
+"""
+Capa de datos compartida del laboratorio: el CSV de reservorios se lee una
+sola vez y se guarda en Parquet con tipos, la fecha ya parseada y las
+columnas derivadas calculadas. Los notebooks de pandas y DuckDB y
+test_pandas.py leen de esta capa en lugar del CSV.
+
+El Parquet guarda en sus metadatos la huella del CSV (tamaño, fecha de
+modificación y SHA-256); mientras el CSV no cambie, ingest() no vuelve a
+leerlo.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+import reservoir_transforms
+
+SOURCE_PATH = 'data/chennai_reservoir_levels.csv'
+LAYER_PATH = 'data/reservoirs.parquet'
+
+RESERVOIRS = ['POONDI', 'CHOLAVARAM', 'REDHILLS', 'CHEMBARAMBAKKAM']
+DERIVED_COLUMNS = ['Total_Water', 'Year', 'Month', 'Month_Name', 'Average_Level',
+                   'Water_Level_Category', 'Dominant_Reservoir']
+
+# Clave de los metadatos del Parquet; _VERSION cambia cuando cambian las
+# columnas derivadas o sus tipos
+_METADATA_KEY = b'reservoir_layer'
+_VERSION = 2
+
+
+def derive_columns(df):
+    """
+    Parsea Date y agrega las columnas derivadas del laboratorio con las
+    transformaciones vectorizadas de reservoir_transforms.
+
+    Args:
+        df (pd.DataFrame): Dataset tal como está en el CSV
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame con Date como fecha y DERIVED_COLUMNS
+        (las de texto, categóricas)
+    """
+    return reservoir_transforms.derive_columns(df, RESERVOIRS)
+
+
+def source_fingerprint(source=SOURCE_PATH):
+    """Tamaño, fecha de modificación y SHA-256 del CSV"""
+    stat = os.stat(source)
+    digest = hashlib.sha256()
+    with open(source, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+
+
+def _stored_metadata(layer):
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(layer).metadata or {}
+    except (OSError, ValueError):
+        return None
+    if _METADATA_KEY not in metadata:
+        return None
+    return json.loads(metadata[_METADATA_KEY])
+
+
+def is_fresh(source=SOURCE_PATH, layer=LAYER_PATH):
+    """
+    Indica si el Parquet corresponde al CSV actual.
+
+    Si tamaño y fecha coinciden no se lee el CSV; si solo cambió la fecha
+    (por ejemplo, una copia) se compara el SHA-256.
+    """
+    if not os.path.exists(layer):
+        return False
+    stored = _stored_metadata(layer)
+    if stored is None or stored.get('version') != _VERSION:
+        return False
+    stat = os.stat(source)
+    if stat.st_size != stored['size']:
+        return False
+    if stat.st_mtime_ns == stored['mtime_ns']:
+        return True
+    return source_fingerprint(source)['sha256'] == stored['sha256']
+
+
+def ingest(source=SOURCE_PATH, layer=LAYER_PATH, force=False):
+    """
+    Lee el CSV, calcula las columnas derivadas y escribe el Parquet, salvo
+    que ya esté al día.
+
+    Args:
+        source (str): CSV de origen
+        layer (str): Parquet de la capa
+        force (bool): Reescribir aunque el CSV no haya cambiado
+
+    Returns:
+        bool: True si se leyó el CSV, False si la capa ya estaba al día
+    """
+    if not force and is_fresh(source, layer):
+        return False
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fingerprint = source_fingerprint(source)
+    df = derive_columns(pd.read_csv(source))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps(dict(fingerprint, version=_VERSION, source=source)).encode()
+
+    # Se escribe aparte y se reemplaza, así una corrida interrumpida no deja
+    # un Parquet a medias que parezca válido
+    os.makedirs(os.path.dirname(layer) or '.', exist_ok=True)
+    temporary = f"{layer}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), temporary)
+    os.replace(temporary, layer)
+    return True
+
+
+def load(source=SOURCE_PATH, layer=LAYER_PATH):
+    """
+    Dataset con las columnas derivadas, ingiriendo el CSV solo si cambió.
+
+    Returns:
+        pd.DataFrame: Columnas del CSV (Date como fecha) más DERIVED_COLUMNS
+    """
+    ingest(source, layer)
+    return pd.read_parquet(layer)
+
+
+def register(conn, name='reservoirs', source=SOURCE_PATH, layer=LAYER_PATH):
+    """
+    Crea en una conexión de DuckDB la vista `name` sobre el Parquet de la
+    capa, ingiriendo el CSV solo si cambió.
+
+    Args:
+        conn: Conexión de duckdb
+        name (str): Nombre de la vista
+    """
+    ingest(source, layer)
+    path = layer.replace("'", "''")
+    conn.execute(f"CREATE OR REPLACE VIEW {name} AS SELECT * FROM read_parquet('{path}')")
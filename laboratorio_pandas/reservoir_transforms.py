@@ -0,0 +1,259 @@
+"""
+Transformaciones vectorizadas para las columnas derivadas de los
+reservorios.
+
+Cada función trabaja sobre columnas completas con NumPy, pandas o Arrow en
+lugar de llamar a Python fila por fila (apply) o grupo por grupo (lambdas
+en agg), y da los mismos valores que la versión fila por fila. Las columnas
+de texto se devuelven como categóricas con las categorías en orden
+alfabético, así agrupar y ordenar por ellas da el mismo orden que con texto.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Límites superiores (excluidos) de cada nivel; lo que no entra en ninguno
+# (incluidos los nulos, como en classify_water_level) es 'Alto'
+WATER_LEVEL_LIMITS = [100, 300, 600]
+WATER_LEVEL_LABELS = ['Crítico', 'Bajo', 'Normal', 'Alto']
+
+# Directivas de fecha que _format_dates arma sin strftime: función de
+# pyarrow.compute y ancho con ceros a la izquierda
+_DATE_FIELDS = {'%d': ('day', 2), '%m': ('month', 2), '%Y': ('year', 4)}
+
+# Nombres que da Series.dt.month_name() sin locale
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+
+
+def classify_water_level(total):
+    """Categoría de nivel según el total de agua almacenada (un valor)"""
+    if total < 100:
+        return 'Crítico'
+    elif total < 300:
+        return 'Bajo'
+    elif total < 600:
+        return 'Normal'
+    else:
+        return 'Alto'
+
+
+def _categorical(labels, codes, index, name):
+    """
+    Serie categórica con categorías alfabéticas a partir de códigos sobre
+    labels (-1 es nulo)
+    """
+    categories = sorted(labels)
+    remap = np.array([categories.index(label) for label in labels] + [-1], dtype=np.int8)
+    values = pd.Categorical.from_codes(remap[codes], categories=categories)
+    return pd.Series(values, index=index, name=name)
+
+
+def _format_dates(parsed, format):
+    """
+    Fechas de Arrow como texto según format. Con solo %d, %m y %Y se arma
+    con los campos de la fecha, bastante más rápido que pc.strftime.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    pieces = re.split(r'(%.)', format)
+    if any(piece.startswith('%') and piece not in _DATE_FIELDS for piece in pieces):
+        return pc.strftime(parsed, format=format)
+    parts = []
+    for piece in pieces:
+        if piece in _DATE_FIELDS:
+            field, width = _DATE_FIELDS[piece]
+            parts.append(pc.utf8_lpad(pc.cast(getattr(pc, field)(parsed), pa.string()), width, padding='0'))
+        elif piece:
+            parts.append(piece)
+    return pc.binary_join_element_wise(*parts, '')
+
+
+def parse_dates(values, format='%d-%m-%Y'):
+    """
+    Parsea una columna de fechas en texto con Arrow; si algún valor no
+    respeta el formato se usa pd.to_datetime, que informa cuál.
+
+    Arrow acepta fechas imposibles como 31-02-2004 (las corre al mes
+    siguiente), así que el resultado se vuelve a formatear y debe coincidir
+    con el texto original; si no (también con días sin el cero adelante),
+    decide pd.to_datetime.
+
+    Args:
+        values (pd.Series): Fechas como texto
+        format (str): Formato de strptime
+
+    Returns:
+        pd.Series: Fechas como datetime64[us], igual que pd.to_datetime
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        text = pa.array(values, type=pa.string())
+        parsed = pc.strptime(text, format=format, unit='us')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.to_datetime(values, format=format)
+    if not pc.all(pc.equal(_format_dates(parsed, format), text)).as_py():
+        return pd.to_datetime(values, format=format)
+    return pd.Series(parsed.to_numpy(zero_copy_only=False), index=values.index, name=values.name)
+
+
+def classify_water_levels(total):
+    """
+    Versión vectorizada de classify_water_level.
+
+    Args:
+        total (pd.Series): Total de agua almacenada
+
+    Returns:
+        pd.Series: Categoría de nivel (categórica)
+    """
+    values = total.to_numpy(dtype=float, na_value=np.nan)
+    conditions = [values < limit for limit in WATER_LEVEL_LIMITS]
+    codes = np.select(conditions, range(len(WATER_LEVEL_LIMITS)), default=len(WATER_LEVEL_LIMITS))
+    return _categorical(WATER_LEVEL_LABELS, codes, total.index, total.name)
+
+
+def month_names(month):
+    """
+    Nombre en inglés de cada número de mes, como Series.dt.month_name().
+
+    Args:
+        month (pd.Series): Mes de 1 a 12
+
+    Returns:
+        pd.Series: Nombre del mes (categórica)
+    """
+    values = month.to_numpy(dtype=float, na_value=np.nan)
+    codes = np.where(np.isnan(values), -1, np.nan_to_num(values) - 1).astype(np.intp)
+    return _categorical(MONTH_NAMES, codes, month.index, month.name)
+
+
+def dominant_reservoirs(df, columns):
+    """
+    Columna con el mayor valor de cada fila, como df[columns].idxmax(axis=1)
+    (en empates, la primera).
+
+    Args:
+        df (pd.DataFrame): Dataset
+        columns (list): Columnas a comparar
+
+    Returns:
+        pd.Series: Nombre de la columna dominante (categórica)
+    """
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    if np.isnan(values).any():
+        # idxmax salta los nulos; con ellos se deja a pandas, con el mismo
+        # tipo categórico que el camino rápido
+        return df[columns].idxmax(axis=1).astype(pd.CategoricalDtype(sorted(columns)))
+    return _categorical(list(columns), values.argmax(axis=1), df.index, None)
+
+
+def _factorize(values):
+    """
+    Códigos enteros (-1 es nulo) y valores posibles en el orden en que los
+    ordena pandas: el de las categorías si la columna es categórica. Los
+    enteros con rango chico se codifican restando el mínimo, sin hashear.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(dtype=np.int64), values.cat.categories
+    array = values.to_numpy()
+    if array.dtype.kind in 'iu' and len(array):
+        low, high = int(array.min()), int(array.max())
+        if high - low <= len(array):
+            return array.astype(np.int64) - low, pd.Index(np.arange(low, high + 1, dtype=array.dtype))
+    codes, uniques = pd.factorize(values, sort=True)
+    return codes.astype(np.int64), uniques
+
+
+def group_mode(df, keys, column):
+    """
+    Valor más frecuente de column en cada grupo, como
+    agg(lambda x: x.mode()[0]): en empates gana el menor valor.
+
+    En lugar de calcular la moda grupo por grupo, pasa grupos y valores a
+    códigos enteros y cuenta todos los pares (grupo, valor) con un solo
+    np.bincount; la moda de cada grupo es el máximo de su fila de conteos.
+
+    Args:
+        df (pd.DataFrame): Dataset
+        keys (list): Columnas de agrupación
+        column (str): Columna de la que se busca la moda
+
+    Returns:
+        pd.Series: Moda por grupo, con los grupos (sin nulos) como índice y
+        ordenados; categórica si column lo es
+    """
+    value_codes, values = _factorize(df[column])
+    valid = value_codes >= 0
+
+    # Código de grupo en base mixta: respeta el orden de las claves y no
+    # hace falta hashear mientras la cantidad de grupos posibles sea chica
+    group_codes = np.zeros(len(df), dtype=np.int64)
+    size = 1
+    for key in keys:
+        codes, uniques = _factorize(df[key])
+        valid &= codes >= 0
+        group_codes = group_codes * len(uniques) + codes
+        size *= len(uniques)
+        if size > max(len(df), 1):
+            # Se renumeran los grupos presentes (el orden se mantiene) para
+            # que la tabla de conteos no crezca más que los datos
+            group_codes, present = pd.factorize(group_codes, sort=True)
+            group_codes = group_codes.astype(np.int64)
+            size = len(present)
+
+    rows = None if valid.all() else np.flatnonzero(valid)
+    if rows is not None:
+        group_codes, value_codes = group_codes[rows], value_codes[rows]
+    counts = np.bincount(group_codes * len(values) + value_codes,
+                         minlength=size * len(values)).reshape(size, len(values))
+    present = np.flatnonzero(counts.any(axis=1))
+    # argmax da el primer máximo: en empates, el menor valor
+    winners = counts[present].argmax(axis=1) if len(values) else np.zeros(0, dtype=np.int64)
+
+    # Una fila de cada grupo para armar el índice con sus claves
+    first = np.empty(size, dtype=np.int64)
+    positions = np.arange(len(group_codes)) if rows is None else rows
+    first[group_codes[::-1]] = positions[::-1]
+    first = first[present]
+    if len(keys) > 1:
+        index = pd.MultiIndex.from_frame(df[keys].iloc[first])
+    else:
+        index = pd.Index(df[keys[0]].iloc[first], name=keys[0])
+    if isinstance(df[column].dtype, pd.CategoricalDtype):
+        modes = pd.Categorical.from_codes(winners, dtype=df[column].dtype)
+    else:
+        modes = values.take(winners)
+    return pd.Series(modes, index=index, name=column)
+
+
+def derive_columns(df, reservoirs):
+    """
+    Parsea Date y agrega las columnas derivadas del laboratorio.
+
+    Args:
+        df (pd.DataFrame): Dataset tal como está en el CSV
+        reservoirs (list): Columnas de los reservorios
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame con Date como fecha y las columnas
+        derivadas
+    """
+    df['Date'] = parse_dates(df['Date'])
+    # Suma columna a columna, no sum(axis=1): un nulo deja el total nulo
+    total = df[reservoirs[0]]
+    for column in reservoirs[1:]:
+        total = total + df[column]
+    df['Total_Water'] = total
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+    df['Month_Name'] = month_names(df['Month'])
+    df['Average_Level'] = df[reservoirs].mean(axis=1)
+    df['Water_Level_Category'] = classify_water_levels(df['Total_Water'])
+    df['Dominant_Reservoir'] = dominant_reservoirs(df, reservoirs)
+    return df
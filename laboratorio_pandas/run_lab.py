@@ -4,31 +4,242 @@ Script principal para ejecutar todo el laboratorio
 Laboratorio: Análisis Tabular con pandas y DuckDB
 """
 
-import sys
+import argparse
+import contextlib
+import importlib
+import io
+import multiprocessing
 import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 
-def run_section(section_name, script_path):
-    """Ejecuta una sección del laboratorio"""
-    print(f"\n{'='*60}")
-    print(f"EJECUTANDO: {section_name}")
-    print(f"{'='*60}")
+# Secciones del laboratorio: (clave, nombre, módulo, dependencias). Cada
+# módulo tiene run(inputs) y recibe en inputs los resultados en memoria de sus
+# dependencias; una sección corre cuando terminaron bien todas ellas. Con
+# --workers N las que no dependen entre sí corren a la vez en procesos
+# separados.
+SECTIONS = [
+    ("dataset", "Carga del dataset", "notebooks.00_dataset", ()),
+    ("pandas", "Análisis con pandas", "notebooks.01_pandas_analysis", ("dataset",)),
+    ("duckdb", "Análisis con DuckDB", "notebooks.02_duckdb_analysis", ("dataset",)),
+    ("comparison", "Comparación y Conclusiones", "notebooks.03_comparison", ("pandas", "duckdb")),
+]
+
+def module_path(module_name):
+    """Archivo de un módulo de sección relativo al directorio del laboratorio"""
+    return module_name.replace('.', os.sep) + '.py'
+
+def peak_memory_mb():
+    """Pico de memoria residente del proceso actual en MB (None si no se puede medir)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KB y macOS bytes
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def run_section(module_name, inputs=None):
+    """
+    Importa el módulo de una sección y llama a su run(inputs).
+    
+    La salida se guarda en lugar de imprimirse para que las secciones que
+    corren a la vez no mezclen sus líneas.
+    
+    Args:
+        module_name (str): Módulo con la función run, p. ej. notebooks.00_dataset
+        inputs (dict): Resultados de las dependencias por clave de sección
+        
+    Returns:
+        dict: ok, output, error, outputs (lo que devolvió run), seconds,
+        peak_mb y entered (time.time() al empezar, para medir el arranque)
+    """
+    entered = time.time()
+    output = io.StringIO()
+    outputs = None
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            outputs = importlib.import_module(module_name).run(inputs or None)
+    except BaseException as e:  # también SystemExit de exit(1) en los scripts
+        error = f"{type(e).__name__}: {e}"
+    return {
+        'ok': error is None,
+        'output': output.getvalue(),
+        'error': error,
+        'outputs': outputs,
+        'seconds': time.perf_counter() - start,
+        'peak_mb': peak_memory_mb(),
+        'entered': entered,
+    }
+
+def check_sections(sections):
+    """
+    Verifica que las dependencias existan y no formen ciclos.
+    
+    Returns:
+        list: Claves en un orden topológico
+        
+    Raises:
+        ValueError: Si hay claves repetidas, dependencias desconocidas o ciclos
+    """
+    deps = {key: tuple(requires) for key, _, _, requires in sections}
+    if len(deps) != len(sections):
+        raise ValueError("Hay secciones con la misma clave")
+    for key, requires in deps.items():
+        unknown = [dep for dep in requires if dep not in deps]
+        if unknown:
+            raise ValueError(f"La sección {key} depende de secciones inexistentes: {unknown}")
+    
+    order, visiting, visited = [], set(), set()
+    def visit(key):
+        if key in visited:
+            return
+        if key in visiting:
+            raise ValueError(f"Dependencias circulares en la sección {key}")
+        visiting.add(key)
+        for dep in deps[key]:
+            visit(dep)
+        visiting.discard(key)
+        visited.add(key)
+        order.append(key)
+    for key in deps:
+        visit(key)
+    return order
+
+def run_sections(sections, workers=1, on_finish=None):
+    """
+    Ejecuta las secciones respetando sus dependencias y pasa a cada una los
+    resultados en memoria de las secciones de las que depende.
+    
+    Con más de un worker las secciones independientes corren en paralelo,
+    cada una en un proceso nuevo: el pico de memoria medido es el de esa
+    sección y un proceso que muere (por ejemplo, sin memoria) solo hace
+    fallar su sección; los resultados viajan entre procesos serializados.
+    Con un worker (por defecto) corren en este mismo proceso, sin costo de
+    arranque ni de serialización; es lo más rápido para este laboratorio,
+    donde arrancar cada proceso cuesta más que lo que se gana en paralelo.
+    En ese caso peak_mb es el pico acumulado del proceso hasta el final de
+    la sección, no el de la sección.
+    
+    Una sección cuya dependencia falló no se ejecuta.
+    
+    Args:
+        sections: Lista de (clave, nombre, módulo, dependencias)
+        workers (int): Secciones simultáneas; con más de una, cada sección
+            corre en su propio proceso
+        on_finish: Función (clave, resultado) llamada al terminar cada sección
+        
+    Returns:
+        tuple: (resultados por clave, segundos de pared). Cada resultado es el
+        dict de run_section más start y end relativos al inicio y startup
+        (segundos desde el lanzamiento hasta que la sección empezó); las
+        secciones omitidas tienen skipped=True
+    """
+    check_sections(sections)
+    modules = {key: module for key, _, module, _ in sections}
+    requires = {key: tuple(deps) for key, _, _, deps in sections}
+    waiting = {key: set(deps) for key, deps in requires.items()}
+    dependents = {key: [other for other in modules if key in requires[other]] for key in modules}
+    workers = workers or 1
+    context = multiprocessing.get_context('spawn')
+    
+    results = {}
+    ready = [key for key, deps in waiting.items() if not deps]
+    running = {}
+    start = time.perf_counter()
+    
+    def inputs(key):
+        return {dep: results[dep]['outputs'] for dep in requires[key]}
+    
+    def finish(key, result, submitted, launched):
+        result.update(start=submitted, end=time.perf_counter() - start,
+                      startup=max(result.get('entered', launched) - launched, 0.0))
+        results[key] = result
+        if on_finish:
+            on_finish(key, result)
+        for other in dependents[key]:
+            if other in results:
+                continue
+            if not result['ok']:
+                skipped = {'ok': False, 'skipped': True, 'output': '', 'outputs': None, 'seconds': 0.0,
+                           'error': f"depende de {key}, que no se completó", 'peak_mb': None}
+                finish(other, skipped, result['end'], launched)
+                continue
+            waiting[other].discard(key)
+            if not waiting[other]:
+                ready.append(other)
+    
+    if workers == 1:
+        while ready:
+            key = ready.pop(0)
+            submitted, launched = time.perf_counter() - start, time.time()
+            finish(key, run_section(modules[key], inputs(key)), submitted, launched)
+        return results, time.perf_counter() - start
     
     try:
-        # Verificar que el archivo existe
-        if not os.path.exists(script_path):
-            print(f"❌ Error: No se encuentra el archivo {script_path}")
-            return False
+        while ready or running:
+            while ready and len(running) < workers:
+                key = ready.pop(0)
+                executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+                future = executor.submit(run_section, modules[key], inputs(key))
+                running[future] = (key, executor, time.perf_counter() - start, time.time())
             
-        # Ejecutar el script
-        with open(script_path, 'r', encoding='utf-8') as file:
-            script_content = file.read()
-            exec(script_content)
-        print(f"\n✓ {section_name} completado exitosamente")
-    except Exception as e:
-        print(f"\n❌ Error en {section_name}: {e}")
-        return False
-    return True
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, executor, submitted, launched = running.pop(future)
+                executor.shutdown()
+                try:
+                    result = future.result()
+                except Exception as e:  # el proceso murió o el resultado no se pudo devolver
+                    result = {'ok': False, 'output': '', 'outputs': None, 'error': f"{type(e).__name__}: {e}",
+                              'seconds': 0.0, 'peak_mb': None}
+                finish(key, result, submitted, launched)
+    finally:
+        for _, executor, _, _ in running.values():
+            executor.shutdown(cancel_futures=True)
+    
+    return results, time.perf_counter() - start
+
+def critical_path(sections, results):
+    """
+    Cadena de dependencias de mayor duración total con los tiempos medidos:
+    el mínimo de tiempo de pared con procesos ilimitados.
+    
+    Returns:
+        tuple: (claves de la ruta, segundos)
+    """
+    finish, previous = {}, {}
+    deps = {key: requires for key, _, _, requires in sections}
+    for key in check_sections(sections):
+        before = max(deps[key], key=lambda dep: finish[dep], default=None)
+        previous[key] = before
+        finish[key] = (finish[before] if before else 0.0) + results[key]['seconds']
+    
+    key = max(finish, key=finish.get)
+    total = finish[key]
+    path = []
+    while key:
+        path.append(key)
+        key = previous[key]
+    return path[::-1], total
+
+def print_section(name, result):
+    """Imprime la salida guardada de una sección y su estado"""
+    print(f"\n{'='*60}")
+    print(f"EJECUTANDO: {name}")
+    print(f"{'='*60}")
+    if result['output']:
+        print(result['output'], end='')
+    if result['ok']:
+        print(f"\n✓ {name} completado exitosamente ({result['seconds']:.2f} s)")
+    elif result.get('skipped'):
+        print(f"⏭️  {name} omitido: {result['error']}")
+    else:
+        print(f"\n❌ Error en {name}: {result['error']}")
 
 def check_requirements():
     """Verificar que las dependencias están instaladas"""
@@ -56,7 +267,7 @@ def check_requirements():
     
     return True
 
-def main():
+def main(workers=1):
     """Función principal"""
     print(f"🚀 Iniciando Laboratorio: Análisis Tabular con pandas y DuckDB")
     print(f"📅 Tiempo de inicio: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -101,11 +312,7 @@ def main():
     
     # Verificar scripts del laboratorio
     print(f"\n📝 Verificando scripts...")
-    scripts_to_check = [
-        "notebooks/01_pandas_analysis.py",
-        "notebooks/02_duckdb_analysis.py", 
-        "notebooks/03_comparison.py"
-    ]
+    scripts_to_check = [module_path(module) for _, _, module, _ in SECTIONS]
     
     missing_scripts = []
     for script in scripts_to_check:
@@ -125,33 +332,39 @@ def main():
     
     # Ejecutar secciones del laboratorio
     print(f"\n🎯 Ejecutando laboratorio...")
-    sections = [
-        ("Análisis con pandas", "notebooks/01_pandas_analysis.py"),
-        ("Análisis con DuckDB", "notebooks/02_duckdb_analysis.py"),  
-        ("Comparación y Conclusiones", "notebooks/03_comparison.py")
-    ]
-    
-    results = []
-    for section_name, script_path in sections:
-        success = run_section(section_name, script_path)
-        results.append((section_name, success))
-        
-        # Pausa entre secciones
-        if success:
-            print(f"⏳ Continuando en 2 segundos...")
-            import time
-            time.sleep(2)
+    names = {key: name for key, name, _, _ in SECTIONS}
+    results, wall_seconds = run_sections(
+        SECTIONS, workers, on_finish=lambda key, result: print_section(names[key], result)
+    )
     
     # Resumen final
     print(f"\n{'='*60}")
     print("📊 RESUMEN FINAL DEL LABORATORIO")
     print(f"{'='*60}")
     
-    for section_name, success in results:
-        status = "✅ COMPLETADO" if success else "❌ FALLIDO"
-        print(f"  {section_name}: {status}")
+    for key, section_name, _, _ in SECTIONS:
+        result = results[key]
+        status = "✅ COMPLETADO" if result['ok'] else ("⏭️  OMITIDO" if result.get('skipped') else "❌ FALLIDO")
+        times = f"{result['start']:.2f}-{result['end']:.2f} s, arranque {result['startup']:.2f} s, {result['seconds']:.2f} s"
+        if workers > 1:
+            # Cada sección corrió en su proceso: el pico es el de la sección
+            memory = f"{result['peak_mb']:.0f} MB" if result['peak_mb'] is not None else "-"
+            times += f", pico {memory}"
+        print(f"  {section_name}: {status} [{times}]")
+    
+    if workers == 1:
+        # Todas las secciones corrieron en este proceso: solo hay un pico
+        peak = peak_memory_mb()
+        print(f"\n💾 Pico de memoria del proceso: {f'{peak:.0f} MB' if peak is not None else '-'}")
+    
+    path, path_seconds = critical_path(SECTIONS, results)
+    sequential_seconds = sum(result['seconds'] for result in results.values())
+    startup_seconds = sum(result['startup'] for result in results.values())
+    print(f"\n⏱️  Tiempo de pared: {wall_seconds:.2f} s (suma de secciones: {sequential_seconds:.2f} s, "
+          f"de arranques: {startup_seconds:.2f} s)")
+    print(f"🧭 Ruta crítica: {' → '.join(names[key] for key in path)} ({path_seconds:.2f} s)")
     
-    total_success = sum(1 for _, success in results if success)
+    total_success = sum(1 for result in results.values() if result['ok'])
     print(f"\n📈 Secciones completadas: {total_success}/{len(results)}")
     
     # Mostrar archivos generados
@@ -172,8 +385,13 @@ def main():
     print(f"\n⏰ Tiempo de finalización: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ejecuta las secciones del laboratorio")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Secciones simultáneas (por defecto 1: corren en este proceso, sin "
+                             "arrancar otros); con N > 1 cada sección corre en su propio proceso")
+    args = parser.parse_args()
     try:
-        main()
+        main(args.workers)
     except KeyboardInterrupt:
         print(f"\n\n⏹️  Laboratorio interrumpido por el usuario.")
     except Exception as e:
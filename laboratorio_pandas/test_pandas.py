@@ -37,9 +37,12 @@ print("\n" + "="*50)
 print("🐍 INICIANDO ANÁLISIS CON PANDAS")
 print("="*50)
 
-# Cargar dataset
-df = pd.read_csv(dataset_path)
+# Cargar dataset desde la capa de datos (el CSV se ingiere solo si cambió)
+import reservoir_dataset
+ingested = reservoir_dataset.ingest(dataset_path)
+df = reservoir_dataset.load(dataset_path)
 print(f"📊 Dataset cargado: {df.shape[0]} filas, {df.shape[1]} columnas")
+print(f"{'📥 CSV ingerido' if ingested else '✅ Capa de datos al día'}: {reservoir_dataset.LAYER_PATH}")
 
 # Exploración básica
 print(f"\n--- Exploración básica ---")
@@ -51,28 +54,10 @@ print(f"Valores nulos:\n{df.isnull().sum()}")
 print(f"\n--- Primeras 5 filas ---")
 print(df.head())
 
-# Crear columnas derivadas
-print(f"\n--- Creando columnas derivadas ---")
-df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
-df['Total_Water'] = df['POONDI'] + df['CHOLAVARAM'] + df['REDHILLS'] + df['CHEMBARAMBAKKAM']
-df['Year'] = df['Date'].dt.year
-df['Month'] = df['Date'].dt.month
-
-# Clasificación de nivel
-def classify_water_level(total):
-    if total < 100:
-        return 'Crítico'
-    elif total < 300:
-        return 'Bajo'
-    elif total < 600:
-        return 'Normal'
-    else:
-        return 'Alto'
-
-df['Water_Level_Category'] = df['Total_Water'].apply(classify_water_level)
-
-print(f"✅ Columnas derivadas creadas")
-print(f"Nuevas columnas: Total_Water, Year, Month, Water_Level_Category")
+# Columnas derivadas, precalculadas en la capa de datos
+print(f"\n--- Columnas derivadas ---")
+print(f"✅ Columnas derivadas disponibles")
+print(f"Nuevas columnas: {', '.join(reservoir_dataset.DERIVED_COLUMNS)}")
 
 # Análisis por año
 print(f"\n--- Análisis por año ---")
@@ -1,5 +1,7 @@
 from dagster import Definitions
-from .assets import (
+# La carpeta (proyecto-covid) no es importable como paquete: assets.py se
+# importa como módulo de nivel superior (ver pythonpath en pyproject.toml)
+from assets import (
     leer_datos,
     datos_procesados,
     metrica_incidencia_7d,
@@ -5,6 +5,8 @@ from dagster import asset, asset_check, AssetCheckResult, AssetCheckSeverity
 import openpyxl
 from typing import Dict, Any
 
+from covid_pipeline.paises import resolver_paises
+
 # Paso 2 - Lectura de Datos
 @asset
 def leer_datos() -> pd.DataFrame:
@@ -154,15 +156,9 @@ def datos_procesados(leer_datos: pd.DataFrame) -> pd.DataFrame:
     paises_interes = ['Ecuador', 'Peru']
     location_col = columnas_reales['location']
     
-    # Buscar países que coincidan (case insensitive)
+    # Buscar países que coincidan (sin distinguir mayúsculas ni tildes)
     paises_disponibles = df_clean[location_col].unique()
-    paises_encontrados = []
-    
-    for pais_interes in paises_interes:
-        for pais_disponible in paises_disponibles:
-            if pais_interes.lower() in pais_disponible.lower():
-                paises_encontrados.append(pais_disponible)
-                break
+    paises_encontrados = resolver_paises(df_clean[location_col], paises_interes)
     
     if not paises_encontrados:
         print(f"ADVERTENCIA: No se encontraron países de interés. Usando los primeros 2 países disponibles.")
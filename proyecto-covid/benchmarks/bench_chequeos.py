@@ -0,0 +1,89 @@
+"""
+Benchmark de los chequeos de entrada: dos asset checks separados vs un
+multi-asset-check de una sola pasada.
+
+Se simula lo que hace Dagster en cada caso: antes, cada check cargaba
+leer_datos desde el IO manager y lo recorría por su cuenta; ahora se carga
+una vez y se perfila en un solo paso. El tamaño por defecto se aproxima al
+compact.csv completo de OWID (~530 mil filas, 61 columnas).
+
+Uso (desde proyecto-covid/):
+    python -m benchmarks.bench_chequeos
+    python -m benchmarks.bench_chequeos --filas 530000 --repeticiones 5
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.owid_sintetico import generar_csv
+from covid_pipeline.chequeos import perfilar_entrada
+from covid_pipeline.ingesta import ALIAS_COLUMNAS
+from covid_pipeline.io_manager import escribir_parquet, leer_parquet
+
+
+def fechas_futuras_original(df: pd.DataFrame) -> int:
+    """Cuerpo original de check_fechas_futuras (modifica df)."""
+    df['date'] = pd.to_datetime(df['date'])
+    return len(df[df['date'] > datetime.now()])
+
+
+def nulos_original(df: pd.DataFrame) -> int:
+    """Cuerpo original de check_columnas_clave."""
+    nulos_por_columna = {}
+    for col in ['location', 'date', 'population']:
+        if col in df.columns:
+            nulos_por_columna[col] = df[col].isnull().sum()
+    return sum(nulos_por_columna.values())
+
+
+def _mejor_tiempo(funcion, repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=530_000)
+    parser.add_argument("--paises", type=int, default=255)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    csv = b"".join(generar_csv(args.filas, args.paises))
+    df = pd.read_csv(io.BytesIO(csv)).rename(columns=ALIAS_COLUMNAS)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "leer_datos.parquet")
+        escribir_parquet(df, ruta)
+
+        def antes():
+            fechas_futuras_original(leer_parquet(ruta))
+            nulos_original(leer_parquet(ruta))
+
+        def despues():
+            perfilar_entrada(leer_parquet(ruta))
+
+        tiempos = {
+            "2 checks (carga incluida)": _mejor_tiempo(antes, args.repeticiones),
+            "multi-check (carga incluida)": _mejor_tiempo(despues, args.repeticiones),
+            "2 checks (solo cálculo)": _mejor_tiempo(
+                lambda: (fechas_futuras_original(df.copy(deep=False)), nulos_original(df)), args.repeticiones),
+            "multi-check (solo cálculo)": _mejor_tiempo(lambda: perfilar_entrada(df), args.repeticiones),
+        }
+
+    print(f"=== BENCHMARK CHEQUEOS DE ENTRADA ({len(df):,} filas, {len(df.columns)} columnas) ===")
+    for nombre, segundos in tiempos.items():
+        print(f"{nombre:<32}{segundos:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark del reporte Excel: pd.ExcelWriter(engine='openpyxl') vs escritura
+en streaming (xlsxwriter constant_memory y openpyxl write-only).
+
+Cada caso corre en un proceso aparte para medir su RSS pico. La tabla
+Datos_Procesados tiene el tamaño indicado; las de métricas, el mismo número
+de filas con sus tres o cuatro columnas.
+
+Uso (desde proyecto-covid/):
+    python -m benchmarks.bench_exportacion
+    python -m benchmarks.bench_exportacion --filas 10000 100000 --solo xlsxwriter
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_ingesta import _rss_pico_mb
+from benchmarks.owid_sintetico import nombres_paises
+from covid_pipeline.exportacion import escribir_reporte, escribir_reporte_pandas
+
+
+def hojas_sinteticas(n_filas: int, n_paises: int = 250) -> dict:
+    """Tablas con las columnas y tipos de las tres hojas del reporte."""
+    rng = np.random.default_rng(0)
+    paises = np.array(nombres_paises(n_paises))[np.arange(n_filas) % n_paises]
+    fechas = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.arange(n_filas) // n_paises, unit='D')
+    casos = rng.gamma(2.0, 50.0, n_filas)
+    return {
+        'Datos_Procesados': pd.DataFrame({
+            'location': paises, 'date': fechas, 'new_cases': casos,
+            'people_vaccinated': casos * 100, 'population': np.full(n_filas, 18e6),
+        }),
+        'Incidencia_7d': pd.DataFrame({'fecha': fechas, 'país': paises, 'incidencia_7d': casos / 10}),
+        'Factor_Crec_7d': pd.DataFrame({
+            'semana_fin': fechas, 'país': paises, 'casos_semana': casos * 7, 'factor_crec_7d': casos / 100,
+        }),
+    }
+
+
+def _ejecutar(modo: str, n_filas: int, cola) -> None:
+    hojas = hojas_sinteticas(n_filas)
+    rss_datos = _rss_pico_mb()
+    with tempfile.TemporaryDirectory() as carpeta:
+        archivo = os.path.join(carpeta, "reporte.xlsx")
+        inicio = time.perf_counter()
+        if modo == "pandas":
+            escribir_reporte_pandas(hojas, archivo)
+        else:
+            escribir_reporte(hojas, archivo, motor=modo)
+        segundos = time.perf_counter() - inicio
+        mb_archivo = os.path.getsize(archivo) / 1024 ** 2
+    cola.put({
+        "modo": modo, "filas": n_filas, "segundos": segundos, "mb_archivo": mb_archivo,
+        "rss_pico_mb": _rss_pico_mb(), "rss_datos_mb": rss_datos,
+    })
+
+
+def medir(modo: str, n_filas: int) -> dict:
+    """Escribe el reporte en un proceso nuevo y devuelve sus métricas."""
+    cola = mp.Queue()
+    proceso = mp.Process(target=_ejecutar, args=(modo, n_filas, cola))
+    proceso.start()
+    resultado = cola.get()
+    proceso.join()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--solo", choices=["pandas", "xlsxwriter", "openpyxl"], default=None)
+    args = parser.parse_args()
+
+    modos = [args.solo] if args.solo else ["pandas", "openpyxl", "xlsxwriter"]
+
+    print("=== BENCHMARK EXPORTACIÓN EXCEL (3 hojas) ===")
+    print(f"{'modo':<12}{'filas':>12}{'tiempo (s)':>12}{'xlsx (MB)':>11}{'RSS datos (MB)':>16}{'RSS pico (MB)':>15}")
+    for n_filas in args.filas:
+        for modo in modos:
+            r = medir(modo, n_filas)
+            print(f"{r['modo']:<12}{r['filas']:>12,}{r['segundos']:>12.2f}{r['mb_archivo']:>11.1f}"
+                  f"{r['rss_datos_mb']:>16.1f}{r['rss_pico_mb']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
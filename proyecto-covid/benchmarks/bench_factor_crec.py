@@ -0,0 +1,76 @@
+"""
+Benchmark de metrica_factor_crec_7d: bucle por filas original vs cálculo vectorizado.
+
+Uso (desde proyecto-covid/):
+    python -m benchmarks.bench_factor_crec
+    python -m benchmarks.bench_factor_crec --paises 1 10 250 --dias 1400
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.owid_sintetico import datos_procesados_sinteticos
+from covid_pipeline.metricas import calcular_factor_crec_7d
+
+
+def factor_crec_bucle(datos_procesados: pd.DataFrame) -> pd.DataFrame:
+    """Implementación original del asset (referencia para equivalencia y benchmark)."""
+    df = datos_procesados.copy()
+    df = df.sort_values(['location', 'date'])
+
+    resultados = []
+
+    for pais in df['location'].unique():
+        df_pais = df[df['location'] == pais].copy()
+        df_pais = df_pais.sort_values('date')
+
+        for i in range(14, len(df_pais)):  # Necesitamos al menos 14 días
+            fecha_fin = df_pais.iloc[i]['date']
+
+            # Casos semana actual (últimos 7 días)
+            casos_semana_actual = df_pais.iloc[i-6:i+1]['new_cases'].sum()
+
+            # Casos semana previa (días 7-13 atrás)
+            casos_semana_prev = df_pais.iloc[i-13:i-6]['new_cases'].sum()
+
+            if casos_semana_prev > 0:
+                factor_crec = casos_semana_actual / casos_semana_prev
+            else:
+                factor_crec = None
+
+            if factor_crec is not None:
+                resultados.append({
+                    'semana_fin': fecha_fin,
+                    'país': pais,
+                    'casos_semana': casos_semana_actual,
+                    'factor_crec_7d': factor_crec
+                })
+
+    return pd.DataFrame(resultados)
+
+
+def _medir(funcion, df) -> float:
+    inicio = time.perf_counter()
+    funcion(df)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paises", type=int, nargs="+", default=[1, 10, 250])
+    parser.add_argument("--dias", type=int, default=1400)
+    args = parser.parse_args()
+
+    print(f"=== BENCHMARK metrica_factor_crec_7d ({args.dias} días por país) ===")
+    print(f"{'países':>8}{'filas':>12}{'bucle (s)':>12}{'vectorizado (s)':>18}{'speed-up':>10}")
+    for n_paises in args.paises:
+        df = datos_procesados_sinteticos(n_paises, args.dias)
+        t_bucle = _medir(factor_crec_bucle, df)
+        t_vector = _medir(calcular_factor_crec_7d, df)
+        print(f"{n_paises:>8}{len(df):>12,}{t_bucle:>12.2f}{t_vector:>18.4f}{t_bucle / t_vector:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
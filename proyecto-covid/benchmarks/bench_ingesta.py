@@ -0,0 +1,73 @@
+"""
+Benchmark de ingesta: lectura completa (response.text + StringIO) vs streaming por chunks.
+
+Cada modo se ejecuta en un proceso aparte para medir su RSS pico de forma
+independiente contra un servidor HTTP local con un compact.csv sintético.
+
+Uso (desde proyecto-covid/):
+    python -m benchmarks.bench_ingesta --filas 2000000
+    python -m benchmarks.bench_ingesta --filas 20000000 --solo streaming   # ~GB
+"""
+
+import argparse
+import multiprocessing as mp
+import resource
+import time
+
+from benchmarks.owid_sintetico import servidor_owid
+from covid_pipeline.ingesta import leer_owid_completo, leer_owid_streaming
+
+
+def _rss_pico_mb() -> float:
+    # En Linux ru_maxrss viene en KiB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _ejecutar_modo(modo: str, url: str, paises, cola) -> None:
+    inicio = time.perf_counter()
+    if modo == "completo":
+        df = leer_owid_completo(url)
+    else:
+        df = leer_owid_streaming(url, paises=paises)
+    segundos = time.perf_counter() - inicio
+    cola.put({
+        "modo": modo,
+        "filas": len(df),
+        "columnas": len(df.columns),
+        "segundos": segundos,
+        "rss_pico_mb": _rss_pico_mb(),
+    })
+
+
+def medir(modo: str, url: str, paises=None) -> dict:
+    """Ejecuta un modo de lectura en un proceso nuevo y devuelve sus métricas."""
+    cola = mp.Queue()
+    proceso = mp.Process(target=_ejecutar_modo, args=(modo, url, paises, cola))
+    proceso.start()
+    resultado = cola.get()
+    proceso.join()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=2_000_000)
+    parser.add_argument("--paises", type=int, default=250)
+    parser.add_argument("--solo", choices=["completo", "streaming"], default=None)
+    args = parser.parse_args()
+
+    modos = [args.solo] if args.solo else ["completo", "streaming"]
+
+    print(f"=== BENCHMARK INGESTA OWID ({args.filas:,} filas, {args.paises} países) ===")
+    with servidor_owid(args.filas, args.paises) as servidor:
+        url = servidor.url
+        resultados = [medir(modo, url) for modo in modos]
+        resultados.append(dict(medir("streaming", url, ["Ecuador", "Peru"]), modo="streaming (Ecuador, Peru)"))
+
+    print(f"{'modo':<28}{'filas':>12}{'cols':>6}{'tiempo (s)':>12}{'RSS pico (MB)':>16}")
+    for r in resultados:
+        print(f"{r['modo']:<28}{r['filas']:>12,}{r['columnas']:>6}{r['segundos']:>12.2f}{r['rss_pico_mb']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
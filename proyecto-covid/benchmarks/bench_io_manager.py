@@ -0,0 +1,92 @@
+"""
+Benchmark del IO manager: pickle (FilesystemIOManager por defecto) vs Parquet.
+
+Mide el tamaño en disco y el tiempo de carga de la salida de leer_datos en
+modo completo (61 columnas) y en modo streaming (5 columnas). Para Parquet se
+mide además la carga proyectada a las columnas que declara datos_procesados
+y la de una partición diaria (solo las filas de un día, como la carga con
+filtro_fecha del IO manager). Como leer_datos, la salida se ordena por fecha.
+
+Uso (desde proyecto-covid/):
+    python -m benchmarks.bench_io_manager
+    python -m benchmarks.bench_io_manager --filas 2000000 --repeticiones 3
+"""
+
+import argparse
+import io
+import os
+import pickle
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.owid_sintetico import generar_csv
+from covid_pipeline.ingesta import ALIAS_COLUMNAS, COLUMNAS_INGESTA
+from covid_pipeline.io_manager import escribir_parquet, leer_parquet
+
+
+def _mejor_tiempo(funcion, repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def medir(df: pd.DataFrame, carpeta: str, repeticiones: int) -> list:
+    """Devuelve (formato, MB en disco, segundos de carga) para cada variante."""
+    ruta_pickle = os.path.join(carpeta, "salida.pickle")
+    ruta_parquet = os.path.join(carpeta, "salida.parquet")
+
+    # Mismo protocolo que PickledObjectFilesystemIOManager
+    with open(ruta_pickle, "wb") as f:
+        pickle.dump(df, f, pickle.HIGHEST_PROTOCOL)
+    escribir_parquet(df, ruta_parquet)
+
+    def cargar_pickle():
+        with open(ruta_pickle, "rb") as f:
+            return pickle.load(f)
+
+    mb_pickle = os.path.getsize(ruta_pickle) / 1024 ** 2
+    mb_parquet = os.path.getsize(ruta_parquet) / 1024 ** 2
+    # Un día a mitad del rango de fechas
+    dia = df['date'].iloc[len(df) // 2]
+    ventana = [('date', '>=', dia), ('date', '<', dia + pd.Timedelta(days=1))]
+    return [
+        ("pickle", mb_pickle, _mejor_tiempo(cargar_pickle, repeticiones)),
+        ("parquet", mb_parquet, _mejor_tiempo(lambda: leer_parquet(ruta_parquet), repeticiones)),
+        ("parquet (5 columnas)", mb_parquet,
+         _mejor_tiempo(lambda: leer_parquet(ruta_parquet, COLUMNAS_INGESTA), repeticiones)),
+        ("parquet (5 col, un día)", mb_parquet,
+         _mejor_tiempo(lambda: leer_parquet(ruta_parquet, COLUMNAS_INGESTA, ventana), repeticiones)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=500_000)
+    parser.add_argument("--paises", type=int, default=250)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    csv = b"".join(generar_csv(args.filas, args.paises))
+    completo = pd.read_csv(io.BytesIO(csv)).rename(columns=ALIAS_COLUMNAS)
+    completo['date'] = pd.to_datetime(completo['date'])
+    completo = completo.sort_values('date', kind='stable', ignore_index=True)
+    salidas = {
+        "completo (61 col)": completo,
+        "streaming (5 col)": completo[COLUMNAS_INGESTA].copy(),
+    }
+
+    print(f"=== BENCHMARK IO MANAGER ({args.filas:,} filas) ===")
+    print(f"{'salida de leer_datos':<22}{'formato':<24}{'MB en disco':>14}{'carga (s)':>12}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for nombre, df in salidas.items():
+            for formato, mb, segundos in medir(df, carpeta, args.repeticiones):
+                print(f"{nombre:<22}{formato:<24}{mb:>14.1f}{segundos:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
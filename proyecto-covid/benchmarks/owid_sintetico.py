@@ -0,0 +1,183 @@
+"""
+Generador de un compact.csv sintético de OWID y servidor HTTP local que lo sirve.
+
+Permite probar y medir la ingesta sin descargar el dataset real. El CSV se
+genera al vuelo mientras se envía, así que puede simular archivos de varios GB
+sin ocuparlos en disco.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Mismo orden de columnas que el compact.csv real (ver tabla_perfilado.csv)
+COLUMNAS_COMPACT = [
+    'country', 'date', 'total_cases', 'new_cases', 'new_cases_smoothed',
+    'total_cases_per_million', 'new_cases_per_million', 'new_cases_smoothed_per_million',
+    'total_deaths', 'new_deaths', 'new_deaths_smoothed', 'total_deaths_per_million',
+    'new_deaths_per_million', 'new_deaths_smoothed_per_million', 'excess_mortality',
+    'excess_mortality_cumulative', 'excess_mortality_cumulative_absolute',
+    'excess_mortality_cumulative_per_million', 'hosp_patients', 'hosp_patients_per_million',
+    'weekly_hosp_admissions', 'weekly_hosp_admissions_per_million', 'icu_patients',
+    'icu_patients_per_million', 'weekly_icu_admissions', 'weekly_icu_admissions_per_million',
+    'stringency_index', 'reproduction_rate', 'total_tests', 'new_tests',
+    'total_tests_per_thousand', 'new_tests_per_thousand', 'new_tests_smoothed',
+    'new_tests_smoothed_per_thousand', 'positive_rate', 'tests_per_case',
+    'total_vaccinations', 'people_vaccinated', 'people_fully_vaccinated', 'total_boosters',
+    'new_vaccinations', 'new_vaccinations_smoothed', 'total_vaccinations_per_hundred',
+    'people_vaccinated_per_hundred', 'people_fully_vaccinated_per_hundred',
+    'total_boosters_per_hundred', 'new_vaccinations_smoothed_per_million',
+    'new_people_vaccinated_smoothed', 'new_people_vaccinated_smoothed_per_hundred',
+    'code', 'continent', 'population', 'population_density', 'median_age',
+    'life_expectancy', 'gdp_per_capita', 'extreme_poverty', 'diabetes_prevalence',
+    'handwashing_facilities', 'hospital_beds_per_thousand', 'human_development_index',
+]
+
+FECHA_INICIO = date(2020, 1, 1)
+
+
+def nombres_paises(n_paises: int) -> List[str]:
+    """Devuelve n nombres de país; los dos primeros son Ecuador y Peru."""
+    base = ['Ecuador', 'Peru']
+    return (base + [f'Pais_{i:03d}' for i in range(len(base), n_paises)])[:n_paises]
+
+
+def generar_csv(n_filas: int, n_paises: int = 250, filas_por_bloque: int = 10_000) -> Iterator[bytes]:
+    """
+    Genera el CSV sintético por bloques de bytes.
+
+    Las filas se reparten en orden por país (como en OWID) con fechas
+    consecutivas. Los valores son deterministas para poder comparar resultados.
+    """
+    paises = nombres_paises(n_paises)
+    filas_por_pais = max(1, -(-n_filas // n_paises))
+    # Columnas que no usa el pipeline: valor constante para abaratar la generación
+    relleno_medio = ',1.5' * (COLUMNAS_COMPACT.index('people_vaccinated') - COLUMNAS_COMPACT.index('new_cases') - 1)
+    relleno_vacunas = ',1.0' * (COLUMNAS_COMPACT.index('code') - COLUMNAS_COMPACT.index('people_vaccinated') - 1)
+    relleno_final = ',2.5' * (len(COLUMNAS_COMPACT) - COLUMNAS_COMPACT.index('population') - 1)
+    relleno_inicio = ',1.0'  # total_cases
+
+    yield (','.join(COLUMNAS_COMPACT) + '\n').encode('utf-8')
+
+    bloque = []
+    emitidas = 0
+    for i_pais, pais in enumerate(paises):
+        poblacion = 1_000_000 + i_pais * 1000
+        for dia in range(filas_por_pais):
+            if emitidas >= n_filas:
+                break
+            fecha = (FECHA_INICIO + timedelta(days=dia)).isoformat()
+            casos = (dia * 7 + i_pais * 13) % 500
+            # Algunos huecos en vacunación, como en los datos reales
+            vacunados = '' if dia % 5 == 0 else str(dia * 10)
+            bloque.append(
+                f'{pais},{fecha}{relleno_inicio},{casos}.0{relleno_medio},{vacunados}'
+                f'{relleno_vacunas},X{i_pais},Continente,{poblacion}.0{relleno_final}\n'
+            )
+            emitidas += 1
+            if len(bloque) >= filas_por_bloque:
+                yield ''.join(bloque).encode('utf-8')
+                bloque = []
+
+    if bloque:
+        yield ''.join(bloque).encode('utf-8')
+
+
+def datos_procesados_sinteticos(n_paises: int, n_dias: int = 1400, semilla: int = 0) -> pd.DataFrame:
+    """
+    Construye un DataFrame con la forma de datos_procesados (ya filtrado y con
+    fechas parseadas), en orden aleatorio, para medir las métricas sin ingesta.
+
+    Los casos incluyen decimales, ceros y algún negativo (revisiones de OWID)
+    para ejercitar el redondeo y el filtro casos_semana_prev > 0.
+    """
+    rng = np.random.default_rng(semilla)
+    paises = np.repeat(nombres_paises(n_paises), n_dias)
+    fechas = np.tile(pd.date_range(FECHA_INICIO, periods=n_dias, freq='D'), n_paises)
+    casos = rng.gamma(2.0, 150.0, size=n_paises * n_dias).round(1)
+    casos[rng.random(casos.size) < 0.05] = 0.0
+    casos[rng.random(casos.size) < 0.002] *= -1
+    poblacion = np.repeat(1_000_000 + np.arange(n_paises) * 1000.0, n_dias)
+
+    df = pd.DataFrame({
+        'location': paises,
+        'date': fechas,
+        'new_cases': casos,
+        'people_vaccinated': np.arange(casos.size, dtype='float64'),
+        'population': poblacion,
+    })
+    return df.sample(frac=1.0, random_state=semilla).reset_index(drop=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Sirve el CSV sintético con ETag/Last-Modified y soporte de peticiones condicionales."""
+
+    def do_GET(self):
+        estado = self.server.estado
+        estado.peticiones += 1
+        etag = f'"{estado.n_filas}-{estado.n_paises}-{estado.version}"'
+
+        if self.headers.get('If-None-Match') == etag:
+            estado.respuestas_304 += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', estado.ultima_modificacion)
+        self.end_headers()
+        for bloque in generar_csv(estado.n_filas, estado.n_paises):
+            self.wfile.write(bloque)
+
+    def log_message(self, *args):
+        pass
+
+
+class ServidorOWID:
+    """Estado del servidor local: URL, versión publicada y contadores de peticiones."""
+
+    def __init__(self, n_filas: int, n_paises: int):
+        self.n_filas = n_filas
+        self.n_paises = n_paises
+        self.version = 1
+        self.ultima_modificacion = formatdate(usegmt=True)
+        self.peticiones = 0
+        self.respuestas_304 = 0
+        self.url = ''
+
+    def publicar(self, n_filas: Optional[int] = None) -> None:
+        """Simula una nueva versión del CSV en OWID (cambia el ETag)."""
+        if n_filas is not None:
+            self.n_filas = n_filas
+        self.version += 1
+        self.ultima_modificacion = formatdate(usegmt=True)
+
+
+@contextmanager
+def servidor_owid(n_filas: int, n_paises: int = 250, puerto: Optional[int] = 0):
+    """
+    Levanta un servidor HTTP local que sirve el compact.csv sintético.
+
+    Yields:
+        ServidorOWID: Estado del servidor; la URL del CSV está en .url
+    """
+    estado = ServidorOWID(n_filas, n_paises)
+    servidor = ThreadingHTTPServer(('127.0.0.1', puerto), _Handler)
+    servidor.estado = estado
+    estado.url = f'http://127.0.0.1:{servidor.server_address[1]}/compact.csv'
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        yield estado
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
@@ -2,25 +2,29 @@ from dagster import Definitions
 from .assets import (
     leer_datos,
     datos_procesados,
+    estado_ventanas,
     metrica_incidencia_7d,
     metrica_factor_crec_7d,
     reporte_excel_covid,
-    check_fechas_futuras,
-    check_columnas_clave,
+    checks_entrada,
     check_incidencia_rango
 )
+from .io_manager import CLAVE_IO_MANAGER, ParquetIOManager
 
 defs = Definitions(
     assets=[
         leer_datos,
         datos_procesados,
+        estado_ventanas,
         metrica_incidencia_7d,
         metrica_factor_crec_7d,
         reporte_excel_covid
     ],
     asset_checks=[
-        check_fechas_futuras,
-        check_columnas_clave,
+        checks_entrada,
         check_incidencia_rango
-    ]
+    ],
+    resources={
+        CLAVE_IO_MANAGER: ParquetIOManager()
+    }
 )
\ No newline at end of file
@@ -1,158 +1,295 @@
+import os
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
-from dagster import asset, asset_check, AssetCheckResult, AssetCheckSeverity
-import openpyxl
-from typing import Dict, Any
+from dagster import (
+    asset, asset_check, multi_asset_check, AssetCheckResult, AssetCheckSeverity, AssetCheckSpec,
+    AssetExecutionContext, AssetIn, Config, DailyPartitionsDefinition, TimeWindowPartitionMapping,
+    TimeWindowPartitionsDefinition, WeeklyPartitionsDefinition
+)
+from typing import Dict, Any, Iterable, List, Optional
+
+from .cache import CacheOWID, DIRECTORIO_CACHE
+from .chequeos import parsear_fechas, perfilar_entrada
+from .exportacion import escribir_reporte
+from .io_manager import CLAVE_IO_MANAGER, METADATA_FILTRO_FECHA
+from .metricas import actualizar_estado, calcular_factor_crec_7d, calcular_incidencia_7d
+from .paises import resolver_paises
+from .ingesta import (
+    URL_OWID, ALIAS_COLUMNAS, COLUMNAS_INGESTA, FILAS_POR_CHUNK,
+    parsear_csv_completo, parsear_csv_streaming
+)
+
+# Particiones por fecha: OWID solo agrega días nuevos, así que cada corrida
+# procesa la partición nueva reutilizando el estado de la anterior.
+#
+# COVID_PARTICIONES se lee al importar el módulo y define las claves de las
+# particiones guardadas (una por día o una por semana). Cambiarla con datos ya
+# materializados deja huérfanas las particiones anteriores: hay que volver a
+# materializar todo (backfill) con el nuevo valor.
+FECHA_INICIO_PARTICIONES = "2020-01-01"
+
+
+def definir_particiones(tipo: str) -> TimeWindowPartitionsDefinition:
+    """
+    Particiones diarias o semanales desde FECHA_INICIO_PARTICIONES.
+
+    Las semanas empiezan el mismo día de la semana que FECHA_INICIO_PARTICIONES
+    (un miércoles): con las semanas de domingo por defecto de Dagster la
+    primera partición empezaría el 2020-01-05 y los días anteriores de OWID
+    nunca se materializarían.
+
+    Args:
+        tipo (str): "semanal"; cualquier otro valor da particiones diarias
+    """
+    if tipo == "semanal":
+        # Dagster numera los días desde el domingo (0); pandas desde el lunes
+        dia = (pd.Timestamp(FECHA_INICIO_PARTICIONES).dayofweek + 1) % 7
+        return WeeklyPartitionsDefinition(start_date=FECHA_INICIO_PARTICIONES, day_offset=dia)
+    return DailyPartitionsDefinition(start_date=FECHA_INICIO_PARTICIONES)
+
+
+PARTICIONES = definir_particiones(os.environ.get("COVID_PARTICIONES", "diaria"))
+
+# Partición inmediatamente anterior (no existe para la primera partición)
+PARTICION_ANTERIOR = TimeWindowPartitionMapping(
+    start_offset=-1, end_offset=-1, allow_nonexistent_upstream_partitions=True
+)
+
+
+def _unir_particiones(particiones: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Concatena en orden las particiones cargadas por un asset no particionado."""
+    partes = [particiones[clave] for clave in sorted(particiones)]
+    no_vacias = [parte for parte in partes if not parte.empty]
+    if not no_vacias:
+        return partes[0] if partes else pd.DataFrame()
+    return pd.concat(no_vacias, ignore_index=True)
+
+
+def _entrada(columnas: Optional[List[str]] = None, filtro_fecha: Optional[str] = None, **kwargs) -> AssetIn:
+    """
+    AssetIn que carga del IO manager Parquet solo las columnas indicadas y,
+    con filtro_fecha, solo las filas de la ventana de la partición.
+    """
+    metadata = {"columnas": columnas} if columnas is not None else {}
+    if filtro_fecha is not None:
+        metadata[METADATA_FILTRO_FECHA] = filtro_fecha
+    return AssetIn(metadata=metadata, **kwargs)
+
+
+def _ordenar_por_fecha(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte date a datetime y ordena las filas por fecha (estable: dentro de
+    cada día se conserva el orden por país), para que cada partición lea del
+    Parquet solo los grupos de filas de su ventana.
+    """
+    if 'date' not in df.columns:
+        return df
+    df = df.assign(date=parsear_fechas(df['date']))
+    return df.sort_values('date', kind='stable', ignore_index=True)
 
 # Paso 2 - Lectura de Datos
-@asset
-def leer_datos() -> pd.DataFrame:
+class LecturaConfig(Config):
+    """Configuración de la ingesta de OWID."""
+    modo: str = "streaming"  # "streaming" o "completo"
+    url: str = URL_OWID
+    filas_por_chunk: int = FILAS_POR_CHUNK
+    paises: Optional[List[str]] = None  # None = todos los países
+    usar_cache: bool = True
+    directorio_cache: str = DIRECTORIO_CACHE
+
+
+@asset(io_manager_key=CLAVE_IO_MANAGER)
+def leer_datos(context: AssetExecutionContext, config: LecturaConfig) -> pd.DataFrame:
     """
     Lee los datos COVID-19 desde la URL canónica de OWID.
     Sin transformaciones, solo lectura.
+
+    En modo streaming el CSV se parsea por chunks a medida que llega,
+    conservando solo las columnas que usa el pipeline. Con usar_cache se
+    reutiliza el último snapshot Parquet si OWID responde 304.
+
+    La salida queda con date como datetime y ordenada por fecha.
     """
-    url = "https://catalog.ourworldindata.org/garden/covid/latest/compact/compact.csv"
-    response = requests.get(url)
-    
-    # Crear DataFrame desde el contenido CSV
-    from io import StringIO
-    df = pd.read_csv(StringIO(response.text))
-    
-    return df
-
-# Chequeos de Entrada
-@asset_check(asset=leer_datos)
-def check_fechas_futuras(leer_datos: pd.DataFrame) -> AssetCheckResult:
-    """Verifica que no existan fechas futuras en los datos."""
-    df = leer_datos
-    df['date'] = pd.to_datetime(df['date'])
-    fechas_futuras = df[df['date'] > datetime.now()]
-    
-    passed = len(fechas_futuras) == 0
-    
-    return AssetCheckResult(
-        passed=passed,
+    if config.modo == "completo":
+        parser = lambda response: parsear_csv_completo(response).rename(columns=ALIAS_COLUMNAS)
+    elif config.modo == "streaming":
+        parser = lambda response: parsear_csv_streaming(
+            response, paises=config.paises, filas_por_chunk=config.filas_por_chunk
+        )
+    else:
+        raise ValueError(f"Modo de lectura no soportado: {config.modo}")
+
+    if not config.usar_cache:
+        with requests.get(config.url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            return _ordenar_por_fecha(parser(response))
+
+    cache = CacheOWID(config.directorio_cache)
+    variante = f"{config.modo}|{COLUMNAS_INGESTA}|{config.paises}"
+    df, acierto = cache.leer(config.url, parser, variante=variante)
+
+    estadisticas = cache.estadisticas()
+    context.add_output_metadata({
+        "cache_acierto": acierto,
+        "cache_aciertos": estadisticas["aciertos"],
+        "cache_fallos": estadisticas["fallos"],
+        "cache_bytes_en_disco": estadisticas["bytes_en_disco"],
+    })
+    return _ordenar_por_fecha(df)
+
+# Chequeos de Entrada (una sola pasada sobre leer_datos)
+@multi_asset_check(
+    specs=[
+        AssetCheckSpec("check_fechas_futuras", asset=leer_datos,
+                       description="Verifica que no existan fechas futuras en los datos."),
+        AssetCheckSpec("check_columnas_clave", asset=leer_datos,
+                       description="Verifica que las columnas clave no tengan valores nulos."),
+    ],
+)
+def checks_entrada(leer_datos: pd.DataFrame) -> Iterable[AssetCheckResult]:
+    """
+    Carga leer_datos una vez y emite por separado el resultado de cada chequeo.
+    Las fechas se parsean a una columna aparte, sin modificar el DataFrame.
+    """
+    perfil = perfilar_entrada(leer_datos)
+
+    yield AssetCheckResult(
+        check_name="check_fechas_futuras",
+        passed=perfil["fechas_futuras"] == 0,
         metadata={
-            "filas_afectadas": len(fechas_futuras),
+            "filas_afectadas": perfil["fechas_futuras"],
             "notas": "Verificación de fechas futuras en el dataset"
         }
     )
 
-@asset_check(asset=leer_datos)
-def check_columnas_clave(leer_datos: pd.DataFrame) -> AssetCheckResult:
-    """Verifica que las columnas clave no tengan valores nulos."""
-    df = leer_datos
-    columnas_clave = ['location', 'date', 'population']
-    
-    nulos_por_columna = {}
-    for col in columnas_clave:
-        if col in df.columns:
-            nulos_por_columna[col] = df[col].isnull().sum()
-    
-    total_nulos = sum(nulos_por_columna.values())
-    passed = total_nulos == 0
-    
-    return AssetCheckResult(
-        passed=passed,
+    total_nulos = sum(perfil["nulos_por_columna"].values())
+    yield AssetCheckResult(
+        check_name="check_columnas_clave",
+        passed=total_nulos == 0,
         metadata={
             "filas_afectadas": total_nulos,
-            "nulos_por_columna": nulos_por_columna,
+            "nulos_por_columna": perfil["nulos_por_columna"],
+            "columnas_faltantes": perfil["columnas_faltantes"],
+            "columnas_presentes": len(perfil["columnas_presentes"]),
             "notas": "Verificación de valores nulos en columnas clave"
         }
     )
 
 # Paso 3 - Procesamiento de Datos
-@asset
-def datos_procesados(leer_datos: pd.DataFrame) -> pd.DataFrame:
+class ProcesamientoConfig(Config):
+    """
+    Selección de países para el procesamiento: nombres exactos de OWID, sin
+    distinguir tildes, mayúsculas ni espacios extra.
+    """
+    paises: List[str] = ['Ecuador', 'Peru']
+    todos_los_paises: bool = False
+
+
+@asset(
+    partitions_def=PARTICIONES,
+    io_manager_key=CLAVE_IO_MANAGER,
+    ins={"leer_datos": _entrada(COLUMNAS_INGESTA, filtro_fecha='date')},
+)
+def datos_procesados(
+    context: AssetExecutionContext, config: ProcesamientoConfig, leer_datos: pd.DataFrame
+) -> pd.DataFrame:
     """
     Procesa los datos aplicando filtros y limpieza.
+
+    Cada partición contiene solo las filas de su rango de fechas: el IO
+    manager ya carga solo esa ventana de leer_datos (ver filtro_fecha), así
+    que una partición no recorre la historia completa. Por defecto filtra a
+    Ecuador y Perú; la configuración permite elegir otros países o procesar
+    todas las ubicaciones de OWID.
     """
-    df = leer_datos.copy()
-    
+    # Ventana de la partición sobre la fecha ya tipada; con el IO manager es
+    # una comprobación sobre pocas filas, invocado directamente hace el filtro
+    ventana = context.partition_time_window
+    fechas = parsear_fechas(leer_datos['date'])
+    inicio = pd.Timestamp(ventana.start).tz_localize(None)
+    fin = pd.Timestamp(ventana.end).tz_localize(None)
+    df = leer_datos[(fechas >= inicio) & (fechas < fin)]
+
+    # Luego a los países de interés. Solo coincidencia exacta (normalizada):
+    # por subcadena el país elegido dependería de qué ubicaciones tenga la
+    # ventana y una partición podría mezclar, por ejemplo, Nigeria con Niger
+    if config.todos_los_paises:
+        df_filtrado = df
+    else:
+        paises_encontrados = resolver_paises(df['location'], config.paises, subcadena=False)
+        context.log.info(f"Usando países: {paises_encontrados}")
+        df_filtrado = df[df['location'].isin(paises_encontrados)]
+
     # Eliminar filas con valores nulos en new_cases o people_vaccinated
-    df_clean = df.dropna(subset=['new_cases', 'people_vaccinated'])
-    
+    df_clean = df_filtrado.dropna(subset=['new_cases', 'people_vaccinated'])
+
     # Eliminar duplicados basados en location y date
     df_clean = df_clean.drop_duplicates(subset=['location', 'date'])
-    
-    # Filtrar a Ecuador y país comparativo (Perú)
-    paises_interes = ['Ecuador', 'Peru']
-    df_filtrado = df_clean[df_clean['location'].isin(paises_interes)]
-    
+
     # Seleccionar columnas esenciales
     columnas_esenciales = ['location', 'date', 'new_cases', 'people_vaccinated', 'population']
-    df_final = df_filtrado[columnas_esenciales].copy()
-    
+    df_final = df_clean[columnas_esenciales].copy()
+
     # Convertir date a datetime
     df_final['date'] = pd.to_datetime(df_final['date'])
-    
+
     return df_final
 
+# Estado de ventanas: últimas 13 filas por país tras cada partición
+@asset(
+    partitions_def=PARTICIONES,
+    io_manager_key=CLAVE_IO_MANAGER,
+    ins={
+        "datos_procesados": _entrada(['location', 'date', 'new_cases', 'population']),
+        "estado_ventanas": AssetIn(partition_mapping=PARTICION_ANTERIOR),
+    },
+)
+def estado_ventanas(
+    datos_procesados: pd.DataFrame, estado_ventanas: Optional[pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Guarda el contexto que necesitan las ventanas de 7 y 14 días para que
+    la partición siguiente no tenga que releer la historia completa.
+    """
+    return actualizar_estado(datos_procesados, estado_ventanas)
+
 # Paso 4A - Métrica de Incidencia a 7 días
-@asset
-def metrica_incidencia_7d(datos_procesados: pd.DataFrame) -> pd.DataFrame:
+@asset(
+    partitions_def=PARTICIONES,
+    io_manager_key=CLAVE_IO_MANAGER,
+    ins={
+        "datos_procesados": _entrada(['location', 'date', 'new_cases', 'population']),
+        "estado_ventanas": AssetIn(partition_mapping=PARTICION_ANTERIOR),
+    },
+)
+def metrica_incidencia_7d(
+    datos_procesados: pd.DataFrame, estado_ventanas: Optional[pd.DataFrame]
+) -> pd.DataFrame:
     """
     Calcula la incidencia acumulada a 7 días por 100 mil habitantes.
     """
-    df = datos_procesados.copy()
-    df = df.sort_values(['location', 'date'])
-    
-    # Calcular incidencia diaria por 100k habitantes
-    df['incidencia_diaria'] = (df['new_cases'] / df['population']) * 100000
-    
-    # Calcular promedio móvil de 7 días
-    df['incidencia_7d'] = df.groupby('location')['incidencia_diaria'].rolling(
-        window=7, min_periods=7
-    ).mean().reset_index(level=0, drop=True)
-    
-    # Seleccionar columnas finales
-    resultado = df[['date', 'location', 'incidencia_7d']].dropna()
-    resultado.columns = ['fecha', 'país', 'incidencia_7d']
-    
-    return resultado
+    return calcular_incidencia_7d(datos_procesados, estado_ventanas)
 
 # Paso 4B - Factor de Crecimiento Semanal
-@asset
-def metrica_factor_crec_7d(datos_procesados: pd.DataFrame) -> pd.DataFrame:
+@asset(
+    partitions_def=PARTICIONES,
+    io_manager_key=CLAVE_IO_MANAGER,
+    ins={
+        "datos_procesados": _entrada(['location', 'date', 'new_cases']),
+        "estado_ventanas": AssetIn(partition_mapping=PARTICION_ANTERIOR),
+    },
+)
+def metrica_factor_crec_7d(
+    datos_procesados: pd.DataFrame, estado_ventanas: Optional[pd.DataFrame]
+) -> pd.DataFrame:
     """
     Calcula el factor de crecimiento semanal de casos.
     """
-    df = datos_procesados.copy()
-    df = df.sort_values(['location', 'date'])
-    
-    resultados = []
-    
-    for pais in df['location'].unique():
-        df_pais = df[df['location'] == pais].copy()
-        df_pais = df_pais.sort_values('date')
-        
-        for i in range(14, len(df_pais)):  # Necesitamos al menos 14 días
-            fecha_fin = df_pais.iloc[i]['date']
-            
-            # Casos semana actual (últimos 7 días)
-            casos_semana_actual = df_pais.iloc[i-6:i+1]['new_cases'].sum()
-            
-            # Casos semana previa (días 7-13 atrás)
-            casos_semana_prev = df_pais.iloc[i-13:i-6]['new_cases'].sum()
-            
-            if casos_semana_prev > 0:
-                factor_crec = casos_semana_actual / casos_semana_prev
-            else:
-                factor_crec = None
-            
-            if factor_crec is not None:
-                resultados.append({
-                    'semana_fin': fecha_fin,
-                    'país': pais,
-                    'casos_semana': casos_semana_actual,
-                    'factor_crec_7d': factor_crec
-                })
-    
-    return pd.DataFrame(resultados)
+    return calcular_factor_crec_7d(datos_procesados, estado_ventanas)
 
 # Paso 5 - Chequeos de Salida
-@asset_check(asset=metrica_incidencia_7d)
+@asset_check(asset=metrica_incidencia_7d, partitions_def=PARTICIONES)
 def check_incidencia_rango(metrica_incidencia_7d: pd.DataFrame) -> AssetCheckResult:
     """Valida que incidencia_7d esté en rango esperado (0-2000)."""
     df = metrica_incidencia_7d
@@ -171,25 +308,48 @@ def check_incidencia_rango(metrica_incidencia_7d: pd.DataFrame) -> AssetCheckRes
     )
 
 # Paso 6 - Exportación de Resultados
-@asset
+class ReporteConfig(Config):
+    """Destino del reporte y tratamiento de tablas que exceden los límites de Excel."""
+    archivo: str = "reporte_covid_resultados.xlsx"
+    desborde: str = "dividir"  # "dividir" en varias hojas, "parquet" o "csv"
+    motor: Optional[str] = None  # "xlsxwriter" u "openpyxl"; None elige el disponible
+
+
+@asset(
+    ins={
+        nombre: AssetIn(metadata={"allow_missing_partitions": True})
+        for nombre in ["datos_procesados", "metrica_incidencia_7d", "metrica_factor_crec_7d"]
+    },
+)
 def reporte_excel_covid(
-    datos_procesados: pd.DataFrame,
-    metrica_incidencia_7d: pd.DataFrame,
-    metrica_factor_crec_7d: pd.DataFrame
+    context: AssetExecutionContext,
+    config: ReporteConfig,
+    datos_procesados: Dict[str, pd.DataFrame],
+    metrica_incidencia_7d: Dict[str, pd.DataFrame],
+    metrica_factor_crec_7d: Dict[str, pd.DataFrame]
 ) -> str:
     """
     Exporta los resultados finales a un archivo Excel.
+    Recibe todas las particiones de cada asset y las une por fecha; las
+    particiones aún no materializadas se omiten.
+
+    Las filas se escriben en streaming (xlsxwriter u openpyxl). Las tablas que
+    superan el límite de filas de Excel se reparten en varias hojas o se
+    exportan a un archivo aparte, según config.desborde.
     """
-    archivo_excel = "reporte_covid_resultados.xlsx"
-    
-    with pd.ExcelWriter(archivo_excel, engine='openpyxl') as writer:
-        # Hoja 1: Datos procesados
-        datos_procesados.to_excel(writer, sheet_name='Datos_Procesados', index=False)
-        
-        # Hoja 2: Métrica incidencia 7d
-        metrica_incidencia_7d.to_excel(writer, sheet_name='Incidencia_7d', index=False)
-        
-        # Hoja 3: Métrica factor crecimiento 7d
-        metrica_factor_crec_7d.to_excel(writer, sheet_name='Factor_Crec_7d', index=False)
-    
-    return f"Reporte exportado exitosamente a {archivo_excel}"
\ No newline at end of file
+    hojas = {
+        'Datos_Procesados': _unir_particiones(datos_procesados),
+        'Incidencia_7d': _unir_particiones(metrica_incidencia_7d),
+        'Factor_Crec_7d': _unir_particiones(metrica_factor_crec_7d),
+    }
+    destino = escribir_reporte(hojas, config.archivo, desborde=config.desborde, motor=config.motor)
+
+    context.add_output_metadata({
+        f"hojas_{nombre}": ", ".join(info["hojas"]) for nombre, info in destino.items()
+    })
+    sidecars = [info["sidecar"] for info in destino.values() if info["sidecar"]]
+    if sidecars:
+        context.log.warning(f"Tablas exportadas fuera del Excel por exceder sus límites: {sidecars}")
+        return f"Reporte exportado exitosamente a {config.archivo} (y {', '.join(sidecars)})"
+
+    return f"Reporte exportado exitosamente a {config.archivo}"
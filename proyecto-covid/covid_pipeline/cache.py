@@ -0,0 +1,203 @@
+"""
+Caché local de snapshots Parquet para la descarga de OWID.
+
+Cada snapshot guarda el DataFrame ya parseado y se identifica por un hash de
+la URL, su validador HTTP (ETag / Last-Modified) y la variante de parseo
+(columnas, países...). Antes de descargar se envía una petición condicional
+(If-None-Match / If-Modified-Since); si el servidor responde 304 se carga el
+Parquet con memory-mapping en lugar de volver a descargar y parsear el CSV.
+
+La usan tanto el asset leer_datos como eda_exploracion.py.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import requests
+
+DIRECTORIO_CACHE = os.environ.get("COVID_CACHE_DIR", ".cache_owid")
+MAX_DIAS_CACHE = 7
+MAX_BYTES_CACHE = 2 * 1024 ** 3  # 2 GiB
+
+_ARCHIVO_INDICE = "indice.json"
+
+
+class CacheOWID:
+    """Caché de snapshots Parquet con revalidación HTTP condicional"""
+
+    def __init__(
+        self,
+        directorio: str = DIRECTORIO_CACHE,
+        max_dias: float = MAX_DIAS_CACHE,
+        max_bytes: int = MAX_BYTES_CACHE,
+    ):
+        """
+        Args:
+            directorio (str): Carpeta donde se guardan los snapshots
+            max_dias (float): Días sin revalidar (304) antes de desalojar un snapshot
+            max_bytes (int): Tamaño total máximo de los snapshots en disco
+        """
+        self.directorio = directorio
+        self.max_dias = max_dias
+        self.max_bytes = max_bytes
+        os.makedirs(directorio, exist_ok=True)
+        self._indice = self._cargar_indice()
+
+    # Índice persistente ---------------------------------------------------
+
+    def _ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio, nombre)
+
+    def _cargar_indice(self) -> Dict[str, Any]:
+        try:
+            with open(self._ruta(_ARCHIVO_INDICE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"validadores": {}, "snapshots": {}, "aciertos": 0, "fallos": 0}
+
+    def _guardar_indice(self) -> None:
+        temporal = self._ruta(_ARCHIVO_INDICE + ".tmp")
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(self._indice, f, indent=2)
+        os.replace(temporal, self._ruta(_ARCHIVO_INDICE))
+
+    @staticmethod
+    def _clave(url: str, validador: Dict[str, Optional[str]], variante: str) -> str:
+        contenido = "\n".join([url, validador.get("etag") or "", validador.get("last_modified") or "", variante])
+        return hashlib.sha256(contenido.encode("utf-8")).hexdigest()[:32]
+
+    # API pública ----------------------------------------------------------
+
+    def leer(
+        self,
+        url: str,
+        parser: Callable[[requests.Response], pd.DataFrame],
+        variante: str = "",
+        timeout: int = 300,
+    ) -> Tuple[pd.DataFrame, bool]:
+        """
+        Devuelve el DataFrame de la URL, desde caché si el servidor lo permite.
+
+        Args:
+            url (str): URL del CSV
+            parser (Callable): Función que convierte la respuesta (stream=True) en DataFrame
+            variante (str): Identifica el parseo (columnas, filtros) dentro de la misma URL
+            timeout (int): Timeout de la petición HTTP en segundos
+
+        Returns:
+            Tuple[pd.DataFrame, bool]: (datos, True si fue un acierto de caché)
+        """
+        validador = self._indice["validadores"].get(url, {})
+        clave = self._clave(url, validador, variante)
+        snapshot = self._indice["snapshots"].get(clave)
+        disponible = snapshot is not None and os.path.exists(self._ruta(snapshot["archivo"]))
+
+        cabeceras = {}
+        if disponible:
+            if validador.get("etag"):
+                cabeceras["If-None-Match"] = validador["etag"]
+            if validador.get("last_modified"):
+                cabeceras["If-Modified-Since"] = validador["last_modified"]
+
+        with requests.get(url, headers=cabeceras, stream=True, timeout=timeout) as response:
+            if response.status_code == 304 and disponible:
+                # El servidor confirmó que el snapshot sigue vigente
+                snapshot["ultimo_uso"] = snapshot["validado"] = time.time()
+                self._indice["aciertos"] += 1
+                self._guardar_indice()
+                return pd.read_parquet(self._ruta(snapshot["archivo"]), memory_map=True), True
+
+            response.raise_for_status()
+            df = parser(response)
+            nuevo_validador = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+        self._indice["fallos"] += 1
+        if nuevo_validador["etag"] or nuevo_validador["last_modified"]:
+            self._guardar_snapshot(url, nuevo_validador, variante, df)
+        self._guardar_indice()
+        return df, False
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict: Contadores de aciertos/fallos y ocupación de la caché
+        """
+        snapshots = self._indice["snapshots"].values()
+        return {
+            "aciertos": self._indice["aciertos"],
+            "fallos": self._indice["fallos"],
+            "snapshots": len(snapshots),
+            "bytes_en_disco": sum(s["bytes"] for s in snapshots),
+        }
+
+    def desalojar(self, conservar: Optional[str] = None) -> int:
+        """
+        Elimina snapshots que el servidor no revalidó en max_dias y, si el
+        total supera max_bytes, los menos usados recientemente.
+
+        Args:
+            conservar (str): Clave que no debe desalojarse (el snapshot recién escrito)
+
+        Returns:
+            int: Número de snapshots eliminados
+        """
+        snapshots = self._indice["snapshots"]
+        limite = time.time() - self.max_dias * 86400
+        # Los índices anteriores a "validado" solo tienen la fecha de creación
+        eliminar = [
+            c for c, s in snapshots.items()
+            if s.get("validado", s["creado"]) < limite and c != conservar
+        ]
+
+        restantes = sorted(
+            (c for c in snapshots if c not in eliminar),
+            key=lambda c: snapshots[c]["ultimo_uso"],
+        )
+        total = sum(snapshots[c]["bytes"] for c in restantes)
+        for clave in restantes:
+            if total <= self.max_bytes:
+                break
+            if clave == conservar:
+                continue
+            eliminar.append(clave)
+            total -= snapshots[clave]["bytes"]
+
+        for clave in eliminar:
+            archivo = self._ruta(snapshots.pop(clave)["archivo"])
+            if os.path.exists(archivo):
+                os.remove(archivo)
+        return len(eliminar)
+
+    # Internos -------------------------------------------------------------
+
+    def _guardar_snapshot(self, url: str, validador: Dict[str, Optional[str]], variante: str, df: pd.DataFrame) -> None:
+        # Los snapshots anteriores de la misma URL y variante quedan obsoletos
+        obsoletos = [c for c, s in self._indice["snapshots"].items() if s["url"] == url and s["variante"] == variante]
+        for clave in obsoletos:
+            archivo = self._ruta(self._indice["snapshots"].pop(clave)["archivo"])
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+        clave = self._clave(url, validador, variante)
+        archivo = f"{clave}.parquet"
+        df.to_parquet(self._ruta(archivo), index=False)
+
+        ahora = time.time()
+        self._indice["validadores"][url] = validador
+        self._indice["snapshots"][clave] = {
+            "url": url,
+            "variante": variante,
+            "archivo": archivo,
+            "bytes": os.path.getsize(self._ruta(archivo)),
+            "creado": ahora,
+            "validado": ahora,
+            "ultimo_uso": ahora,
+        }
+        self.desalojar(conservar=clave)
@@ -0,0 +1,62 @@
+"""
+Perfilado de una sola pasada para los chequeos de entrada sobre leer_datos.
+
+Calcula en un único recorrido lo que antes hacían por separado
+check_fechas_futuras y check_columnas_clave, sin modificar el DataFrame
+recibido: las fechas se parsean una vez a una columna tipada aparte.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+COLUMNAS_CLAVE = ['location', 'date', 'population']
+
+
+def parsear_fechas(fechas: pd.Series) -> pd.Series:
+    """
+    Convierte la columna date a datetime64 sin tocar la original.
+
+    OWID publica fechas ISO (YYYY-MM-DD); con el formato explícito pandas usa
+    su parser rápido en lugar de inferir el formato fila a fila.
+    """
+    if pd.api.types.is_datetime64_any_dtype(fechas):
+        return fechas
+    return pd.to_datetime(fechas, format='ISO8601')
+
+
+def perfilar_entrada(
+    df: pd.DataFrame,
+    columnas_clave: Optional[List[str]] = None,
+    ahora: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Perfila el DataFrame de leer_datos para los chequeos de entrada.
+
+    Args:
+        df (pd.DataFrame): Salida de leer_datos (no se modifica)
+        columnas_clave (List[str]): Columnas que no deben tener nulos; por defecto COLUMNAS_CLAVE
+        ahora (datetime): Referencia para fechas futuras; por defecto datetime.now()
+
+    Returns:
+        Dict: fechas_futuras, nulos_por_columna, columnas_presentes y columnas_faltantes
+    """
+    columnas_clave = COLUMNAS_CLAVE if columnas_clave is None else columnas_clave
+    ahora = datetime.now() if ahora is None else ahora
+
+    presentes = [col for col in columnas_clave if col in df.columns]
+    faltantes = [col for col in columnas_clave if col not in df.columns]
+
+    nulos = df[presentes].isna().sum()
+
+    fechas_futuras = 0
+    if 'date' in df.columns:
+        fechas_futuras = int((parsear_fechas(df['date']) > ahora).sum())
+
+    return {
+        'fechas_futuras': fechas_futuras,
+        'nulos_por_columna': {col: int(nulos[col]) for col in presentes},
+        'columnas_presentes': list(df.columns),
+        'columnas_faltantes': faltantes,
+    }
@@ -0,0 +1,169 @@
+"""
+Exportación del reporte Excel en modo streaming.
+
+Las filas se escriben a disco a medida que se agregan en lugar de construir
+todo el libro en memoria como hace pd.ExcelWriter. Se usa xlsxwriter en modo
+constant_memory si está instalado y, si no, el modo write-only de openpyxl
+(igual de acotado en memoria, pero bastante más lento al serializar). Los
+valores se convierten por bloques de filas, así que la memoria adicional
+queda acotada por un bloque.
+
+Si una tabla no cabe en una hoja (1.048.576 filas contando el encabezado o
+16.384 columnas) se reparte en varias hojas (Hoja, Hoja_2, ...) o se escribe
+en un archivo Parquet/CSV al lado del Excel, según la estrategia elegida.
+"""
+
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+from openpyxl import Workbook
+
+try:
+    import xlsxwriter
+except ImportError:  # dependencia opcional
+    xlsxwriter = None
+
+MAX_FILAS_EXCEL = 1_048_576
+MAX_COLUMNAS_EXCEL = 16_384
+FILAS_POR_BLOQUE = 50_000
+
+ESTRATEGIAS_DESBORDE = ("dividir", "parquet", "csv")
+MOTORES = ("xlsxwriter", "openpyxl")
+
+# Mismo formato que usa pandas para las columnas datetime
+FORMATO_FECHA = "yyyy-mm-dd hh:mm:ss"
+
+
+def _filas(df: pd.DataFrame, filas_por_bloque: int = FILAS_POR_BLOQUE) -> Iterator[tuple]:
+    """
+    Recorre las filas del DataFrame como tuplas de valores que openpyxl
+    puede escribir (NaN/NaT pasan a celdas vacías, como en to_excel).
+    """
+    for inicio in range(0, len(df), filas_por_bloque):
+        bloque = df.iloc[inicio:inicio + filas_por_bloque]
+        columnas = []
+        for _, serie in bloque.items():
+            valores = serie.to_numpy(dtype=object)
+            valores[serie.isna().to_numpy()] = None
+            columnas.append(valores)
+        yield from zip(*columnas)
+
+
+class _LibroOpenpyxl:
+    """Libro openpyxl en modo write-only."""
+
+    def __init__(self, archivo: str):
+        self._archivo = archivo
+        self._libro = Workbook(write_only=True)
+
+    def escribir_hoja(self, nombre: str, df: pd.DataFrame) -> None:
+        hoja = self._libro.create_sheet(title=nombre)
+        hoja.append([str(col) for col in df.columns])
+        for fila in _filas(df):
+            hoja.append(fila)
+
+    def cerrar(self) -> None:
+        self._libro.save(self._archivo)
+
+
+class _LibroXlsxwriter:
+    """Libro xlsxwriter en modo constant_memory (cada fila se vuelca al escribir la siguiente)."""
+
+    def __init__(self, archivo: str):
+        self._libro = xlsxwriter.Workbook(
+            archivo, {"constant_memory": True, "default_date_format": FORMATO_FECHA}
+        )
+
+    def escribir_hoja(self, nombre: str, df: pd.DataFrame) -> None:
+        hoja = self._libro.add_worksheet(nombre)
+        hoja.write_row(0, 0, [str(col) for col in df.columns])
+        for numero, fila in enumerate(_filas(df), start=1):
+            hoja.write_row(numero, 0, fila)
+
+    def cerrar(self) -> None:
+        self._libro.close()
+
+
+def _abrir_libro(archivo: str, motor: Optional[str]):
+    if motor is None:
+        motor = "xlsxwriter" if xlsxwriter is not None else "openpyxl"
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de Excel no soportado: {motor}")
+    if motor == "xlsxwriter":
+        if xlsxwriter is None:
+            raise ImportError("El motor 'xlsxwriter' requiere el paquete xlsxwriter")
+        return _LibroXlsxwriter(archivo)
+    return _LibroOpenpyxl(archivo)
+
+
+def _escribir_sidecar(df: pd.DataFrame, archivo_excel: str, nombre: str, formato: str) -> str:
+    base = os.path.splitext(archivo_excel)[0]
+    ruta = f"{base}_{nombre}.{formato}"
+    if formato == "parquet":
+        df.to_parquet(ruta, index=False)
+    else:
+        df.to_csv(ruta, index=False)
+    return ruta
+
+
+def escribir_reporte(
+    hojas: Dict[str, pd.DataFrame],
+    archivo_excel: str,
+    desborde: str = "dividir",
+    max_filas: int = MAX_FILAS_EXCEL,
+    motor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Escribe cada DataFrame en una hoja del libro, en modo streaming.
+
+    Args:
+        hojas (Dict[str, pd.DataFrame]): Nombre de hoja -> datos, en orden
+        archivo_excel (str): Ruta del .xlsx
+        desborde (str): Qué hacer con las tablas que no caben en una hoja:
+            "dividir" en varias hojas, o escribir un sidecar "parquet" o "csv"
+            (en ese caso la hoja solo indica dónde quedaron los datos)
+        max_filas (int): Filas por hoja incluido el encabezado
+        motor (str): "xlsxwriter" u "openpyxl"; por defecto xlsxwriter si está instalado
+
+    Returns:
+        Dict: Por cada tabla, las hojas usadas y el sidecar (si lo hubo)
+    """
+    if desborde not in ESTRATEGIAS_DESBORDE:
+        raise ValueError(f"Estrategia de desborde no soportada: {desborde}")
+
+    filas_por_hoja = max_filas - 1
+    libro = _abrir_libro(archivo_excel, motor)
+    destino: Dict[str, Any] = {}
+
+    for nombre, df in hojas.items():
+        cabe_columnas = len(df.columns) <= MAX_COLUMNAS_EXCEL
+        if cabe_columnas and len(df) <= filas_por_hoja:
+            libro.escribir_hoja(nombre, df)
+            destino[nombre] = {"hojas": [nombre], "sidecar": None}
+        elif cabe_columnas and desborde == "dividir":
+            nombres: List[str] = []
+            for parte, inicio in enumerate(range(0, len(df), filas_por_hoja), start=1):
+                nombre_hoja = nombre if parte == 1 else f"{nombre}_{parte}"
+                libro.escribir_hoja(nombre_hoja, df.iloc[inicio:inicio + filas_por_hoja])
+                nombres.append(nombre_hoja)
+            destino[nombre] = {"hojas": nombres, "sidecar": None}
+        else:
+            formato = "csv" if desborde == "csv" else "parquet"
+            ruta = _escribir_sidecar(df, archivo_excel, nombre, formato)
+            aviso = pd.DataFrame({
+                "nota": [f"{len(df):,} filas x {len(df.columns)} columnas exceden el límite de Excel"],
+                "archivo": [os.path.basename(ruta)],
+            })
+            libro.escribir_hoja(nombre, aviso)
+            destino[nombre] = {"hojas": [nombre], "sidecar": ruta}
+
+    libro.cerrar()
+    return destino
+
+
+def escribir_reporte_pandas(hojas: Dict[str, pd.DataFrame], archivo_excel: str) -> None:
+    """Escritura original con pd.ExcelWriter(engine='openpyxl'); se conserva para comparar."""
+    with pd.ExcelWriter(archivo_excel, engine='openpyxl') as writer:
+        for nombre, df in hojas.items():
+            df.to_excel(writer, sheet_name=nombre, index=False)
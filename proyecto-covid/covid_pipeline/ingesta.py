@@ -0,0 +1,146 @@
+"""
+Ingesta de datos COVID-19 desde OWID.
+
+Contiene dos caminos de lectura del compact.csv:
+- completo: descarga todo el cuerpo HTTP a memoria y lo parsea de una vez
+  (comportamiento original de leer_datos).
+- streaming: lee el cuerpo HTTP por bloques y lo pasa directo a un parser
+  CSV por chunks, conservando solo las columnas (y países) necesarios.
+"""
+
+import io
+from io import StringIO
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import requests
+
+URL_OWID = "https://catalog.ourworldindata.org/garden/covid/latest/compact/compact.csv"
+
+# Columnas que usan los assets y checks del pipeline
+COLUMNAS_INGESTA = ['location', 'date', 'new_cases', 'people_vaccinated', 'population']
+
+# En el compact.csv actual la columna de países se llama 'country'
+ALIAS_COLUMNAS = {'country': 'location'}
+
+# Tipos explícitos para evitar la inferencia de pandas en cada chunk
+DTYPES_INGESTA: Dict[str, str] = {
+    'location': 'str',
+    'country': 'str',
+    'date': 'str',
+    'new_cases': 'float64',
+    'people_vaccinated': 'float64',
+    'population': 'float64',
+}
+
+FILAS_POR_CHUNK = 200_000
+BYTES_POR_BLOQUE = 1 << 20  # 1 MiB
+
+
+class _LectorIterContent(io.RawIOBase):
+    """Adapta un iterador de bytes (response.iter_content) a un archivo de solo lectura."""
+
+    def __init__(self, bloques: Iterator[bytes]):
+        self._bloques = bloques
+        self._pendiente = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pendiente:
+            try:
+                self._pendiente = memoryview(next(self._bloques))
+            except StopIteration:
+                return 0
+
+        n = min(len(buffer), len(self._pendiente))
+        buffer[:n] = self._pendiente[:n]
+        self._pendiente = self._pendiente[n:]
+        return n
+
+
+def parsear_csv_completo(response: requests.Response) -> pd.DataFrame:
+    """Parsea el cuerpo completo de la respuesta (texto + StringIO), sin proyección."""
+    return pd.read_csv(StringIO(response.text))
+
+
+def parsear_csv_streaming(
+    response: requests.Response,
+    columnas: Optional[List[str]] = None,
+    paises: Optional[List[str]] = None,
+    filas_por_chunk: int = FILAS_POR_CHUNK,
+    bytes_por_bloque: int = BYTES_POR_BLOQUE,
+) -> pd.DataFrame:
+    """
+    Parsea una respuesta abierta con stream=True por bloques y chunks de filas.
+
+    Ver leer_owid_streaming para el detalle de los argumentos.
+    """
+    columnas = list(columnas or COLUMNAS_INGESTA)
+    aceptadas = set(columnas) | {alias for alias, destino in ALIAS_COLUMNAS.items() if destino in columnas}
+    dtypes = {col: tipo for col, tipo in DTYPES_INGESTA.items() if col in aceptadas}
+
+    flujo = io.BufferedReader(
+        _LectorIterContent(response.iter_content(chunk_size=bytes_por_bloque)),
+        buffer_size=bytes_por_bloque,
+    )
+    lector = pd.read_csv(
+        flujo,
+        usecols=lambda col: col in aceptadas,
+        dtype=dtypes,
+        chunksize=filas_por_chunk,
+    )
+
+    partes = []
+    for chunk in lector:
+        chunk = chunk.rename(columns=ALIAS_COLUMNAS)
+        if paises is not None:
+            chunk = chunk[chunk['location'].isin(paises)]
+        partes.append(chunk)
+
+    if not partes:
+        return pd.DataFrame(columns=columnas)
+
+    return pd.concat(partes, ignore_index=True)
+
+
+def leer_owid_completo(url: str = URL_OWID, timeout: int = 300) -> pd.DataFrame:
+    """
+    Lee el CSV completo en memoria (texto + StringIO), sin proyección de columnas.
+    Es el camino original; se conserva para comparación y compatibilidad.
+    """
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return parsear_csv_completo(response)
+
+
+def leer_owid_streaming(
+    url: str = URL_OWID,
+    columnas: Optional[List[str]] = None,
+    paises: Optional[List[str]] = None,
+    filas_por_chunk: int = FILAS_POR_CHUNK,
+    bytes_por_bloque: int = BYTES_POR_BLOQUE,
+    timeout: int = 300,
+) -> pd.DataFrame:
+    """
+    Lee el CSV de OWID en streaming, por bloques HTTP y chunks de filas.
+
+    Solo se materializan las columnas pedidas (con tipos explícitos) y, si se
+    indica, las filas de los países pedidos, de modo que la memoria pico queda
+    acotada por el resultado filtrado más un chunk.
+
+    Args:
+        url (str): URL del compact.csv (o de un servidor local equivalente)
+        columnas (List[str]): Columnas a conservar; por defecto COLUMNAS_INGESTA
+        paises (List[str]): Países a conservar; None conserva todos
+        filas_por_chunk (int): Filas que parsea pandas en cada chunk
+        bytes_por_bloque (int): Tamaño de cada bloque leído del socket
+        timeout (int): Timeout de la petición HTTP en segundos
+
+    Returns:
+        pd.DataFrame: Datos con la columna de países normalizada a 'location'
+    """
+    with requests.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        return parsear_csv_streaming(response, columnas, paises, filas_por_chunk, bytes_por_bloque)
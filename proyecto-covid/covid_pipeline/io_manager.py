@@ -0,0 +1,119 @@
+"""
+IO manager Parquet para los DataFrames que se pasan entre assets.
+
+Reemplaza el pickle del FilesystemIOManager por defecto: cada salida se
+guarda como un archivo Parquet (uno por partición) y al cargarla se leen con
+memory-mapping solo las columnas que declara el asset consumidor en la
+metadata de su AssetIn:
+
+    AssetIn(metadata={"columnas": ["location", "date", "new_cases"]})
+
+Sin esa metadata se cargan todas las columnas. El índice del DataFrame no se
+guarda: los assets del pipeline no dependen de él.
+
+Un asset particionado por fecha que consume una salida sin particionar puede
+declarar además la columna de fecha por la que filtrar:
+
+    AssetIn(metadata={"columnas": [...], "filtro_fecha": "date"})
+
+Entonces solo se cargan las filas de la ventana de la partición. Los archivos
+se escriben en grupos de FILAS_POR_GRUPO filas, así que si la salida está
+ordenada por esa columna pyarrow descarta por sus estadísticas los grupos
+fuera de la ventana sin leerlos.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dagster import (
+    ConfigurableIOManagerFactory, InitResourceContext, InputContext, OutputContext, UPathIOManager
+)
+from pydantic import Field
+from upath import UPath
+
+# Clave del recurso con el que se registran los assets que devuelven DataFrames
+CLAVE_IO_MANAGER = "io_manager_parquet"
+
+# Clave de la metadata de AssetIn con las columnas a cargar
+METADATA_COLUMNAS = "columnas"
+
+# Clave de la metadata de AssetIn con la columna de fecha que se filtra por
+# la ventana de la partición del consumidor
+METADATA_FILTRO_FECHA = "filtro_fecha"
+
+# Filas por grupo de Parquet: con OWID (unos 250 países por día) cada grupo
+# cubre unos dos meses, que es lo que se lee para una partición diaria
+FILAS_POR_GRUPO = 16_384
+
+
+def escribir_parquet(df: pd.DataFrame, ruta: str, filas_por_grupo: int = FILAS_POR_GRUPO) -> None:
+    """Escribe el DataFrame como Parquet, sin el índice."""
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), ruta, row_group_size=filas_por_grupo)
+
+
+def leer_parquet(
+    ruta: str, columnas: Optional[List[str]] = None, filtros: Optional[Sequence[Tuple]] = None
+) -> pd.DataFrame:
+    """
+    Lee un Parquet con memory-mapping, proyectando columnas si se indican.
+
+    Args:
+        ruta (str): Archivo Parquet
+        columnas (List[str]): Columnas a leer; None lee todas
+        filtros (Sequence[Tuple]): Filtros de filas de pyarrow, p. ej.
+            [('date', '>=', inicio)]; None lee todas las filas
+
+    Returns:
+        pd.DataFrame: Datos leídos
+    """
+    return pq.read_table(ruta, columns=columnas, filters=filtros, memory_map=True).to_pandas()
+
+
+def _filtros_ventana(context: InputContext, columna: str) -> Optional[List[Tuple]]:
+    """Filtros de la ventana de la partición que se está calculando (None si no hay)."""
+    if context.has_asset_partitions or not context.has_partition_key:
+        return None
+    ventana = context.step_context.partition_time_window
+    # Las fechas guardadas no tienen zona horaria
+    return [
+        (columna, '>=', pd.Timestamp(ventana.start).tz_localize(None)),
+        (columna, '<', pd.Timestamp(ventana.end).tz_localize(None)),
+    ]
+
+
+class _ParquetUPathIOManager(UPathIOManager):
+    """Guarda y carga DataFrames como Parquet; las particiones las resuelve UPathIOManager."""
+
+    extension = ".parquet"
+
+    def dump_to_path(self, context: OutputContext, obj: pd.DataFrame, path: UPath) -> None:
+        if not isinstance(obj, pd.DataFrame):
+            raise TypeError(
+                f"{context.asset_key.to_user_string()} devolvió {type(obj).__name__}; "
+                "este IO manager solo guarda pd.DataFrame"
+            )
+        escribir_parquet(obj, str(path))
+
+    def load_from_path(self, context: InputContext, path: UPath) -> pd.DataFrame:
+        metadata = context.definition_metadata or {}
+        filtros = None
+        if metadata.get(METADATA_FILTRO_FECHA):
+            filtros = _filtros_ventana(context, metadata[METADATA_FILTRO_FECHA])
+        return leer_parquet(str(path), metadata.get(METADATA_COLUMNAS), filtros)
+
+    def get_metadata(self, context: OutputContext, obj: pd.DataFrame):
+        return {"filas": len(obj), "columnas": len(obj.columns)}
+
+
+class ParquetIOManager(ConfigurableIOManagerFactory):
+    """IO manager Parquet con proyección de columnas en la carga."""
+
+    base_dir: Optional[str] = Field(
+        default=None, description="Carpeta base; por defecto el storage de la instancia de Dagster."
+    )
+
+    def create_io_manager(self, context: InitResourceContext) -> _ParquetUPathIOManager:
+        base_dir = self.base_dir or context.instance.storage_directory()
+        return _ParquetUPathIOManager(base_path=UPath(base_dir))
@@ -0,0 +1,151 @@
+"""
+Cálculo vectorizado de las métricas epidemiológicas del pipeline.
+
+Las funciones reciben el DataFrame de datos_procesados y no dependen de
+Dagster, para poder probarlas y medirlas de forma aislada.
+
+Todas aceptan un `estado` opcional con las últimas filas de cada país ya
+procesadas (ver actualizar_estado). Con él se calculan solo las filas nuevas
+de una partición sin releer la historia completa; sin él se recalcula todo.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+VENTANA = 7
+# Primera fila (por país) con factor de crecimiento; se conserva el offset
+# del cálculo original (range(14, ...)) aunque la fila 13 ya tendría dos semanas.
+INICIO_FACTOR = 14
+# Filas previas por país que necesita la ventana más larga (dos semanas)
+FILAS_ESTADO = 2 * VENTANA - 1
+
+COLUMNAS_FACTOR = ['semana_fin', 'país', 'casos_semana', 'factor_crec_7d']
+COLUMNAS_INCIDENCIA = ['fecha', 'país', 'incidencia_7d']
+COLUMNAS_ESTADO = ['location', 'date', 'new_cases', 'population', 'posicion']
+
+
+def _unir_con_estado(datos_procesados: pd.DataFrame, estado: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Ordena las filas por país y fecha, les asigna su posición dentro de la
+    historia de su país y antepone las filas del estado previo.
+
+    La columna 'nuevo' marca las filas de datos_procesados (las que hay que
+    devolver); las del estado solo sirven de contexto para las ventanas.
+    """
+    df = datos_procesados.sort_values(['location', 'date'])
+    posicion = df.groupby('location', sort=False).cumcount()
+
+    if estado is None or estado.empty:
+        return df.assign(posicion=posicion.to_numpy(), nuevo=True)
+
+    siguiente = estado.groupby('location')['posicion'].max() + 1
+    posicion = posicion + df['location'].map(siguiente).fillna(0).astype('int64')
+    df = df.assign(posicion=posicion.to_numpy(), nuevo=True)
+
+    contexto = estado[estado['location'].isin(df['location'].unique())].assign(nuevo=False)
+    return pd.concat([contexto, df], ignore_index=True).sort_values(['location', 'posicion'])
+
+
+def _sumas_ventana(valores: np.ndarray) -> np.ndarray:
+    """sumas[k] = valores[k] + ... + valores[k+6], sumando en orden como Series.sum()."""
+    if len(valores) < VENTANA:
+        return np.empty(0, dtype='float64')
+    return sliding_window_view(valores, VENTANA).sum(axis=1)
+
+
+def calcular_incidencia_7d(datos_procesados: pd.DataFrame, estado: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Calcula la incidencia acumulada a 7 días por 100 mil habitantes.
+
+    Es el promedio de las últimas 7 filas del país de
+    new_cases / population * 100000; se omiten las filas sin 7 valores válidos.
+
+    Args:
+        datos_procesados (pd.DataFrame): Columnas location, date, new_cases y population
+        estado (pd.DataFrame): Últimas filas previas de cada país (opcional)
+
+    Returns:
+        pd.DataFrame: fecha, país, incidencia_7d
+    """
+    df = _unir_con_estado(datos_procesados, estado)
+    diaria = ((df['new_cases'] / df['population']) * 100000).to_numpy(dtype='float64', na_value=np.nan)
+
+    sumas = _sumas_ventana(diaria)
+    filas = np.flatnonzero((df['posicion'].to_numpy() >= VENTANA - 1) & df['nuevo'].to_numpy())
+    incidencia = sumas[filas - (VENTANA - 1)] / VENTANA
+
+    validas = ~np.isnan(incidencia)
+    filas = filas[validas]
+
+    return pd.DataFrame({
+        'fecha': df['date'].iloc[filas].reset_index(drop=True),
+        'país': df['location'].iloc[filas].reset_index(drop=True),
+        'incidencia_7d': incidencia[validas],
+    })
+
+
+def calcular_factor_crec_7d(datos_procesados: pd.DataFrame, estado: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Calcula el factor de crecimiento semanal de casos para todos los países a la vez.
+
+    Para cada fila i de un país (ordenado por fecha) con i >= 14:
+    casos_semana = suma de las filas i-6..i y casos_semana_prev = suma de las
+    filas i-13..i-7; se conservan las filas con casos_semana_prev > 0.
+
+    Las sumas de 7 filas se hacen con una vista deslizante sobre el arreglo
+    ordenado, sumando en el mismo orden que Series.sum() sobre cada ventana,
+    así el resultado es idéntico bit a bit al del bucle por filas (una suma
+    móvil incremental acumularía otro redondeo).
+
+    Args:
+        datos_procesados (pd.DataFrame): Columnas location, date y new_cases
+        estado (pd.DataFrame): Últimas filas previas de cada país (opcional)
+
+    Returns:
+        pd.DataFrame: semana_fin, país, casos_semana, factor_crec_7d
+    """
+    df = _unir_con_estado(datos_procesados, estado)
+    # Series.sum() omite NaN, que equivale a sumarlos como 0
+    casos = df['new_cases'].to_numpy(dtype='float64', na_value=0.0)
+
+    sumas = _sumas_ventana(casos)
+    filas = np.flatnonzero((df['posicion'].to_numpy() >= INICIO_FACTOR) & df['nuevo'].to_numpy())
+
+    casos_semana = sumas[filas - (VENTANA - 1)]
+    casos_semana_prev = sumas[filas - (2 * VENTANA - 1)]
+
+    crece = casos_semana_prev > 0
+    filas = filas[crece]
+    casos_semana = casos_semana[crece]
+
+    return pd.DataFrame({
+        'semana_fin': df['date'].iloc[filas].reset_index(drop=True),
+        'país': df['location'].iloc[filas].reset_index(drop=True),
+        'casos_semana': casos_semana,
+        'factor_crec_7d': casos_semana / casos_semana_prev[crece],
+    })
+
+
+def actualizar_estado(datos_procesados: pd.DataFrame, estado: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Devuelve el estado tras incorporar datos_procesados: las últimas
+    FILAS_ESTADO filas de cada país con su posición en la historia del país.
+
+    Los países sin filas nuevas conservan su estado anterior.
+
+    Args:
+        datos_procesados (pd.DataFrame): Filas nuevas (una partición)
+        estado (pd.DataFrame): Estado anterior (opcional)
+
+    Returns:
+        pd.DataFrame: Columnas COLUMNAS_ESTADO
+    """
+    df = _unir_con_estado(datos_procesados, estado)
+    if estado is not None and not estado.empty:
+        sin_cambios = estado[~estado['location'].isin(df['location'].unique())]
+        df = pd.concat([sin_cambios, df], ignore_index=True).sort_values(['location', 'posicion'])
+
+    return df.groupby('location', sort=False).tail(FILAS_ESTADO)[COLUMNAS_ESTADO].reset_index(drop=True)
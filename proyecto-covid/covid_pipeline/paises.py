@@ -0,0 +1,71 @@
+"""
+Selección de países del dataset OWID.
+
+Los nombres pedidos se resuelven contra un índice de nombres normalizados
+(minúsculas, sin tildes ni espacios extra) construido una sola vez sobre las
+ubicaciones únicas, en lugar de comparar cada país pedido con cada ubicación.
+"""
+
+from typing import Iterable, List
+
+import pandas as pd
+
+
+def normalizar_nombres(nombres: pd.Series) -> pd.Series:
+    """Normaliza nombres de país de forma vectorizada: 'Perú ' -> 'peru'."""
+    return (
+        nombres.astype(str)
+        .str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore')
+        .str.decode('ascii')
+        .str.strip()
+        .str.lower()
+    )
+
+
+def construir_indice(ubicaciones: pd.Series) -> pd.Series:
+    """
+    Construye el índice nombre normalizado -> nombre original.
+
+    Args:
+        ubicaciones (pd.Series): Columna de países del dataset (con repeticiones)
+
+    Returns:
+        pd.Series: Nombres originales indexados por su forma normalizada
+    """
+    unicas = pd.Series(pd.unique(ubicaciones.dropna()))
+    indice = pd.Series(unicas.to_numpy(), index=normalizar_nombres(unicas).to_numpy())
+    return indice[~indice.index.duplicated()]
+
+
+def resolver_paises(ubicaciones: pd.Series, pedidos: Iterable[str], subcadena: bool = True) -> List[str]:
+    """
+    Traduce los países pedidos a los nombres exactos del dataset.
+
+    Primero se busca coincidencia exacta del nombre normalizado en el índice.
+    Con subcadena, los que no coinciden se buscan como subcadena (criterio
+    del filtro original), quedándose con la primera ubicación que los
+    contenga. Esa búsqueda depende de qué ubicaciones haya en ubicaciones:
+    sobre un subconjunto (una partición) 'Niger' puede caer en 'Nigeria' si
+    Niger no tiene filas ahí, así que en ese caso conviene subcadena=False.
+
+    Args:
+        ubicaciones (pd.Series): Columna de países del dataset
+        pedidos (Iterable[str]): Nombres de país pedidos en la configuración
+        subcadena (bool): Buscar por subcadena los que no coinciden exactamente
+
+    Returns:
+        List[str]: Nombres encontrados, sin repetidos y en el orden pedido
+    """
+    indice = construir_indice(ubicaciones)
+    pedidos_norm = normalizar_nombres(pd.Series(list(pedidos), dtype=object))
+
+    encontrados = indice.reindex(pedidos_norm.to_numpy())
+
+    for posicion in range(len(pedidos_norm) if subcadena else 0):
+        if pd.isna(encontrados.iloc[posicion]):
+            coincidencias = indice[indice.index.str.contains(pedidos_norm.iloc[posicion], regex=False)]
+            if len(coincidencias) > 0:
+                encontrados.iloc[posicion] = coincidencias.iloc[0]
+
+    return list(dict.fromkeys(encontrados.dropna()))
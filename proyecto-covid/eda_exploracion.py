@@ -1,6 +1,7 @@
 import pandas as pd
-import requests
-from io import StringIO
+
+from covid_pipeline.cache import CacheOWID
+from covid_pipeline.ingesta import URL_OWID, parsear_csv_completo
 
 def explorar_datos_covid():
     """
@@ -8,11 +9,11 @@ def explorar_datos_covid():
     Genera tabla_perfilado.csv con estadísticas básicas
     """
     
-    # Descargar datos desde OWID
-    url = "https://catalog.ourworldindata.org/garden/covid/latest/compact/compact.csv"
+    # Descargar datos desde OWID (o reutilizar el snapshot local si no cambió)
     print("Descargando datos desde OWID...")
-    response = requests.get(url)
-    df = pd.read_csv(StringIO(response.text))
+    cache = CacheOWID()
+    df, acierto = cache.leer(URL_OWID, parsear_csv_completo, variante="eda")
+    print("Usando snapshot en caché" if acierto else "Datos descargados y guardados en caché")
     
     print("=== COLUMNAS DISPONIBLES EN EL DATASET ===")
     print(df.columns.tolist())
@@ -0,0 +1,106 @@
+"""
+Pruebas de la caché de snapshots Parquet con revalidación condicional.
+"""
+
+import os
+import time
+
+import pytest
+from dagster import materialize
+
+from benchmarks.owid_sintetico import servidor_owid
+from covid_pipeline.assets import leer_datos
+from covid_pipeline.cache import CacheOWID
+from covid_pipeline.ingesta import parsear_csv_completo, parsear_csv_streaming
+from covid_pipeline.io_manager import CLAVE_IO_MANAGER, ParquetIOManager
+
+
+@pytest.fixture
+def servidor():
+    with servidor_owid(n_filas=120, n_paises=4) as servidor:
+        yield servidor
+
+
+def test_segunda_lectura_usa_snapshot(servidor, tmp_path):
+    cache = CacheOWID(str(tmp_path))
+
+    df1, acierto1 = cache.leer(servidor.url, parsear_csv_streaming)
+    df2, acierto2 = cache.leer(servidor.url, parsear_csv_streaming)
+
+    assert (acierto1, acierto2) == (False, True)
+    assert servidor.respuestas_304 == 1
+    assert df2.equals(df1)
+    assert cache.estadisticas()["aciertos"] == 1
+    assert cache.estadisticas()["fallos"] == 1
+
+
+def test_nueva_version_invalida_snapshot(servidor, tmp_path):
+    cache = CacheOWID(str(tmp_path))
+    cache.leer(servidor.url, parsear_csv_streaming)
+
+    servidor.publicar(n_filas=160)
+    df, acierto = cache.leer(servidor.url, parsear_csv_streaming)
+
+    assert acierto is False
+    assert len(df) == 160
+    # El snapshot obsoleto se reemplaza
+    assert cache.estadisticas()["snapshots"] == 1
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".parquet")]) == 1
+
+
+def test_variantes_no_se_mezclan(servidor, tmp_path):
+    cache = CacheOWID(str(tmp_path))
+
+    completo, _ = cache.leer(servidor.url, parsear_csv_completo, variante="eda")
+    proyectado, _ = cache.leer(servidor.url, parsear_csv_streaming, variante="pipeline")
+    completo_cache, acierto = cache.leer(servidor.url, parsear_csv_completo, variante="eda")
+
+    assert acierto is True
+    assert len(completo.columns) > len(proyectado.columns)
+    assert list(completo_cache.columns) == list(completo.columns)
+
+
+def test_desalojo_por_tamano_y_antiguedad(servidor, tmp_path):
+    cache = CacheOWID(str(tmp_path))
+    cache.leer(servidor.url, parsear_csv_streaming, variante="a")
+    cache.leer(servidor.url, parsear_csv_streaming, variante="b")
+    assert cache.estadisticas()["snapshots"] == 2
+
+    cache.max_bytes = 1
+    assert cache.desalojar() == 2
+
+    cache.leer(servidor.url, parsear_csv_streaming, variante="c")
+    cache.max_bytes = 10 ** 9
+    cache.max_dias = 0
+    time.sleep(0.01)
+    assert cache.desalojar() == 1
+    assert cache.estadisticas()["snapshots"] == 0
+
+
+def test_revalidacion_renueva_la_antiguedad(servidor, tmp_path):
+    cache = CacheOWID(str(tmp_path), max_dias=7)
+    cache.leer(servidor.url, parsear_csv_streaming)
+    hace_diez_dias = time.time() - 10 * 86400
+    for snapshot in cache._indice["snapshots"].values():
+        snapshot["creado"] = snapshot["validado"] = hace_diez_dias
+
+    # Un 304 confirma el snapshot: no se desaloja aunque se haya creado hace más de max_dias
+    _, acierto = cache.leer(servidor.url, parsear_csv_streaming)
+    assert acierto is True
+    assert cache.desalojar() == 0
+    assert cache.estadisticas()["snapshots"] == 1
+
+
+def test_leer_datos_reporta_metadata_de_cache(servidor, tmp_path):
+    run_config = {"ops": {"leer_datos": {"config": {
+        "url": servidor.url, "directorio_cache": str(tmp_path)
+    }}}}
+    recursos = {CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path / "storage"))}
+
+    materialize([leer_datos], run_config=run_config, resources=recursos)
+    resultado = materialize([leer_datos], run_config=run_config, resources=recursos)
+
+    materializacion = resultado.asset_materializations_for_node("leer_datos")[0]
+    assert materializacion.metadata["cache_acierto"].value is True
+    assert materializacion.metadata["cache_aciertos"].value == 1
+    assert materializacion.metadata["cache_fallos"].value == 1
@@ -0,0 +1,60 @@
+"""
+Pruebas del perfilado de una pasada y del multi-asset-check de entrada.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+from dagster import materialize
+
+from benchmarks.owid_sintetico import servidor_owid
+from covid_pipeline.assets import checks_entrada, leer_datos
+from covid_pipeline.chequeos import perfilar_entrada
+from covid_pipeline.io_manager import CLAVE_IO_MANAGER, ParquetIOManager
+
+
+def _entrada():
+    return pd.DataFrame({
+        'location': ['Ecuador', None, 'Peru', 'Peru'],
+        'date': ['2021-01-01', '2021-01-02', '2999-01-01', '2999-01-02'],
+        'population': [18e6, 18e6, None, 33e6],
+        'new_cases': [1.0, 2.0, 3.0, 4.0],
+    })
+
+
+def test_perfil_cuenta_fechas_futuras_y_nulos_sin_modificar_la_entrada():
+    df = _entrada()
+    perfil = perfilar_entrada(df, ahora=datetime(2024, 1, 1))
+
+    assert perfil['fechas_futuras'] == 2
+    assert perfil['nulos_por_columna'] == {'location': 1, 'date': 0, 'population': 1}
+    assert perfil['columnas_faltantes'] == []
+    assert perfil['columnas_presentes'] == list(df.columns)
+    pd.testing.assert_frame_equal(df, _entrada())
+
+
+def test_perfil_informa_columnas_clave_faltantes():
+    perfil = perfilar_entrada(_entrada().drop(columns=['population', 'date']))
+
+    assert perfil['fechas_futuras'] == 0
+    assert perfil['nulos_por_columna'] == {'location': 1}
+    assert perfil['columnas_faltantes'] == ['date', 'population']
+
+
+def test_perfil_acepta_fechas_ya_parseadas():
+    df = _entrada().assign(date=lambda d: pd.to_datetime(d['date']))
+    assert perfilar_entrada(df, ahora=datetime(2024, 1, 1))['fechas_futuras'] == 2
+
+
+def test_multi_check_emite_ambos_resultados(tmp_path):
+    with servidor_owid(n_filas=40, n_paises=2) as servidor:
+        run_config = {"ops": {"leer_datos": {"config": {"url": servidor.url, "usar_cache": False}}}}
+        resultado = materialize(
+            [leer_datos, checks_entrada], run_config=run_config,
+            resources={CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path))},
+        )
+
+    evaluaciones = {e.check_name: e for e in resultado.get_asset_check_evaluations()}
+    assert set(evaluaciones) == {"check_fechas_futuras", "check_columnas_clave"}
+    assert evaluaciones["check_fechas_futuras"].passed
+    assert evaluaciones["check_columnas_clave"].metadata["filas_afectadas"].value == 0
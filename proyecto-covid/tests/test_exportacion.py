@@ -0,0 +1,90 @@
+"""
+Pruebas de la exportación Excel en streaming y de sus estrategias de desborde.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from dagster import build_asset_context
+from openpyxl import load_workbook
+
+from covid_pipeline.assets import ReporteConfig, reporte_excel_covid
+from covid_pipeline.exportacion import escribir_reporte, escribir_reporte_pandas
+
+
+def _tabla(n=10):
+    return pd.DataFrame({
+        'location': ['Ecuador', 'Peru'] * (n // 2),
+        'date': pd.date_range('2021-01-01', periods=n, freq='D'),
+        'new_cases': np.where(np.arange(n) % 3 == 0, np.nan, np.arange(n, dtype='float64')),
+        'population': np.full(n, 18e6),
+    })
+
+
+@pytest.mark.parametrize("motor", ["xlsxwriter", "openpyxl"])
+def test_mismo_contenido_que_pandas_excelwriter(tmp_path, motor):
+    if motor == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    hojas = {'Datos_Procesados': _tabla(), 'Incidencia_7d': _tabla(4)}
+    escribir_reporte(hojas, str(tmp_path / "streaming.xlsx"), motor=motor)
+    escribir_reporte_pandas(hojas, str(tmp_path / "pandas.xlsx"))
+
+    for nombre in hojas:
+        streaming = pd.read_excel(tmp_path / "streaming.xlsx", sheet_name=nombre)
+        original = pd.read_excel(tmp_path / "pandas.xlsx", sheet_name=nombre)
+        pd.testing.assert_frame_equal(streaming, original)
+
+
+def test_tabla_vacia_deja_solo_encabezado(tmp_path):
+    escribir_reporte({'Factor_Crec_7d': _tabla().iloc[:0]}, str(tmp_path / "r.xlsx"))
+    leido = pd.read_excel(tmp_path / "r.xlsx", sheet_name='Factor_Crec_7d')
+    assert list(leido.columns) == list(_tabla().columns) and leido.empty
+
+
+def test_divide_en_varias_hojas_al_exceder_el_limite(tmp_path):
+    archivo = str(tmp_path / "r.xlsx")
+    destino = escribir_reporte({'Datos_Procesados': _tabla(10)}, archivo, max_filas=5)
+
+    assert destino['Datos_Procesados']['hojas'] == ['Datos_Procesados', 'Datos_Procesados_2', 'Datos_Procesados_3']
+    assert load_workbook(archivo, read_only=True).sheetnames == destino['Datos_Procesados']['hojas']
+
+    partes = pd.read_excel(archivo, sheet_name=None)
+    unido = pd.concat([partes[h] for h in destino['Datos_Procesados']['hojas']], ignore_index=True)
+    assert len(unido) == 10
+    assert (unido['date'] == _tabla(10)['date']).all()
+
+
+@pytest.mark.parametrize("formato", ["parquet", "csv"])
+def test_sidecar_al_exceder_el_limite(tmp_path, formato):
+    archivo = str(tmp_path / "r.xlsx")
+    destino = escribir_reporte({'Datos_Procesados': _tabla(10), 'Incidencia_7d': _tabla(2)},
+                               archivo, desborde=formato, max_filas=5)
+
+    sidecar = destino['Datos_Procesados']['sidecar']
+    assert sidecar == str(tmp_path / f"r_Datos_Procesados.{formato}")
+    assert destino['Incidencia_7d']['sidecar'] is None
+
+    leido = pd.read_parquet(sidecar) if formato == "parquet" else pd.read_csv(sidecar)
+    assert len(leido) == 10
+    aviso = pd.read_excel(archivo, sheet_name='Datos_Procesados')
+    assert aviso['archivo'].iloc[0] == f"r_Datos_Procesados.{formato}"
+
+
+def test_estrategia_o_motor_invalidos(tmp_path):
+    with pytest.raises(ValueError, match="no soportada"):
+        escribir_reporte({'x': _tabla()}, str(tmp_path / "r.xlsx"), desborde="truncar")
+    with pytest.raises(ValueError, match="no soportado"):
+        escribir_reporte({'x': _tabla()}, str(tmp_path / "r.xlsx"), motor="xlwt")
+
+
+def test_asset_une_particiones_y_exporta(tmp_path):
+    archivo = str(tmp_path / "reporte.xlsx")
+    particiones = {'2021-01-02': _tabla(4).iloc[2:], '2021-01-01': _tabla(4).iloc[:2]}
+    mensaje = reporte_excel_covid(
+        build_asset_context(), ReporteConfig(archivo=archivo), particiones, particiones, particiones
+    )
+
+    assert mensaje == f"Reporte exportado exitosamente a {archivo}"
+    leido = pd.read_excel(archivo, sheet_name=None)
+    assert list(leido) == ['Datos_Procesados', 'Incidencia_7d', 'Factor_Crec_7d']
+    assert (leido['Datos_Procesados']['date'] == _tabla(4)['date']).all()
@@ -0,0 +1,49 @@
+"""
+Pruebas de la ingesta de OWID contra un servidor HTTP local con datos sintéticos.
+"""
+
+import pytest
+
+from benchmarks.owid_sintetico import servidor_owid
+from covid_pipeline.ingesta import (
+    ALIAS_COLUMNAS, COLUMNAS_INGESTA, leer_owid_completo, leer_owid_streaming
+)
+
+
+@pytest.fixture(scope="module")
+def url_owid():
+    """Servidor local con 5 países x 40 días."""
+    with servidor_owid(n_filas=200, n_paises=5) as servidor:
+        yield servidor.url
+
+
+def test_streaming_equivale_a_lectura_completa(url_owid):
+    completo = leer_owid_completo(url_owid).rename(columns=ALIAS_COLUMNAS)[COLUMNAS_INGESTA]
+    # Chunks y bloques pequeños para forzar cortes en medio de filas
+    streaming = leer_owid_streaming(url_owid, filas_por_chunk=7, bytes_por_bloque=13)
+
+    assert list(streaming.columns) == COLUMNAS_INGESTA
+    assert streaming.equals(completo)
+
+
+def test_streaming_tipos_explicitos(url_owid):
+    df = leer_owid_streaming(url_owid)
+
+    assert df['new_cases'].dtype == 'float64'
+    assert df['people_vaccinated'].dtype == 'float64'
+    assert df['population'].dtype == 'float64'
+    assert df['people_vaccinated'].isnull().sum() > 0
+
+
+def test_streaming_filtra_paises(url_owid):
+    df = leer_owid_streaming(url_owid, paises=['Ecuador', 'Peru'], filas_por_chunk=25)
+
+    assert set(df['location']) == {'Ecuador', 'Peru'}
+    assert len(df) == 80
+
+
+def test_streaming_sin_coincidencias(url_owid):
+    df = leer_owid_streaming(url_owid, paises=['Atlantida'])
+
+    assert df.empty
+    assert list(df.columns) == COLUMNAS_INGESTA
@@ -0,0 +1,105 @@
+"""
+Pruebas del IO manager Parquet: proyección de columnas, particiones y tipos.
+"""
+
+import pandas as pd
+import pytest
+from dagster import AssetIn, DailyPartitionsDefinition, asset, materialize
+
+from covid_pipeline.io_manager import CLAVE_IO_MANAGER, ParquetIOManager, escribir_parquet, leer_parquet
+
+
+def _datos():
+    return pd.DataFrame({
+        'location': ['Ecuador', 'Peru', 'Ecuador'],
+        'date': pd.to_datetime(['2021-01-01', '2021-01-01', '2021-01-02']),
+        'new_cases': [1.5, None, 3.0],
+        'population': [18e6, 33e6, 18e6],
+    }, index=[10, 20, 30])
+
+
+def test_ida_y_vuelta_conserva_tipos_y_omite_indice(tmp_path):
+    ruta = str(tmp_path / "datos.parquet")
+    escribir_parquet(_datos(), ruta)
+
+    pd.testing.assert_frame_equal(leer_parquet(ruta), _datos().reset_index(drop=True))
+    assert list(leer_parquet(ruta, ['date', 'location']).columns) == ['date', 'location']
+
+
+def test_consumidor_carga_solo_columnas_declaradas(tmp_path):
+    @asset(io_manager_key=CLAVE_IO_MANAGER)
+    def origen() -> pd.DataFrame:
+        return _datos()
+
+    @asset(ins={"origen": AssetIn(metadata={"columnas": ['location', 'new_cases']})})
+    def proyectado(origen: pd.DataFrame) -> list:
+        return list(origen.columns)
+
+    @asset
+    def completo(origen: pd.DataFrame) -> list:
+        return list(origen.columns)
+
+    recursos = {CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path))}
+    resultado = materialize([origen, proyectado, completo], resources=recursos)
+
+    assert resultado.output_for_node("proyectado") == ['location', 'new_cases']
+    assert resultado.output_for_node("completo") == list(_datos().columns)
+    assert (tmp_path / "origen.parquet").exists()
+
+
+def test_particiones_faltantes_se_omiten(tmp_path):
+    particiones = DailyPartitionsDefinition(start_date="2021-01-01", end_date="2021-01-04")
+
+    @asset(partitions_def=particiones, io_manager_key=CLAVE_IO_MANAGER)
+    def diario(context) -> pd.DataFrame:
+        return _datos().assign(particion=context.partition_key)
+
+    @asset(ins={"diario": AssetIn(metadata={"allow_missing_partitions": True, "columnas": ['particion']})})
+    def union(diario: dict) -> list:
+        return sorted(diario)
+
+    recursos = {CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path))}
+    for clave in ["2021-01-01", "2021-01-03"]:
+        materialize([diario], partition_key=clave, resources=recursos)
+
+    resultado = materialize([diario, union], selection=[union], resources=recursos)
+    assert resultado.output_for_node("union") == ["2021-01-01", "2021-01-03"]
+
+
+def test_filtro_fecha_carga_solo_la_ventana_de_la_particion(tmp_path):
+    particiones = DailyPartitionsDefinition(start_date="2021-01-01", end_date="2021-01-04")
+
+    @asset(io_manager_key=CLAVE_IO_MANAGER)
+    def origen() -> pd.DataFrame:
+        return _datos()
+
+    @asset(partitions_def=particiones,
+           ins={"origen": AssetIn(metadata={"columnas": ['location', 'date'], "filtro_fecha": 'date'})})
+    def ventana(origen: pd.DataFrame) -> list:
+        return origen['location'].tolist()
+
+    recursos = {CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path))}
+    materialize([origen], resources=recursos)
+
+    resultado = materialize([origen, ventana], selection=[ventana], partition_key="2021-01-01", resources=recursos)
+    assert resultado.output_for_node("ventana") == ['Ecuador', 'Peru']
+    resultado = materialize([origen, ventana], selection=[ventana], partition_key="2021-01-02", resources=recursos)
+    assert resultado.output_for_node("ventana") == ['Ecuador']
+
+
+def test_leer_parquet_filtra_filas_por_grupos(tmp_path):
+    ruta = str(tmp_path / "datos.parquet")
+    escribir_parquet(_datos(), ruta, filas_por_grupo=1)
+
+    df = leer_parquet(ruta, filtros=[('date', '>=', pd.Timestamp('2021-01-02'))])
+    assert df['location'].tolist() == ['Ecuador']
+
+
+def test_rechaza_salidas_que_no_son_dataframe(tmp_path):
+    @asset(io_manager_key=CLAVE_IO_MANAGER)
+    def texto() -> str:
+        return "no es un DataFrame"
+
+    recursos = {CLAVE_IO_MANAGER: ParquetIOManager(base_dir=str(tmp_path))}
+    with pytest.raises(TypeError, match="solo guarda pd.DataFrame"):
+        materialize([texto], resources=recursos)
@@ -0,0 +1,97 @@
+"""
+Pruebas de equivalencia de las métricas vectorizadas contra la implementación original.
+"""
+
+import pandas as pd
+
+from benchmarks.bench_factor_crec import factor_crec_bucle
+from benchmarks.owid_sintetico import datos_procesados_sinteticos
+from covid_pipeline.metricas import (
+    COLUMNAS_FACTOR, COLUMNAS_INCIDENCIA, FILAS_ESTADO,
+    actualizar_estado, calcular_factor_crec_7d, calcular_incidencia_7d
+)
+
+
+def test_factor_crec_identico_al_bucle():
+    df = datos_procesados_sinteticos(n_paises=4, n_dias=120)
+
+    esperado = factor_crec_bucle(df)
+    obtenido = calcular_factor_crec_7d(df)
+
+    # Igualdad exacta: mismos valores, tipos y orden de filas
+    pd.testing.assert_frame_equal(obtenido, esperado, check_exact=True)
+
+
+def test_factor_crec_paises_con_distinta_longitud():
+    df = datos_procesados_sinteticos(n_paises=3, n_dias=40)
+    # Un país con menos de 15 días no produce filas
+    df = df[~((df['location'] == 'Peru') & (df['date'] >= '2020-01-10'))]
+
+    obtenido = calcular_factor_crec_7d(df)
+
+    pd.testing.assert_frame_equal(obtenido, factor_crec_bucle(df), check_exact=True)
+    assert 'Peru' not in set(obtenido['país'])
+
+
+def test_factor_crec_sin_datos_suficientes():
+    df = datos_procesados_sinteticos(n_paises=1, n_dias=10)
+
+    obtenido = calcular_factor_crec_7d(df)
+
+    assert obtenido.empty
+    assert list(obtenido.columns) == COLUMNAS_FACTOR
+
+
+def _por_particiones(df: pd.DataFrame, funcion) -> pd.DataFrame:
+    """Aplica una métrica día por día arrastrando el estado entre particiones."""
+    partes = []
+    estado = None
+    for _, particion in df.groupby('date'):
+        partes.append(funcion(particion, estado))
+        estado = actualizar_estado(particion, estado)
+    return pd.concat(partes, ignore_index=True)
+
+
+def _ordenar(df: pd.DataFrame, columnas) -> pd.DataFrame:
+    return df.sort_values(columnas).reset_index(drop=True)
+
+
+def test_incremental_igual_a_recalculo_completo():
+    df = datos_procesados_sinteticos(n_paises=3, n_dias=60)
+    # Huecos como los que deja dropna en people_vaccinated
+    df = df.drop(df.sample(frac=0.2, random_state=1).index)
+
+    incidencia = _por_particiones(df, calcular_incidencia_7d)
+    factor = _por_particiones(df, calcular_factor_crec_7d)
+
+    pd.testing.assert_frame_equal(
+        _ordenar(incidencia, ['país', 'fecha']), calcular_incidencia_7d(df), check_exact=True
+    )
+    pd.testing.assert_frame_equal(
+        _ordenar(factor, ['país', 'semana_fin']), calcular_factor_crec_7d(df), check_exact=True
+    )
+
+
+def test_estado_conserva_ultimas_filas_por_pais():
+    df = datos_procesados_sinteticos(n_paises=2, n_dias=30)
+
+    estado = actualizar_estado(df[df['date'] < '2020-01-21'])
+    estado = actualizar_estado(df[(df['date'] >= '2020-01-21') & (df['location'] == 'Peru')], estado)
+
+    assert len(estado) == 2 * FILAS_ESTADO
+    assert estado.groupby('location')['posicion'].max().to_dict() == {'Ecuador': 19, 'Peru': 29}
+
+
+def test_incidencia_equivale_al_promedio_movil_original():
+    df = datos_procesados_sinteticos(n_paises=3, n_dias=50)
+
+    esperado = df.sort_values(['location', 'date'])
+    esperado['incidencia_diaria'] = (esperado['new_cases'] / esperado['population']) * 100000
+    esperado['incidencia_7d'] = esperado.groupby('location')['incidencia_diaria'].rolling(
+        window=7, min_periods=7
+    ).mean().reset_index(level=0, drop=True)
+    esperado = esperado[['date', 'location', 'incidencia_7d']].dropna().reset_index(drop=True)
+    esperado.columns = COLUMNAS_INCIDENCIA
+
+    # La suma de cada ventana difiere del promedio móvil incremental solo en redondeo
+    pd.testing.assert_frame_equal(calcular_incidencia_7d(df), esperado, rtol=1e-12)
@@ -0,0 +1,85 @@
+"""
+Pruebas de la selección de países y de datos_procesados configurable.
+"""
+
+import pandas as pd
+from dagster import build_asset_context
+
+from covid_pipeline.assets import ProcesamientoConfig, datos_procesados
+from covid_pipeline.paises import construir_indice, resolver_paises
+
+UBICACIONES = pd.Series([
+    'Ecuador', 'Ecuador', 'Peru', 'Papua New Guinea', 'South America', 'Perú (dummy)', 'Chile'
+])
+
+
+def test_indice_normalizado():
+    indice = construir_indice(UBICACIONES)
+
+    assert indice['ecuador'] == 'Ecuador'
+    assert indice['peru (dummy)'] == 'Perú (dummy)'
+    assert indice.index.is_unique
+
+
+def test_resolver_coincidencia_exacta_sin_tildes_ni_mayusculas():
+    assert resolver_paises(UBICACIONES, ['ECUADOR', ' Perú ']) == ['Ecuador', 'Peru']
+
+
+def test_resolver_por_subcadena_y_sin_repetidos():
+    assert resolver_paises(UBICACIONES, ['guinea', 'Chile', 'chile']) == ['Papua New Guinea', 'Chile']
+
+
+def test_resolver_solo_exacto():
+    assert resolver_paises(UBICACIONES, ['guinea', 'Chile'], subcadena=False) == ['Chile']
+
+
+def test_resolver_sin_coincidencias():
+    assert resolver_paises(UBICACIONES, ['Atlantida']) == []
+
+
+def _leer_datos_prueba() -> pd.DataFrame:
+    return pd.DataFrame({
+        'location': ['Ecuador', 'Ecuador', 'Peru', 'Chile', 'Chile'],
+        'date': ['2021-01-01', '2021-01-01', '2021-01-01', '2021-01-01', '2021-01-02'],
+        'new_cases': [1.0, 1.0, 2.0, 3.0, None],
+        'people_vaccinated': [10.0, 10.0, 20.0, 30.0, 40.0],
+        'population': [100.0, 100.0, 200.0, 300.0, 300.0],
+    })
+
+
+def test_datos_procesados_paises_por_defecto():
+    df = datos_procesados(
+        context=build_asset_context(partition_key="2021-01-01"), config=ProcesamientoConfig(), leer_datos=_leer_datos_prueba()
+    )
+
+    assert sorted(df['location']) == ['Ecuador', 'Peru']
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+
+
+def test_datos_procesados_todos_los_paises():
+    df = datos_procesados(
+        context=build_asset_context(partition_key="2021-01-01"),
+        config=ProcesamientoConfig(todos_los_paises=True),
+        leer_datos=_leer_datos_prueba(),
+    )
+
+    assert sorted(df['location']) == ['Chile', 'Ecuador', 'Peru']
+    assert len(df) == 3
+
+
+def test_datos_procesados_pais_ausente_en_la_ventana():
+    """Un país sin filas en la partición no se reemplaza por otro que lo contenga"""
+    leer_datos = pd.DataFrame({
+        'location': ['Nigeria', 'Peru', 'Niger', 'Nigeria', 'Peru'],
+        'date': ['2021-01-01', '2021-01-01', '2021-01-02', '2021-01-02', '2021-01-02'],
+        'new_cases': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'people_vaccinated': [10.0, 20.0, 30.0, 40.0, 50.0],
+        'population': [100.0, 200.0, 300.0, 100.0, 200.0],
+    })
+    config = ProcesamientoConfig(paises=['Niger', 'Peru'])
+
+    for fecha, esperado in [("2021-01-01", ['Peru']), ("2021-01-02", ['Niger', 'Peru'])]:
+        df = datos_procesados(
+            context=build_asset_context(partition_key=fecha), config=config, leer_datos=leer_datos
+        )
+        assert sorted(df['location']) == esperado